@@ -1,12 +1,14 @@
 """Analytics and optimization client."""
 
 from datetime import datetime
+from typing import Any
 
 from taskdog_client.base_client import BaseApiClient
 from taskdog_client.converters import (
     convert_to_optimization_output,
     convert_to_statistics_output,
 )
+from taskdog_core.application.dto.capacity_lane import CapacityLane
 from taskdog_core.application.dto.optimization_output import OptimizationOutput
 from taskdog_core.application.dto.statistics_output import StatisticsOutput
 
@@ -51,6 +53,11 @@ class AnalyticsClient:
         force_override: bool = True,
         task_ids: list[int] | None = None,
         include_all_days: bool = False,
+        portfolio_algorithms: list[str] | None = None,
+        changed_task_ids: list[int] | None = None,
+        lanes: list[CapacityLane] | None = None,
+        num_simulations: int | None = None,
+        profile: bool = False,
     ) -> OptimizationOutput:
         """Optimize task schedules.
 
@@ -61,6 +68,16 @@ class AnalyticsClient:
             force_override: Force override existing schedules
             task_ids: Specific task IDs to optimize (None means all schedulable tasks)
             include_all_days: If True, schedule tasks on weekends and holidays too (default: False)
+            portfolio_algorithms: Algorithms evaluated by the "portfolio"
+                algorithm (None means the server default set)
+            changed_task_ids: Tasks changed since the last run; when set, only
+                the tasks whose schedules can change are re-allocated
+            lanes: Capacity lanes with their own daily limits and days off
+                (None schedules everything as a single worker)
+            num_simulations: Orderings sampled by the "monte_carlo" algorithm
+                (None means the server default)
+            profile: If True, ask the server for per-phase timings and
+                strategy counters (default: False)
 
         Returns:
             OptimizationOutput with optimization results
@@ -70,7 +87,7 @@ class AnalyticsClient:
             TaskNotFoundException: If any specified task_id does not exist
             NoSchedulableTasksError: If no tasks can be scheduled
         """
-        payload: dict[str, str | float | bool | list[int] | None] = {
+        payload: dict[str, Any] = {
             "algorithm": algorithm,
             "start_date": start_date.isoformat() if start_date else None,
             "max_hours_per_day": max_hours_per_day,
@@ -81,6 +98,24 @@ class AnalyticsClient:
         # Only include task_ids if it's not None
         if task_ids is not None:
             payload["task_ids"] = task_ids
+        if portfolio_algorithms is not None:
+            payload["portfolio_algorithms"] = portfolio_algorithms
+        if changed_task_ids is not None:
+            payload["changed_task_ids"] = changed_task_ids
+        if num_simulations is not None:
+            payload["num_simulations"] = num_simulations
+        if profile:
+            payload["profile"] = True
+        if lanes:
+            payload["lanes"] = [
+                {
+                    "name": lane.name,
+                    "max_hours_per_day": lane.max_hours_per_day,
+                    "tags": list(lane.tags),
+                    "days_off": [day.isoformat() for day in sorted(lane.days_off)],
+                }
+                for lane in lanes
+            ]
 
         data = self._base._request_json("post", "/api/v1/optimize", json=payload)
         return convert_to_optimization_output(data)
@@ -10,9 +10,15 @@ if TYPE_CHECKING:
 
 from taskdog_core.application.dto.optimization_output import (
     OptimizationOutput,
+    OptimizationProfile,
     SchedulingFailure,
 )
-from taskdog_core.application.dto.optimization_summary import OptimizationSummary
+from taskdog_core.application.dto.optimization_summary import (
+    CriticalPath,
+    OptimizationSummary,
+    PortfolioCandidate,
+    SearchStats,
+)
 from taskdog_core.application.dto.task_dto import TaskSummaryDto
 from taskdog_core.shared.utils.datetime_parser import parse_iso_date
 
@@ -68,6 +74,22 @@ def _parse_optimization_summary(
         days_span=days_span,
         unscheduled_tasks=unscheduled_tasks,
         overloaded_days=[],  # Not provided by API
+        selected_algorithm=summary_data.get("selected_algorithm"),
+        touched_count=summary_data.get("touched_count", 0),
+        portfolio=[
+            PortfolioCandidate.model_validate(candidate)
+            for candidate in summary_data.get("portfolio", [])
+        ],
+        critical_path=(
+            CriticalPath.model_validate(summary_data["critical_path"])
+            if summary_data.get("critical_path")
+            else None
+        ),
+        search_stats=(
+            SearchStats.model_validate(summary_data["search_stats"])
+            if summary_data.get("search_stats")
+            else None
+        ),
     )
 
 
@@ -94,6 +116,28 @@ def _parse_scheduling_failures(
     ]
 
 
+def _parse_lane_allocations(
+    lanes_data: dict[str, dict[str, float]],
+) -> dict[str, dict[date_type, float]]:
+    """Parse per-lane daily allocations keyed by ISO date strings.
+
+    Args:
+        lanes_data: Mapping of lane name to {date string: hours}
+
+    Returns:
+        Mapping of lane name to {date: hours}
+    """
+    lane_allocations: dict[str, dict[date_type, float]] = {}
+    for lane, allocations in lanes_data.items():
+        parsed: dict[date_type, float] = {}
+        for day_str, hours in allocations.items():
+            day = parse_iso_date(day_str)
+            if day is not None:
+                parsed[day] = hours
+        lane_allocations[lane] = parsed
+    return lane_allocations
+
+
 def convert_to_optimization_output(data: dict[str, Any]) -> OptimizationOutput:
     """Convert API response to OptimizationOutput.
 
@@ -107,13 +151,20 @@ def convert_to_optimization_output(data: dict[str, Any]) -> OptimizationOutput:
                     "total_hours": float,
                     "start_date": str (ISO),
                     "end_date": str (ISO),
-                    "algorithm": str
+                    "algorithm": str,
+                    "selected_algorithm": str | None (portfolio only),
+                    "portfolio": [{...}] (portfolio only),
+                    "critical_path": {...} | None (dependency_aware only),
+                    "search_stats": {...} | None (exact only),
+                    "touched_count": int
                 },
                 "failures": [{
                     "task_id": int,
                     "task_name": str,
                     "reason": str
                 }],
+                "lane_allocations": {lane: {date: hours}} (capacity lanes only),
+                "profile": {...} | None (profiled runs only),
                 "message": str
             }
 
@@ -142,4 +193,10 @@ def convert_to_optimization_output(data: dict[str, Any]) -> OptimizationOutput:
         daily_allocations=daily_allocations,
         summary=summary,
         task_states_before=task_states_before,
+        lane_allocations=_parse_lane_allocations(data.get("lane_allocations", {})),
+        profile=(
+            OptimizationProfile.model_validate(data["profile"])
+            if data.get("profile")
+            else None
+        ),
     )
@@ -84,6 +84,7 @@ class QueryClient:
         include_gantt: bool = False,
         gantt_start_date: date | None = None,
         gantt_end_date: date | None = None,
+        limit: int | None = None,
     ) -> TaskListOutput:
         """List tasks with optional filtering and sorting.
 
@@ -98,6 +99,7 @@ class QueryClient:
             include_gantt: If True, include Gantt chart data
             gantt_start_date: Gantt chart start date
             gantt_end_date: Gantt chart end date
+            limit: Maximum number of tasks to return, after sorting
 
         Returns:
             TaskListOutput with task list and metadata, optionally including Gantt data
@@ -113,6 +115,8 @@ class QueryClient:
                 extra["gantt_start_date"] = gantt_start_date.isoformat()
             if gantt_end_date:
                 extra["gantt_end_date"] = gantt_end_date.isoformat()
+        if limit is not None:
+            extra["limit"] = limit
 
         params = self._build_list_params(
             include_archived, sort_by, reverse, status, tags, **extra
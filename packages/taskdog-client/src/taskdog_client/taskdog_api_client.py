@@ -25,6 +25,7 @@ from taskdog_core.application.dto.audit_log_dto import (
     AuditLogOutput,
 )
 from taskdog_core.application.dto.bulk_operation_output import BulkOperationOutput
+from taskdog_core.application.dto.capacity_lane import CapacityLane
 from taskdog_core.application.dto.delete_tag_output import DeleteTagOutput
 from taskdog_core.application.dto.next_tasks_output import NextTasksOutput
 from taskdog_core.application.dto.optimization_output import OptimizationOutput
@@ -272,6 +273,11 @@ class TaskdogApiClient:
         force_override: bool = True,
         task_ids: list[int] | None = None,
         include_all_days: bool = False,
+        portfolio_algorithms: list[str] | None = None,
+        changed_task_ids: list[int] | None = None,
+        lanes: list[CapacityLane] | None = None,
+        num_simulations: int | None = None,
+        profile: bool = False,
     ) -> OptimizationOutput:
         """Optimize task schedules.
 
@@ -282,6 +288,11 @@ class TaskdogApiClient:
             force_override: Force override existing schedules
             task_ids: Specific task IDs to optimize
             include_all_days: If True, schedule tasks on weekends and holidays too (default: False)
+            portfolio_algorithms: Algorithms evaluated by the "portfolio" algorithm
+            changed_task_ids: Tasks changed since the last run (incremental mode)
+            lanes: Capacity lanes with their own daily limits and days off
+            num_simulations: Orderings sampled by the "monte_carlo" algorithm
+            profile: If True, report per-phase timings and strategy counters
 
         Returns:
             OptimizationOutput with results
@@ -293,6 +304,11 @@ class TaskdogApiClient:
             force_override,
             task_ids,
             include_all_days,
+            portfolio_algorithms,
+            changed_task_ids,
+            lanes,
+            num_simulations,
+            profile,
         )
 
     def get_algorithm_metadata(self) -> list[tuple[str, str, str]]:
@@ -313,6 +329,7 @@ class TaskdogApiClient:
         include_gantt: bool = False,
         gantt_start_date: date | None = None,
         gantt_end_date: date | None = None,
+        limit: int | None = None,
     ) -> TaskListOutput:
         """List tasks with optional filtering and sorting."""
         return self._queries.list_tasks(
@@ -326,6 +343,7 @@ class TaskdogApiClient:
             include_gantt,
             gantt_start_date,
             gantt_end_date,
+            limit,
         )
 
     def get_task_by_id(self, task_id: int) -> TaskDetailOutput:
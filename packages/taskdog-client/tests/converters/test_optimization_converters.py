@@ -1,5 +1,7 @@
 """Tests for optimization converter functions."""
 
+from datetime import date
+
 from taskdog_client.converters.optimization_converters import (
     _parse_optimization_summary,
     _parse_scheduling_failures,
@@ -33,6 +35,94 @@ class TestParseOptimizationSummary:
         assert result.unscheduled_tasks[0].id == 11
         assert result.unscheduled_tasks[1].id == 12
 
+    def test_portfolio_results(self):
+        """Test portfolio selection and candidates are parsed."""
+        summary = {
+            "scheduled_tasks": 1,
+            "total_hours": 4.0,
+            "start_date": "2025-01-01",
+            "end_date": "2025-01-01",
+            "selected_algorithm": "balanced",
+            "touched_count": 1,
+            "portfolio": [
+                {"algorithm": "greedy", "fitness": 10.0, "runtime_seconds": 0.01},
+                {
+                    "algorithm": "balanced",
+                    "fitness": 12.5,
+                    "runtime_seconds": 0.02,
+                    "scheduled_count": 1,
+                    "selected": True,
+                },
+            ],
+        }
+
+        result = _parse_optimization_summary(summary, [])
+
+        assert result.selected_algorithm == "balanced"
+        assert result.touched_count == 1
+        assert [c.algorithm for c in result.portfolio] == ["greedy", "balanced"]
+        assert result.portfolio[1].selected is True
+        assert result.portfolio[1].fitness == 12.5
+
+    def test_without_portfolio(self):
+        """Test non-portfolio summaries leave portfolio fields empty."""
+        summary = {
+            "scheduled_tasks": 1,
+            "total_hours": 4.0,
+            "start_date": "2025-01-01",
+            "end_date": "2025-01-01",
+        }
+
+        result = _parse_optimization_summary(summary, [])
+
+        assert result.selected_algorithm is None
+        assert result.portfolio == []
+        assert result.touched_count == 0
+        assert result.critical_path is None
+        assert result.search_stats is None
+
+    def test_critical_path(self):
+        """Test the dependency_aware critical path is parsed."""
+        summary = {
+            "scheduled_tasks": 2,
+            "total_hours": 12.0,
+            "start_date": "2025-01-01",
+            "end_date": "2025-01-02",
+            "critical_path": {
+                "task_ids": [3, 5],
+                "total_hours": 12.0,
+                "length_days": 2,
+            },
+        }
+
+        result = _parse_optimization_summary(summary, [])
+
+        assert result.critical_path is not None
+        assert result.critical_path.task_ids == [3, 5]
+        assert result.critical_path.length_days == 2
+
+    def test_search_stats(self):
+        """Test the exact algorithm's search statistics are parsed."""
+        summary = {
+            "scheduled_tasks": 3,
+            "total_hours": 12.0,
+            "start_date": "2025-01-01",
+            "end_date": "2025-01-02",
+            "search_stats": {
+                "nodes_explored": 42,
+                "runtime_seconds": 0.01,
+                "nodes_per_second": 4200.0,
+                "optimal": True,
+                "fallback": None,
+            },
+        }
+
+        result = _parse_optimization_summary(summary, [])
+
+        assert result.search_stats is not None
+        assert result.search_stats.nodes_explored == 42
+        assert result.search_stats.optimal is True
+
     def test_single_day_span(self):
         """Test calculation with single day."""
         summary = {
@@ -249,3 +339,51 @@ class TestConvertToOptimizationOutput:
         result = convert_to_optimization_output(data)
 
         assert result.task_states_before == {}
+
+    def test_lane_allocations(self):
+        """Test per-lane allocations are parsed into date keys."""
+        data = {
+            "summary": {
+                "scheduled_tasks": 2,
+                "total_hours": 10.0,
+                "start_date": "2025-01-06",
+                "end_date": "2025-01-07",
+            },
+            "failures": [],
+            "lane_allocations": {
+                "alice": {"2025-01-06": 4.0},
+                "default": {"2025-01-06": 4.0, "2025-01-07": 2.0},
+            },
+        }
+
+        result = convert_to_optimization_output(data)
+
+        assert result.lane_allocations == {
+            "alice": {date(2025, 1, 6): 4.0},
+            "default": {date(2025, 1, 6): 4.0, date(2025, 1, 7): 2.0},
+        }
+        assert result.profile is None
+
+    def test_profile(self):
+        """Test the profile of a profiled run is parsed."""
+        data = {
+            "summary": {
+                "scheduled_tasks": 1,
+                "total_hours": 4.0,
+                "start_date": "2025-01-06",
+                "end_date": "2025-01-06",
+            },
+            "failures": [],
+            "profile": {
+                "phases": {"load_tasks": 0.001, "strategy": 0.02},
+                "total_seconds": 0.025,
+                "counters": {"generations": 7, "early_terminated": False},
+            },
+        }
+
+        result = convert_to_optimization_output(data)
+
+        assert result.profile is not None
+        assert result.profile.phases == {"load_tasks": 0.001, "strategy": 0.02}
+        assert result.profile.total_seconds == 0.025
+        assert result.profile.counters == {"generations": 7, "early_terminated": False}
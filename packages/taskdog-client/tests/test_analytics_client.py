@@ -1,11 +1,13 @@
 """Tests for AnalyticsClient."""
 
-from datetime import datetime
+from datetime import date, datetime
 from unittest.mock import Mock, patch
 
 import pytest
 from taskdog_client.analytics_client import AnalyticsClient
 
+from taskdog_core.application.dto.capacity_lane import CapacityLane
+
 
 class TestAnalyticsClient:
     """Test cases for AnalyticsClient."""
@@ -58,6 +60,63 @@ class TestAnalyticsClient:
         assert payload["force_override"] is True
         assert result == mock_output
 
+    @patch("taskdog_client.analytics_client.convert_to_optimization_output")
+    def test_optimize_schedule_portfolio_algorithms(self, mock_convert):
+        """Test optional optimization fields are sent only when given."""
+        self.mock_base._request_json.return_value = {"summary": {}}
+
+        self.client.optimize_schedule(
+            algorithm="portfolio",
+            start_date=None,
+            max_hours_per_day=8.0,
+            portfolio_algorithms=["greedy", "balanced"],
+            changed_task_ids=[3],
+            num_simulations=500,
+            profile=True,
+        )
+        self.client.optimize_schedule(
+            algorithm="greedy", start_date=None, max_hours_per_day=8.0
+        )
+
+        first, second = self.mock_base._request_json.call_args_list
+        assert first[1]["json"]["portfolio_algorithms"] == ["greedy", "balanced"]
+        assert first[1]["json"]["changed_task_ids"] == [3]
+        assert first[1]["json"]["num_simulations"] == 500
+        assert first[1]["json"]["profile"] is True
+        assert "portfolio_algorithms" not in second[1]["json"]
+        assert "changed_task_ids" not in second[1]["json"]
+        assert "num_simulations" not in second[1]["json"]
+        assert "profile" not in second[1]["json"]
+
+    @patch("taskdog_client.analytics_client.convert_to_optimization_output")
+    def test_optimize_schedule_lanes(self, mock_convert):
+        """Test capacity lanes are serialized into the request payload."""
+        self.mock_base._request_json.return_value = {"summary": {}}
+
+        self.client.optimize_schedule(
+            algorithm="greedy",
+            start_date=None,
+            max_hours_per_day=8.0,
+            lanes=[
+                CapacityLane(
+                    "alice",
+                    4.0,
+                    tags=("alice",),
+                    days_off=frozenset({date(2025, 1, 8), date(2025, 1, 7)}),
+                )
+            ],
+        )
+
+        payload = self.mock_base._request_json.call_args[1]["json"]
+        assert payload["lanes"] == [
+            {
+                "name": "alice",
+                "max_hours_per_day": 4.0,
+                "tags": ["alice"],
+                "days_off": ["2025-01-07", "2025-01-08"],
+            }
+        ]
+
     def test_get_algorithm_metadata(self):
         """Test get_algorithm_metadata makes correct API call."""
         self.mock_base._request_json.return_value = [
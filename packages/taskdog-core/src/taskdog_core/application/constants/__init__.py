@@ -2,26 +2,42 @@
 
 from taskdog_core.application.constants.optimization import (
     DEADLINE_PENALTY_MULTIPLIER,
+    DEFAULT_CAPACITY_LANE,
+    EXACT_MAX_TASKS,
+    EXACT_TIME_LIMIT_SECONDS,
+    FITNESS_CACHE_MAX_ENTRIES,
     GENETIC_CROSSOVER_RATE,
     GENETIC_EARLY_TERMINATION_GENERATIONS,
     GENETIC_GENERATIONS,
     GENETIC_MUTATION_RATE,
     GENETIC_POPULATION_SIZE,
     GENETIC_TOURNAMENT_SIZE,
+    MONTE_CARLO_CHUNK_SIZE,
+    MONTE_CARLO_MAX_SIMULATIONS,
     MONTE_CARLO_NUM_SIMULATIONS,
-    ROUND_ROBIN_MAX_ITERATIONS,
+    OPTIMIZATION_MAX_WORKERS,
+    PORTFOLIO_DEFAULT_ALGORITHMS,
+    SCENARIO_MAX_COUNT,
     SCHEDULING_EPSILON,
 )
 
 __all__ = [
     "DEADLINE_PENALTY_MULTIPLIER",
+    "DEFAULT_CAPACITY_LANE",
+    "EXACT_MAX_TASKS",
+    "EXACT_TIME_LIMIT_SECONDS",
+    "FITNESS_CACHE_MAX_ENTRIES",
     "GENETIC_CROSSOVER_RATE",
     "GENETIC_EARLY_TERMINATION_GENERATIONS",
     "GENETIC_GENERATIONS",
     "GENETIC_MUTATION_RATE",
     "GENETIC_POPULATION_SIZE",
     "GENETIC_TOURNAMENT_SIZE",
+    "MONTE_CARLO_CHUNK_SIZE",
+    "MONTE_CARLO_MAX_SIMULATIONS",
     "MONTE_CARLO_NUM_SIMULATIONS",
-    "ROUND_ROBIN_MAX_ITERATIONS",
+    "OPTIMIZATION_MAX_WORKERS",
+    "PORTFOLIO_DEFAULT_ALGORITHMS",
+    "SCENARIO_MAX_COUNT",
     "SCHEDULING_EPSILON",
 ]
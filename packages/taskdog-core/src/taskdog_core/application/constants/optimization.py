@@ -16,13 +16,55 @@ GENETIC_EARLY_TERMINATION_GENERATIONS = (
 MONTE_CARLO_NUM_SIMULATIONS = (
     50  # Number of random simulations to run (reduced from 100 for performance)
 )
+MONTE_CARLO_MAX_SIMULATIONS = 10000  # Upper bound for per-request simulation counts
+# Simulations are drawn in chunks, each from its own RNG stream derived from the
+# seed, so the chosen ordering does not depend on the order chunks are run in.
+MONTE_CARLO_CHUNK_SIZE = 64
+
+# Process Pool Parameters
+# Worker processes shared by the strategies that split a run into independent
+# jobs (Monte Carlo chunks, portfolio members, what-if scenarios). Capped at
+# the number of CPUs.
+OPTIMIZATION_MAX_WORKERS = 4
+
+# Exact (Branch and Bound) Parameters
+# The search is exponential in the number of tasks; larger backlogs, and runs
+# that hit the time limit, fall back to the greedy ordering or the best
+# ordering found so far.
+EXACT_MAX_TASKS = 12
+EXACT_TIME_LIMIT_SECONDS = 5.0
+
+# Fitness Cache Parameters
+# Evaluated orderings kept across runs by the genetic and Monte Carlo
+# strategies. Entries are a 16-byte key and a float, so the bound keeps the
+# cache at a few megabytes.
+FITNESS_CACHE_MAX_ENTRIES = 50000
 
 # Default seed for randomized strategies (genetic, monte_carlo) so identical
 # input yields an identical schedule unless an explicit seed is provided.
 DEFAULT_OPTIMIZATION_SEED = 0
 
-# Round Robin Parameters
-ROUND_ROBIN_MAX_ITERATIONS = 10000  # Safety limit to prevent infinite loops
+# Portfolio Parameters
+# Strategies run by the "portfolio" algorithm when none are specified. The
+# randomized search strategies (genetic, monte_carlo) are opt-in because they
+# dominate the portfolio's runtime.
+PORTFOLIO_DEFAULT_ALGORITHMS = (
+    "greedy",
+    "balanced",
+    "backward",
+    "priority_first",
+    "earliest_deadline",
+    "round_robin",
+    "dependency_aware",
+)
+
+# Capacity Lanes
+# Lane that receives tasks matching no configured lane. It uses the run's
+# max_hours_per_day unless a lane with this name is configured explicitly.
+DEFAULT_CAPACITY_LANE = "default"
+
+# What-if Scenario Parameters
+SCENARIO_MAX_COUNT = 20  # Maximum scenarios evaluated per request
 
 # Penalty Multipliers (shared across multiple algorithms)
 DEADLINE_PENALTY_MULTIPLIER = (
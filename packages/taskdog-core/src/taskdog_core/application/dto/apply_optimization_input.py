@@ -0,0 +1,21 @@
+"""DTO for applying a previously computed optimization result."""
+
+from dataclasses import dataclass, field
+
+from taskdog_core.application.dto.optimization_output import PlannedTaskSchedule
+
+
+@dataclass
+class ApplyOptimizationInput:
+    """Request data for persisting a dry-run optimization result.
+
+    Attributes:
+        planned_schedules: Schedules computed by a dry-run optimization
+        cleared_task_ids: IDs of tasks whose existing schedule should be cleared
+        expected_data_version: Data version the schedules were computed from;
+            when set, the apply is rejected if the tasks changed since
+    """
+
+    planned_schedules: list[PlannedTaskSchedule]
+    cleared_task_ids: list[int] = field(default_factory=list)
+    expected_data_version: str | None = None
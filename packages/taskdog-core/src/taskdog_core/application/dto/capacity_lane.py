@@ -0,0 +1,38 @@
+"""Capacity lane definition for multi-resource optimization."""
+
+from dataclasses import dataclass
+from datetime import date
+
+from taskdog_core.domain.exceptions.task_exceptions import TaskValidationError
+
+
+@dataclass(frozen=True)
+class CapacityLane:
+    """A named worker (or team) with its own daily limit and calendar.
+
+    Tasks are assigned to the first lane sharing one of their tags. Each
+    lane is scheduled against its own capacity, so several people can be
+    planned from one database.
+
+    Attributes:
+        name: Unique lane name (e.g. an assignee)
+        max_hours_per_day: Daily work hour limit of the lane
+        tags: Task tags routed to this lane
+        days_off: Extra non-working dates of the lane (e.g. vacation),
+            on top of weekends and holidays
+    """
+
+    name: str
+    max_hours_per_day: float
+    tags: tuple[str, ...] = ()
+    days_off: frozenset[date] = frozenset()
+
+    def __post_init__(self) -> None:
+        """Validate the lane definition."""
+        if not self.name.strip():
+            raise TaskValidationError("Capacity lane name must not be empty")
+        if self.max_hours_per_day <= 0:
+            raise TaskValidationError(
+                f"Max hours per day of lane '{self.name}' must be greater than 0 "
+                f"(got {self.max_hours_per_day})"
+            )
@@ -0,0 +1,60 @@
+"""DTOs for evaluating what-if schedule scenarios."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class TaskOverride:
+    """Hypothetical change to one task, applied only within a scenario.
+
+    Attributes:
+        task_id: ID of the task to change
+        estimated_duration: Replacement estimate in hours (None keeps it)
+        deadline: Replacement deadline (None keeps it)
+        priority: Replacement priority (None keeps it)
+    """
+
+    task_id: int
+    estimated_duration: float | None = None
+    deadline: datetime | None = None
+    priority: int | None = None
+
+
+@dataclass(frozen=True)
+class ScheduleScenario:
+    """One what-if variant of an optimization run.
+
+    Attributes:
+        name: Label identifying the scenario in the results
+        algorithm_name: Algorithm to use (None uses the base algorithm)
+        max_hours_per_day: Daily limit to use (None uses the base limit)
+        task_overrides: Task changes assumed by this scenario
+    """
+
+    name: str
+    algorithm_name: str | None = None
+    max_hours_per_day: float | None = None
+    task_overrides: tuple[TaskOverride, ...] = ()
+
+
+@dataclass
+class EvaluateScenariosInput:
+    """Request data for evaluating several scenarios on the same tasks.
+
+    Every scenario re-plans all schedulable tasks (as with force_override)
+    around fixed and in-progress work. Nothing is saved.
+
+    Attributes:
+        start_date: Starting date for optimization
+        max_hours_per_day: Base daily work hour limit
+        algorithm_name: Base optimization algorithm
+        scenarios: Variants to evaluate
+        include_all_days: If True, schedule tasks on weekends and holidays too
+    """
+
+    start_date: datetime
+    max_hours_per_day: float
+    algorithm_name: str
+    scenarios: list[ScheduleScenario] = field(default_factory=list)
+    include_all_days: bool = False
@@ -2,7 +2,7 @@
 
 from datetime import date, datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from taskdog_core.application.dto.optimization_summary import OptimizationSummary
 from taskdog_core.application.dto.task_dto import TaskSummaryDto
@@ -20,6 +20,44 @@ class SchedulingFailure(BaseModel):
     reason: str
 
 
+class PlannedTaskSchedule(BaseModel):
+    """Schedule computed for a single task by an optimization run.
+
+    Carries everything needed to persist the schedule later, so a preview
+    (dry run) can be applied without re-running the strategy.
+
+    Attributes:
+        task_id: ID of the scheduled task
+        planned_start: Computed start datetime
+        planned_end: Computed end datetime
+        daily_allocations: Hours allocated to the task per day
+    """
+
+    task_id: int
+    planned_start: datetime
+    planned_end: datetime
+    daily_allocations: dict[date, float]
+
+
+class OptimizationProfile(BaseModel):
+    """Where an optimization run spent its time.
+
+    Attributes:
+        phases: Wall-clock seconds per phase, in the order the phases first
+            ran: load_tasks (loading all tasks, plus the data version of a
+            dry run), load_allocations (SQL aggregation of existing
+            allocations), strategy, persist (saving schedules; absent for
+            dry runs) and summary
+        total_seconds: Wall-clock seconds of the whole run
+        counters: Strategy-internal counters such as evaluations, cache_hits,
+            generations or early_terminated (empty for strategies without any)
+    """
+
+    phases: dict[str, float] = Field(default_factory=dict)
+    total_seconds: float = 0.0
+    counters: dict[str, int | bool] = Field(default_factory=dict)
+
+
 class OptimizationOutput(BaseModel):
     """Complete result of schedule optimization.
 
@@ -33,6 +71,17 @@ class OptimizationOutput(BaseModel):
         daily_allocations: Mapping of date objects to allocated hours
         summary: Optimization summary with metrics
         task_states_before: Mapping of task IDs to their planned_start before optimization
+        planned_schedules: Computed schedule per successfully scheduled task
+        cleared_task_ids: IDs of tasks whose old schedule is (or would be) cleared
+            because they could not be rescheduled under force_override
+        dry_run: True if the result was computed without being persisted
+        data_version: Version of the task data a dry run was computed from;
+            applying the result fails if the tasks changed since (None when
+            the result was persisted directly)
+        lane_allocations: Allocated hours per capacity lane and date (runs
+            with capacity lanes only)
+        profile: Per-phase timings and strategy counters (only when
+            profiling was requested)
     """
 
     successful_tasks: list[TaskSummaryDto]
@@ -40,6 +89,12 @@ class OptimizationOutput(BaseModel):
     daily_allocations: dict[date, float]
     summary: OptimizationSummary
     task_states_before: dict[int, datetime | None]
+    planned_schedules: list[PlannedTaskSchedule] = Field(default_factory=list)
+    cleared_task_ids: list[int] = Field(default_factory=list)
+    dry_run: bool = False
+    data_version: str | None = None
+    lane_allocations: dict[str, dict[date, float]] = Field(default_factory=dict)
+    profile: OptimizationProfile | None = None
 
     def has_failures(self) -> bool:
         """Check if any tasks failed to be scheduled.
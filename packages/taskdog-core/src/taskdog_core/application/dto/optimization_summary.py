@@ -1,10 +1,67 @@
 """DTO for optimization summary data."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from taskdog_core.application.dto.task_dto import TaskSummaryDto
 
 
+class PortfolioCandidate(BaseModel):
+    """Outcome of one strategy evaluated by the portfolio algorithm.
+
+    Attributes:
+        algorithm: Strategy name
+        fitness: ScheduleFitnessCalculator score (None if the strategy failed)
+        runtime_seconds: Wall-clock time spent in the strategy
+        scheduled_count: Number of tasks the strategy scheduled
+        failed_count: Number of tasks the strategy could not schedule
+        selected: True for the strategy whose schedule was kept
+        error: Error message if the strategy raised
+    """
+
+    algorithm: str
+    fitness: float | None
+    runtime_seconds: float
+    scheduled_count: int = 0
+    failed_count: int = 0
+    selected: bool = False
+    error: str | None = None
+
+
+class CriticalPath(BaseModel):
+    """Longest dependency chain among the optimized tasks.
+
+    Attributes:
+        task_ids: Tasks on the chain, from first prerequisite to last dependent
+        total_hours: Estimated hours along the chain
+        length_days: Days the chain needs at max_hours_per_day, i.e. the
+            shortest possible span of the schedule
+    """
+
+    task_ids: list[int]
+    total_hours: float
+    length_days: int
+
+
+class SearchStats(BaseModel):
+    """Effort of the exact (branch and bound) search.
+
+    Attributes:
+        nodes_explored: Search tree nodes visited
+        runtime_seconds: Wall-clock time of the search
+        nodes_per_second: Nodes visited per second of runtime
+        optimal: True if the search completed, so no task ordering scores
+            higher under ScheduleFitnessCalculator
+        fallback: Why the search was skipped or cut short ("size" or
+            "time"), None if it completed
+    """
+
+    nodes_explored: int
+    runtime_seconds: float
+    nodes_per_second: float
+    optimal: bool
+    fallback: str | None = None
+
+
 class OptimizationSummary(BaseModel):
     """Summary data from schedule optimization.
 
@@ -16,6 +73,11 @@ class OptimizationSummary(BaseModel):
         days_span: Number of days covered by schedule
         unscheduled_tasks: Basic info of tasks that could not be scheduled
         overloaded_days: List of (date_str, hours) tuples exceeding max hours
+        selected_algorithm: Strategy whose schedule was kept (portfolio only)
+        portfolio: Per-strategy fitness and runtime (portfolio only)
+        touched_count: Number of tasks passed to the strategy for re-allocation
+        critical_path: Longest dependency chain (dependency_aware only)
+        search_stats: Nodes explored and search outcome (exact only)
     """
 
     new_count: int
@@ -25,3 +87,8 @@ class OptimizationSummary(BaseModel):
     days_span: int
     unscheduled_tasks: list[TaskSummaryDto]
     overloaded_days: list[tuple[str, float]]
+    selected_algorithm: str | None = None
+    portfolio: list[PortfolioCandidate] = Field(default_factory=list)
+    touched_count: int = 0
+    critical_path: CriticalPath | None = None
+    search_stats: SearchStats | None = None
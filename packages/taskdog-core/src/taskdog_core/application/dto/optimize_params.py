@@ -1,10 +1,15 @@
 """Parameters for optimization strategies."""
 
-from dataclasses import dataclass
-from datetime import datetime
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from typing import TYPE_CHECKING
 
-from taskdog_core.domain.exceptions.task_exceptions import TaskValidationError
+from taskdog_core.application.utils.workday_calendar import WorkdayCalendar
+from taskdog_core.domain.exceptions.task_exceptions import (
+    OptimizationCancelledError,
+    TaskValidationError,
+)
 
 if TYPE_CHECKING:
     from taskdog_core.domain.services.holiday_checker import IHolidayChecker
@@ -24,6 +29,17 @@ class OptimizeParams:
         include_all_days: If True, schedule tasks on weekends and holidays too (default: False)
         seed: Seed for randomized strategies (genetic, monte_carlo). None falls back
             to a fixed default so identical input yields an identical schedule.
+        portfolio_algorithms: Strategies evaluated by the portfolio algorithm.
+            None uses PORTFOLIO_DEFAULT_ALGORITHMS.
+        num_simulations: Orderings sampled by monte_carlo. None uses
+            MONTE_CARLO_NUM_SIMULATIONS.
+        cancellation_check: Optional callable polled by strategies between units
+            of work (tasks, generations, simulations). Returning True aborts
+            the run with OptimizationCancelledError.
+        days_off: Extra non-working dates on top of holidays (e.g. the
+            vacation of the person a capacity lane models)
+        workdays: Workday index built from holiday_checker and days_off once
+            per run and shared by every strategy and candidate evaluation
     """
 
     start_date: datetime
@@ -31,11 +47,33 @@ class OptimizeParams:
     holiday_checker: "IHolidayChecker | None" = None
     include_all_days: bool = False
     seed: int | None = None
+    portfolio_algorithms: tuple[str, ...] | None = None
+    num_simulations: int | None = None
+    cancellation_check: Callable[[], bool] | None = None
+    days_off: frozenset[date] = frozenset()
+    workdays: WorkdayCalendar = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate optimization parameters."""
+        """Validate optimization parameters and build the workday index."""
         if self.max_hours_per_day <= 0:
             raise TaskValidationError(
                 f"Max hours per day must be greater than 0 "
                 f"(got {self.max_hours_per_day})"
             )
+        if self.num_simulations is not None and self.num_simulations <= 0:
+            raise TaskValidationError(
+                f"Number of simulations must be greater than 0 "
+                f"(got {self.num_simulations})"
+            )
+        object.__setattr__(
+            self, "workdays", WorkdayCalendar(self.holiday_checker, self.days_off)
+        )
+
+    def raise_if_cancelled(self) -> None:
+        """Abort the optimization run if cancellation was requested.
+
+        Raises:
+            OptimizationCancelledError: If cancellation_check returns True
+        """
+        if self.cancellation_check is not None and self.cancellation_check():
+            raise OptimizationCancelledError()
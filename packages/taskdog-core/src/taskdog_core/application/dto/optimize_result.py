@@ -4,6 +4,11 @@ from dataclasses import dataclass, field
 from datetime import date
 
 from taskdog_core.application.dto.optimization_output import SchedulingFailure
+from taskdog_core.application.dto.optimization_summary import (
+    CriticalPath,
+    PortfolioCandidate,
+    SearchStats,
+)
 from taskdog_core.application.dto.task_dto import TaskSummaryDto
 from taskdog_core.domain.entities.task import Task
 
@@ -19,11 +24,25 @@ class OptimizeResult:
         tasks: List of tasks with updated schedules
         failures: List of scheduling failures with reasons
         daily_allocations: Mapping of dates to allocated hours
+        selected_algorithm: Strategy that produced this result (portfolio only)
+        portfolio: Per-strategy evaluation results (portfolio only)
+        critical_path: Longest dependency chain (dependency_aware only)
+        search_stats: Nodes explored and search outcome (exact only)
+        lane_allocations: Allocated hours per capacity lane and date (runs
+            with capacity lanes only)
+        counters: Strategy-internal counters for profiling, e.g. evaluations
+            or cache_hits (strategies without any leave it empty)
     """
 
     tasks: list[Task] = field(default_factory=list)
     failures: list[SchedulingFailure] = field(default_factory=list)
     daily_allocations: dict[date, float] = field(default_factory=dict)
+    selected_algorithm: str | None = None
+    portfolio: list[PortfolioCandidate] = field(default_factory=list)
+    critical_path: CriticalPath | None = None
+    search_stats: SearchStats | None = None
+    lane_allocations: dict[str, dict[date, float]] = field(default_factory=dict)
+    counters: dict[str, int | bool] = field(default_factory=dict)
 
     def record_failure(self, task: Task, reason: str) -> None:
         """Record a task scheduling failure with a reason.
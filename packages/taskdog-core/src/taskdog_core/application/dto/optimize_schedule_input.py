@@ -1,8 +1,11 @@
 """DTO for optimizing task schedules."""
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 
+from taskdog_core.application.dto.capacity_lane import CapacityLane
+
 
 @dataclass
 class OptimizeScheduleInput:
@@ -15,6 +18,21 @@ class OptimizeScheduleInput:
         algorithm_name: Name of optimization algorithm to use
         task_ids: Specific task IDs to optimize (None means all schedulable tasks)
         include_all_days: If True, schedule tasks on weekends and holidays too (default: False)
+        portfolio_algorithms: Strategies evaluated when algorithm_name is "portfolio"
+            (None uses the default set)
+        changed_task_ids: IDs of tasks that were added, completed or edited since
+            the last run. When set, only the tasks whose schedules can change are
+            re-allocated (incremental mode); mutually exclusive with task_ids
+        dry_run: If True, compute the schedule without persisting it (default: False)
+        cancellation_check: Optional callable polled during optimization; returning
+            True aborts the run with OptimizationCancelledError
+        lanes: Capacity lanes (workers or teams) with their own daily limits
+            and days off. Tasks matching no lane use max_hours_per_day.
+            None schedules everything as a single worker
+        num_simulations: Orderings sampled when algorithm_name is "monte_carlo"
+            (None uses the default count)
+        profile: If True, report per-phase timings and strategy counters in
+            OptimizationOutput.profile (default: False)
     """
 
     start_date: datetime
@@ -23,3 +41,10 @@ class OptimizeScheduleInput:
     algorithm_name: str
     task_ids: list[int] | None = None
     include_all_days: bool = False
+    portfolio_algorithms: list[str] | None = None
+    changed_task_ids: list[int] | None = None
+    dry_run: bool = False
+    cancellation_check: Callable[[], bool] | None = None
+    lanes: list[CapacityLane] | None = None
+    num_simulations: int | None = None
+    profile: bool = False
@@ -27,6 +27,8 @@ class ListTasksInput:
         include_gantt: If True, also build the Gantt overlay from the same fetch
         chart_start_date: Start date for the Gantt chart display range
         chart_end_date: End date for the Gantt chart display range
+        limit: Return at most this many tasks, counted after sorting
+            (default: None, no limit)
     """
 
     include_archived: bool = False
@@ -40,3 +42,4 @@ class ListTasksInput:
     include_gantt: bool = False
     chart_start_date: date | None = None
     chart_end_date: date | None = None
+    limit: int | None = None
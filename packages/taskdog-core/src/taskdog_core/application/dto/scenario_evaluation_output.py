@@ -0,0 +1,43 @@
+"""DTOs for what-if schedule scenario results."""
+
+from datetime import date
+
+from pydantic import BaseModel, Field
+
+
+class ScenarioResult(BaseModel):
+    """Compact outcome of one evaluated scenario.
+
+    Attributes:
+        name: Scenario label
+        algorithm: Algorithm the scenario ran
+        max_hours_per_day: Daily limit the scenario ran with
+        scheduled_count: Tasks that received a schedule
+        failed_count: Tasks that could not be scheduled
+        deadline_misses: Tasks with a deadline that end after it or could
+            not be scheduled
+        end_date: Last day with scheduled work (None if nothing was scheduled)
+        peak_load: Highest hours planned on a single day from the start date,
+            including fixed and in-progress work
+        total_hours: Estimated hours of the scheduled tasks
+    """
+
+    name: str
+    algorithm: str
+    max_hours_per_day: float
+    scheduled_count: int
+    failed_count: int
+    deadline_misses: int
+    end_date: date | None = None
+    peak_load: float = 0.0
+    total_hours: float = 0.0
+
+
+class ScenarioEvaluationOutput(BaseModel):
+    """Results of a batch of what-if scenarios, in request order.
+
+    Attributes:
+        scenarios: One result per requested scenario
+    """
+
+    scenarios: list[ScenarioResult] = Field(default_factory=list)
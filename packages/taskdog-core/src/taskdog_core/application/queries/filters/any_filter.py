@@ -0,0 +1,50 @@
+"""Filter combining multiple filters with OR logic."""
+
+from taskdog_core.application.queries.filters.task_filter import TaskFilter
+from taskdog_core.domain.entities.task import Task
+from taskdog_core.domain.repositories.task_criteria import AnyOf, TaskCriterion
+
+
+class AnyFilter(TaskFilter):
+    """Filter that keeps tasks passing at least one of its filters (OR logic).
+
+    Build it with the | operator: ``filter1 | filter2``.
+
+    Example:
+        >>> either = StatusFilter(TaskStatus.PENDING) | TagFilter(["urgent"])
+        >>> # Returns tasks that are pending OR tagged urgent
+    """
+
+    def __init__(self, filters: list[TaskFilter]):
+        """Initialize the filter with alternatives.
+
+        Args:
+            filters: List of TaskFilter instances, any of which may match
+        """
+        self.filters = filters
+
+    def filter(self, tasks: list[Task]) -> list[Task]:
+        """Keep tasks that pass any filter, in their original order.
+
+        Args:
+            tasks: List of all tasks to filter
+
+        Returns:
+            Tasks that pass at least one filter
+        """
+        kept: set[int] = set()
+        for f in self.filters:
+            kept.update(id(task) for task in f.filter(tasks))
+        return [task for task in tasks if id(task) in kept]
+
+    def to_criterion(self) -> TaskCriterion | None:
+        """Express the filter as an AnyOf criterion.
+
+        Returns:
+            AnyOf of the sub-filters' criteria, or None if any sub-filter
+            can only be applied in Python
+        """
+        criteria = [f.to_criterion() for f in self.filters]
+        if any(criterion is None for criterion in criteria):
+            return None
+        return AnyOf(tuple(c for c in criteria if c is not None))
@@ -8,6 +8,7 @@
 
 from taskdog_core.application.queries.filters.task_filter import TaskFilter
 from taskdog_core.domain.entities.task import Task
+from taskdog_core.domain.repositories.task_criteria import AllOf, TaskCriterion
 
 
 class CompositeFilter(TaskFilter):
@@ -58,3 +59,15 @@ class CompositeFilter(TaskFilter):
         for f in self.filters:
             result = f.filter(result)
         return result
+
+    def to_criterion(self) -> TaskCriterion | None:
+        """Express the filter as an AllOf criterion.
+
+        Returns:
+            AllOf of the sub-filters' criteria, or None if any sub-filter
+            can only be applied in Python
+        """
+        criteria = [f.to_criterion() for f in self.filters]
+        if any(criterion is None for criterion in criteria):
+            return None
+        return AllOf(tuple(c for c in criteria if c is not None))
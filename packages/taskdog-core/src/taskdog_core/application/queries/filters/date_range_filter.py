@@ -4,6 +4,7 @@ from datetime import date
 
 from taskdog_core.application.queries.filters.task_filter import TaskFilter
 from taskdog_core.domain.entities.task import Task
+from taskdog_core.domain.repositories.task_criteria import DateInRange, TaskCriterion
 
 
 class DateRangeFilter(TaskFilter):
@@ -17,25 +18,33 @@ class DateRangeFilter(TaskFilter):
     If both are provided, filters tasks with dates in [start_date, end_date].
     """
 
-    def __init__(self, start_date: date | None = None, end_date: date | None = None):
+    def __init__(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        include_undated: bool = True,
+    ):
         """Initialize filter with date range.
 
         Args:
             start_date: Optional start date (inclusive)
             end_date: Optional end date (inclusive)
+            include_undated: Keep tasks without any date (default: True)
         """
         if start_date is None and end_date is None:
             raise ValueError("At least one of start_date or end_date must be provided")
 
         self.start_date = start_date
         self.end_date = end_date
+        self.include_undated = include_undated
 
     def filter(self, tasks: list[Task]) -> list[Task]:
         """Filter tasks by date range.
 
         A task is included if any of its date fields (planned_start, planned_end,
         actual_start, actual_end, deadline) falls within the specified range.
-        Tasks without any dates are also included (for gantt display purposes).
+        Tasks without any dates are also included (for gantt display purposes)
+        unless include_undated is False.
 
         Args:
             tasks: List of all tasks
@@ -60,7 +69,8 @@ class DateRangeFilter(TaskFilter):
 
             # Include tasks with no dates (unscheduled tasks)
             if not task_dates:
-                filtered.append(task)
+                if self.include_undated:
+                    filtered.append(task)
                 continue
 
             # Check if any date falls within the range
@@ -91,3 +101,7 @@ class DateRangeFilter(TaskFilter):
             return True
 
         return False
+
+    def to_criterion(self) -> TaskCriterion:
+        """Express the filter as a DateInRange criterion."""
+        return DateInRange(self.start_date, self.end_date, self.include_undated)
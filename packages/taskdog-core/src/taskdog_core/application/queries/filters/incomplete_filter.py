@@ -1,7 +1,8 @@
 """Filter for incomplete tasks."""
 
 from taskdog_core.application.queries.filters.task_filter import TaskFilter
-from taskdog_core.domain.entities.task import Task
+from taskdog_core.domain.entities.task import Task, TaskStatus
+from taskdog_core.domain.repositories.task_criteria import StatusIn, TaskCriterion
 
 
 class IncompleteFilter(TaskFilter):
@@ -21,3 +22,7 @@ class IncompleteFilter(TaskFilter):
             List of tasks that are not completed, canceled, or archived
         """
         return [task for task in tasks if not task.is_finished]
+
+    def to_criterion(self) -> TaskCriterion:
+        """Express the filter as the statuses that are not finished."""
+        return StatusIn(frozenset({TaskStatus.PENDING, TaskStatus.IN_PROGRESS}))
@@ -2,6 +2,7 @@
 
 from taskdog_core.application.queries.filters.task_filter import TaskFilter
 from taskdog_core.domain.entities.task import Task
+from taskdog_core.domain.repositories.task_criteria import NotArchived, TaskCriterion
 
 
 class NonArchivedFilter(TaskFilter):
@@ -21,3 +22,7 @@ class NonArchivedFilter(TaskFilter):
             List of tasks that are not archived
         """
         return [task for task in tasks if not task.is_archived]
+
+    def to_criterion(self) -> TaskCriterion:
+        """Express the filter as a NotArchived criterion."""
+        return NotArchived()
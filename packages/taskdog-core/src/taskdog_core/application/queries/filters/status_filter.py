@@ -2,6 +2,7 @@
 
 from taskdog_core.application.queries.filters.task_filter import TaskFilter
 from taskdog_core.domain.entities.task import Task, TaskStatus
+from taskdog_core.domain.repositories.task_criteria import StatusIn, TaskCriterion
 
 
 class StatusFilter(TaskFilter):
@@ -28,3 +29,7 @@ class StatusFilter(TaskFilter):
             List of tasks with the specified status
         """
         return [task for task in tasks if task.status == self.status]
+
+    def to_criterion(self) -> TaskCriterion:
+        """Express the filter as a StatusIn criterion."""
+        return StatusIn(frozenset({self.status}))
@@ -2,6 +2,7 @@
 
 from taskdog_core.application.queries.filters.task_filter import TaskFilter
 from taskdog_core.domain.entities.task import Task
+from taskdog_core.domain.repositories.task_criteria import HasTags, TaskCriterion
 
 
 class TagFilter(TaskFilter):
@@ -40,3 +41,7 @@ class TagFilter(TaskFilter):
             ]
         # OR logic: task must have at least one specified tag
         return [task for task in tasks if any(tag in task.tags for tag in self.tags)]
+
+    def to_criterion(self) -> TaskCriterion:
+        """Express the filter as a HasTags criterion."""
+        return HasTags(tuple(self.tags), self.match_all)
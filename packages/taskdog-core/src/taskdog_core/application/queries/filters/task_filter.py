@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from taskdog_core.domain.entities.task import Task
+    from taskdog_core.domain.repositories.task_criteria import TaskCriterion
 
 
 class TaskFilter(ABC):
@@ -19,6 +20,11 @@ class TaskFilter(ABC):
     Filters can be composed using the >> operator:
         filter1 >> filter2 >> filter3
     This creates a composite filter that applies all filters in sequence.
+    The | operator combines filters with OR logic instead.
+
+    Filters that can be expressed as a TaskCriterion return it from
+    to_criterion(), so the repository can apply them in its query (SQL)
+    instead of fetching every task and filtering in Python.
     """
 
     @abstractmethod
@@ -32,6 +38,17 @@ class TaskFilter(ABC):
             Filtered list of tasks matching the criteria
         """
 
+    def to_criterion(self) -> TaskCriterion | None:
+        """Express the filter as a repository criterion.
+
+        The criterion must select exactly the tasks filter() keeps.
+
+        Returns:
+            Equivalent TaskCriterion, or None if the filter can only be
+            applied in Python (the default)
+        """
+        return None
+
     def __rshift__(self, other: TaskFilter | None) -> TaskFilter:
         """Compose filters using the >> operator.
 
@@ -69,3 +86,22 @@ class TaskFilter(ABC):
 
         # Create new CompositeFilter with both filters
         return CompositeFilter([self, other])
+
+    def __or__(self, other: TaskFilter) -> TaskFilter:
+        """Combine filters with OR logic using the | operator.
+
+        Args:
+            other: The alternative filter
+
+        Returns:
+            An AnyFilter keeping tasks that pass either filter
+
+        Examples:
+            >>> either = StatusFilter(TaskStatus.PENDING) | TagFilter(["urgent"])
+        """
+        # Import here to avoid circular dependency
+        from taskdog_core.application.queries.filters.any_filter import AnyFilter
+
+        left = self.filters if isinstance(self, AnyFilter) else [self]
+        right = other.filters if isinstance(other, AnyFilter) else [other]
+        return AnyFilter([*left, *right])
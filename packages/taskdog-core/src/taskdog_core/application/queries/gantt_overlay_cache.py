@@ -0,0 +1,259 @@
+"""Bounded cache of Gantt overlay data shared across requests.
+
+Building a Gantt overlay fetches the daily allocations of the listed tasks,
+sums the daily workload and looks up holidays for the chart range. The
+result depends only on which tasks are listed, the range and the stored
+data, so the TUI's reloads, pans and resizes would otherwise repeat the same
+queries for a viewport that moved by a few days.
+
+Entries are keyed by the set of listed task ids (what the filter parameters
+resolve to, so equivalent filters share an entry) and a data version that
+is bumped on every task change. Each entry covers a window wider than the
+requested range, and requests inside the window are served by slicing it.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from datetime import date
+
+    from taskdog_core.domain.entities.task import Task
+    from taskdog_core.domain.services.holiday_checker import IHolidayChecker
+
+# Distinct task sets (filters) kept. Entries hold the allocations of the
+# listed tasks over a window of a few months, so the bound keeps the cache
+# at a few megabytes even for large backlogs.
+GANTT_OVERLAY_CACHE_MAX_ENTRIES = 32
+
+# Days fetched on each side of a requested range, so panning the chart by
+# up to this many days is served from the cached window
+GANTT_OVERLAY_CACHE_MARGIN_DAYS = 28
+
+
+@dataclass(frozen=True)
+class GanttOverlayCacheStats:
+    """Snapshot of Gantt overlay cache usage.
+
+    Attributes:
+        hits: Lookups answered from a cached window
+        misses: Lookups that required fetching a window
+        evictions: Entries dropped because the cache was full
+        entries: Task sets currently cached
+        max_entries: Maximum number of cached task sets
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    max_entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 without lookups)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class GanttOverlayWindow:
+    """Overlay data fetched for a date window.
+
+    Attributes:
+        start_date: First day of the window
+        end_date: Last day of the window
+        task_daily_hours: Daily hour allocations per task in the window
+        daily_workload: Daily workload totals in the window
+        holidays: Holiday dates in the window
+    """
+
+    start_date: date
+    end_date: date
+    task_daily_hours: dict[int, dict[date, float]]
+    daily_workload: dict[date, float]
+    holidays: set[date]
+
+    def covers(self, start_date: date, end_date: date) -> bool:
+        """Whether the window contains the range from start_date to end_date."""
+        return self.start_date <= start_date and end_date <= self.end_date
+
+    def slice(self, start_date: date, end_date: date) -> GanttOverlayWindow:
+        """Cut the window down to a range inside it.
+
+        Tasks without allocations in the range are left out, as the
+        repository does when the range is fetched directly.
+
+        Args:
+            start_date: First day of the range
+            end_date: Last day of the range
+
+        Returns:
+            GanttOverlayWindow for the range
+        """
+        task_daily_hours: dict[int, dict[date, float]] = {}
+        for task_id, hours in self.task_daily_hours.items():
+            in_range = {
+                day: value
+                for day, value in hours.items()
+                if start_date <= day <= end_date
+            }
+            if in_range:
+                task_daily_hours[task_id] = in_range
+        return GanttOverlayWindow(
+            start_date=start_date,
+            end_date=end_date,
+            task_daily_hours=task_daily_hours,
+            daily_workload={
+                day: hours
+                for day, hours in self.daily_workload.items()
+                if start_date <= day <= end_date
+            },
+            holidays={day for day in self.holidays if start_date <= day <= end_date},
+        )
+
+
+@dataclass(frozen=True)
+class _Entry:
+    version: int
+    holiday_checker: IHolidayChecker | None
+    window: GanttOverlayWindow
+
+
+class GanttOverlayCache:
+    """Thread-safe LRU cache of Gantt overlay windows per listed task set.
+
+    Register task_changed() with TaskRepository.add_change_listener() so any
+    save or delete bumps the data version; entries built from older data are
+    then never served. Once ``max_entries`` task sets are cached, the least
+    recently used one is evicted.
+
+    Examples:
+        >>> from datetime import date
+        >>> cache = GanttOverlayCache(margin_days=7)
+        >>> def fetch(start, end):
+        ...     return GanttOverlayWindow(start, end, {}, {}, set())
+        >>> day = date(2025, 1, 6)
+        >>> cache.get_or_fetch([], day, day, None, fetch).start_date
+        datetime.date(2025, 1, 6)
+        >>> cache.stats().misses
+        1
+    """
+
+    def __init__(
+        self,
+        max_entries: int = GANTT_OVERLAY_CACHE_MAX_ENTRIES,
+        margin_days: int = GANTT_OVERLAY_CACHE_MARGIN_DAYS,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached task sets
+            margin_days: Days fetched on each side of a requested range
+
+        Raises:
+            ValueError: If max_entries is not positive or margin_days is
+                negative
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive (got {max_entries})")
+        if margin_days < 0:
+            raise ValueError(f"margin_days must not be negative (got {margin_days})")
+        self.max_entries = max_entries
+        self.margin_days = margin_days
+        self._entries: OrderedDict[frozenset[int], _Entry] = OrderedDict()
+        self._version = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def task_changed(self, task_id: int, task: Task | None) -> None:
+        """Invalidate every entry after a task was saved or deleted.
+
+        Args:
+            task_id: ID of the changed task
+            task: The saved task, or None if it was deleted
+        """
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+    def get_or_fetch(
+        self,
+        task_ids: Iterable[int],
+        start_date: date,
+        end_date: date,
+        holiday_checker: IHolidayChecker | None,
+        fetch: Callable[[date, date], GanttOverlayWindow],
+    ) -> GanttOverlayWindow:
+        """Return the overlay data of a range, fetching a wider window on a miss.
+
+        The fetch runs outside the lock. If a task changes meanwhile, the
+        window is still returned but not cached, as it may predate the
+        change.
+
+        Args:
+            task_ids: IDs of the listed tasks
+            start_date: First day of the chart range
+            end_date: Last day of the chart range
+            holiday_checker: Holiday checker the window's holidays come from
+            fetch: Fetches the overlay data of a window (start, end)
+
+        Returns:
+            GanttOverlayWindow covering exactly the chart range
+        """
+        key = frozenset(task_ids)
+        with self._lock:
+            version = self._version
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.version == version
+                and entry.holiday_checker is holiday_checker
+                and entry.window.covers(start_date, end_date)
+            ):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.window.slice(start_date, end_date)
+            self._misses += 1
+
+        margin = timedelta(days=self.margin_days)
+        window = fetch(start_date - margin, end_date + margin)
+
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = _Entry(version, holiday_checker, window)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return window.slice(start_date, end_date)
+
+    def stats(self) -> GanttOverlayCacheStats:
+        """Return current hit, miss, eviction and size counters."""
+        with self._lock:
+            return GanttOverlayCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
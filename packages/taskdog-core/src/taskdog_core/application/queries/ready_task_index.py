@@ -0,0 +1,171 @@
+"""Executable tasks kept ready for the "next" query as tasks change.
+
+A task is executable (ready) when it is PENDING or IN_PROGRESS, not
+archived, and every task it depends on is COMPLETED. Answering "what next?"
+from scratch loads every task to resolve dependency statuses and sorts all
+candidates. The index instead keeps the ready tasks in a heap ordered like
+TaskQueryService.executable_sort_key, and re-evaluates only the changed task
+and the tasks depending on it, so a query pops just the first ``limit``
+entries.
+"""
+
+from __future__ import annotations
+
+import copy
+import heapq
+import threading
+from typing import TYPE_CHECKING, Any
+
+from taskdog_core.domain.entities.task import TaskStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from taskdog_core.domain.entities.task import Task
+    from taskdog_core.domain.repositories.task_repository import TaskRepository
+
+_CANDIDATE_STATUSES = (TaskStatus.PENDING, TaskStatus.IN_PROGRESS)
+
+# Stale heap entries tolerated before the heap is rebuilt from the ready set
+_COMPACT_SLACK = 64
+
+
+class ReadyTaskIndex:
+    """Thread-safe heap of executable tasks, updated per changed task.
+
+    Register task_changed() with TaskRepository.add_change_listener(). The
+    index is loaded from the repository in a single pass on first use.
+
+    Heap entries are removed lazily: an entry is stale once its task left
+    the ready set or was re-pushed with a different sort key. Stale entries
+    are dropped when a query reaches them, or all at once when they
+    outnumber the live ones.
+    """
+
+    def __init__(
+        self,
+        repository: TaskRepository,
+        sort_key: Callable[[Task], tuple[Any, ...]],
+    ):
+        """Initialize the index.
+
+        Args:
+            repository: Repository to load the tasks from
+            sort_key: Ranks ready tasks; must be unique per task (e.g. end
+                with the task ID)
+        """
+        self._repository = repository
+        self._sort_key = sort_key
+        self._lock = threading.Lock()
+        self._loaded = False
+        # Status of every task, including archived and finished ones, so
+        # dependencies resolve after their target was archived
+        self._status: dict[int, TaskStatus] = {}
+        # PENDING/IN_PROGRESS tasks that are not archived
+        self._candidates: dict[int, Task] = {}
+        # Dependency target -> candidates depending on it
+        self._dependents: dict[int, set[int]] = {}
+        # Ready candidates and the sort key of their live heap entry
+        self._ready: dict[int, tuple[Any, ...]] = {}
+        self._heap: list[tuple[tuple[Any, ...], int]] = []
+
+    def task_changed(self, task_id: int, task: Task | None) -> None:
+        """Update the index for a saved or deleted task.
+
+        Args:
+            task_id: ID of the changed task
+            task: The saved task, or None if it was deleted
+        """
+        with self._lock:
+            if not self._loaded:
+                return
+            self._remove_candidate(task_id)
+            if task is None:
+                self._status.pop(task_id, None)
+            else:
+                self._status[task_id] = task.status
+                self._add_candidate(task_id, copy.deepcopy(task))
+            self._refresh(task_id)
+            # The task's status decides whether its dependents are ready
+            for dependent_id in self._dependents.get(task_id, ()):
+                self._refresh(dependent_id)
+            if len(self._heap) > 2 * len(self._ready) + _COMPACT_SLACK:
+                self._heap = [(key, ready_id) for ready_id, key in self._ready.items()]
+                heapq.heapify(self._heap)
+
+    def top(self, limit: int, tags: list[str] | None = None) -> list[Task]:
+        """Return the first ready tasks in sort order.
+
+        Args:
+            limit: Maximum number of tasks to return
+            tags: Only return tasks having any of these tags
+
+        Returns:
+            Copies of up to ``limit`` ready tasks
+        """
+        with self._lock:
+            self._load()
+            selected: list[tuple[tuple[Any, ...], int]] = []
+            skipped: list[tuple[tuple[Any, ...], int]] = []
+            seen: set[int] = set()
+            while self._heap and len(selected) < limit:
+                entry = heapq.heappop(self._heap)
+                key, task_id = entry
+                if self._ready.get(task_id) != key or task_id in seen:
+                    continue  # stale, or pushed again after leaving and re-entering
+                seen.add(task_id)
+                task = self._candidates[task_id]
+                if tags and not any(tag in task.tags for tag in tags):
+                    skipped.append(entry)
+                else:
+                    selected.append(entry)
+            for entry in selected + skipped:
+                heapq.heappush(self._heap, entry)
+            return [copy.deepcopy(self._candidates[task_id]) for _, task_id in selected]
+
+    def __len__(self) -> int:
+        """Number of ready tasks (0 before the index is loaded)."""
+        return len(self._ready)
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        for task in self._repository.iter_all():
+            assert task.id is not None
+            self._status[task.id] = task.status
+            self._add_candidate(task.id, task)
+        for task_id in self._candidates:
+            self._refresh(task_id)
+        self._loaded = True
+
+    def _add_candidate(self, task_id: int, task: Task) -> None:
+        if task.status not in _CANDIDATE_STATUSES or task.is_archived:
+            return
+        self._candidates[task_id] = task
+        for dep_id in task.depends_on:
+            self._dependents.setdefault(dep_id, set()).add(task_id)
+
+    def _remove_candidate(self, task_id: int) -> None:
+        old = self._candidates.pop(task_id, None)
+        if old is None:
+            return
+        for dep_id in old.depends_on:
+            dependents = self._dependents.get(dep_id)
+            if dependents is not None:
+                dependents.discard(task_id)
+                if not dependents:
+                    del self._dependents[dep_id]
+
+    def _refresh(self, task_id: int) -> None:
+        """Add a candidate to the ready set or take a task out of it."""
+        task = self._candidates.get(task_id)
+        if task is None or not all(
+            self._status.get(dep_id) == TaskStatus.COMPLETED
+            for dep_id in task.depends_on
+        ):
+            self._ready.pop(task_id, None)
+            return
+        key = self._sort_key(task)
+        if self._ready.get(task_id) != key:
+            self._ready[task_id] = key
+            heapq.heappush(self._heap, (key, task_id))
@@ -117,9 +117,11 @@ class TaskFilterBuilder:
             Updated filter chain with date filter applied
         """
         if input_dto.start_date is not None or input_dto.end_date is not None:
+            # Unscheduled tasks are not listed for a date range
             date_filter = DateRangeFilter(
                 start_date=input_dto.start_date,
                 end_date=input_dto.end_date,
+                include_undated=False,
             )
             return TaskFilterBuilder._compose(filter_obj, date_filter)
 
@@ -3,26 +3,26 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from taskdog_core.application.dto.gantt_overlay import GanttDateRange, GanttOverlay
 from taskdog_core.application.queries.base import QueryService
+from taskdog_core.application.queries.gantt_overlay_cache import GanttOverlayWindow
 from taskdog_core.application.sorters.task_sorter import TaskSorter
 from taskdog_core.domain.entities.task import TaskStatus
+from taskdog_core.domain.repositories.task_criteria import AllOf
+from taskdog_core.domain.repositories.task_order import TaskOrder
 
 if TYPE_CHECKING:
     from datetime import date
 
-    from taskdog_core.application.queries.filters.composite_filter import (
-        CompositeFilter,
-    )
-    from taskdog_core.application.queries.filters.date_range_filter import (
-        DateRangeFilter,
-    )
-    from taskdog_core.application.queries.filters.status_filter import StatusFilter
-    from taskdog_core.application.queries.filters.tag_filter import TagFilter
     from taskdog_core.application.queries.filters.task_filter import TaskFilter
+    from taskdog_core.application.queries.gantt_overlay_cache import (
+        GanttOverlayCache,
+    )
+    from taskdog_core.application.queries.ready_task_index import ReadyTaskIndex
     from taskdog_core.domain.entities.task import Task
+    from taskdog_core.domain.repositories.task_criteria import TaskCriterion
     from taskdog_core.domain.repositories.task_repository import TaskRepository
     from taskdog_core.domain.services.holiday_checker import IHolidayChecker
     from taskdog_core.domain.services.time_provider import ITimeProvider
@@ -39,54 +39,81 @@ class TaskQueryService(QueryService):
         self,
         repository: TaskRepository,
         time_provider: ITimeProvider,
+        overlay_cache: GanttOverlayCache | None = None,
+        ready_index: ReadyTaskIndex | None = None,
     ) -> None:
         """Initialize query service with repository.
 
         Args:
             repository: Task repository for data access
             time_provider: Provider for current time, supplied by the caller.
+            overlay_cache: Optional cache of Gantt overlay data shared across
+                calls (for long-lived processes such as the API server)
+            ready_index: Optional index of executable tasks kept up to date
+                by repository change listeners; must be built with
+                TaskQueryService.executable_sort_key
         """
         super().__init__(repository)
         self.sorter = TaskSorter()
         self._time_provider = time_provider
+        self._overlay_cache = overlay_cache
+        self._ready_index = ready_index
 
     def get_filtered_tasks(
         self,
         filter_obj: TaskFilter | None = None,
         sort_by: str = "id",
         reverse: bool = False,
+        limit: int | None = None,
     ) -> list[Task]:
         """Get tasks with optional filtering and sorting.
 
-        Hybrid approach: Simple filters (archived, status, tags, dates) are applied
-        at the SQL level for performance. Complex filters (dependencies, JSON fields)
-        are applied in Python after fetching.
+        The filter tree (archived, status, incomplete, tags, dates, and their
+        AND/OR compositions) is compiled into a single repository criterion
+        and applied at the SQL level. When every filter compiles, sorting and
+        the limit are applied at the SQL level too (ORDER BY/LIMIT); otherwise
+        the remaining filters, sorting and limit are applied in Python after
+        fetching.
 
         Args:
             filter_obj: Optional filter object to apply. If None, returns all tasks.
             sort_by: Sort key (id, priority, deadline, name, status, planned_start,
                 estimated_duration, created_at, updated_at)
             reverse: Reverse sort order (default: False)
+            limit: Return at most this many tasks (default: None, no limit)
 
         Returns:
             Filtered and sorted list of tasks
+
+        Raises:
+            ValueError: If sort_by is not a valid sort key
         """
-        # Hybrid approach: Use SQL filtering for simple filters
-        # Extract SQL-compatible filter parameters
-        sql_params = self._extract_sql_params(filter_obj)
+        order = TaskOrder(sort_by, reverse)
+
+        # Split into the criterion the repository applies and the filters
+        # that need Python processing
+        criterion, remaining_filter = self._split_filter(filter_obj)
+
+        if remaining_filter is None:
+            return self.repository.get_matching(criterion, order, limit)
 
-        # Get remaining complex filters that need Python processing
-        remaining_filter = self._get_remaining_filter(filter_obj)
+        tasks = remaining_filter.filter(self.repository.get_matching(criterion))
+        tasks = self.sorter.sort(tasks, sort_by, reverse)
+        return tasks if limit is None else tasks[:limit]
 
-        # Fetch tasks with SQL filtering (repository.get_filtered() may optimize)
-        tasks = self.repository.get_filtered(**sql_params)
+    def count_filtered_tasks(self, filter_obj: TaskFilter | None = None) -> int:
+        """Count the tasks get_filtered_tasks() returns without a limit.
 
-        # Apply remaining complex filters in Python (if any)
-        if remaining_filter:
-            tasks = remaining_filter.filter(tasks)
+        Args:
+            filter_obj: Optional filter object to apply. If None, counts all tasks.
 
-        # Sort tasks
-        return self.sorter.sort(tasks, sort_by, reverse)
+        Returns:
+            Number of tasks matching the filter
+        """
+        criterion, remaining_filter = self._split_filter(filter_obj)
+        if remaining_filter is None:
+            return self.repository.count_matching(criterion)
+        return len(remaining_filter.filter(self.repository.get_matching(criterion)))
 
     def get_executable_tasks(
         self, tags: list[str] | None = None, limit: int = 10
@@ -96,10 +123,16 @@ class TaskQueryService(QueryService):
         Executable = PENDING/IN_PROGRESS, not archived, every dependency COMPLETED.
         Order: IN_PROGRESS before PENDING; then deadline asc (None last);
         then priority desc; then estimated_duration asc (None last); then id asc.
+
+        With a ready index the first ``limit`` tasks are popped from its heap
+        instead of loading and sorting every task.
         """
+        if self._ready_index is not None:
+            return self._ready_index.top(limit, tags)
+
         # Load the full task universe (incl. archived/completed) so a dependency's
         # status can be resolved even after it was archived post-completion.
-        # Fetched unsorted: the candidates are re-sorted by _executable_sort_key below.
+        # Fetched unsorted: the candidates are re-sorted by executable_sort_key below.
         all_tasks = self.repository.get_all()
         status_by_id = {t.id: t.status for t in all_tasks}
 
@@ -116,13 +149,14 @@ class TaskQueryService(QueryService):
             and (not tags or any(tag in t.tags for tag in tags))
             and deps_met(t)
         ]
-        candidates.sort(key=self._executable_sort_key)
+        candidates.sort(key=self.executable_sort_key)
         return candidates[:limit]
 
     @staticmethod
-    def _executable_sort_key(
+    def executable_sort_key(
         task: Task,
     ) -> tuple[int, bool, datetime, int, bool, float, int | None]:
+        """Rank of an executable task (lower comes first), unique per task."""
         status_tier = 0 if task.status == TaskStatus.IN_PROGRESS else 1
         has_deadline = task.deadline is None  # False (0) sorts before True (1)
         deadline = task.deadline or datetime.max
@@ -135,180 +169,49 @@ class TaskQueryService(QueryService):
         )
         return (status_tier, has_deadline, deadline, priority, has_est, est, task.id)
 
-    def _extract_sql_params(self, filter_obj: TaskFilter | None) -> dict[str, Any]:
-        """Extract SQL-compatible filter parameters from filter object.
+    def _split_filter(
+        self, filter_obj: TaskFilter | None
+    ) -> tuple[TaskCriterion | None, TaskFilter | None]:
+        """Split a filter into the part the repository applies and the rest.
 
-        Walks through the filter chain and extracts parameters that can be
-        handled by repository.get_filtered() at the SQL level.
+        Filters expressible as a TaskCriterion go to the repository query.
+        In an AND composition, the sub-filters that are not expressible are
+        left for Python while the others are still pushed down.
 
         Args:
-            filter_obj: Filter object to extract from
+            filter_obj: Filter to split
 
         Returns:
-            Dictionary of SQL filter parameters
+            Tuple of (criterion for the repository or None, filter to apply
+            in Python afterwards or None)
         """
         from taskdog_core.application.queries.filters.composite_filter import (
             CompositeFilter,
         )
-        from taskdog_core.application.queries.filters.date_range_filter import (
-            DateRangeFilter,
-        )
-        from taskdog_core.application.queries.filters.non_archived_filter import (
-            NonArchivedFilter,
-        )
-        from taskdog_core.application.queries.filters.status_filter import StatusFilter
-        from taskdog_core.application.queries.filters.tag_filter import TagFilter
-
-        params = self._get_default_sql_params()
 
         if not filter_obj:
-            return params
-
-        # Dispatch to the appropriate handler based on filter type
-        if isinstance(filter_obj, CompositeFilter):
-            self._handle_composite_filter(params, filter_obj)
-        elif isinstance(filter_obj, NonArchivedFilter):
-            self._handle_non_archived_filter(params)
-        elif isinstance(filter_obj, StatusFilter):
-            self._handle_status_filter(params, filter_obj)
-        elif isinstance(filter_obj, TagFilter):
-            self._handle_tag_filter(params, filter_obj)
-        elif isinstance(filter_obj, DateRangeFilter):
-            self._handle_date_range_filter(params, filter_obj)
-
-        return params
-
-    def _get_default_sql_params(self) -> dict[str, Any]:
-        """Get default SQL filter parameters.
-
-        Returns:
-            Dictionary with default values for all SQL parameters
-        """
-        return {
-            "include_archived": True,
-            "status": None,
-            "tags": None,
-            "match_all_tags": False,
-            "start_date": None,
-            "end_date": None,
-        }
-
-    def _handle_non_archived_filter(self, params: dict[str, Any]) -> None:
-        """Handle NonArchivedFilter by setting include_archived to False.
+            return None, None
 
-        Args:
-            params: SQL parameters dictionary to update
-        """
-        params["include_archived"] = False
+        criterion = filter_obj.to_criterion()
+        if criterion is not None:
+            return criterion, None
 
-    def _handle_status_filter(
-        self, params: dict[str, Any], filter_obj: StatusFilter
-    ) -> None:
-        """Handle StatusFilter by extracting status value.
+        if not isinstance(filter_obj, CompositeFilter):
+            return None, filter_obj
 
-        Args:
-            params: SQL parameters dictionary to update
-            filter_obj: StatusFilter instance
-        """
-        params["status"] = filter_obj.status
-
-    def _handle_tag_filter(self, params: dict[str, Any], filter_obj: TagFilter) -> None:
-        """Handle TagFilter by extracting tags and match_all flag.
-
-        Args:
-            params: SQL parameters dictionary to update
-            filter_obj: TagFilter instance
-        """
-        params["tags"] = filter_obj.tags
-        params["match_all_tags"] = filter_obj.match_all
-
-    def _handle_date_range_filter(
-        self, params: dict[str, Any], filter_obj: DateRangeFilter
-    ) -> None:
-        """Handle DateRangeFilter by extracting start_date and end_date.
-
-        Args:
-            params: SQL parameters dictionary to update
-            filter_obj: DateRangeFilter instance
-        """
-        params["start_date"] = filter_obj.start_date
-        params["end_date"] = filter_obj.end_date
-
-    def _handle_composite_filter(
-        self, params: dict[str, Any], filter_obj: CompositeFilter
-    ) -> None:
-        """Handle CompositeFilter by recursively processing sub-filters.
-
-        Args:
-            params: SQL parameters dictionary to update
-            filter_obj: CompositeFilter instance
-        """
+        criteria: list[TaskCriterion] = []
+        remaining: list[TaskFilter] = []
         for sub_filter in filter_obj.filters:
-            sub_params = self._extract_sql_params(sub_filter)
-            self._merge_sql_params(params, sub_params)
-
-    def _merge_sql_params(
-        self, params: dict[str, Any], sub_params: dict[str, Any]
-    ) -> None:
-        """Merge sub-filter parameters into main parameters.
-
-        Uses the following merge logic:
-        - For include_archived: Use AND logic (False takes precedence)
-        - For other fields: Prefer non-None values from sub_params
-
-        Args:
-            params: Main parameters dictionary to update
-            sub_params: Sub-filter parameters to merge
-        """
-        for key, value in sub_params.items():
-            if value is not None and (params[key] is None or key == "include_archived"):
-                if key == "include_archived":
-                    # For archived, use AND logic (False takes precedence)
-                    params[key] = params[key] and value
-                else:
-                    params[key] = value
-
-    def _get_remaining_filter(self, filter_obj: TaskFilter | None) -> TaskFilter | None:
-        """Get filters that cannot be handled by SQL and need Python processing.
-
-        Some filters have complex logic that cannot be easily translated to
-        SQL WHERE clauses and need to be applied in Python.
+            sub_criterion, sub_remaining = self._split_filter(sub_filter)
+            if sub_criterion is not None:
+                criteria.append(sub_criterion)
+            if sub_remaining is not None:
+                remaining.append(sub_remaining)
 
-        Args:
-            filter_obj: Original filter object
-
-        Returns:
-            Filter object with only complex filters, or None if all filters are SQL-compatible
-        """
-        from taskdog_core.application.queries.filters.composite_filter import (
-            CompositeFilter,
-        )
-        from taskdog_core.application.queries.filters.incomplete_filter import (
-            IncompleteFilter,
-        )
-
-        if not filter_obj:
-            return None
-
-        # Check if filter contains complex filters that need Python processing
-        if isinstance(filter_obj, IncompleteFilter):
-            # IncompleteFilter uses task.is_finished property
-            return filter_obj
-
-        if isinstance(filter_obj, CompositeFilter):
-            # Check sub-filters in CompositeFilter
-            complex_filters: list[TaskFilter] = []
-            for sub_filter in filter_obj.filters:
-                remaining = self._get_remaining_filter(sub_filter)
-                if remaining:
-                    complex_filters.append(remaining)
-
-            if len(complex_filters) == 1:
-                return complex_filters[0]
-            if len(complex_filters) > 1:
-                return CompositeFilter(complex_filters)
-
-        return None
+        pushed = AllOf(tuple(criteria)) if criteria else None
+        if len(remaining) > 1:
+            return pushed, CompositeFilter(remaining)
+        return pushed, remaining[0] if remaining else None
 
     def get_all_tags(self) -> dict[str, int]:
         """Get all unique tags with their task counts.
@@ -384,6 +287,53 @@ class TaskQueryService(QueryService):
 
         range_start, range_end = date_range
 
+        def fetch(start: date, end: date) -> GanttOverlayWindow:
+            return self._fetch_overlay_window(tasks, start, end, holiday_checker)
+
+        if self._overlay_cache is None:
+            window = fetch(range_start, range_end)
+        else:
+            window = self._overlay_cache.get_or_fetch(
+                (task.id for task in tasks if task.id is not None),
+                range_start,
+                range_end,
+                holiday_checker,
+                fetch,
+            )
+
+        # Calculate total estimated duration
+        total_estimated = sum(
+            task.estimated_duration
+            for task in tasks
+            if task.estimated_duration is not None
+        )
+
+        return GanttOverlay(
+            date_range=GanttDateRange(start_date=range_start, end_date=range_end),
+            task_daily_hours=window.task_daily_hours,
+            daily_workload=window.daily_workload,
+            holidays=window.holidays,
+            total_estimated_duration=total_estimated,
+        )
+
+    def _fetch_overlay_window(
+        self,
+        tasks: list[Task],
+        range_start: date,
+        range_end: date,
+        holiday_checker: IHolidayChecker | None,
+    ) -> GanttOverlayWindow:
+        """Fetch allocations, workload totals and holidays for a date window.
+
+        Args:
+            tasks: Tasks listed in the chart
+            range_start: First day of the window
+            range_end: Last day of the window
+            holiday_checker: Optional holiday checker for pre-computing holidays
+
+        Returns:
+            GanttOverlayWindow with the window's overlay data
+        """
         # Get all task IDs for bulk allocation fetch
         task_ids = [task.id for task in tasks if task.id is not None]
 
@@ -411,19 +361,12 @@ class TaskQueryService(QueryService):
         if holiday_checker:
             holidays = holiday_checker.get_holidays_in_range(range_start, range_end)
 
-        # Calculate total estimated duration
-        total_estimated = sum(
-            task.estimated_duration
-            for task in tasks
-            if task.estimated_duration is not None
-        )
-
-        return GanttOverlay(
-            date_range=GanttDateRange(start_date=range_start, end_date=range_end),
+        return GanttOverlayWindow(
+            start_date=range_start,
+            end_date=range_end,
             task_daily_hours=task_daily_hours,
             daily_workload=daily_workload,
             holidays=holidays,
-            total_estimated_duration=total_estimated,
         )
 
     def _calculate_daily_workload(
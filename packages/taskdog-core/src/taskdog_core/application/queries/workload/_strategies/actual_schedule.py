@@ -148,25 +148,19 @@ class ActualScheduleStrategy(WorkloadCalculationStrategy):
         planned_start = task.planned_start.date()
         planned_end = task.planned_end.date()
 
-        # Count working days (weekdays excluding holidays) in the scheduled period
-        working_day_count = self.count_working_days(planned_start, planned_end)
+        # Working days (weekdays excluding holidays) in the scheduled period
+        working_days = self.working_days_between(planned_start, planned_end)
 
-        if working_day_count > 0:
+        if working_days:
             # Period contains working days -> distribute across working days only
-            hours_per_day = task.estimated_duration / working_day_count
-            result: dict[date, float] = {}
-            current_date = planned_start
-            while current_date <= planned_end:
-                if self.is_working_day(current_date):
-                    result[current_date] = hours_per_day
-                current_date += timedelta(days=1)
-            return result
+            hours_per_day = task.estimated_duration / len(working_days)
+            return dict.fromkeys(working_days, hours_per_day)
         # Period has only non-working days -> distribute across all days
         total_days = (planned_end - planned_start).days + 1
         if total_days == 0:
             return {}
         hours_per_day = task.estimated_duration / total_days
-        result = {}
+        result: dict[date, float] = {}
         current_date = planned_start
         while current_date <= planned_end:
             result[current_date] = hours_per_day
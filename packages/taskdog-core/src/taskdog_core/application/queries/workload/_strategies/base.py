@@ -1,11 +1,11 @@
 """Base class for workload calculation strategies."""
 
 from abc import ABC, abstractmethod
-from datetime import date, timedelta
+from datetime import date
 from typing import TYPE_CHECKING
 
+from taskdog_core.application.utils.workday_calendar import WorkdayCalendar
 from taskdog_core.domain.entities.task import Task
-from taskdog_core.shared.utils.date_utils import is_weekday
 
 if TYPE_CHECKING:
     from taskdog_core.domain.services.holiday_checker import IHolidayChecker
@@ -36,10 +36,11 @@ class WorkloadCalculationStrategy(ABC):
 
     ## Common Utilities
 
-    - `is_working_day(date)`: Check if a date is a working day (weekday AND non-holiday)
-    - `count_working_days(start, end)`: Count working days in a date range
+    - `working_days_between(start, end)`: List working days in a date range
 
-    These utilities ensure consistent working day logic across all strategies.
+    This utility ensures consistent working day logic across all strategies.
+    It is backed by a WorkdayCalendar, so holidays are fetched once per
+    year and each query is linear in the days returned.
     """
 
     def __init__(self, holiday_checker: "IHolidayChecker | None" = None):
@@ -50,6 +51,7 @@ class WorkloadCalculationStrategy(ABC):
                            If None, only weekends are excluded (weekday check only).
         """
         self.holiday_checker = holiday_checker
+        self._workdays = WorkdayCalendar(holiday_checker)
 
     @abstractmethod
     def compute_from_planned_period(self, task: Task) -> dict[date, float]:
@@ -67,35 +69,14 @@ class WorkloadCalculationStrategy(ABC):
             Empty dict if task is missing required fields.
         """
 
-    def is_working_day(self, check_date: date) -> bool:
-        """Check if a date is a working day (weekday and not a holiday).
-
-        Args:
-            check_date: Date to check
-
-        Returns:
-            True if the date is a working day, False otherwise
-        """
-        if not is_weekday(check_date):
-            return False
-        return not (
-            self.holiday_checker and self.holiday_checker.is_holiday(check_date)
-        )
-
-    def count_working_days(self, start_date: date, end_date: date) -> int:
-        """Count working days (weekdays excluding holidays) in a date range.
+    def working_days_between(self, start_date: date, end_date: date) -> list[date]:
+        """List working days (weekdays excluding holidays) in a date range.
 
         Args:
             start_date: Start date (inclusive)
             end_date: End date (inclusive)
 
         Returns:
-            Number of working days
+            Working days in ascending order
         """
-        count = 0
-        current_date = start_date
-        while current_date <= end_date:
-            if self.is_working_day(current_date):
-                count += 1
-            current_date += timedelta(days=1)
-        return count
+        return self._workdays.workdays_between(start_date, end_date)
@@ -0,0 +1,245 @@
+"""In-memory dependency graph kept in topological order as tasks change."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from taskdog_core.domain.entities.task import Task
+    from taskdog_core.domain.repositories.task_repository import TaskRepository
+
+
+def find_dependency_path(
+    source: int,
+    goal: int,
+    edges: Mapping[int, Iterable[int]],
+    within: Callable[[int], bool] | None = None,
+    visited: set[int] | None = None,
+) -> list[int] | None:
+    """Depth-first search for a path along dependency edges.
+
+    Iterative, so long dependency chains cannot exceed the recursion limit.
+    Edges are followed in their stored order, so the path found is the one
+    a recursive DFS would find.
+
+    Args:
+        source: Task ID to start from
+        goal: Task ID to reach
+        edges: Edges to follow per task ID (missing IDs have none)
+        within: Only enter tasks for which this returns True (the goal is
+            always entered)
+        visited: Filled with the task IDs explored
+
+    Returns:
+        Task IDs from source to goal, or None if goal is unreachable
+    """
+    if visited is None:
+        visited = set()
+    if source == goal:
+        return [source]
+    visited.add(source)
+    path = [source]
+    stack = [iter(edges.get(source, ()))]
+    while stack:
+        for next_id in stack[-1]:
+            if next_id == goal:
+                return [*path, goal]
+            if next_id in visited or (within is not None and not within(next_id)):
+                continue
+            visited.add(next_id)
+            path.append(next_id)
+            stack.append(iter(edges.get(next_id, ())))
+            break
+        else:
+            stack.pop()
+            path.pop()
+    return None
+
+
+class DependencyGraphIndex:
+    """Thread-safe dependency graph with incremental cycle detection.
+
+    Register task_changed() with TaskRepository.add_change_listener(). The
+    graph is loaded from the repository in a single pass on first use.
+
+    The index keeps a topological order of the tasks (a task comes before
+    the tasks it depends on) with the Pearce-Kelly algorithm: a new
+    dependency that already agrees with the order needs no search, and one
+    that does not only searches and reorders the tasks ranked between its
+    two ends. If stored dependencies form a cycle (e.g. written by an older
+    version), the order is dropped until the cycle is removed and cycle
+    checks search the whole reachable graph instead.
+    """
+
+    def __init__(self, repository: TaskRepository):
+        """Initialize the index.
+
+        Args:
+            repository: Repository to load the dependencies from
+        """
+        self._repository = repository
+        self._lock = threading.Lock()
+        self._loaded = False
+        # Task -> tasks it depends on (in depends_on order), and the reverse
+        self._depends_on: dict[int, list[int]] = {}
+        self._dependents: dict[int, set[int]] = {}
+        # Topological rank per task; None while the graph has a cycle
+        self._rank: dict[int, int] | None = {}
+        self._next_rank = 0
+
+    def task_changed(self, task_id: int, task: Task | None) -> None:
+        """Update the dependencies of a saved or deleted task.
+
+        Tasks depending on a deleted task keep their edge to it, as their
+        stored depends_on does.
+
+        Args:
+            task_id: ID of the changed task
+            task: The saved task, or None if it was deleted
+        """
+        with self._lock:
+            if not self._loaded:
+                return
+            old = self._depends_on.get(task_id, [])
+            new = list(task.depends_on) if task is not None else []
+            if new == old:
+                return
+            for dep_id in set(old) - set(new):
+                self._dependents[dep_id].discard(task_id)
+            kept = [dep_id for dep_id in new if dep_id in old]
+            self._depends_on[task_id] = kept
+
+            # Edges are added one at a time so the order holds for all the
+            # others while each is inserted
+            for dep_id in new:
+                if dep_id in old:
+                    continue
+                kept.append(dep_id)
+                self._dependents.setdefault(dep_id, set()).add(task_id)
+                if self._rank is not None and not self._insert_edge(task_id, dep_id):
+                    # Recomputed on next use, once the cycle may be gone
+                    self._rank = None
+            self._depends_on[task_id] = new
+            if not new:
+                del self._depends_on[task_id]
+
+    def detect_cycle(self, start_task_id: int, target_task_id: int) -> list[int] | None:
+        """Detect if adding a dependency would create a cycle.
+
+        Args:
+            start_task_id: The task that would depend on target_task_id
+            target_task_id: The task to be added as a dependency
+
+        Returns:
+            Task IDs of the path from target_task_id back to start_task_id
+            if the dependency would close a cycle, None otherwise
+        """
+        with self._lock:
+            self._load()
+            if self._rank is None:
+                self._rank = self._topological_rank()
+            rank = self._rank
+            if rank is None:
+                return find_dependency_path(
+                    target_task_id, start_task_id, self._depends_on
+                )
+            if start_task_id == target_task_id:
+                return [start_task_id]
+            upper = rank.get(start_task_id)
+            if upper is None or upper < rank.get(target_task_id, upper + 1):
+                return None
+            # Only tasks ranked at or before start_task_id can lead back to it
+            return find_dependency_path(
+                target_task_id,
+                start_task_id,
+                self._depends_on,
+                within=lambda task_id: rank.get(task_id, upper + 1) <= upper,
+            )
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        for task in self._repository.iter_all():
+            assert task.id is not None
+            if task.depends_on:
+                self._depends_on[task.id] = list(task.depends_on)
+                for dep_id in task.depends_on:
+                    self._dependents.setdefault(dep_id, set()).add(task.id)
+        self._rank = self._topological_rank()
+        self._loaded = True
+
+    def _topological_rank(self) -> dict[int, int] | None:
+        """Rank every task with edges using Kahn's algorithm, None on a cycle."""
+        pending = {
+            task_id: len(dependents)
+            for task_id, dependents in self._dependents.items()
+            if dependents
+        }
+        ready = deque(task_id for task_id in self._depends_on if task_id not in pending)
+        rank: dict[int, int] = {}
+        while ready:
+            task_id = ready.popleft()
+            rank[task_id] = len(rank)
+            for dep_id in set(self._depends_on.get(task_id, ())):
+                pending[dep_id] -= 1
+                if not pending[dep_id]:
+                    ready.append(dep_id)
+        if any(pending.values()):
+            return None
+        self._next_rank = len(rank)
+        return rank
+
+    def _insert_edge(self, task_id: int, dep_id: int) -> bool:
+        """Restore the order after task_id started depending on dep_id.
+
+        Returns:
+            False if the new edge closed a cycle
+        """
+        rank = self._rank
+        assert rank is not None
+        for node in (task_id, dep_id):
+            if node not in rank:
+                rank[node] = self._next_rank
+                self._next_rank += 1
+        lower, upper = rank[dep_id], rank[task_id]
+        if lower > upper:
+            return True
+        if task_id == dep_id:
+            return False
+
+        # Tasks dep_id depends on, ranked up to task_id: reaching task_id
+        # means a cycle
+        forward: set[int] = set()
+        if (
+            find_dependency_path(
+                dep_id,
+                task_id,
+                self._depends_on,
+                within=lambda node: rank[node] <= upper,
+                visited=forward,
+            )
+            is not None
+        ):
+            return False
+        # Tasks depending on task_id, ranked from dep_id on
+        backward: set[int] = set()
+        find_dependency_path(
+            task_id,
+            dep_id,
+            self._dependents,
+            within=lambda node: rank[node] >= lower,
+            visited=backward,
+        )
+
+        # Reuse the ranks of the affected tasks: everything that leads to
+        # task_id now comes before everything dep_id leads to
+        moved = sorted(backward, key=rank.__getitem__) + sorted(
+            forward, key=rank.__getitem__
+        )
+        for node, new_rank in zip(moved, sorted(rank[n] for n in moved), strict=True):
+            rank[node] = new_rank
+        return True
@@ -1,5 +1,9 @@
 """Service for dependency graph operations."""
 
+from taskdog_core.application.services.dependency_graph_index import (
+    DependencyGraphIndex,
+    find_dependency_path,
+)
 from taskdog_core.domain.repositories.task_repository import TaskRepository
 
 
@@ -10,13 +14,21 @@ class DependencyGraphService:
     cycle detection, path finding, and dependency validation.
     """
 
-    def __init__(self, repository: TaskRepository):
+    def __init__(
+        self,
+        repository: TaskRepository,
+        graph_index: DependencyGraphIndex | None = None,
+    ):
         """Initialize service with repository.
 
         Args:
             repository: Task repository for accessing task data
+            graph_index: Optional in-memory dependency graph kept up to date
+                by repository change listeners; without it the reachable
+                tasks are loaded from the repository on each check
         """
         self.repository = repository
+        self.graph_index = graph_index
 
     def detect_cycle(self, start_task_id: int, target_task_id: int) -> list[int] | None:
         """Detect if adding a dependency would create a cycle using DFS.
@@ -33,45 +45,12 @@ class DependencyGraphService:
             List of task IDs forming the cycle if detected, None otherwise.
             Example: [1, 2, 3, 1] means task1→task2→task3→task1
         """
-        adjacency = self._load_reachable_adjacency(target_task_id)
-
-        visited: set[int] = set()
-        rec_stack: list[int] = []
-
-        def dfs(current_id: int) -> bool:
-            """Depth-first search to detect if we can reach start_task_id.
-
-            Args:
-                current_id: Current task ID being explored
-
-            Returns:
-                True if we can reach start_task_id, False otherwise
-            """
-            # If we reached the start task, we found a cycle
-            if current_id == start_task_id:
-                rec_stack.append(current_id)
-                return True
-
-            # If already visited in this path, no cycle here
-            if current_id in visited:
-                return False
+        if self.graph_index is not None:
+            return self.graph_index.detect_cycle(start_task_id, target_task_id)
 
-            visited.add(current_id)
-            rec_stack.append(current_id)
-
-            for dep_id in adjacency.get(current_id, []):
-                if dfs(dep_id):
-                    return True
-
-            rec_stack.pop()
-            return False
-
-        # Start DFS from the target task
         # If we can reach start_task from target_task, adding the dependency creates a cycle
-        if dfs(target_task_id):
-            return rec_stack.copy()
-
-        return None
+        adjacency = self._load_reachable_adjacency(target_task_id)
+        return find_dependency_path(target_task_id, start_task_id, adjacency)
 
     def _load_reachable_adjacency(self, root_id: int) -> dict[int, list[int]]:
         """Load the depends_on adjacency of the subgraph reachable from root_id.
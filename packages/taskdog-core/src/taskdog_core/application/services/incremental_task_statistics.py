@@ -0,0 +1,167 @@
+"""Task statistics kept up to date as tasks change."""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from taskdog_core.application.services.statistics_accumulator import (
+    StatisticsAccumulator,
+    TaskContribution,
+)
+from taskdog_core.application.services.task_statistics_calculator import (
+    TaskStatisticsCalculator,
+)
+
+if TYPE_CHECKING:
+    from taskdog_core.application.dto.statistics_output import StatisticsOutput
+    from taskdog_core.domain.entities.task import Task
+    from taskdog_core.domain.repositories.task_repository import TaskRepository
+    from taskdog_core.domain.services.time_provider import ITimeProvider
+
+
+@dataclass
+class _PeriodWindow:
+    """Counts for a sliding period ('7d' or '30d').
+
+    Tasks that ended before the start of the period leave it as time
+    passes, so they are kept in a heap by end time and taken out when the
+    period is next read.
+    """
+
+    period: str
+    accumulator: StatisticsAccumulator = field(default_factory=StatisticsAccumulator)
+    members: set[int] = field(default_factory=set)
+    by_end: list[tuple[datetime, int]] = field(default_factory=list)
+
+    def add(self, task_id: int, contribution: TaskContribution, now: datetime) -> None:
+        if not contribution.in_period(
+            TaskStatisticsCalculator.period_start(self.period, now)
+        ):
+            return
+        self.accumulator.add(contribution)
+        self.members.add(task_id)
+        if contribution.actual_end is not None:
+            heapq.heappush(self.by_end, (contribution.actual_end, task_id))
+
+    def remove(self, task_id: int, contribution: TaskContribution) -> None:
+        if task_id in self.members:
+            self.members.remove(task_id)
+            self.accumulator.remove(contribution)
+
+    def advance(
+        self, now: datetime, contributions: dict[int, TaskContribution]
+    ) -> None:
+        since = TaskStatisticsCalculator.period_start(self.period, now)
+        assert since is not None
+        while self.by_end and self.by_end[0][0] < since:
+            end, task_id = heapq.heappop(self.by_end)
+            contribution = contributions.get(task_id)
+            # Entries of tasks that changed since they were pushed are stale
+            if contribution is not None and contribution.actual_end == end:
+                self.remove(task_id, contribution)
+
+
+class IncrementalTaskStatistics:
+    """Task statistics updated per changed task instead of recomputed.
+
+    Register task_changed() with TaskRepository.add_change_listener() and
+    each save or delete moves just that task's contribution between the
+    counts, e.g. when it is completed, canceled or reopened. The counts for
+    all tasks and for the '7d' and '30d' periods are loaded from the
+    repository in a single pass on first use.
+    """
+
+    def __init__(
+        self,
+        repository: TaskRepository,
+        time_provider: ITimeProvider | None = None,
+        calculator: TaskStatisticsCalculator | None = None,
+    ):
+        """Initialize the statistics.
+
+        Args:
+            repository: Repository to load the initial counts from
+            time_provider: Clock for the sliding periods (default: system time)
+            calculator: Calculator building the output from the counts
+        """
+        self._repository = repository
+        self._time_provider = time_provider
+        self._calculator = calculator or TaskStatisticsCalculator()
+        self._lock = threading.Lock()
+        self._contributions: dict[int, TaskContribution] | None = None
+        self._all = StatisticsAccumulator()
+        self._windows = {
+            period: _PeriodWindow(period)
+            for period in TaskStatisticsCalculator.PERIOD_DAYS
+        }
+
+    def task_changed(self, task_id: int, task: Task | None) -> None:
+        """Update the counts for a saved or deleted task.
+
+        Args:
+            task_id: ID of the changed task
+            task: The saved task, or None if it was deleted
+        """
+        with self._lock:
+            if self._contributions is None:
+                return
+            now = self._now()
+            old = self._contributions.pop(task_id, None)
+            if old is not None:
+                self._all.remove(old)
+                for window in self._windows.values():
+                    window.remove(task_id, old)
+            if task is not None:
+                self._add(task_id, TaskContribution.from_task(task, task_id), now)
+
+    def calculate(self, period: str = "all") -> StatisticsOutput:
+        """Calculate statistics from the current counts.
+
+        Args:
+            period: Time period filter ('7d', '30d', or 'all')
+
+        Returns:
+            StatisticsOutput containing all calculated statistics
+        """
+        now = self._now()
+        with self._lock:
+            contributions = self._load(now)
+            for window in self._windows.values():
+                window.advance(now, contributions)
+
+            if period != "all":
+                aggregates = self._windows[period].accumulator.aggregates()
+            else:
+                # Finished tasks in the sliding periods are the trend counts
+                aggregates = replace(
+                    self._all.aggregates(),
+                    completions_since=[
+                        window.accumulator.finished_count
+                        for window in self._windows.values()
+                    ],
+                )
+        return self._calculator.calculate_from_aggregates(aggregates, period)
+
+    def _now(self) -> datetime:
+        if self._time_provider is None:
+            return datetime.now()
+        return self._time_provider.now()
+
+    def _load(self, now: datetime) -> dict[int, TaskContribution]:
+        if self._contributions is None:
+            self._contributions = {}
+            for task in self._repository.iter_all():
+                assert task.id is not None
+                self._add(task.id, TaskContribution.from_task(task), now)
+        return self._contributions
+
+    def _add(self, task_id: int, contribution: TaskContribution, now: datetime) -> None:
+        assert self._contributions is not None
+        self._contributions[task_id] = contribution
+        self._all.add(contribution)
+        for window in self._windows.values():
+            window.add(task_id, contribution, now)
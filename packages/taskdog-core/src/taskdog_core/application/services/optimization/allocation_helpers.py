@@ -36,25 +36,6 @@ def prepare_task_for_allocation(task: Task) -> Task | None:
     return task_copy
 
 
-def calculate_available_hours(
-    daily_allocations: dict[date, float],
-    date_obj: date,
-    max_hours_per_day: float,
-) -> float:
-    """Calculate available hours for a specific date.
-
-    Args:
-        daily_allocations: Current daily allocations
-        date_obj: Date to check
-        max_hours_per_day: Maximum work hours per day
-
-    Returns:
-        Available hours (0.0 if fully allocated)
-    """
-    current_allocation = daily_allocations.get(date_obj, 0.0)
-    return max_hours_per_day - current_allocation
-
-
 def set_planned_times(
     task: Task,
     schedule_start: datetime,
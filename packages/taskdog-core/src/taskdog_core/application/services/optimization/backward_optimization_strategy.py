@@ -7,14 +7,15 @@ from taskdog_core.application.dto.optimize_params import OptimizeParams
 from taskdog_core.application.dto.optimize_result import OptimizeResult
 from taskdog_core.application.services.optimization.allocation_helpers import (
     SCHEDULE_START_TIME,
-    calculate_available_hours,
     prepare_task_for_allocation,
     set_planned_times,
 )
+from taskdog_core.application.services.optimization.capacity_calendar import (
+    CapacityCalendar,
+)
 from taskdog_core.application.services.optimization.optimization_strategy import (
     OptimizationStrategy,
 )
-from taskdog_core.application.utils.date_helper import is_workday
 from taskdog_core.domain.entities.task import Task
 from taskdog_core.shared.constants import DEFAULT_SCHEDULE_DAYS
 
@@ -38,14 +39,15 @@ class BackwardOptimizationStrategy(OptimizationStrategy):
         params: OptimizeParams,
     ) -> OptimizeResult:
         """Optimize task schedules using backward allocation."""
-        # Copy existing allocations to avoid mutating the input
-        daily_allocations = dict(existing_allocations)
-        result = OptimizeResult(daily_allocations=daily_allocations)
+        # The calendar copies existing allocations to avoid mutating the input
+        calendar = CapacityCalendar.from_params(params, existing_allocations)
+        result = OptimizeResult(daily_allocations=calendar.allocations)
 
         sorted_tasks = self._sort_tasks(tasks, params.start_date)
 
         for task in sorted_tasks:
-            updated_task = self._allocate_task(task, daily_allocations, params)
+            params.raise_if_cancelled()
+            updated_task = self._allocate_task(task, calendar, params)
             if updated_task:
                 result.tasks.append(updated_task)
             else:
@@ -67,10 +69,15 @@ class BackwardOptimizationStrategy(OptimizationStrategy):
     def _allocate_task(
         self,
         task: Task,
-        daily_allocations: dict[date, float],
+        calendar: CapacityCalendar,
         params: OptimizeParams,
     ) -> Task | None:
-        """Allocate task using backward allocation from deadline."""
+        """Allocate task using backward allocation from deadline.
+
+        Days without free capacity are skipped with calendar.last_fit(), and
+        tasks that cannot fit between start_date and the target end fail
+        before any day is visited.
+        """
         task_copy = prepare_task_for_allocation(task)
         if task_copy is None:
             return None
@@ -82,42 +89,36 @@ class BackwardOptimizationStrategy(OptimizationStrategy):
             days=DEFAULT_SCHEDULE_DAYS
         )
 
-        current_date = target_end
+        # Compare at day granularity: allocation is per-day, while start_date
+        # (defaults to now()) and deadline carry times of day (#964)
+        last_day = target_end.date()
         remaining_hours = task_copy.estimated_duration
+        if (
+            calendar.total_free_hours(calendar.origin, last_day)
+            < remaining_hours - 2 * SCHEDULING_EPSILON
+        ):
+            return None
+
         schedule_start = None
         schedule_end = None
         temp_allocations: list[tuple[date, float, datetime]] = []
 
+        next_day = last_day
         while remaining_hours > SCHEDULING_EPSILON:
-            if not params.include_all_days and not is_workday(
-                current_date, params.holiday_checker
-            ):
-                current_date -= timedelta(days=1)
-                continue
-
-            # Compare at day granularity: allocation is per-day, while start_date
-            # (defaults to now()) and deadline carry times of day (#964)
-            if current_date.date() < params.start_date.date():
+            date_obj = calendar.last_fit(next_day)
+            if date_obj is None:
                 return None
 
-            date_obj = current_date.date()
-            available_hours = calculate_available_hours(
-                daily_allocations,
-                date_obj,
-                params.max_hours_per_day,
-            )
-
-            if available_hours > SCHEDULING_EPSILON:
-                allocated = min(remaining_hours, available_hours)
-                temp_allocations.append((date_obj, allocated, current_date))
-                remaining_hours -= allocated
+            allocated = min(remaining_hours, calendar.free_hours(date_obj))
+            current_date = target_end - timedelta(days=(last_day - date_obj).days)
+            temp_allocations.append((date_obj, allocated, current_date))
+            remaining_hours -= allocated
 
-            current_date -= timedelta(days=1)
+            next_day = date_obj - timedelta(days=1)
 
         task_daily_allocations: dict[date, float] = {}
         for date_obj, hours, datetime_obj in reversed(temp_allocations):
-            current_allocation = daily_allocations.get(date_obj, 0.0)
-            daily_allocations[date_obj] = current_allocation + hours
+            calendar.allocate(date_obj, hours)
             task_daily_allocations[date_obj] = hours
 
             if schedule_start is None:
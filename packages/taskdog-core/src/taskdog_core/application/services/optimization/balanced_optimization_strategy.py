@@ -7,17 +7,18 @@ from taskdog_core.application.constants.optimization import SCHEDULING_EPSILON
 from taskdog_core.application.dto.optimize_params import OptimizeParams
 from taskdog_core.application.dto.optimize_result import OptimizeResult
 from taskdog_core.application.services.optimization.allocation_helpers import (
-    calculate_available_hours,
     prepare_task_for_allocation,
     set_planned_times,
 )
+from taskdog_core.application.services.optimization.capacity_calendar import (
+    CapacityCalendar,
+)
 from taskdog_core.application.services.optimization.optimization_strategy import (
     OptimizationStrategy,
 )
 from taskdog_core.application.sorters.optimization_task_sorter import (
     OptimizationTaskSorter,
 )
-from taskdog_core.application.utils.date_helper import is_workday
 from taskdog_core.domain.entities.task import Task
 from taskdog_core.shared.constants import DEFAULT_SCHEDULE_DAYS
 from taskdog_core.shared.utils.date_utils import count_weekdays
@@ -52,14 +53,15 @@ class BalancedOptimizationStrategy(OptimizationStrategy):
         params: OptimizeParams,
     ) -> OptimizeResult:
         """Optimize task schedules using balanced distribution."""
-        # Copy existing allocations to avoid mutating the input
-        daily_allocations = dict(existing_allocations)
-        result = OptimizeResult(daily_allocations=daily_allocations)
+        # The calendar copies existing allocations to avoid mutating the input
+        calendar = CapacityCalendar.from_params(params, existing_allocations)
+        result = OptimizeResult(daily_allocations=calendar.allocations)
 
         sorted_tasks = self._sort_tasks(tasks, params.start_date)
 
         for task in sorted_tasks:
-            updated_task = self._allocate_task(task, daily_allocations, params)
+            params.raise_if_cancelled()
+            updated_task = self._allocate_task(task, calendar, params)
             if updated_task:
                 result.tasks.append(updated_task)
             else:
@@ -75,7 +77,7 @@ class BalancedOptimizationStrategy(OptimizationStrategy):
     def _allocate_task(
         self,
         task: Task,
-        daily_allocations: dict[date, float],
+        calendar: CapacityCalendar,
         params: OptimizeParams,
     ) -> Task | None:
         """Allocate task using balanced distribution with multi-pass approach."""
@@ -94,6 +96,14 @@ class BalancedOptimizationStrategy(OptimizationStrategy):
         if available_weekdays == 0:
             return None
 
+        # Last day d with start_date + d days <= end_date
+        last_day = calendar.origin + timedelta(days=(end_date - params.start_date).days)
+        if (
+            calendar.total_free_hours(calendar.origin, last_day)
+            < task_copy.estimated_duration - 2 * SCHEDULING_EPSILON
+        ):
+            return None
+
         target_hours_per_day = task_copy.estimated_duration / available_weekdays
         state = _AllocationState(
             remaining_hours=task_copy.estimated_duration,
@@ -105,14 +115,14 @@ class BalancedOptimizationStrategy(OptimizationStrategy):
         # Multi-pass allocation until all hours allocated or no capacity
         while state.remaining_hours > SCHEDULING_EPSILON:
             made_progress = self._allocate_single_pass(
-                state, daily_allocations, params, end_date, target_hours_per_day
+                state, calendar, params, last_day, target_hours_per_day
             )
             if not made_progress:
                 break
 
         if state.remaining_hours > SCHEDULING_EPSILON:
             for date_obj, hours in state.task_daily_allocations.items():
-                daily_allocations[date_obj] -= hours
+                calendar.release(date_obj, hours)
             return None
 
         if state.schedule_start and state.task_daily_allocations:
@@ -136,64 +146,51 @@ class BalancedOptimizationStrategy(OptimizationStrategy):
     def _allocate_single_pass(
         self,
         state: _AllocationState,
-        daily_allocations: dict[date, float],
+        calendar: CapacityCalendar,
         params: OptimizeParams,
-        end_date: datetime,
+        last_day: date,
         target_hours_per_day: float,
     ) -> bool:
-        """Execute single allocation pass across all days. Returns True if progress."""
-        made_progress = False
-        current_date = params.start_date
-
-        while current_date <= end_date:
-            if not params.include_all_days and not is_workday(
-                current_date, params.holiday_checker
-            ):
-                current_date += timedelta(days=1)
-                continue
-
-            allocated = self._try_allocate_day(
-                state, daily_allocations, params, current_date, target_hours_per_day
+        """Execute single allocation pass across all days. Returns True if progress.
+
+        Each day is visited at most once per pass, so the pass's allocations
+        are applied to the calendar together at the end.
+        """
+        pass_allocations: dict[date, float] = {}
+
+        for date_obj, available_hours in calendar.iter_free_days(
+            calendar.origin, last_day
+        ):
+            current_date = params.start_date + timedelta(
+                days=(date_obj - calendar.origin).days
             )
-            if allocated:
-                made_progress = True
-                if state.remaining_hours <= SCHEDULING_EPSILON:
-                    break
-
-            current_date += timedelta(days=1)
+            pass_allocations[date_obj] = self._allocate_day(
+                state, current_date, available_hours, target_hours_per_day
+            )
+            if state.remaining_hours <= SCHEDULING_EPSILON:
+                break
 
-        return made_progress
+        calendar.allocate_many(pass_allocations)
+        return bool(pass_allocations)
 
-    def _try_allocate_day(
+    def _allocate_day(
         self,
         state: _AllocationState,
-        daily_allocations: dict[date, float],
-        params: OptimizeParams,
         current_date: datetime,
+        available_hours: float,
         target_hours_per_day: float,
-    ) -> bool:
-        """Try to allocate hours for a single day. Returns True if allocated."""
+    ) -> float:
+        """Allocate hours on a day with free capacity. Returns hours allocated."""
         date_obj = current_date.date()
         desired_allocation = min(target_hours_per_day, state.remaining_hours)
 
-        available_hours = calculate_available_hours(
-            daily_allocations,
-            date_obj,
-            params.max_hours_per_day,
-        )
-
-        if available_hours <= SCHEDULING_EPSILON:
-            return False
-
         if state.schedule_start is None:
             state.schedule_start = current_date
 
         allocated = min(desired_allocation, available_hours)
-        current_allocation = daily_allocations.get(date_obj, 0.0)
-        daily_allocations[date_obj] = current_allocation + allocated
         state.task_daily_allocations[date_obj] = (
             state.task_daily_allocations.get(date_obj, 0.0) + allocated
         )
         state.remaining_hours -= allocated
         state.schedule_end = current_date
-        return True
+        return allocated
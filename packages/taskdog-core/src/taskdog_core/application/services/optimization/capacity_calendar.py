@@ -0,0 +1,438 @@
+"""Remaining daily capacity indexed by a segment tree."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+from taskdog_core.application.constants.optimization import SCHEDULING_EPSILON
+from taskdog_core.application.utils.workday_calendar import WorkdayCalendar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from taskdog_core.application.dto.optimize_params import OptimizeParams
+
+# Initial number of days covered; the calendar doubles on demand
+DEFAULT_HORIZON_DAYS = 64
+
+# Days searched past the covered horizon for a workday before giving up
+MAX_NON_WORKDAY_RUN = 366
+
+
+class CapacityCalendar:
+    """Free hours per day from an origin date, with logarithmic-time queries.
+
+    Each day offset from ``origin`` is a leaf holding the hours still free on
+    that day: ``max_hours_per_day`` minus the allocated hours on workdays, and
+    zero on non-workdays (weekends and holidays, unless all days are
+    included). A segment tree keeps the maximum and the sum of free hours per
+    range, so the strategies can jump straight to the next (or previous) day
+    with capacity and check whether a window can fit a task at all, instead
+    of scanning day by day.
+
+    Days before ``origin`` are never schedulable. The covered horizon grows
+    by doubling when a query or allocation reaches past it.
+
+    ``allocations`` mirrors the plain ``dict[date, float]`` the strategies
+    return as ``OptimizeResult.daily_allocations`` and is updated with the
+    same arithmetic, so results are identical to day-by-day scanning.
+    """
+
+    def __init__(
+        self,
+        origin: date,
+        max_hours_per_day: float,
+        existing_allocations: Mapping[date, float] | None = None,
+        workdays: WorkdayCalendar | None = None,
+        include_all_days: bool = False,
+    ) -> None:
+        """Initialize the calendar.
+
+        Args:
+            origin: First schedulable day
+            max_hours_per_day: Maximum work hours per day
+            existing_allocations: Hours already allocated per day (copied)
+            workdays: Workday index for the mask (None means weekdays only)
+            include_all_days: If True, weekends and holidays have capacity too
+        """
+        self.origin = origin
+        self.max_hours_per_day = max_hours_per_day
+        self.allocations: dict[date, float] = dict(existing_allocations or {})
+        self._workday_calendar = workdays or WorkdayCalendar()
+        self._include_all_days = include_all_days
+
+        last_offset = max(
+            (self._offset(day) for day in self.allocations),
+            default=0,
+        )
+        self._size = 0
+        self._workdays: list[bool] = []
+        self._max: list[float] = []
+        self._sum: list[float] = []
+        self._grow(max(DEFAULT_HORIZON_DAYS, last_offset + 1))
+
+    @classmethod
+    def from_params(
+        cls,
+        params: OptimizeParams,
+        existing_allocations: Mapping[date, float] | None = None,
+    ) -> CapacityCalendar:
+        """Create a calendar for an optimization run.
+
+        Args:
+            params: Optimization parameters (start date, daily limit, workdays)
+            existing_allocations: Hours already allocated per day
+
+        Returns:
+            Calendar starting at params.start_date
+        """
+        return cls(
+            origin=params.start_date.date(),
+            max_hours_per_day=params.max_hours_per_day,
+            existing_allocations=existing_allocations,
+            workdays=params.workdays,
+            include_all_days=params.include_all_days,
+        )
+
+    # Queries
+
+    def free_hours(self, day: date) -> float:
+        """Hours still free on a day (0.0 for non-workdays and past days).
+
+        Args:
+            day: Day to check
+
+        Returns:
+            Free hours
+        """
+        offset = self._offset(day)
+        if offset < 0:
+            return 0.0
+        self._ensure(offset)
+        return self._max[self._size + offset]
+
+    def total_free_hours(self, start: date, end: date) -> float:
+        """Total free hours over an inclusive day range.
+
+        Args:
+            start: First day of the range
+            end: Last day of the range
+
+        Returns:
+            Sum of free hours (0.0 for an empty range)
+        """
+        lo = max(self._offset(start), 0)
+        hi = self._offset(end)
+        if hi < lo:
+            return 0.0
+        self._ensure(hi)
+        total = 0.0
+        lo += self._size
+        hi += self._size + 1
+        while lo < hi:
+            if lo & 1:
+                total += self._sum[lo]
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                total += self._sum[hi]
+            lo >>= 1
+            hi >>= 1
+        return total
+
+    def first_fit(
+        self,
+        start: date,
+        min_free: float = SCHEDULING_EPSILON,
+        end: date | None = None,
+    ) -> date | None:
+        """Find the first day on or after start with more than min_free hours.
+
+        Args:
+            start: Earliest day to consider
+            min_free: Free hours the day must exceed
+            end: Latest day to consider (None means unbounded)
+
+        Returns:
+            Matching day, or None if there is none in range
+        """
+        lo = max(self._offset(start), 0)
+        if end is not None:
+            hi = self._offset(end)
+            if hi < lo:
+                return None
+            self._ensure(hi)
+            offset = self._find_first(lo, min_free)
+            if offset is None or offset > hi:
+                return None
+            return self._day(offset)
+
+        self._ensure(lo)
+        offset = self._find_first(lo, min_free)
+        if offset is not None:
+            return self._day(offset)
+        if min_free >= self.max_hours_per_day:
+            return None
+
+        # Every allocated day lies inside the horizon, so past it the first
+        # workday is entirely free
+        for offset in range(self._size, self._size + MAX_NON_WORKDAY_RUN):
+            day = self._day(offset)
+            if self._include_all_days or self._workday_calendar.is_workday(day):
+                return day
+        return None
+
+    def last_fit(
+        self,
+        end: date,
+        min_free: float = SCHEDULING_EPSILON,
+        start: date | None = None,
+    ) -> date | None:
+        """Find the latest day on or before end with more than min_free hours.
+
+        Args:
+            end: Latest day to consider
+            min_free: Free hours the day must exceed
+            start: Earliest day to consider (never before the origin)
+
+        Returns:
+            Matching day, or None if there is none in range
+        """
+        lo = 0 if start is None else max(self._offset(start), 0)
+        hi = self._offset(end)
+        if hi < lo:
+            return None
+        self._ensure(hi)
+        offset = self._find_last(hi, min_free)
+        if offset is None or offset < lo:
+            return None
+        return self._day(offset)
+
+    def iter_free_days(
+        self,
+        start: date,
+        end: date,
+        min_free: float = SCHEDULING_EPSILON,
+    ) -> Iterator[tuple[date, float]]:
+        """Iterate over days in an inclusive range with more than min_free hours.
+
+        Consecutive matches cost amortized constant time, so a full pass over
+        a window is linear in the number of matching days.
+
+        Args:
+            start: First day of the range
+            end: Last day of the range
+            min_free: Free hours a day must exceed
+
+        Yields:
+            (day, free_hours) pairs in date order
+        """
+        lo = max(self._offset(start), 0)
+        hi = self._offset(end)
+        if hi < lo:
+            return
+        self._ensure(hi)
+        offset = self._find_first(lo, min_free)
+        while offset is not None and offset <= hi:
+            yield self._day(offset), self._max[self._size + offset]
+            if offset == hi:
+                return
+            offset = self._find_first(offset + 1, min_free)
+
+    # Updates
+
+    def allocate(self, day: date, hours: float) -> None:
+        """Add hours to a day's allocation.
+
+        Args:
+            day: Day to allocate on
+            hours: Hours to add
+        """
+        self.allocations[day] = self.allocations.get(day, 0.0) + hours
+        self._refresh(day)
+
+    def allocate_many(self, hours_by_day: Mapping[date, float]) -> None:
+        """Add hours to several days, updating the tree once per node.
+
+        Args:
+            hours_by_day: Hours to add per day
+        """
+        if not hours_by_day:
+            return
+        for day, hours in hours_by_day.items():
+            self.allocations[day] = self.allocations.get(day, 0.0) + hours
+        offsets = [
+            (self._offset(day), day) for day in hours_by_day if self._offset(day) >= 0
+        ]
+        if not offsets:
+            return
+        self._ensure(max(offset for offset, _day in offsets))
+
+        max_free, sum_free = self._max, self._sum
+        parents = set()
+        for offset, day in offsets:
+            node = self._size + offset
+            value = self._leaf_value(offset, day)
+            max_free[node] = value
+            sum_free[node] = value
+            parents.add(node >> 1)
+        while parents:
+            for node in parents:
+                left, right = max_free[2 * node], max_free[2 * node + 1]
+                max_free[node] = max(right, left)
+                sum_free[node] = sum_free[2 * node] + sum_free[2 * node + 1]
+            parents = {node >> 1 for node in parents if node > 1}
+
+    def release(self, day: date, hours: float) -> None:
+        """Remove hours from a day's allocation (rollback of allocate()).
+
+        Args:
+            day: Day to release hours on
+            hours: Hours to remove
+        """
+        self.allocations[day] -= hours
+        self._refresh(day)
+
+    def fill_forward(
+        self,
+        hours: float,
+        start: date,
+        end: date | None = None,
+    ) -> dict[date, float] | None:
+        """Allocate hours on the earliest free days, filling each day.
+
+        This is the greedy forward fill: every day with capacity from start
+        on takes as many of the remaining hours as it has free. If the hours
+        do not fit by end, nothing stays allocated.
+
+        Args:
+            hours: Hours to allocate
+            start: Earliest day to use (clamped to the origin)
+            end: Latest day to use (None means unbounded)
+
+        Returns:
+            Hours allocated per day in date order (empty if hours is within
+            SCHEDULING_EPSILON of zero), or None if they do not fit
+        """
+        allocated: dict[date, float] = {}
+        remaining = hours
+        next_day = max(start, self.origin)
+        while remaining > SCHEDULING_EPSILON:
+            day = self.first_fit(next_day, end=end)
+            if day is None:
+                for allocated_day, allocated_hours in allocated.items():
+                    self.release(allocated_day, allocated_hours)
+                return None
+
+            amount = min(remaining, self.free_hours(day))
+            self.allocate(day, amount)
+            allocated[day] = amount
+            remaining -= amount
+            next_day = day + timedelta(days=1)
+        return allocated
+
+    # Internals
+
+    def _offset(self, day: date) -> int:
+        return (day - self.origin).days
+
+    def _day(self, offset: int) -> date:
+        return self.origin + timedelta(days=offset)
+
+    def _leaf_value(self, offset: int, day: date) -> float:
+        if not self._workdays[offset]:
+            return 0.0
+        return max(0.0, self.max_hours_per_day - self.allocations.get(day, 0.0))
+
+    def _refresh(self, day: date) -> None:
+        offset = self._offset(day)
+        if offset < 0:
+            return
+        self._ensure(offset)
+        max_free, sum_free = self._max, self._sum
+        node = self._size + offset
+        value = self._leaf_value(offset, day)
+        max_free[node] = value
+        sum_free[node] = value
+        while node > 1:
+            node >>= 1
+            left, right = max_free[2 * node], max_free[2 * node + 1]
+            max_free[node] = max(right, left)
+            sum_free[node] = sum_free[2 * node] + sum_free[2 * node + 1]
+
+    def _ensure(self, offset: int) -> None:
+        if offset >= self._size:
+            size = self._size
+            while size <= offset:
+                size *= 2
+            self._grow(size)
+
+    def _grow(self, min_days: int) -> None:
+        size = 1
+        while size < min_days:
+            size *= 2
+        if size <= self._size:
+            return
+
+        if self._include_all_days:
+            self._workdays.extend([True] * (size - len(self._workdays)))
+        else:
+            covered = len(self._workdays)
+            workdays = self._workday_calendar.workdays_between(
+                self._day(covered), self._day(size - 1)
+            )
+            mask = [False] * (size - covered)
+            for day in workdays:
+                mask[self._offset(day) - covered] = True
+            self._workdays.extend(mask)
+
+        self._size = size
+        self._max = [0.0] * (2 * size)
+        self._sum = [0.0] * (2 * size)
+        for offset in range(size):
+            value = self._leaf_value(offset, self._day(offset))
+            self._max[size + offset] = value
+            self._sum[size + offset] = value
+        for node in range(size - 1, 0, -1):
+            left, right = 2 * node, 2 * node + 1
+            self._max[node] = max(self._max[left], self._max[right])
+            self._sum[node] = self._sum[left] + self._sum[right]
+
+    def _find_first(self, lo: int, min_free: float) -> int | None:
+        """Leftmost offset >= lo whose free hours exceed min_free.
+
+        Walks up from the leaf until a subtree to the right has capacity,
+        then descends into it, so scanning consecutive days is cheap.
+        """
+        max_free = self._max
+        node = self._size + lo
+        while max_free[node] <= min_free:
+            # Climb while node is a right child, then step to the next subtree
+            while node & 1:
+                node >>= 1
+            if node == 0:
+                return None
+            node += 1
+        while node < self._size:
+            node *= 2
+            if max_free[node] <= min_free:
+                node += 1
+        return node - self._size
+
+    def _find_last(self, hi: int, min_free: float) -> int | None:
+        """Rightmost offset <= hi whose free hours exceed min_free."""
+        max_free = self._max
+        node = self._size + hi
+        while max_free[node] <= min_free:
+            # Climb while node is a left child, then step to the previous subtree
+            while not node & 1:
+                node >>= 1
+            if node == 1:
+                return None
+            node -= 1
+        while node < self._size:
+            node = 2 * node + 1
+            if max_free[node] <= min_free:
+                node -= 1
+        return node - self._size
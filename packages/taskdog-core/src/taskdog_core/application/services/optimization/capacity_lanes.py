@@ -0,0 +1,157 @@
+"""Multi-resource scheduling: one capacity lane per worker or team.
+
+Every task belongs to exactly one lane, chosen by its tags. A run schedules
+each lane's tasks against that lane's own capacity calendar (daily limit,
+days off) and existing allocations, then merges the results. Each task is
+allocated once, on its lane only, so the cost of a run grows with the
+number of tasks, not with tasks times lanes.
+
+Dependencies are honored within a lane. Prerequisites in other lanes are
+treated like tasks outside the run.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from taskdog_core.application.constants.optimization import DEFAULT_CAPACITY_LANE
+from taskdog_core.application.dto.capacity_lane import CapacityLane
+from taskdog_core.application.dto.optimize_result import OptimizeResult
+from taskdog_core.domain.exceptions.task_exceptions import TaskValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+    from datetime import date
+
+    from taskdog_core.application.dto.optimize_params import OptimizeParams
+    from taskdog_core.application.services.optimization.optimization_strategy import (
+        OptimizationStrategy,
+    )
+    from taskdog_core.domain.entities.task import Task
+
+
+def resolve_lanes(
+    lanes: Iterable[CapacityLane], default_max_hours_per_day: float
+) -> tuple[CapacityLane, ...]:
+    """Validate configured lanes and add the default lane.
+
+    Args:
+        lanes: Configured lanes
+        default_max_hours_per_day: Daily limit of the default lane unless a
+            lane named DEFAULT_CAPACITY_LANE is configured
+
+    Returns:
+        Configured lanes followed by the default lane
+
+    Raises:
+        TaskValidationError: If two lanes share a name
+    """
+    resolved = list(lanes)
+    seen: set[str] = set()
+    for lane in resolved:
+        if lane.name in seen:
+            raise TaskValidationError(f"Duplicate capacity lane: '{lane.name}'")
+        seen.add(lane.name)
+    if DEFAULT_CAPACITY_LANE not in seen:
+        resolved.append(CapacityLane(DEFAULT_CAPACITY_LANE, default_max_hours_per_day))
+    return tuple(resolved)
+
+
+def partition_by_lane(
+    tasks: Iterable[Task], lanes: Sequence[CapacityLane]
+) -> dict[str, list[Task]]:
+    """Group tasks by lane, keeping their order within each lane.
+
+    A task goes to the first lane that shares one of its tags, otherwise to
+    the default lane.
+
+    Args:
+        tasks: Tasks to assign
+        lanes: Resolved lanes (see resolve_lanes)
+
+    Returns:
+        Mapping of every lane name to its tasks
+    """
+    lane_by_tag: dict[str, str] = {}
+    for lane in lanes:
+        for tag in lane.tags:
+            lane_by_tag.setdefault(tag, lane.name)
+
+    groups: dict[str, list[Task]] = {lane.name: [] for lane in lanes}
+    for task in tasks:
+        name = next(
+            (lane_by_tag[tag] for tag in task.tags if tag in lane_by_tag),
+            DEFAULT_CAPACITY_LANE,
+        )
+        groups[name].append(task)
+    return groups
+
+
+def optimize_by_lane(
+    strategy: OptimizationStrategy,
+    tasks_by_lane: Mapping[str, list[Task]],
+    allocations_by_lane: Mapping[str, Mapping[date, float]],
+    params: OptimizeParams,
+    lanes: Sequence[CapacityLane],
+) -> OptimizeResult:
+    """Run a strategy once per lane and merge the results.
+
+    Args:
+        strategy: Strategy used for every lane
+        tasks_by_lane: Tasks to schedule per lane (see partition_by_lane)
+        allocations_by_lane: Existing allocations per lane
+        params: Run parameters; each lane overrides the daily limit and adds
+            its days off
+        lanes: Resolved lanes (see resolve_lanes)
+
+    Returns:
+        Merged result. daily_allocations holds the total over all lanes and
+        lane_allocations the allocations of each lane. The critical path is
+        the longest of all lanes; portfolio details and search statistics
+        are kept only when a single lane had tasks. Counters are summed over
+        the lanes (flags are combined with "or").
+    """
+    merged = OptimizeResult()
+    lane_results: list[OptimizeResult] = []
+
+    for lane in lanes:
+        existing = dict(allocations_by_lane.get(lane.name, {}))
+        lane_tasks = tasks_by_lane.get(lane.name, [])
+        if not lane_tasks:
+            merged.lane_allocations[lane.name] = existing
+            continue
+
+        lane_params = replace(
+            params,
+            max_hours_per_day=lane.max_hours_per_day,
+            days_off=params.days_off | lane.days_off,
+        )
+        result = strategy.optimize_tasks(lane_tasks, existing, lane_params)
+        lane_results.append(result)
+
+        merged.tasks.extend(result.tasks)
+        merged.failures.extend(result.failures)
+        merged.lane_allocations[lane.name] = result.daily_allocations
+
+    for allocations in merged.lane_allocations.values():
+        for day, hours in allocations.items():
+            merged.daily_allocations[day] = (
+                merged.daily_allocations.get(day, 0.0) + hours
+            )
+
+    for lane_result in lane_results:
+        for name, value in lane_result.counters.items():
+            if isinstance(value, bool):
+                merged.counters[name] = bool(merged.counters.get(name)) or value
+            else:
+                merged.counters[name] = merged.counters.get(name, 0) + value
+
+    paths = [r.critical_path for r in lane_results if r.critical_path is not None]
+    if paths:
+        merged.critical_path = max(paths, key=lambda path: path.length_days)
+    if len(lane_results) == 1:
+        merged.selected_algorithm = lane_results[0].selected_algorithm
+        merged.portfolio = lane_results[0].portfolio
+        merged.search_stats = lane_results[0].search_stats
+    return merged
@@ -0,0 +1,54 @@
+"""Version token of the task data an optimization was computed from.
+
+A dry-run optimization returns a plan that is only valid for the task data
+it saw. The token digests every task field an optimization reads or writes,
+so applying the plan later can detect that tasks were added, deleted,
+rescheduled, re-estimated, started or completed in between. Fields the
+optimizers ignore (names, tags, notes, timestamps) do not affect it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from taskdog_core.domain.entities.task import Task
+
+# Digest size of data versions in bytes
+_DIGEST_SIZE = 16
+
+
+def compute_data_version(tasks: Iterable[Task]) -> str:
+    """Digest the scheduling-relevant state of all tasks.
+
+    Tasks are sorted by ID first, so the version does not depend on the
+    order in which the repository returned them.
+
+    Args:
+        tasks: All tasks in the repository
+
+    Returns:
+        Hex digest identifying the scheduling state of the tasks
+    """
+    rows = sorted(
+        (
+            task.id if task.id is not None else -1,
+            task.status.value,
+            task.is_archived,
+            task.is_fixed,
+            task.priority,
+            task.estimated_duration,
+            task.deadline,
+            task.planned_start,
+            task.planned_end,
+            tuple(sorted(task.daily_allocations.items())),
+            tuple(sorted(task.depends_on)),
+        )
+        for task in tasks
+    )
+    digest = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    digest.update(repr(rows).encode())
+    return digest.hexdigest()
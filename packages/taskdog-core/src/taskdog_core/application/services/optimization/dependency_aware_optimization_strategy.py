@@ -1,51 +1,185 @@
 """Dependency-aware optimization strategy implementation using Critical Path Method."""
 
-from datetime import datetime
+import heapq
+import math
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
 
+from taskdog_core.application.dto.optimization_summary import CriticalPath
+from taskdog_core.application.dto.optimize_params import OptimizeParams
+from taskdog_core.application.dto.optimize_result import OptimizeResult
+from taskdog_core.application.services.optimization.capacity_calendar import (
+    CapacityCalendar,
+)
 from taskdog_core.application.services.optimization.greedy_based_optimization_strategy import (
     GreedyBasedOptimizationStrategy,
 )
+from taskdog_core.application.services.optimization.precedence_graph import (
+    PrecedenceGraph,
+    TaskTiming,
+)
 from taskdog_core.domain.entities.task import Task
 
+_NO_DEADLINE = datetime(9999, 12, 31, 23, 59, 59)
+
 
 class DependencyAwareOptimizationStrategy(GreedyBasedOptimizationStrategy):
-    """Critical Path Method (CPM) optimization strategy.
+    """Critical Path Method (CPM) list scheduler.
 
-    This strategy schedules tasks based on their position in the dependency graph,
-    prioritizing tasks that block other tasks (critical path tasks):
+    This strategy schedules tasks in dependency order, most urgent first:
 
-    1. Calculate blocking count: How many tasks depend on each task
-    2. Sort by blocking count (higher = schedule first)
-    3. Secondary sort by deadline (earlier first)
-    4. Tertiary sort by priority (higher first)
-    5. Allocate time blocks using greedy forward allocation
+    1. Build the dependency graph of the optimized tasks (topological order)
+    2. Estimate durations in days from estimated hours and max_hours_per_day
+    3. Forward pass: earliest start/finish of each task
+    4. Backward pass: latest finish from deadlines and successors, giving
+       each task's slack
+    5. List scheduling: repeatedly take the ready task (all prerequisites
+       allocated) with the least slack, then earliest deadline, then
+       highest priority
+    6. Allocate it greedily from the day after its last prerequisite ends
+
+    A task whose prerequisite could not be scheduled is not scheduled either.
+    The longest dependency chain is reported as ``critical_path``.
     """
 
     DISPLAY_NAME = "Dependency Aware"
     DESCRIPTION = "Critical Path Method"
 
-    def _sort_tasks(self, tasks: list[Task], start_date: datetime) -> list[Task]:
-        """Sort tasks using Critical Path Method (CPM)."""
-        blocking_count: dict[int, int] = {}
-        for task in tasks:
-            if task.id is not None:
-                blocking_count[task.id] = 0
+    def optimize_tasks(
+        self,
+        tasks: list[Task],
+        existing_allocations: dict[date, float],
+        params: OptimizeParams,
+    ) -> OptimizeResult:
+        """Optimize task schedules with CPM list scheduling.
+
+        Args:
+            tasks: List of tasks to schedule
+            existing_allocations: Pre-aggregated daily allocations from existing tasks
+            params: Optimization parameters (start_date, max_hours_per_day, etc.)
 
-        for task in tasks:
-            for dep_id in task.depends_on:
-                if dep_id in blocking_count:
-                    blocking_count[dep_id] += 1
+        Returns:
+            OptimizeResult containing modified tasks, daily allocations,
+            failures and the critical path
+        """
+        calendar = CapacityCalendar.from_params(params, existing_allocations)
+        result = OptimizeResult(daily_allocations=calendar.allocations)
+        if not tasks:
+            return result
 
-        def critical_path_key(task: Task) -> tuple[int, datetime, int]:
-            task_id = task.id if task.id is not None else 0
-            blocking = blocking_count.get(task_id, 0)
-            deadline_val = task.deadline or datetime(9999, 12, 31, 23, 59, 59)
-            priority_val = task.priority if task.priority is not None else 0
+        graph = PrecedenceGraph(tasks)
+        timings = graph.compute_timings(
+            [self._duration_days(task, params) for task in tasks],
+            [self._due_day(task, params) for task in tasks],
+        )
+        result.critical_path = self._summarize_critical_path(graph, timings)
+
+        # Last allocated day per node, and nodes that could not be scheduled
+        finish_days: dict[int, date] = {}
+        failed: set[int] = set()
+        for node in self._list_schedule(graph, timings):
+            params.raise_if_cancelled()
+            task = tasks[node]
+            predecessors = graph.predecessors[node]
+
+            blocker = next((p for p in predecessors if p in failed), None)
+            if blocker is not None:
+                failed.add(node)
+                result.record_failure(
+                    task,
+                    f"Prerequisite task {tasks[blocker].id} could not be scheduled",
+                )
+                continue
+
+            earliest_day = max(
+                (
+                    finish_days[p] + timedelta(days=1)
+                    for p in predecessors
+                    if p in finish_days
+                ),
+                default=calendar.origin,
+            )
+            updated_task = self._allocate_from(task, calendar, params, earliest_day)
+            if updated_task and updated_task.planned_end:
+                result.tasks.append(updated_task)
+                finish_days[node] = updated_task.planned_end.date()
+            else:
+                failed.add(node)
+                result.record_allocation_failure(task)
 
+        return result
+
+    def _list_schedule(
+        self, graph: PrecedenceGraph, timings: Sequence[TaskTiming]
+    ) -> list[int]:
+        """Order nodes by repeatedly picking the most urgent ready node.
+
+        Args:
+            graph: Dependency graph of the run
+            timings: CPM timings per node
+
+        Returns:
+            Nodes in scheduling order (prerequisites before dependents)
+        """
+        tasks = graph.tasks
+
+        def urgency(node: int) -> tuple[int, datetime, int, int]:
+            task = tasks[node]
             return (
-                -blocking,
-                deadline_val,
-                -priority_val,
+                timings[node].slack,
+                task.deadline or _NO_DEADLINE,
+                -(task.priority or 0),
+                node,
             )
 
-        return sorted(tasks, key=critical_path_key)
+        in_degree = [len(preds) for preds in graph.predecessors]
+        ready = [urgency(node) for node, degree in enumerate(in_degree) if degree == 0]
+        heapq.heapify(ready)
+        scheduled = [False] * len(tasks)
+        order: list[int] = []
+        # Fallback queue for cycles: topological order lists cyclic nodes last
+        pending = iter(graph.order)
+
+        while len(order) < len(tasks):
+            if not ready:
+                node = next(n for n in pending if not scheduled[n])
+                heapq.heappush(ready, urgency(node))
+            node = heapq.heappop(ready)[-1]
+            if scheduled[node]:
+                continue
+            scheduled[node] = True
+            order.append(node)
+            for successor in graph.successors[node]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0 and not scheduled[successor]:
+                    heapq.heappush(ready, urgency(successor))
+        return order
+
+    def _summarize_critical_path(
+        self, graph: PrecedenceGraph, timings: Sequence[TaskTiming]
+    ) -> CriticalPath:
+        """Describe the longest dependency chain for the summary."""
+        nodes = graph.critical_path(timings)
+        chain = [graph.tasks[node] for node in nodes]
+        return CriticalPath(
+            task_ids=[task.id for task in chain if task.id is not None],
+            total_hours=sum(task.estimated_duration or 0.0 for task in chain),
+            length_days=timings[nodes[-1]].earliest_finish if nodes else 0,
+        )
+
+    @staticmethod
+    def _duration_days(task: Task, params: OptimizeParams) -> int:
+        """Days a task needs when it gets full days of capacity."""
+        hours = task.estimated_duration or 0.0
+        return math.ceil(hours / params.max_hours_per_day) if hours > 0 else 0
+
+    @staticmethod
+    def _due_day(task: Task, params: OptimizeParams) -> int | None:
+        """Schedulable days from the start through the deadline day."""
+        if task.deadline is None:
+            return None
+        start = params.start_date.date()
+        last = task.deadline.date()
+        if params.include_all_days:
+            return max(0, (last - start).days + 1)
+        return params.workdays.count_workdays(start, last)
@@ -0,0 +1,404 @@
+"""Exact (branch and bound) optimization strategy implementation."""
+
+import logging
+import math
+import time
+from datetime import date, timedelta
+
+from taskdog_core.application.constants.optimization import (
+    EXACT_MAX_TASKS,
+    EXACT_TIME_LIMIT_SECONDS,
+    SCHEDULING_EPSILON,
+)
+from taskdog_core.application.dto.optimization_summary import SearchStats
+from taskdog_core.application.dto.optimize_params import OptimizeParams
+from taskdog_core.application.dto.optimize_result import OptimizeResult
+from taskdog_core.application.services.optimization.allocation_helpers import (
+    SCHEDULE_END_TIME,
+)
+from taskdog_core.application.services.optimization.capacity_calendar import (
+    CapacityCalendar,
+)
+from taskdog_core.application.services.optimization.greedy_optimization_strategy import (
+    GreedyOptimizationStrategy,
+)
+from taskdog_core.application.services.optimization.optimization_strategy import (
+    OptimizationStrategy,
+)
+from taskdog_core.application.services.optimization.schedule_fitness_calculator import (
+    DEADLINE_PENALTY_MULTIPLIER,
+    SCHEDULED_TASK_BONUS,
+    ScheduleFitnessCalculator,
+)
+from taskdog_core.domain.entities.task import Task
+
+logger = logging.getLogger(__name__)
+
+
+class _SearchTimeoutError(Exception):
+    """Raised inside the search when the time limit is reached."""
+
+
+class ExactOptimizationStrategy(OptimizationStrategy):
+    """Branch and bound search for the best task ordering.
+
+    Like Monte Carlo, this strategy looks for the ordering whose greedy
+    schedule scores highest under ScheduleFitnessCalculator, but it searches
+    the orderings depth-first and proves the result optimal:
+
+    1. The greedy priority ordering is evaluated first and is the incumbent
+    2. Each node appends one task to the ordering, fills it forward on a
+       shared CapacityCalendar and releases the hours when backtracking
+    3. A node is pruned when an upper bound on the score of any completion
+       does not beat the incumbent. The bound assumes every remaining task
+       that still fits is scheduled, in descending priority order, with a
+       perfectly even workload; the number of such tasks is capped by the
+       free capacity up to their latest deadline
+    4. Greedy forward fill leaves the calendar in the same state for any
+       order of the same scheduled tasks, so nodes are memoized on
+       (scheduled-set bitmask, frontier day); a node is pruned when its state
+       was already reached with an equal or better score so far
+
+    Backlogs with more than MAX_TASKS tasks fall back to the greedy ordering,
+    and a search that exceeds TIME_LIMIT_SECONDS keeps the best ordering
+    found so far. result.search_stats reports the nodes explored per second
+    and whether the ordering is proven optimal.
+    """
+
+    DISPLAY_NAME = "Exact"
+    DESCRIPTION = "Proven best ordering (small backlogs)"
+
+    MAX_TASKS = EXACT_MAX_TASKS
+    TIME_LIMIT_SECONDS = EXACT_TIME_LIMIT_SECONDS
+
+    def __init__(self) -> None:
+        """Initialize strategy."""
+        self.fitness_calculator = ScheduleFitnessCalculator()
+
+    def optimize_tasks(
+        self,
+        tasks: list[Task],
+        existing_allocations: dict[date, float],
+        params: OptimizeParams,
+    ) -> OptimizeResult:
+        """Optimize task schedules with a branch and bound search.
+
+        Args:
+            tasks: List of tasks to schedule (already filtered by is_schedulable())
+            existing_allocations: Pre-aggregated daily allocations from existing tasks
+            params: Optimization parameters (start_date, max_hours_per_day, etc.)
+
+        Returns:
+            OptimizeResult containing modified tasks, daily allocations,
+            failures and search_stats
+        """
+        if not tasks:
+            return OptimizeResult()
+
+        started = time.perf_counter()
+        greedy_strategy = GreedyOptimizationStrategy()
+        greedy_order = greedy_strategy._sort_tasks(tasks, params.start_date)
+
+        fallback: str | None
+        if len(tasks) > self.MAX_TASKS:
+            best_order, nodes_explored, evaluations = greedy_order, 0, 0
+            fallback = "size"
+        else:
+            search = _BranchAndBound(
+                greedy_order,
+                existing_allocations,
+                params,
+                greedy_strategy,
+                self.fitness_calculator,
+            )
+            best_order, fallback = search.run(started + self.TIME_LIMIT_SECONDS)
+            nodes_explored = search.nodes_explored
+            evaluations = search.evaluations
+
+        # Schedule tasks according to best order using greedy allocation
+        calendar = CapacityCalendar.from_params(params, existing_allocations)
+        result = OptimizeResult(daily_allocations=calendar.allocations)
+        for task in best_order:
+            updated_task = greedy_strategy._allocate_task(task, calendar, params)
+            if updated_task:
+                result.tasks.append(updated_task)
+            else:
+                result.record_allocation_failure(task)
+
+        runtime = time.perf_counter() - started
+        result.search_stats = SearchStats(
+            nodes_explored=nodes_explored,
+            runtime_seconds=runtime,
+            nodes_per_second=nodes_explored / runtime if runtime > 0 else 0.0,
+            optimal=fallback is None,
+            fallback=fallback,
+        )
+        result.counters = {
+            "nodes_explored": nodes_explored,
+            "evaluations": evaluations,
+        }
+        logger.debug(
+            "Exact search: %d nodes in %.3fs (%.0f nodes/s), %s",
+            nodes_explored,
+            runtime,
+            result.search_stats.nodes_per_second,
+            "optimal" if fallback is None else f"fallback: {fallback}",
+        )
+
+        return result
+
+
+class _BranchAndBound:
+    """Depth-first branch and bound over the orderings of a task list.
+
+    Tasks are referred to by their index in the greedy ordering, and sets of
+    tasks are bitmasks over those indices. Children are expanded in greedy
+    order, so the first leaf is the greedy schedule.
+    """
+
+    def __init__(
+        self,
+        tasks: list[Task],
+        existing_allocations: dict[date, float],
+        params: OptimizeParams,
+        greedy_strategy: GreedyOptimizationStrategy,
+        fitness_calculator: ScheduleFitnessCalculator,
+    ) -> None:
+        """Initialize the search.
+
+        Args:
+            tasks: Tasks in greedy order
+            existing_allocations: Pre-aggregated daily allocations from existing tasks
+            params: Optimization parameters
+            greedy_strategy: Greedy strategy used to evaluate complete orderings
+            fitness_calculator: Calculator scoring complete orderings
+        """
+        self.tasks = tasks
+        self.params = params
+        self.existing_allocations = existing_allocations
+        self.greedy_strategy = greedy_strategy
+        self.fitness_calculator = fitness_calculator
+        self.calendar = CapacityCalendar.from_params(params, existing_allocations)
+
+        self.priorities = [task.priority or 0 for task in tasks]
+        self.hours = [task.estimated_duration or 0.0 for task in tasks]
+        # Allocation is per-day, so the last usable day is the deadline's date
+        self.last_days = [
+            task.deadline.date() if task.deadline else None for task in tasks
+        ]
+
+        self.nodes_explored = 0
+        self.evaluations = 0
+        self.best_score = -math.inf
+        self.best_order = tasks
+        # Best prefix value seen per (scheduled-set bitmask, frontier day)
+        self._memo: dict[tuple[int, date | None], float] = {}
+        self._stop_at = math.inf
+
+    def run(self, stop_at: float) -> tuple[list[Task], str | None]:
+        """Search for the highest-scoring ordering.
+
+        Args:
+            stop_at: time.perf_counter() value at which the search gives up
+
+        Returns:
+            (best ordering found, fallback reason): the reason is "time" if
+            the search was cut short and None if the ordering is optimal
+        """
+        self._stop_at = stop_at
+        self.best_score = self._evaluate(self.tasks)
+        try:
+            self._search(0, [], 0.0, 0.0, 0.0, None)
+        except _SearchTimeoutError:
+            return self.best_order, "time"
+        return self.best_order, None
+
+    def _search(
+        self,
+        scheduled: int,
+        path: list[int],
+        weighted_positions: float,
+        priority_sum: float,
+        deadline_penalty: float,
+        frontier: date | None,
+    ) -> None:
+        """Explore the completions of a partial ordering.
+
+        Args:
+            scheduled: Bitmask of the tasks scheduled so far
+            path: Indices of the scheduled tasks in order
+            weighted_positions: Sum of priority * position over the path
+            priority_sum: Sum of priorities over the path
+            deadline_penalty: Deadline penalty of the path
+            frontier: Last day with hours allocated by the path
+        """
+        self.nodes_explored += 1
+        self.params.raise_if_cancelled()
+        if time.perf_counter() > self._stop_at:
+            raise _SearchTimeoutError
+
+        # The score of a complete ordering is this prefix value plus terms
+        # that only depend on the scheduled set, so a worse prefix reaching
+        # the same state cannot lead to a better ordering
+        key = (scheduled, frontier)
+        prefix_value = -weighted_positions - deadline_penalty
+        if self._memo.get(key, -math.inf) >= prefix_value:
+            return
+        self._memo[key] = prefix_value
+
+        # Capacity only shrinks further down, so tasks that do not fit now
+        # are never scheduled in this subtree
+        calendar = self.calendar
+        candidates = []
+        for index in range(len(self.tasks)):
+            if scheduled >> index & 1:
+                continue
+            allocated = calendar.fill_forward(
+                self.hours[index], calendar.origin, self.last_days[index]
+            )
+            if allocated:
+                self._release(allocated)
+                candidates.append(index)
+
+        if not candidates:
+            # Leaf: the remaining tasks go last, where they fail
+            order = [self.tasks[index] for index in path] + [
+                task
+                for index, task in enumerate(self.tasks)
+                if not scheduled >> index & 1
+            ]
+            score = self._evaluate(order)
+            if score > self.best_score:
+                self.best_score = score
+                self.best_order = order
+            return
+
+        bound = self._upper_bound(
+            candidates, len(path), weighted_positions, priority_sum, deadline_penalty
+        )
+        if bound <= self.best_score:
+            return
+
+        position = len(path)
+        for index in candidates:
+            allocated = calendar.fill_forward(
+                self.hours[index], calendar.origin, self.last_days[index]
+            )
+            assert allocated, "Candidate no longer fits"
+            last_day = next(reversed(allocated))
+            priority = self.priorities[index]
+            path.append(index)
+            self._search(
+                scheduled | 1 << index,
+                path,
+                weighted_positions + priority * position,
+                priority_sum + priority,
+                deadline_penalty + self._lateness_penalty(index, last_day),
+                last_day if frontier is None else max(frontier, last_day),
+            )
+            path.pop()
+            self._release(allocated)
+
+    def _upper_bound(
+        self,
+        candidates: list[int],
+        position: int,
+        weighted_positions: float,
+        priority_sum: float,
+        deadline_penalty: float,
+    ) -> float:
+        """Highest score any completion of the current path can reach.
+
+        The priority score sum(priority * (scheduled_count - position)) grows
+        with the final scheduled count, the remaining tasks score most in
+        descending priority order, and the workload and remaining deadline
+        penalties are at least zero.
+
+        Args:
+            candidates: Remaining tasks that still fit
+            position: Number of tasks on the path
+            weighted_positions: Sum of priority * position over the path
+            priority_sum: Sum of priorities over the path
+            deadline_penalty: Deadline penalty of the path
+
+        Returns:
+            Upper bound of the fitness score
+        """
+        count = len(candidates)
+        last_days = [
+            day for day in (self.last_days[i] for i in candidates) if day is not None
+        ]
+        if len(last_days) == count:
+            # Scheduled tasks end by their deadlines, so together they fit in
+            # the free hours up to the latest one
+            capacity = self.calendar.total_free_hours(
+                self.calendar.origin, max(last_days)
+            )
+            fitting = 0
+            total_hours = 0.0
+            for hours in sorted(self.hours[i] for i in candidates):
+                total_hours += hours
+                if total_hours > capacity + SCHEDULING_EPSILON * (fitting + 1):
+                    break
+                fitting += 1
+            count = fitting
+
+        final_count = position + count
+        top_priorities = sorted((self.priorities[i] for i in candidates), reverse=True)
+        remaining_score = sum(
+            priority * (count - rank)
+            for rank, priority in enumerate(top_priorities[:count])
+        )
+        return (
+            priority_sum * final_count
+            - weighted_positions
+            + remaining_score
+            + SCHEDULED_TASK_BONUS * final_count
+            - deadline_penalty
+        )
+
+    def _lateness_penalty(self, index: int, last_day: date) -> float:
+        """Deadline penalty of a task whose allocation ends on last_day."""
+        deadline = self.tasks[index].deadline
+        if deadline is None:
+            return 0.0
+        planned_end = (
+            self.params.start_date
+            + timedelta(days=(last_day - self.calendar.origin).days)
+        ).replace(
+            hour=SCHEDULE_END_TIME.hour,
+            minute=SCHEDULE_END_TIME.minute,
+            second=SCHEDULE_END_TIME.second,
+        )
+        if planned_end <= deadline:
+            return 0.0
+        return (planned_end - deadline).days * DEADLINE_PENALTY_MULTIPLIER
+
+    def _release(self, allocated: dict[date, float]) -> None:
+        for day, hours in allocated.items():
+            self.calendar.release(day, hours)
+
+    def _evaluate(self, task_order: list[Task]) -> float:
+        """Score a complete ordering by scheduling it on a fresh calendar.
+
+        Args:
+            task_order: Ordering of all tasks
+
+        Returns:
+            Fitness score with the scheduling bonus (higher is better)
+        """
+        self.evaluations += 1
+        calendar = CapacityCalendar.from_params(self.params, self.existing_allocations)
+        scheduled_tasks = []
+        for task in task_order:
+            updated_task = self.greedy_strategy._allocate_task(
+                task, calendar, self.params
+            )
+            if updated_task:
+                scheduled_tasks.append(updated_task)
+
+        return self.fitness_calculator.calculate_fitness(
+            scheduled_tasks,
+            calendar.allocations,
+            include_scheduling_bonus=True,
+        )
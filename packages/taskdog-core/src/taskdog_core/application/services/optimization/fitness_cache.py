@@ -0,0 +1,233 @@
+"""Bounded cache of schedule fitness scores shared across optimization runs.
+
+The genetic and Monte Carlo strategies score many task orderings by
+simulating a greedy allocation for each. The score of an ordering depends
+only on the ordering and the run's inputs, so it is cached under a digest of
+both: re-optimizing an unchanged backlog (same tasks, allocations and
+parameters) reuses the earlier evaluations instead of simulating again.
+
+Only the score is stored. The strategies rebuild the schedule of the single
+best ordering with one more greedy pass.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from taskdog_core.application.constants.optimization import (
+    FITNESS_CACHE_MAX_ENTRIES,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from datetime import date
+
+    from taskdog_core.application.dto.optimize_params import OptimizeParams
+    from taskdog_core.domain.entities.task import Task
+
+# Digest size of cache keys and fingerprints in bytes
+_DIGEST_SIZE = 16
+
+# Packed stand-in for tasks without an id
+_NO_ID = -1
+
+
+@dataclass(frozen=True)
+class FitnessCacheStats:
+    """Snapshot of fitness cache usage.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that required an evaluation
+        entries: Orderings currently cached
+        max_entries: Maximum number of cached orderings
+    """
+
+    hits: int
+    misses: int
+    entries: int
+    max_entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 without lookups)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def fitness_fingerprint(
+    namespace: str,
+    tasks: Iterable[Task],
+    params: OptimizeParams,
+    existing_allocations: Mapping[date, float] | None = None,
+) -> bytes:
+    """Digest the inputs that determine the fitness of an ordering.
+
+    Covers everything a greedy simulation and the fitness calculator read:
+    task estimates, deadlines and priorities, the allocations the simulation
+    starts from, and the scheduling parameters. Tasks and allocations are
+    sorted first, so the fingerprint does not depend on input order.
+
+    Holidays are identified by the checker's ``country`` attribute. Checkers
+    without one are identified per instance, which keeps results cacheable
+    within a run but not across runs.
+
+    Args:
+        namespace: Evaluation variant (e.g. the strategy name)
+        tasks: Tasks being ordered
+        params: Optimization parameters
+        existing_allocations: Allocations the simulation starts from
+
+    Returns:
+        Fingerprint digest
+    """
+    checker = params.holiday_checker
+    holidays: object = None
+    if checker is not None:
+        country = getattr(checker, "country", None)
+        holidays = (
+            type(checker).__qualname__,
+            country if country is not None else id(checker),
+        )
+
+    task_rows = sorted(
+        repr((task.id, task.estimated_duration, task.deadline, task.priority))
+        for task in tasks
+    )
+    allocation_rows = sorted((existing_allocations or {}).items())
+    payload = repr(
+        (
+            namespace,
+            params.start_date,
+            params.max_hours_per_day,
+            params.include_all_days,
+            holidays,
+            sorted(params.days_off),
+            task_rows,
+            allocation_rows,
+        )
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=_DIGEST_SIZE).digest()
+
+
+class FitnessCache:
+    """Thread-safe LRU cache mapping (fingerprint, ordering) to a fitness score.
+
+    Keys are fixed-size digests of the input fingerprint and the ordering's
+    task ids, so an entry costs the same whatever the backlog size. Once
+    ``max_entries`` is reached, the least recently used ordering is evicted.
+
+    Examples:
+        >>> cache = FitnessCache(max_entries=2)
+        >>> key = cache.ordering_key(b"inputs", [])
+        >>> cache.get(key) is None
+        True
+        >>> cache.put(key, 1.5)
+        >>> cache.get(key)
+        1.5
+        >>> cache.stats().hit_rate
+        0.5
+    """
+
+    def __init__(self, max_entries: int = FITNESS_CACHE_MAX_ENTRIES) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached orderings
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive (got {max_entries})")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, float] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def ordering_key(fingerprint: bytes, task_order: Iterable[Task]) -> bytes:
+        """Build the cache key of a task ordering.
+
+        Args:
+            fingerprint: Digest from fitness_fingerprint()
+            task_order: Tasks in evaluation order
+
+        Returns:
+            Cache key digest
+        """
+        ids = array(
+            "q", (_NO_ID if task.id is None else task.id for task in task_order)
+        )
+        digest = hashlib.blake2b(fingerprint, digest_size=_DIGEST_SIZE)
+        digest.update(ids.tobytes())
+        return digest.digest()
+
+    def get(self, key: bytes) -> float | None:
+        """Look up a cached fitness score and record a hit or miss.
+
+        Args:
+            key: Key from ordering_key()
+
+        Returns:
+            Cached fitness, or None if the ordering was not cached
+        """
+        with self._lock:
+            fitness = self._entries.get(key)
+            if fitness is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return fitness
+
+    def put(self, key: bytes, fitness: float) -> None:
+        """Store a fitness score, evicting the least recently used if full.
+
+        Args:
+            key: Key from ordering_key()
+            fitness: Fitness score of the ordering
+        """
+        with self._lock:
+            self._entries[key] = fitness
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> FitnessCacheStats:
+        """Return current hit, miss and size counters."""
+        with self._lock:
+            return FitnessCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_shared_cache = FitnessCache()
+
+
+def get_shared_fitness_cache() -> FitnessCache:
+    """Return the process-wide cache used by strategies by default.
+
+    Every strategy instance created without an explicit cache uses this one,
+    so evaluations carry over between runs in a long-lived server process.
+    """
+    return _shared_cache
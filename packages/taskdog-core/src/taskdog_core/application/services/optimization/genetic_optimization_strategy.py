@@ -1,6 +1,7 @@
 """Genetic algorithm optimization strategy implementation."""
 
 import copy
+import logging
 import random
 from datetime import date
 
@@ -15,6 +16,14 @@ from taskdog_core.application.constants.optimization import (
 )
 from taskdog_core.application.dto.optimize_params import OptimizeParams
 from taskdog_core.application.dto.optimize_result import OptimizeResult
+from taskdog_core.application.services.optimization.capacity_calendar import (
+    CapacityCalendar,
+)
+from taskdog_core.application.services.optimization.fitness_cache import (
+    FitnessCache,
+    fitness_fingerprint,
+    get_shared_fitness_cache,
+)
 from taskdog_core.application.services.optimization.greedy_optimization_strategy import (
     GreedyOptimizationStrategy,
 )
@@ -26,6 +35,8 @@ from taskdog_core.application.services.optimization.schedule_fitness_calculator
 )
 from taskdog_core.domain.entities.task import Task
 
+logger = logging.getLogger(__name__)
+
 
 class GeneticOptimizationStrategy(OptimizationStrategy):
     """Genetic algorithm for task scheduling optimization.
@@ -54,14 +65,21 @@ class GeneticOptimizationStrategy(OptimizationStrategy):
     EARLY_TERMINATION_GENERATIONS = GENETIC_EARLY_TERMINATION_GENERATIONS
     TOURNAMENT_SIZE = GENETIC_TOURNAMENT_SIZE
 
-    def __init__(self) -> None:
-        """Initialize strategy."""
+    def __init__(self, fitness_cache: FitnessCache | None = None) -> None:
+        """Initialize strategy.
+
+        Args:
+            fitness_cache: Cache for ordering evaluations (default: the
+                process-wide shared cache)
+        """
         self.fitness_calculator = ScheduleFitnessCalculator()
-        # Cache for fitness evaluations: stores (fitness, daily_allocations, scheduled_tasks)
-        self._fitness_cache: dict[
-            tuple[int | None, ...], tuple[float, dict[date, float], list[Task]]
-        ] = {}
+        self._fitness_cache = (
+            fitness_cache if fitness_cache is not None else get_shared_fitness_cache()
+        )
+        self._fingerprint = b""
         self._rng = random.Random()
+        # Profiling counters of the current run (see OptimizeResult.counters)
+        self._counters: dict[str, int | bool] = {}
 
     def optimize_tasks(
         self,
@@ -88,8 +106,16 @@ class GeneticOptimizationStrategy(OptimizationStrategy):
         # Create greedy strategy instance for allocation
         greedy_strategy = GreedyOptimizationStrategy()
 
-        # Clear fitness cache for new optimization run
-        self._fitness_cache.clear()
+        # Evaluations start from empty allocations, so only the tasks and
+        # parameters identify them in the shared cache
+        self._fingerprint = fitness_fingerprint("genetic", tasks, params)
+
+        self._counters = {
+            "generations": 0,
+            "evaluations": 0,
+            "cache_hits": 0,
+            "early_terminated": False,
+        }
 
         # Seed a local RNG per run so identical input + seed is reproducible
         self._rng.seed(
@@ -103,34 +129,31 @@ class GeneticOptimizationStrategy(OptimizationStrategy):
             greedy_strategy,
         )
 
-        # Reuse cached allocation results for the best order (performance optimization)
-        cache_key = tuple(task.id for task in best_order)
-        if cache_key in self._fitness_cache:
-            # Use cached results to avoid redundant allocation
-            _fitness, cached_daily_allocations, cached_scheduled_tasks = (
-                self._fitness_cache[cache_key]
-            )
-            # Update result.daily_allocations with cached results
-            result.daily_allocations.update(cached_daily_allocations)
-            result.tasks = cached_scheduled_tasks
-
-            # Record failed tasks (tasks that were not successfully scheduled)
-            scheduled_task_ids = {task.id for task in cached_scheduled_tasks}
-            for task in best_order:
-                if task.id not in scheduled_task_ids:
-                    # Task was not successfully scheduled - record failure
-                    result.record_allocation_failure(task)
-        else:
-            # Fallback: allocate tasks if cache miss (shouldn't happen normally)
-            for task in best_order:
-                updated_task = greedy_strategy._allocate_task(
-                    task, result.daily_allocations, params
-                )
-                if updated_task:
-                    result.tasks.append(updated_task)
-                else:
-                    # Record allocation failure
-                    result.record_allocation_failure(task)
+        # The cache only keeps scores, so rebuild the best order's schedule
+        # with the same simulation that scored it
+        _fitness, daily_allocations, scheduled_tasks = self._evaluate_fitness(
+            best_order,
+            params,
+            greedy_strategy,
+        )
+        result.daily_allocations.update(daily_allocations)
+        result.tasks = scheduled_tasks
+        result.counters = dict(self._counters)
+
+        # Record failed tasks (tasks that were not successfully scheduled)
+        scheduled_task_ids = {task.id for task in scheduled_tasks}
+        for task in best_order:
+            if task.id not in scheduled_task_ids:
+                result.record_allocation_failure(task)
+
+        stats = self._fitness_cache.stats()
+        logger.debug(
+            "Fitness cache: %d hits, %d misses (%.1f%% hit rate), %d entries",
+            stats.hits,
+            stats.misses,
+            stats.hit_rate * 100,
+            stats.entries,
+        )
 
         return result
 
@@ -161,13 +184,17 @@ class GeneticOptimizationStrategy(OptimizationStrategy):
 
         # Evolve population
         for _generation in range(self.GENERATIONS):
+            # Cooperative cancellation point between generations
+            params.raise_if_cancelled()
+            self._counters["generations"] += 1
+
             # Evaluate fitness for each individual (only need fitness scores for evolution)
             fitness_scores = [
                 self._evaluate_fitness_cached(
                     individual,
                     params,
                     greedy_strategy,
-                )[0]  # Extract fitness score only
+                )
                 for individual in population
             ]
 
@@ -181,6 +208,7 @@ class GeneticOptimizationStrategy(OptimizationStrategy):
 
             # Early termination if no improvement
             if generations_without_improvement >= self.EARLY_TERMINATION_GENERATIONS:
+                self._counters["early_terminated"] = True
                 break
 
             # Select parents (tournament selection)
@@ -213,7 +241,7 @@ class GeneticOptimizationStrategy(OptimizationStrategy):
             population = next_generation
 
         # Return best individual from final generation
-        final_results = [
+        final_scores = [
             self._evaluate_fitness_cached(
                 individual,
                 params,
@@ -222,7 +250,7 @@ class GeneticOptimizationStrategy(OptimizationStrategy):
             for individual in population
         ]
         # Find best individual by fitness score
-        best_idx = max(range(len(final_results)), key=lambda i: final_results[i][0])
+        best_idx = max(range(len(final_scores)), key=lambda i: final_scores[i])
         return population[best_idx]
 
     def _evaluate_fitness_cached(
@@ -230,7 +258,7 @@ class GeneticOptimizationStrategy(OptimizationStrategy):
         task_order: list[Task],
         params: OptimizeParams,
         greedy_strategy: GreedyOptimizationStrategy,
-    ) -> tuple[float, dict[date, float], list[Task]]:
+    ) -> float:
         """Evaluate fitness with caching to avoid redundant calculations.
 
         Args:
@@ -239,26 +267,25 @@ class GeneticOptimizationStrategy(OptimizationStrategy):
             greedy_strategy: Greedy strategy instance
 
         Returns:
-            Tuple of (fitness_score, daily_allocations, scheduled_tasks)
+            Fitness score (higher is better)
         """
-        # Create cache key from task IDs (tuple is hashable)
-        cache_key = tuple(task.id for task in task_order)
+        cache_key = self._fitness_cache.ordering_key(self._fingerprint, task_order)
 
         # Return cached result if available
-        if cache_key in self._fitness_cache:
-            return self._fitness_cache[cache_key]
+        fitness = self._fitness_cache.get(cache_key)
+        if fitness is not None:
+            self._counters["cache_hits"] += 1
+            return fitness
 
-        # Calculate fitness and allocation results
-        fitness, daily_allocations, scheduled_tasks = self._evaluate_fitness(
+        self._counters["evaluations"] += 1
+        fitness, _daily_allocations, _scheduled_tasks = self._evaluate_fitness(
             task_order,
             params,
             greedy_strategy,
         )
+        self._fitness_cache.put(cache_key, fitness)
 
-        # Cache the complete result (fitness + allocations + tasks)
-        self._fitness_cache[cache_key] = (fitness, daily_allocations, scheduled_tasks)
-
-        return fitness, daily_allocations, scheduled_tasks
+        return fitness
 
     def _evaluate_fitness(
         self,
@@ -280,13 +307,12 @@ class GeneticOptimizationStrategy(OptimizationStrategy):
         """
         # Simulate scheduling with this order
         # Start with empty allocations for fair comparison across orderings
-        daily_allocations: dict[date, float] = {}
+        calendar = CapacityCalendar.from_params(params)
+        daily_allocations = calendar.allocations
         scheduled_tasks = []
 
         for task in task_order:
-            updated_task = greedy_strategy._allocate_task(
-                task, daily_allocations, params
-            )
+            updated_task = greedy_strategy._allocate_task(task, calendar, params)
             if updated_task:
                 scheduled_tasks.append(updated_task)
 
@@ -2,21 +2,21 @@
 
 from datetime import date, datetime, timedelta
 
-from taskdog_core.application.constants.optimization import SCHEDULING_EPSILON
 from taskdog_core.application.dto.optimize_params import OptimizeParams
 from taskdog_core.application.dto.optimize_result import OptimizeResult
 from taskdog_core.application.services.optimization.allocation_helpers import (
-    calculate_available_hours,
     prepare_task_for_allocation,
     set_planned_times,
 )
+from taskdog_core.application.services.optimization.capacity_calendar import (
+    CapacityCalendar,
+)
 from taskdog_core.application.services.optimization.optimization_strategy import (
     OptimizationStrategy,
 )
 from taskdog_core.application.sorters.optimization_task_sorter import (
     OptimizationTaskSorter,
 )
-from taskdog_core.application.utils.date_helper import is_workday
 from taskdog_core.domain.entities.task import Task
 
 
@@ -50,14 +50,15 @@ class GreedyBasedOptimizationStrategy(OptimizationStrategy):
         Returns:
             OptimizeResult containing modified tasks, daily allocations, and failures
         """
-        # Copy existing allocations to avoid mutating the input
-        daily_allocations = dict(existing_allocations)
-        result = OptimizeResult(daily_allocations=daily_allocations)
+        # The calendar copies existing allocations to avoid mutating the input
+        calendar = CapacityCalendar.from_params(params, existing_allocations)
+        result = OptimizeResult(daily_allocations=calendar.allocations)
 
         sorted_tasks = self._sort_tasks(tasks, params.start_date)
 
         for task in sorted_tasks:
-            updated_task = self._allocate_task(task, daily_allocations, params)
+            params.raise_if_cancelled()
+            updated_task = self._allocate_task(task, calendar, params)
             if updated_task:
                 result.tasks.append(updated_task)
             else:
@@ -84,7 +85,7 @@ class GreedyBasedOptimizationStrategy(OptimizationStrategy):
     def _allocate_task(
         self,
         task: Task,
-        daily_allocations: dict[date, float],
+        calendar: CapacityCalendar,
         params: OptimizeParams,
     ) -> Task | None:
         """Allocate task using greedy forward allocation.
@@ -96,10 +97,33 @@ class GreedyBasedOptimizationStrategy(OptimizationStrategy):
         - Fills each day greedily (maximum possible hours per day)
         - Completes before effective deadline
 
+        calendar.fill_forward() skips days without free capacity with a
+        segment tree query instead of visiting them one by one.
+
+        Args:
+            task: Task to schedule
+            calendar: Current capacity calendar (modified in place)
+            params: Optimization parameters
+
+        Returns:
+            Copy of task with updated schedule, or None if allocation fails
+        """
+        return self._allocate_from(task, calendar, params, calendar.origin)
+
+    def _allocate_from(
+        self,
+        task: Task,
+        calendar: CapacityCalendar,
+        params: OptimizeParams,
+        earliest_day: date,
+    ) -> Task | None:
+        """Allocate task greedily, starting no earlier than earliest_day.
+
         Args:
             task: Task to schedule
-            daily_allocations: Current daily allocations (modified in place)
+            calendar: Current capacity calendar (modified in place)
             params: Optimization parameters
+            earliest_day: First day the task may use (clamped to the origin)
 
         Returns:
             Copy of task with updated schedule, or None if allocation fails
@@ -108,59 +132,22 @@ class GreedyBasedOptimizationStrategy(OptimizationStrategy):
         if task_copy is None:
             return None
 
-        effective_deadline = task_copy.deadline
-
-        current_date = params.start_date
-        remaining_hours = task_copy.estimated_duration
-        assert remaining_hours is not None
-        schedule_start = None
-        schedule_end = None
-        task_daily_allocations: dict[date, float] = {}
-
-        while remaining_hours > SCHEDULING_EPSILON:
-            if not params.include_all_days and not is_workday(
-                current_date, params.holiday_checker
-            ):
-                current_date += timedelta(days=1)
-                continue
-
-            # Compare at day granularity: allocation is per-day, while start_date
-            # (defaults to now()) and deadline carry times of day (#964)
-            if effective_deadline and current_date.date() > effective_deadline.date():
-                for date_obj, hours in task_daily_allocations.items():
-                    daily_allocations[date_obj] -= hours
-                return None
-
-            date_obj = current_date.date()
-            available_hours = calculate_available_hours(
-                daily_allocations,
-                date_obj,
-                params.max_hours_per_day,
-            )
-
-            if available_hours > SCHEDULING_EPSILON:
-                if schedule_start is None:
-                    schedule_start = current_date
-
-                allocated = min(remaining_hours, available_hours)
-                current_allocation = daily_allocations.get(date_obj, 0.0)
-                daily_allocations[date_obj] = current_allocation + allocated
-                task_daily_allocations[date_obj] = allocated
-                remaining_hours -= allocated
-
-                schedule_end = current_date
-
-            current_date += timedelta(days=1)
-
-        if schedule_start and schedule_end:
-            set_planned_times(
-                task_copy,
-                schedule_start,
-                schedule_end,
-                task_daily_allocations,
-            )
-            return task_copy
-
-        for date_obj, hours in task_daily_allocations.items():
-            daily_allocations[date_obj] -= hours
-        return None
+        # Compare at day granularity: allocation is per-day, while start_date
+        # (defaults to now()) and deadline carry times of day (#964)
+        last_day = task_copy.deadline.date() if task_copy.deadline else None
+
+        assert task_copy.estimated_duration is not None
+        task_daily_allocations = calendar.fill_forward(
+            task_copy.estimated_duration, earliest_day, last_day
+        )
+        if not task_daily_allocations:
+            return None
+
+        days = list(task_daily_allocations)
+        set_planned_times(
+            task_copy,
+            params.start_date + timedelta(days=(days[0] - calendar.origin).days),
+            params.start_date + timedelta(days=(days[-1] - calendar.origin).days),
+            task_daily_allocations,
+        )
+        return task_copy
@@ -0,0 +1,97 @@
+"""Helper functions for scoping incremental re-optimization.
+
+An incremental run re-allocates only the tasks whose schedules can change
+after an edit: the changed tasks, their downstream dependents, and the
+reschedulable tasks competing for days the change frees or consumes.
+Everything else stays in place and is treated as existing workload.
+"""
+
+from collections.abc import Iterable
+from datetime import date
+
+from taskdog_core.domain.entities.task import Task
+
+
+def find_downstream_dependents(tasks: list[Task], seed_ids: Iterable[int]) -> set[int]:
+    """Find every task that transitively depends on one of the seed tasks.
+
+    Args:
+        tasks: All tasks in the system
+        seed_ids: IDs of the changed tasks
+
+    Returns:
+        IDs of downstream dependents
+    """
+    dependents: dict[int, list[int]] = {}
+    for task in tasks:
+        if task.id is None:
+            continue
+        for dep_id in task.depends_on:
+            dependents.setdefault(dep_id, []).append(task.id)
+
+    seeds = set(seed_ids)
+    found: set[int] = set()
+    stack = list(seeds)
+    while stack:
+        for dependent_id in dependents.get(stack.pop(), []):
+            if dependent_id not in found:
+                found.add(dependent_id)
+                stack.append(dependent_id)
+    return found
+
+
+def collect_allocation_days(tasks: Iterable[Task]) -> set[date]:
+    """Collect the days on which the given tasks hold allocations.
+
+    Args:
+        tasks: Tasks to inspect
+
+    Returns:
+        Set of allocated dates
+    """
+    return {
+        day
+        for task in tasks
+        for day, hours in task.daily_allocations.items()
+        if hours > 0
+    }
+
+
+def find_competing_tasks(
+    tasks: list[Task], excluded_ids: set[int], window_start: date
+) -> list[Task]:
+    """Find reschedulable tasks that compete for days from window_start on.
+
+    A task competes when it could be moved by the optimizer (pending,
+    non-fixed, with an estimate) and its current schedule reaches
+    window_start or later, so freed capacity could pull it earlier or
+    consumed capacity could push it later. Tasks finishing before
+    window_start keep their slots.
+
+    Args:
+        tasks: All tasks in the system
+        excluded_ids: IDs already in the affected set
+        window_start: Earliest day freed or consumed by the change
+
+    Returns:
+        Competing tasks in input order
+    """
+    competing = []
+    for task in tasks:
+        if task.id is None or task.id in excluded_ids:
+            continue
+        if not task.is_schedulable(force_override=True):
+            continue
+        last_day = _last_scheduled_day(task)
+        if last_day is not None and last_day >= window_start:
+            competing.append(task)
+    return competing
+
+
+def _last_scheduled_day(task: Task) -> date | None:
+    """Return the last day a task is scheduled on, if it has a schedule."""
+    if task.daily_allocations:
+        return max(task.daily_allocations)
+    if task.planned_end is not None:
+        return task.planned_end.date()
+    return None
@@ -1,25 +1,89 @@
 """Monte Carlo optimization strategy implementation."""
 
+import hashlib
+import logging
 import random
+from dataclasses import dataclass
 from datetime import date
 
 from taskdog_core.application.constants.optimization import (
     DEFAULT_OPTIMIZATION_SEED,
+    MONTE_CARLO_CHUNK_SIZE,
     MONTE_CARLO_NUM_SIMULATIONS,
+    OPTIMIZATION_MAX_WORKERS,
 )
 from taskdog_core.application.dto.optimize_params import OptimizeParams
 from taskdog_core.application.dto.optimize_result import OptimizeResult
+from taskdog_core.application.services.optimization.capacity_calendar import (
+    CapacityCalendar,
+)
+from taskdog_core.application.services.optimization.fitness_cache import (
+    FitnessCache,
+    fitness_fingerprint,
+    get_shared_fitness_cache,
+)
 from taskdog_core.application.services.optimization.greedy_optimization_strategy import (
     GreedyOptimizationStrategy,
 )
 from taskdog_core.application.services.optimization.optimization_strategy import (
     OptimizationStrategy,
 )
+from taskdog_core.application.services.optimization.process_pool import (
+    run_in_processes,
+    uses_process_pool,
+    without_cancellation,
+)
 from taskdog_core.application.services.optimization.schedule_fitness_calculator import (
     ScheduleFitnessCalculator,
 )
 from taskdog_core.domain.entities.task import Task
 
+logger = logging.getLogger(__name__)
+
+# Best ordering of a chunk: (score, simulation index, task positions)
+_ChunkBest = tuple[float, int, list[int]]
+
+
+def _stream_seed(seed: int, stream: int) -> int:
+    """Derive the seed of an independent RNG stream from a run seed.
+
+    Args:
+        seed: Seed of the optimization run
+        stream: Index of the stream (chunk)
+
+    Returns:
+        64-bit seed for random.Random
+    """
+    digest = hashlib.blake2b(f"{seed}:{stream}".encode(), digest_size=8)
+    return int.from_bytes(digest.digest(), "big")
+
+
+@dataclass(frozen=True)
+class _ChunkJob:
+    """Picklable inputs of one chunk of simulations.
+
+    Attributes:
+        tasks: Snapshot of the tasks to order
+        existing_allocations: Allocations the simulations start from
+        params: Optimization parameters (without cancellation_check when
+            the chunk runs in a worker process)
+        fingerprint: Fitness cache fingerprint of the run
+        seed: Seed of the chunk's RNG stream
+        indices: Simulation indices covered by the chunk
+    """
+
+    tasks: list[Task]
+    existing_allocations: dict[date, float]
+    params: OptimizeParams
+    fingerprint: bytes
+    seed: int
+    indices: range
+
+
+def _run_chunk(job: _ChunkJob) -> tuple[_ChunkBest | None, dict[str, int]]:
+    """Evaluate a chunk in a worker process, with that process's fitness cache."""
+    return MonteCarloOptimizationStrategy()._run_chunk(job)
+
 
 class MonteCarloOptimizationStrategy(OptimizationStrategy):
     """Monte Carlo simulation algorithm for task scheduling optimization.
@@ -31,23 +95,38 @@ class MonteCarloOptimizationStrategy(OptimizationStrategy):
     4. Evaluate score (deadline compliance, priority, workload balance)
     5. Return the best schedule found
 
+    Simulations are split into chunks of CHUNK_SIZE, each drawing from its
+    own RNG stream derived from the seed, and the best ordering is picked by
+    score, then by simulation index. The result therefore only depends on the
+    seed and the number of simulations, not on the order in which chunks are
+    evaluated or on the number of workers. A single chunk runs in the calling
+    process; several chunks run on the shared optimization process pool, at
+    most MAX_WORKERS at a time, and cancellation is checked between them.
+
     Parameters:
-    - Number of simulations: 100
+    - Number of simulations: params.num_simulations (default 50)
     """
 
     DISPLAY_NAME = "Monte Carlo"
     DESCRIPTION = "Random sampling approach"
 
     NUM_SIMULATIONS = MONTE_CARLO_NUM_SIMULATIONS
+    CHUNK_SIZE = MONTE_CARLO_CHUNK_SIZE
+    MAX_WORKERS = OPTIMIZATION_MAX_WORKERS
+
+    def __init__(self, fitness_cache: FitnessCache | None = None) -> None:
+        """Initialize strategy.
 
-    def __init__(self) -> None:
-        """Initialize strategy."""
+        Args:
+            fitness_cache: Cache for ordering evaluations (default: the
+                process-wide shared cache)
+        """
         self.fitness_calculator = ScheduleFitnessCalculator()
-        self._evaluation_cache: dict[
-            tuple[int | None, ...], float
-        ] = {}  # Cache for evaluation results
+        self._fitness_cache = (
+            fitness_cache if fitness_cache is not None else get_shared_fitness_cache()
+        )
+        self._fingerprint = b""
         self._existing_allocations: dict[date, float] = {}
-        self._rng = random.Random()
 
     def optimize_tasks(
         self,
@@ -68,41 +147,47 @@ class MonteCarloOptimizationStrategy(OptimizationStrategy):
         if not tasks:
             return OptimizeResult()
 
-        # Seed a local RNG per run so identical input + seed is reproducible
-        self._rng.seed(
-            params.seed if params.seed is not None else DEFAULT_OPTIMIZATION_SEED
-        )
-
         # Store existing allocations for use in evaluation
         self._existing_allocations = existing_allocations
 
         # Copy existing allocations to avoid mutating the input
-        result = OptimizeResult(daily_allocations=dict(existing_allocations))
+        calendar = CapacityCalendar.from_params(params, existing_allocations)
+        result = OptimizeResult(daily_allocations=calendar.allocations)
 
         # Create greedy strategy instance for allocation
         greedy_strategy = GreedyOptimizationStrategy()
 
-        # Clear evaluation cache for new optimization run
-        self._evaluation_cache.clear()
+        # Scores depend on the existing allocations the simulations start from
+        self._fingerprint = fitness_fingerprint(
+            "monte_carlo", tasks, params, existing_allocations
+        )
 
         # Run Monte Carlo simulation
         best_order = self._monte_carlo_simulation(
             tasks,
             params,
             greedy_strategy,
+            result.counters,
         )
 
         # Schedule tasks according to best order using greedy allocation
         for task in best_order:
-            updated_task = greedy_strategy._allocate_task(
-                task, result.daily_allocations, params
-            )
+            updated_task = greedy_strategy._allocate_task(task, calendar, params)
             if updated_task:
                 result.tasks.append(updated_task)
             else:
                 # Record allocation failure
                 result.record_allocation_failure(task)
 
+        stats = self._fitness_cache.stats()
+        logger.debug(
+            "Fitness cache: %d hits, %d misses (%.1f%% hit rate), %d entries",
+            stats.hits,
+            stats.misses,
+            stats.hit_rate * 100,
+            stats.entries,
+        )
+
         return result
 
     def _monte_carlo_simulation(
@@ -110,6 +195,7 @@ class MonteCarloOptimizationStrategy(OptimizationStrategy):
         schedulable_tasks: list[Task],
         params: OptimizeParams,
         greedy_strategy: GreedyOptimizationStrategy,
+        counters: dict[str, int | bool],
     ) -> list[Task]:
         """Run Monte Carlo simulation to find optimal task ordering.
 
@@ -117,45 +203,185 @@ class MonteCarloOptimizationStrategy(OptimizationStrategy):
             schedulable_tasks: List of tasks to schedule
             params: Optimization parameters
             greedy_strategy: Greedy strategy instance
+            counters: Receives the simulations, duplicates_skipped,
+                evaluations and cache_hits of all chunks
 
         Returns:
             List of tasks in optimal order
         """
-        best_order = None
-        best_score = float("-inf")
-        evaluated_orderings: set[tuple[int, ...]] = set()
+        seed = params.seed if params.seed is not None else DEFAULT_OPTIMIZATION_SEED
+        num_simulations = params.num_simulations or self.NUM_SIMULATIONS
+        chunks = [
+            (stream, range(first, min(first + self.CHUNK_SIZE, num_simulations)))
+            for stream, first in enumerate(range(0, num_simulations, self.CHUNK_SIZE))
+        ]
+
+        if uses_process_pool(len(chunks), self.MAX_WORKERS):
+            worker_params = without_cancellation(params)
+            outcomes = run_in_processes(
+                _run_chunk,
+                [
+                    self._chunk_job(schedulable_tasks, worker_params, seed, *chunk)
+                    for chunk in chunks
+                ],
+                self.MAX_WORKERS,
+                params.raise_if_cancelled,
+            )
+        else:
+            outcomes = [
+                self._run_chunk(
+                    self._chunk_job(schedulable_tasks, params, seed, *chunk),
+                    greedy_strategy,
+                )
+                for chunk in chunks
+            ]
+
+        # Merge in chunk order so counters do not depend on completion order
+        chunk_counters: dict[str, int] = {}
+        for _chunk_best, outcome_counters in outcomes:
+            for name, value in outcome_counters.items():
+                chunk_counters[name] = chunk_counters.get(name, 0) + value
+        counters["simulations"] = num_simulations
+        for name in ("duplicates_skipped", "evaluations", "cache_hits"):
+            counters[name] = chunk_counters.get(name, 0)
+
+        # Highest score wins; ties go to the earliest simulation
+        best = min(
+            (
+                chunk_best
+                for chunk_best, _counters in outcomes
+                if chunk_best is not None
+            ),
+            key=lambda chunk_best: (-chunk_best[0], chunk_best[1]),
+            default=None,
+        )
+        if best is None:
+            return schedulable_tasks
+        return [schedulable_tasks[position] for position in best[2]]
 
-        for _ in range(self.NUM_SIMULATIONS):
-            # Generate random ordering
-            random_order = self._rng.sample(schedulable_tasks, len(schedulable_tasks))
+    def _chunk_job(
+        self,
+        schedulable_tasks: list[Task],
+        params: OptimizeParams,
+        seed: int,
+        stream: int,
+        indices: range,
+    ) -> _ChunkJob:
+        """Bundle the inputs of one chunk.
 
-            # Skip duplicate orderings
-            ordering_key = tuple(
-                task.id for task in random_order if task.id is not None
+        Args:
+            schedulable_tasks: List of tasks to schedule
+            params: Optimization parameters
+            seed: Seed of the optimization run
+            stream: Index of the chunk's RNG stream
+            indices: Simulation indices covered by the chunk
+
+        Returns:
+            _ChunkJob for the chunk
+        """
+        return _ChunkJob(
+            tasks=schedulable_tasks,
+            existing_allocations=self._existing_allocations,
+            params=params,
+            fingerprint=self._fingerprint,
+            seed=_stream_seed(seed, stream),
+            indices=indices,
+        )
+
+    def _run_chunk(
+        self,
+        job: _ChunkJob,
+        greedy_strategy: GreedyOptimizationStrategy | None = None,
+    ) -> tuple[_ChunkBest | None, dict[str, int]]:
+        """Evaluate one chunk with this strategy's fitness cache.
+
+        Args:
+            job: Inputs of the chunk
+            greedy_strategy: Greedy strategy instance (default: a new one)
+
+        Returns:
+            Tuple of (best of the chunk or None, the chunk's counters)
+        """
+        self._fingerprint = job.fingerprint
+        self._existing_allocations = job.existing_allocations
+        counters: dict[str, int] = {}
+        best = self._simulate_chunk(
+            job.tasks,
+            job.params,
+            greedy_strategy or GreedyOptimizationStrategy(),
+            random.Random(job.seed),
+            job.indices,
+            counters,
+        )
+        return best, counters
+
+    def _simulate_chunk(
+        self,
+        schedulable_tasks: list[Task],
+        params: OptimizeParams,
+        greedy_strategy: GreedyOptimizationStrategy,
+        rng: random.Random,
+        indices: range,
+        counters: dict[str, int],
+    ) -> _ChunkBest | None:
+        """Evaluate one chunk of random orderings drawn from its own stream.
+
+        Args:
+            schedulable_tasks: List of tasks to schedule
+            params: Optimization parameters
+            greedy_strategy: Greedy strategy instance
+            rng: RNG stream of this chunk
+            indices: Simulation indices covered by this chunk
+            counters: Profiling counters of the run (updated in place)
+
+        Returns:
+            Best (score, simulation index, positions in schedulable_tasks) of
+            the chunk, or None if nothing was evaluated
+        """
+        best: _ChunkBest | None = None
+        # 64-bit hashes of the orderings already evaluated in this chunk
+        evaluated_orderings: set[int] = set()
+
+        for index in indices:
+            # Cooperative cancellation point between simulations
+            params.raise_if_cancelled()
+
+            # Generate random ordering as positions, which map a worker's
+            # result back to the caller's tasks
+            positions = rng.sample(
+                range(len(schedulable_tasks)), len(schedulable_tasks)
             )
-            if ordering_key in evaluated_orderings:
+            random_order = [schedulable_tasks[position] for position in positions]
+
+            # Skip duplicate orderings
+            ordering_hash = hash(tuple(task.id for task in random_order))
+            if ordering_hash in evaluated_orderings:
+                counters["duplicates_skipped"] = (
+                    counters.get("duplicates_skipped", 0) + 1
+                )
                 continue
-            evaluated_orderings.add(ordering_key)
+            evaluated_orderings.add(ordering_hash)
 
             # Evaluate this ordering (with caching)
             score = self._evaluate_ordering_cached(
                 random_order,
                 params,
                 greedy_strategy,
+                counters,
             )
 
             # Track best ordering
-            if score > best_score:
-                best_score = score
-                best_order = random_order
+            if best is None or score > best[0]:
+                best = (score, index, positions)
 
-        return best_order or schedulable_tasks
+        return best
 
     def _evaluate_ordering_cached(
         self,
         task_order: list[Task],
         params: OptimizeParams,
         greedy_strategy: GreedyOptimizationStrategy,
+        counters: dict[str, int],
     ) -> float:
         """Evaluate ordering with caching to avoid redundant calculations.
 
@@ -163,17 +389,20 @@ class MonteCarloOptimizationStrategy(OptimizationStrategy):
             task_order: Ordering of tasks to evaluate
             params: Optimization parameters
             greedy_strategy: Greedy strategy instance
+            counters: Profiling counters of the run
 
         Returns:
             Score (higher is better)
         """
-        # Create cache key from task IDs (tuple is hashable)
-        cache_key = tuple(task.id for task in task_order)
+        cache_key = self._fitness_cache.ordering_key(self._fingerprint, task_order)
 
         # Return cached result if available
-        if cache_key in self._evaluation_cache:
-            return self._evaluation_cache[cache_key]
+        cached_score = self._fitness_cache.get(cache_key)
+        if cached_score is not None:
+            counters["cache_hits"] = counters.get("cache_hits", 0) + 1
+            return cached_score
 
+        counters["evaluations"] = counters.get("evaluations", 0) + 1
         # Calculate score
         score = self._evaluate_ordering(
             task_order,
@@ -182,7 +411,7 @@ class MonteCarloOptimizationStrategy(OptimizationStrategy):
         )
 
         # Cache the result
-        self._evaluation_cache[cache_key] = score
+        self._fitness_cache.put(cache_key, score)
 
         return score
 
@@ -205,14 +434,13 @@ class MonteCarloOptimizationStrategy(OptimizationStrategy):
             Score (higher is better)
         """
         # Simulate scheduling with this order
-        # Use pre-computed existing allocations (copy to avoid mutation)
-        daily_allocations = dict(self._existing_allocations)
+        # Use pre-computed existing allocations (the calendar copies them)
+        calendar = CapacityCalendar.from_params(params, self._existing_allocations)
+        daily_allocations = calendar.allocations
         scheduled_tasks = []
 
         for task in task_order:
-            updated_task = greedy_strategy._allocate_task(
-                task, daily_allocations, params
-            )
+            updated_task = greedy_strategy._allocate_task(task, calendar, params)
             if updated_task:
                 scheduled_tasks.append(updated_task)
 
@@ -52,4 +52,8 @@ class OptimizationStrategy(ABC):
 
         Returns:
             OptimizeResult containing modified tasks, daily allocations, and failures
+
+        Raises:
+            OptimizationCancelledError: If params.cancellation_check requests
+                cancellation at one of the strategy's checkpoints
         """
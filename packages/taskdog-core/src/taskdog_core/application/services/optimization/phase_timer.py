@@ -0,0 +1,49 @@
+"""Wall-clock timing of the phases of an optimization run."""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class PhaseTimer:
+    """Accumulates wall-clock seconds per named phase.
+
+    A phase may run several times (incremental runs call the strategy until
+    the affected set is stable, capacity lanes aggregate allocations per
+    lane); its durations are summed. Phases are reported in the order they
+    first ran.
+    """
+
+    def __init__(self) -> None:
+        """Start timing the run."""
+        self._started = time.perf_counter()
+        self._seconds: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as part of a phase.
+
+        Args:
+            name: Phase name
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._seconds[name] = (
+                self._seconds.get(name, 0.0) + time.perf_counter() - started
+            )
+
+    @property
+    def phases(self) -> dict[str, float]:
+        """Seconds spent per phase, in the order the phases first ran."""
+        return dict(self._seconds)
+
+    def elapsed(self) -> float:
+        """Seconds since the timer was created."""
+        return time.perf_counter() - self._started
@@ -0,0 +1,261 @@
+"""Portfolio optimization strategy implementation."""
+
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from taskdog_core.application.constants.optimization import (
+    OPTIMIZATION_MAX_WORKERS,
+    PORTFOLIO_DEFAULT_ALGORITHMS,
+)
+from taskdog_core.application.dto.optimization_summary import PortfolioCandidate
+from taskdog_core.application.dto.optimize_params import OptimizeParams
+from taskdog_core.application.dto.optimize_result import OptimizeResult
+from taskdog_core.application.services.optimization.optimization_strategy import (
+    OptimizationStrategy,
+)
+from taskdog_core.application.services.optimization.process_pool import (
+    run_in_processes,
+    uses_process_pool,
+    without_cancellation,
+)
+from taskdog_core.application.services.optimization.schedule_fitness_calculator import (
+    ScheduleFitnessCalculator,
+)
+from taskdog_core.domain.entities.task import Task
+from taskdog_core.domain.exceptions.task_exceptions import OptimizationCancelledError
+
+
+@dataclass(frozen=True)
+class _MemberJob:
+    """Picklable inputs of one portfolio member run in a worker process.
+
+    Attributes:
+        name: Strategy name (the worker creates its own instance)
+        tasks: Snapshot of the tasks to schedule
+        existing_allocations: Pre-aggregated daily allocations
+        params: Optimization parameters without cancellation_check
+    """
+
+    name: str
+    tasks: list[Task]
+    existing_allocations: dict[date, float]
+    params: OptimizeParams
+
+
+def _run_member(
+    job: _MemberJob,
+) -> tuple[PortfolioCandidate, OptimizeResult | None]:
+    """Run and score one portfolio member in a worker process."""
+    # Imported here: the factory registers PortfolioOptimizationStrategy
+    from taskdog_core.application.services.optimization.strategy_factory import (
+        StrategyFactory,
+    )
+
+    return PortfolioOptimizationStrategy()._run_candidate(
+        job.name,
+        StrategyFactory.create(job.name),
+        job.tasks,
+        job.existing_allocations,
+        job.params,
+    )
+
+
+class PortfolioOptimizationStrategy(OptimizationStrategy):
+    """Runs several strategies on the same input and keeps the best schedule.
+
+    1. Run each configured strategy on the shared, pre-loaded tasks and
+       existing allocations
+    2. Score each schedule with ScheduleFitnessCalculator
+    3. Return the highest-scoring result (ties go to the earlier strategy in
+       the configured order), annotated with every candidate's fitness and
+       runtime
+
+    Strategies run on the shared optimization process pool, at most
+    MAX_WORKERS at a time, each on its own copy of the inputs; cancellation
+    is checked between completed strategies. Without a pool (one strategy,
+    one CPU, or inside a worker) they run one after another in the calling
+    process.
+    """
+
+    DISPLAY_NAME = "Portfolio"
+    DESCRIPTION = "Best of several algorithms"
+
+    NAME = "portfolio"
+    MAX_WORKERS = OPTIMIZATION_MAX_WORKERS
+
+    def __init__(self) -> None:
+        """Initialize strategy."""
+        self.fitness_calculator = ScheduleFitnessCalculator()
+
+    def optimize_tasks(
+        self,
+        tasks: list[Task],
+        existing_allocations: dict[date, float],
+        params: OptimizeParams,
+    ) -> OptimizeResult:
+        """Optimize task schedules by picking the best of several strategies.
+
+        Args:
+            tasks: List of tasks to schedule (already filtered by is_schedulable())
+            existing_allocations: Pre-aggregated daily allocations from existing tasks
+            params: Optimization parameters; params.portfolio_algorithms selects
+                the strategies to evaluate
+
+        Returns:
+            OptimizeResult of the winning strategy, with selected_algorithm and
+            per-strategy portfolio results set
+
+        Raises:
+            ValueError: If an algorithm is unknown or is "portfolio" itself
+            OptimizationCancelledError: If cancellation is requested
+        """
+        algorithms = list(params.portfolio_algorithms or PORTFOLIO_DEFAULT_ALGORITHMS)
+        strategies = self._create_strategies(algorithms)
+
+        if uses_process_pool(len(strategies), self.MAX_WORKERS):
+            worker_params = without_cancellation(params)
+            outcomes = run_in_processes(
+                _run_member,
+                [
+                    _MemberJob(name, tasks, existing_allocations, worker_params)
+                    for name, _strategy in strategies
+                ],
+                self.MAX_WORKERS,
+                params.raise_if_cancelled,
+            )
+        else:
+            outcomes = [
+                self._run_candidate(name, strategy, tasks, existing_allocations, params)
+                for name, strategy in strategies
+            ]
+
+        # Keep results in configured order so ties are deterministic
+        best: tuple[float, OptimizeResult, str] | None = None
+        candidates: list[PortfolioCandidate] = []
+        for candidate, result in outcomes:
+            candidates.append(candidate)
+            if result is None or candidate.fitness is None:
+                continue
+            if best is None or candidate.fitness > best[0]:
+                best = (candidate.fitness, result, candidate.algorithm)
+
+        if best is None:
+            # Every strategy raised: surface the first error
+            raise ValueError(
+                f"All portfolio algorithms failed: {candidates[0].error}"
+                if candidates
+                else "No portfolio algorithms configured"
+            )
+
+        _fitness, winner, winner_name = best
+        winner.selected_algorithm = winner_name
+        winner.portfolio = [
+            candidate.model_copy(
+                update={"selected": candidate.algorithm == winner_name}
+            )
+            for candidate in candidates
+        ]
+        return winner
+
+    def _create_strategies(
+        self, algorithms: list[str]
+    ) -> list[tuple[str, OptimizationStrategy]]:
+        """Instantiate the configured strategies, validating names up front.
+
+        Args:
+            algorithms: Strategy names in evaluation order
+
+        Returns:
+            List of (name, strategy) pairs without duplicates
+
+        Raises:
+            ValueError: If a name is unknown or refers to the portfolio itself
+        """
+        # Imported here: the factory registers this strategy, so a module-level
+        # import would be circular
+        from taskdog_core.application.services.optimization.strategy_factory import (
+            StrategyFactory,
+        )
+
+        strategies: list[tuple[str, OptimizationStrategy]] = []
+        for name in dict.fromkeys(algorithms):
+            if name == self.NAME:
+                raise ValueError("The portfolio algorithm cannot include itself")
+            strategies.append((name, StrategyFactory.create(name)))
+        if not strategies:
+            raise ValueError("No portfolio algorithms configured")
+        return strategies
+
+    def _run_candidate(
+        self,
+        name: str,
+        strategy: OptimizationStrategy,
+        tasks: list[Task],
+        existing_allocations: dict[date, float],
+        params: OptimizeParams,
+    ) -> tuple[PortfolioCandidate, OptimizeResult | None]:
+        """Run and score a single strategy.
+
+        Args:
+            name: Strategy name
+            strategy: Strategy instance
+            tasks: Tasks to schedule
+            existing_allocations: Pre-aggregated daily allocations
+            params: Optimization parameters
+
+        Returns:
+            Tuple of (candidate report, result or None if the strategy raised)
+
+        Raises:
+            OptimizationCancelledError: If cancellation is requested
+        """
+        params.raise_if_cancelled()
+        started = time.perf_counter()
+        try:
+            result = strategy.optimize_tasks(tasks, existing_allocations, params)
+        except OptimizationCancelledError:
+            raise
+        except Exception as e:
+            return (
+                PortfolioCandidate(
+                    algorithm=name,
+                    fitness=None,
+                    runtime_seconds=time.perf_counter() - started,
+                    error=str(e),
+                ),
+                None,
+            )
+        runtime = time.perf_counter() - started
+
+        return (
+            PortfolioCandidate(
+                algorithm=name,
+                fitness=self._score(result),
+                runtime_seconds=runtime,
+                scheduled_count=len(result.tasks),
+                failed_count=len(result.failures),
+            ),
+            result,
+        )
+
+    def _score(self, result: OptimizeResult) -> float:
+        """Score a strategy result on a common basis.
+
+        Strategies return tasks in their own processing order, so tasks are
+        ranked by planned start before scoring; the priority term then rewards
+        schedules that actually run high-priority work first.
+
+        Args:
+            result: Strategy result
+
+        Returns:
+            Fitness score (higher is better)
+        """
+        ordered = sorted(
+            result.tasks,
+            key=lambda t: (t.planned_start or datetime.max, t.id or 0),
+        )
+        return self.fitness_calculator.calculate_fitness(
+            ordered, result.daily_allocations, include_scheduling_bonus=True
+        )
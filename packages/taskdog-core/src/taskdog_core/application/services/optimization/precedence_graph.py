@@ -0,0 +1,183 @@
+"""Dependency graph of the tasks in an optimization run, with CPM timings."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from taskdog_core.domain.entities.task import Task
+
+
+@dataclass(frozen=True)
+class TaskTiming:
+    """Critical Path Method timings of one task, in days from the start.
+
+    Attributes:
+        earliest_start: Earliest day offset the task can start
+        earliest_finish: earliest_start plus the task's duration
+        latest_start: Latest start that keeps successors and deadlines on time
+        latest_finish: latest_start plus the task's duration
+    """
+
+    earliest_start: int
+    earliest_finish: int
+    latest_start: int
+    latest_finish: int
+
+    @property
+    def slack(self) -> int:
+        """Days the task can slip without delaying a successor or deadline.
+
+        Negative when a deadline cannot be met even without slipping.
+        """
+        return self.latest_finish - self.earliest_finish
+
+
+class PrecedenceGraph:
+    """Directed acyclic graph of "prerequisite -> dependent" edges.
+
+    Nodes are positions in the task list given to the constructor. Only
+    dependencies between tasks of that list become edges; dependencies on
+    other tasks (completed or not being optimized) are ignored.
+
+    All passes are iterative and linear in nodes plus edges, so deep chains
+    and graphs with tens of thousands of tasks are fine.
+
+    Cycles are not expected (add_dependency rejects them). If one exists
+    anyway, its tasks are appended to the topological order in input order
+    and their edges inside the cycle are ignored by the scheduler.
+    """
+
+    def __init__(self, tasks: Sequence[Task]) -> None:
+        """Build the graph.
+
+        Args:
+            tasks: Tasks of the optimization run
+        """
+        self.tasks = list(tasks)
+        position = {
+            task.id: node for node, task in enumerate(self.tasks) if task.id is not None
+        }
+        self.predecessors: list[list[int]] = [[] for _ in self.tasks]
+        self.successors: list[list[int]] = [[] for _ in self.tasks]
+        for node, task in enumerate(self.tasks):
+            for dep_id in dict.fromkeys(task.depends_on):
+                prerequisite = position.get(dep_id)
+                if prerequisite is not None and prerequisite != node:
+                    self.predecessors[node].append(prerequisite)
+                    self.successors[prerequisite].append(node)
+        self.order = self._topological_order()
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def _topological_order(self) -> list[int]:
+        """Kahn's algorithm, keeping input order among independent nodes."""
+        in_degree = [len(preds) for preds in self.predecessors]
+        queue = deque(node for node, degree in enumerate(in_degree) if degree == 0)
+        order: list[int] = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for successor in self.successors[node]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    queue.append(successor)
+
+        if len(order) < len(self.tasks):
+            placed = set(order)
+            order.extend(node for node in range(len(self.tasks)) if node not in placed)
+        return order
+
+    def compute_timings(
+        self,
+        durations: Sequence[int],
+        due: Sequence[int | None],
+    ) -> list[TaskTiming]:
+        """Run the forward (earliest) and backward (latest) CPM passes.
+
+        The backward pass starts from each task's deadline, or from the
+        horizon (the later of the longest path and the latest deadline) for
+        tasks without one.
+
+        Args:
+            durations: Duration of each node in days
+            due: Day offset each node must finish by (None for no deadline)
+
+        Returns:
+            Timings per node, indexed like the tasks
+        """
+        count = len(self.tasks)
+        earliest_finish = [0] * count
+        earliest_start = [0] * count
+        for node in self.order:
+            start = max(
+                (earliest_finish[p] for p in self.predecessors[node]), default=0
+            )
+            earliest_start[node] = start
+            earliest_finish[node] = start + durations[node]
+
+        horizon = max(
+            max(earliest_finish, default=0),
+            max((d for d in due if d is not None), default=0),
+        )
+        latest_start = [0] * count
+        latest_finish = [0] * count
+        for node in reversed(self.order):
+            node_due = due[node]
+            finish = horizon if node_due is None else node_due
+            for successor in self.successors[node]:
+                finish = min(finish, latest_start[successor])
+            latest_finish[node] = finish
+            latest_start[node] = finish - durations[node]
+
+        return [
+            TaskTiming(
+                earliest_start=earliest_start[node],
+                earliest_finish=earliest_finish[node],
+                latest_start=latest_start[node],
+                latest_finish=latest_finish[node],
+            )
+            for node in range(count)
+        ]
+
+    def critical_path(self, timings: Sequence[TaskTiming]) -> list[int]:
+        """Find the longest dependency chain.
+
+        Starts from the node that finishes last and walks back through the
+        predecessor that determines each earliest start, preferring the one
+        with the least slack.
+
+        Args:
+            timings: Result of compute_timings()
+
+        Returns:
+            Nodes of the chain from first to last (empty for an empty graph)
+        """
+        if not self.tasks:
+            return []
+
+        node = min(
+            range(len(self.tasks)),
+            key=lambda n: (-timings[n].earliest_finish, timings[n].slack, n),
+        )
+        path = [node]
+        visited = {node}
+        while True:
+            start = timings[node].earliest_start
+            drivers = [
+                p
+                for p in self.predecessors[node]
+                if p not in visited and timings[p].earliest_finish == start
+            ]
+            if not drivers:
+                break
+            node = min(drivers, key=lambda n: (timings[n].slack, n))
+            path.append(node)
+            visited.add(node)
+        path.reverse()
+        return path
@@ -0,0 +1,186 @@
+"""Process pool for CPU-bound optimization work.
+
+Strategy evaluations are pure Python, so threads serialize on the GIL. Runs
+that split their work into independent jobs (Monte Carlo chunks, portfolio
+members, what-if scenarios) hand them to one process pool shared by the
+whole process, so worker start-up is paid once rather than per run.
+
+Jobs and their results cross process boundaries, so the job function must
+be defined at module level and its argument and result must be picklable.
+In particular, OptimizeParams must not carry a cancellation_check: callers
+strip it with without_cancellation() and check for cancellation in the
+calling process instead, between completed jobs.
+
+Workers use the "spawn" start method, which is safe in the threaded server.
+Inside a worker, nested runs (e.g. a Monte Carlo member of a portfolio)
+execute their jobs in that worker rather than starting another pool.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from taskdog_core.application.constants.optimization import (
+    OPTIMIZATION_MAX_WORKERS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from concurrent.futures import Future
+
+    from taskdog_core.application.dto.optimize_params import OptimizeParams
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+# True in worker processes of the pool
+_in_worker = False
+
+
+def _mark_worker() -> None:
+    global _in_worker
+    _in_worker = True
+
+
+def pool_size() -> int:
+    """Number of worker processes of the shared pool.
+
+    Returns:
+        OPTIMIZATION_MAX_WORKERS, capped at the number of CPUs
+    """
+    return max(1, min(OPTIMIZATION_MAX_WORKERS, os.cpu_count() or 1))
+
+
+def uses_process_pool(job_count: int, max_workers: int) -> bool:
+    """Check whether run_in_processes() would hand jobs to the pool.
+
+    Args:
+        job_count: Number of jobs of the run
+        max_workers: Maximum jobs of the run in flight at once
+
+    Returns:
+        False for a single job, a limit of one worker, a single-CPU pool, or
+        when already running inside a worker process
+    """
+    return job_count > 1 and min(max_workers, pool_size()) > 1 and not _in_worker
+
+
+def without_cancellation(params: OptimizeParams) -> OptimizeParams:
+    """Copy parameters for a worker process.
+
+    The cancellation check is usually a closure over in-process state (a job
+    token, a lambda), which can neither be pickled nor observed from another
+    process.
+
+    Args:
+        params: Parameters of the run
+
+    Returns:
+        The same parameters without cancellation_check
+    """
+    if params.cancellation_check is None:
+        return params
+    return replace(params, cancellation_check=None)
+
+
+def run_in_processes[T, R](
+    fn: Callable[[T], R],
+    jobs: Sequence[T],
+    max_workers: int = OPTIMIZATION_MAX_WORKERS,
+    raise_if_cancelled: Callable[[], None] | None = None,
+) -> list[R]:
+    """Run independent jobs on the shared process pool.
+
+    Jobs run in the calling process, one after another, when
+    uses_process_pool() is False. Otherwise at most max_workers of them are
+    in flight at once, and raise_if_cancelled is called before each
+    submission and after each completed job. When it raises (or a job does),
+    jobs that have not started are cancelled; jobs already running in a
+    worker finish there and their results are dropped.
+
+    Args:
+        fn: Module-level function applied to each job
+        jobs: Picklable job arguments
+        max_workers: Maximum jobs of this run in flight at once
+        raise_if_cancelled: Called between jobs; raises to abort the run
+
+    Returns:
+        Results in job order, independent of completion order
+    """
+    check_cancelled = raise_if_cancelled or _never_cancelled
+    if not uses_process_pool(len(jobs), max_workers):
+        results: list[R] = []
+        for job in jobs:
+            check_cancelled()
+            results.append(fn(job))
+        return results
+
+    pool = _get_pool()
+    try:
+        return _run_on_pool(
+            pool, fn, jobs, min(max_workers, pool_size()), check_cancelled
+        )
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        raise
+
+
+def _never_cancelled() -> None:
+    pass
+
+
+def _run_on_pool[T, R](
+    pool: ProcessPoolExecutor,
+    fn: Callable[[T], R],
+    jobs: Sequence[T],
+    limit: int,
+    check_cancelled: Callable[[], None],
+) -> list[R]:
+    """Keep up to limit jobs in flight and collect results by job index."""
+    collected: dict[int, R] = {}
+    in_flight: dict[Future[R], int] = {}
+    pending = iter(enumerate(jobs))
+    try:
+        while True:
+            for index, job in pending:
+                check_cancelled()
+                in_flight[pool.submit(fn, job)] = index
+                if len(in_flight) >= limit:
+                    break
+            if not in_flight:
+                return [collected[index] for index in range(len(jobs))]
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                collected[in_flight.pop(future)] = future.result()
+            check_cancelled()
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Return the shared pool, starting it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=pool_size(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_mark_worker,
+            )
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Forget a broken pool so the next run starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
@@ -1,27 +1,64 @@
 """Round-robin optimization strategy implementation."""
 
 import copy
+import heapq
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import TYPE_CHECKING
 
-from taskdog_core.application.constants.optimization import (
-    ROUND_ROBIN_MAX_ITERATIONS,
-    SCHEDULING_EPSILON,
-)
+from taskdog_core.application.constants.optimization import SCHEDULING_EPSILON
 from taskdog_core.application.dto.optimize_params import OptimizeParams
 from taskdog_core.application.dto.optimize_result import OptimizeResult
 from taskdog_core.application.services.optimization.allocation_helpers import (
     SCHEDULE_END_TIME,
     SCHEDULE_START_TIME,
 )
+from taskdog_core.application.services.optimization.capacity_calendar import (
+    CapacityCalendar,
+)
 from taskdog_core.application.services.optimization.optimization_strategy import (
     OptimizationStrategy,
 )
-from taskdog_core.application.utils.date_helper import is_workday
 from taskdog_core.domain.entities.task import Task
 
-if TYPE_CHECKING:
-    from taskdog_core.domain.services.holiday_checker import IHolidayChecker
+
+@dataclass
+class _Rotation:
+    """Outcome of the round-robin allocation.
+
+    Every task still in the rotation receives the same share of a day, so
+    the allocations are stored once per day instead of once per task and
+    day: a finished task received shares[i] on days[i] for every i before
+    its last day, and the rest of its estimate on that day.
+
+    Attributes:
+        days: Days that received hours, in date order
+        shares: Hours each task in the rotation received on the matching day
+        finished: Index into days of each finished task's last day
+        unfinished: Number of days on which each task that expired or ran
+            out of days received hours
+    """
+
+    days: list[date] = field(default_factory=list)
+    shares: list[float] = field(default_factory=list)
+    finished: dict[int, int] = field(default_factory=dict)
+    unfinished: dict[int, int] = field(default_factory=dict)
+
+    def hours_left(self, estimate: float, day_count: int) -> float:
+        """Hours of an estimate left after the shares of the first days.
+
+        Shares are subtracted one at a time, as a per-task counter would be.
+
+        Args:
+            estimate: Estimated hours of the task
+            day_count: Number of days the task received its share on
+
+        Returns:
+            Remaining hours
+        """
+        remaining = float(estimate)
+        for share in self.shares[:day_count]:
+            remaining -= share
+        return remaining
 
 
 class RoundRobinOptimizationStrategy(OptimizationStrategy):
@@ -62,234 +99,197 @@ class RoundRobinOptimizationStrategy(OptimizationStrategy):
         # Filter out tasks without ID (should not happen, but for type safety)
         schedulable_tasks = [t for t in tasks if t.id is not None]
 
-        # Calculate effective deadlines for all tasks
-        task_effective_deadlines: dict[int, datetime | None] = {
-            task.id: task.deadline for task in schedulable_tasks if task.id is not None
-        }
-
-        # Track remaining hours for each task
-        task_remaining: dict[int, float] = {
-            task.id: task.estimated_duration or 0.0
-            for task in schedulable_tasks
-            if task.id is not None
-        }
-        # Store original tasks (deep copy deferred until _build_updated_tasks)
-        task_map: dict[int, Task] = {
-            task.id: task for task in schedulable_tasks if task.id is not None
-        }
-
-        # Track allocations per task and per day
-        task_daily_allocations: dict[int, dict[date, float]] = {
-            task.id: {} for task in schedulable_tasks if task.id is not None
-        }
-        daily_allocations: dict[date, float] = dict(existing_allocations)
-
-        # Track start and end dates for each task
-        task_start_dates: dict[int, datetime] = {}
-        task_end_dates: dict[int, datetime] = {}
-
-        # Allocate time in round-robin fashion
-        self._allocate_round_robin(
-            task_remaining,
-            task_daily_allocations,
-            daily_allocations,
-            task_start_dates,
-            task_end_dates,
-            params.start_date,
-            params.max_hours_per_day,
-            task_effective_deadlines,
-            params.holiday_checker,
-            existing_allocations=existing_allocations,
-            include_all_days=params.include_all_days,
+        calendar = CapacityCalendar.from_params(params, existing_allocations)
+        rotation = self._allocate_round_robin(
+            schedulable_tasks, calendar, params.start_date
         )
 
         # Identify tasks that couldn't be fully scheduled
-        fully_scheduled_task_ids = set()
-        for task_id, remaining_hours in task_remaining.items():
-            if remaining_hours > SCHEDULING_EPSILON:  # Task not fully scheduled
-                task = task_map[task_id]
-
-                if task_id in task_start_dates:
-                    # Partially scheduled but ran out of time
-                    result.record_failure(
-                        task,
-                        f"Could not complete scheduling before deadline ({remaining_hours:.1f}h remaining)",
-                    )
-                else:
-                    # Never scheduled at all
-                    result.record_failure(
-                        task, "Deadline too close or no time available"
-                    )
+        for task in schedulable_tasks:
+            assert task.id is not None
+            day_count = rotation.unfinished.get(task.id)
+            if day_count is None:
+                continue
+            if day_count:
+                # Partially scheduled but ran out of time
+                remaining_hours = rotation.hours_left(
+                    task.estimated_duration or 0.0, day_count
+                )
+                result.record_failure(
+                    task,
+                    f"Could not complete scheduling before deadline ({remaining_hours:.1f}h remaining)",
+                )
             else:
-                # Fully scheduled
-                fully_scheduled_task_ids.add(task_id)
+                # Never scheduled at all
+                result.record_failure(task, "Deadline too close or no time available")
 
         # Build updated tasks with schedules (only fully scheduled tasks)
         result.tasks = self._build_updated_tasks(
-            task_map,
-            task_start_dates,
-            task_end_dates,
-            task_daily_allocations,
-            fully_scheduled_task_ids,
+            schedulable_tasks, rotation, calendar.origin, params.start_date
         )
-        result.daily_allocations = daily_allocations
+        result.daily_allocations = calendar.allocations
 
         return result
 
     def _allocate_round_robin(
         self,
-        task_remaining: dict[int, float],
-        task_daily_allocations: dict[int, dict[date, float]],
-        daily_allocations: dict[date, float],
-        task_start_dates: dict[int, datetime],
-        task_end_dates: dict[int, datetime],
+        tasks: list[Task],
+        calendar: CapacityCalendar,
         start_date: datetime,
-        max_hours_per_day: float,
-        task_effective_deadlines: dict[int, datetime | None],
-        holiday_checker: "IHolidayChecker | None" = None,
-        existing_allocations: dict[date, float] | None = None,
-        include_all_days: bool = False,
-    ) -> None:
+    ) -> _Rotation:
         """Allocate time in round-robin fashion across tasks.
 
-        Args:
-            task_remaining: Dict of remaining hours per task
-            task_daily_allocations: Dict of daily allocations per task
-            daily_allocations: Dict of total daily allocations
-            task_start_dates: Dict to store task start dates
-            task_end_dates: Dict to store task end dates
-            start_date: Starting date for allocation
-            max_hours_per_day: Maximum hours per day
-            task_effective_deadlines: Effective deadlines for each task
-            holiday_checker: Optional holiday checker
-            existing_allocations: Existing allocations from Fixed/IN_PROGRESS tasks
-            include_all_days: If True, schedule tasks on weekends and holidays too
-        """
-        current_date = start_date
-        max_iterations = (
-            ROUND_ROBIN_MAX_ITERATIONS  # Safety limit to prevent infinite loops
-        )
-        existing = existing_allocations or {}
+        Each day is visited once, so its available hours are whatever the
+        existing allocations (Fixed/IN_PROGRESS tasks) left free in the
+        calendar. Days without capacity are skipped with first_fit(), and
+        tasks drop out of the rotation once finished or past their deadline.
 
-        iteration = 0
-        while any(hours > SCHEDULING_EPSILON for hours in task_remaining.values()):
-            iteration += 1
-            if iteration > max_iterations:
-                break
+        All tasks join the rotation on the first day and receive the same
+        share every day, so they finish in the order of their estimates and
+        expire in the order of their deadlines. Both orders are kept in
+        heaps, which makes a day cost O(log n) per task leaving the rotation
+        instead of a pass over all tasks, and lets the rotation run over
+        horizons of any length.
 
-            # Skip weekends and holidays (unless include_all_days is True)
-            if not include_all_days and not is_workday(current_date, holiday_checker):
-                current_date += timedelta(days=1)
-                continue
-
-            date_obj = current_date.date()
-
-            # Calculate available hours (respect existing allocations)
-            existing_hours = existing.get(date_obj, 0.0)
-            available_hours = max(0.0, max_hours_per_day - existing_hours)
-
-            if available_hours <= SCHEDULING_EPSILON:
-                current_date += timedelta(days=1)
-                continue
+        Args:
+            tasks: Tasks to schedule
+            calendar: Capacity calendar seeded with existing allocations
+                (receives the allocated hours)
+            start_date: Starting date for allocation
 
-            # Get active tasks (with remaining hours and not past deadline)
-            active_tasks = [
-                tid
-                for tid, remaining in task_remaining.items()
-                if remaining > SCHEDULING_EPSILON
-                and not self._is_past_deadline(
-                    current_date, task_effective_deadlines.get(tid)
-                )
-            ]
+        Returns:
+            Days, shares and the outcome of every task
+        """
+        rotation = _Rotation()
+        estimates = {
+            task.id: task.estimated_duration or 0.0
+            for task in tasks
+            if task.id is not None
+        }
+        active = {
+            task_id
+            for task_id, hours in estimates.items()
+            if hours > SCHEDULING_EPSILON
+        }
 
-            if not active_tasks:
-                # Check if any tasks still have remaining hours (past deadline)
-                if any(h > SCHEDULING_EPSILON for h in task_remaining.values()):
-                    current_date += timedelta(days=1)
-                    continue
+        by_estimate = [(estimates[task_id], task_id) for task_id in active]
+        heapq.heapify(by_estimate)
+        # A task stays in the rotation up to the last day whose date (at the
+        # time of day of start_date) is not past its deadline
+        by_deadline = [
+            (
+                calendar.origin
+                + timedelta(days=(task.deadline - start_date) // timedelta(days=1)),
+                task.id,
+            )
+            for task in tasks
+            if task.id in active and task.deadline is not None
+        ]
+        heapq.heapify(by_deadline)
+
+        # Hours every task still in the rotation has received so far
+        received = 0.0
+        daily_totals: dict[date, float] = {}
+        day = calendar.first_fit(calendar.origin)
+
+        while active and day is not None:
+            while by_deadline and by_deadline[0][0] < day:
+                _, task_id = heapq.heappop(by_deadline)
+                if task_id in active:
+                    active.remove(task_id)
+                    rotation.unfinished[task_id] = len(rotation.days)
+            if not active:
                 break
 
             # Distribute available hours equally among active tasks
-            hours_per_task = available_hours / len(active_tasks)
+            share = calendar.free_hours(day) / len(active)
+            index = len(rotation.days)
+            rotation.days.append(day)
+            rotation.shares.append(share)
 
             daily_total = 0.0
-            for task_id in active_tasks:
-                # Allocate up to hours_per_task, but not more than remaining
-                allocated = min(hours_per_task, task_remaining[task_id])
-                task_remaining[task_id] -= allocated
-
-                # Record allocation (accumulate if already allocated today)
-                current_task_daily = task_daily_allocations[task_id].get(date_obj, 0.0)
-                task_daily_allocations[task_id][date_obj] = (
-                    current_task_daily + allocated
-                )
-                daily_total += allocated
-
-                # Track start and end dates
-                if task_id not in task_start_dates:
-                    task_start_dates[task_id] = current_date
-                task_end_dates[task_id] = current_date
+            while by_estimate:
+                hours, task_id = by_estimate[0]
+                if task_id not in active:
+                    heapq.heappop(by_estimate)
+                    continue
+                if hours - received - share > SCHEDULING_EPSILON:
+                    break
+                heapq.heappop(by_estimate)
+                active.remove(task_id)
+                rotation.finished[task_id] = index
+                daily_total += min(share, hours - received)
 
-            daily_allocations[date_obj] = (
-                daily_allocations.get(date_obj, 0.0) + daily_total
-            )
+            daily_total += share * len(active)
+            daily_totals[day] = daily_total
+            received += share
 
-            # Move to next day
-            current_date += timedelta(days=1)
+            # Move to the next day with free capacity
+            day = calendar.first_fit(day + timedelta(days=1))
 
-    def _is_past_deadline(
-        self, current_date: datetime, deadline: datetime | None
-    ) -> bool:
-        """Check if current date is past the deadline."""
-        if deadline is None:
-            return False
-        return current_date > deadline
+        for task_id in active:
+            rotation.unfinished[task_id] = len(rotation.days)
+        calendar.allocate_many(daily_totals)
+        return rotation
 
     def _build_updated_tasks(
         self,
-        task_map: dict[int, Task],
-        task_start_dates: dict[int, datetime],
-        task_end_dates: dict[int, datetime],
-        task_daily_allocations: dict[int, dict[date, float]],
-        fully_scheduled_task_ids: set[int],
+        tasks: list[Task],
+        rotation: _Rotation,
+        origin: date,
+        start_date: datetime,
     ) -> list[Task]:
         """Build updated tasks with schedules.
 
         Args:
-            task_map: Dict of original tasks by ID
-            task_start_dates: Dict of task start dates
-            task_end_dates: Dict of task end dates
-            task_daily_allocations: Dict of daily allocations per task
-            fully_scheduled_task_ids: Set of task IDs that were fully scheduled
+            tasks: Tasks passed to the strategy
+            rotation: Outcome of the round-robin allocation
+            origin: First day of the capacity calendar
+            start_date: Starting date for allocation
 
         Returns:
             List of updated tasks with schedules (only fully scheduled tasks)
         """
         updated_tasks = []
-        for task_id, original_task in task_map.items():
-            # Only include fully scheduled tasks
-            if task_id in fully_scheduled_task_ids and task_id in task_start_dates:
-                # Deep copy only for tasks that were fully scheduled (performance optimization)
-                task = copy.deepcopy(original_task)
-
-                start_dt = task_start_dates[task_id]
-                end_dt = task_end_dates[task_id]
-
-                start_with_time = start_dt.replace(
-                    hour=SCHEDULE_START_TIME.hour,
-                    minute=SCHEDULE_START_TIME.minute,
-                    second=SCHEDULE_START_TIME.second,
-                )
-                end_with_time = end_dt.replace(
-                    hour=SCHEDULE_END_TIME.hour,
-                    minute=SCHEDULE_END_TIME.minute,
-                    second=SCHEDULE_END_TIME.second,
+        for original_task in tasks:
+            assert original_task.id is not None
+            last_index = rotation.finished.get(original_task.id)
+            if last_index is None:
+                continue
+
+            # Deep copy only for tasks that were fully scheduled (performance optimization)
+            task = copy.deepcopy(original_task)
+
+            daily_allocations = dict(
+                zip(
+                    rotation.days[:last_index],
+                    rotation.shares[:last_index],
+                    strict=True,
                 )
+            )
+            daily_allocations[rotation.days[last_index]] = min(
+                rotation.shares[last_index],
+                rotation.hours_left(
+                    original_task.estimated_duration or 0.0, last_index
+                ),
+            )
 
-                task.planned_start = start_with_time
-                task.planned_end = end_with_time
-                task.set_daily_allocations(task_daily_allocations[task_id])
+            start_dt = start_date + timedelta(days=(rotation.days[0] - origin).days)
+            end_dt = start_date + timedelta(
+                days=(rotation.days[last_index] - origin).days
+            )
+            task.planned_start = start_dt.replace(
+                hour=SCHEDULE_START_TIME.hour,
+                minute=SCHEDULE_START_TIME.minute,
+                second=SCHEDULE_START_TIME.second,
+            )
+            task.planned_end = end_dt.replace(
+                hour=SCHEDULE_END_TIME.hour,
+                minute=SCHEDULE_END_TIME.minute,
+                second=SCHEDULE_END_TIME.second,
+            )
+            task.set_daily_allocations(daily_allocations)
 
-                updated_tasks.append(task)
+            updated_tasks.append(task)
 
         return updated_tasks
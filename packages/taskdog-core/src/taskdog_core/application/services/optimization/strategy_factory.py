@@ -14,6 +14,9 @@ from taskdog_core.application.services.optimization.dependency_aware_optimizatio
 from taskdog_core.application.services.optimization.earliest_deadline_optimization_strategy import (
     EarliestDeadlineOptimizationStrategy,
 )
+from taskdog_core.application.services.optimization.exact_optimization_strategy import (
+    ExactOptimizationStrategy,
+)
 from taskdog_core.application.services.optimization.genetic_optimization_strategy import (
     GeneticOptimizationStrategy,
 )
@@ -26,6 +29,9 @@ from taskdog_core.application.services.optimization.monte_carlo_optimization_str
 from taskdog_core.application.services.optimization.optimization_strategy import (
     OptimizationStrategy,
 )
+from taskdog_core.application.services.optimization.portfolio_optimization_strategy import (
+    PortfolioOptimizationStrategy,
+)
 from taskdog_core.application.services.optimization.priority_first_optimization_strategy import (
     PriorityFirstOptimizationStrategy,
 )
@@ -52,6 +58,8 @@ class StrategyFactory:
         "dependency_aware": DependencyAwareOptimizationStrategy,
         "genetic": GeneticOptimizationStrategy,
         "monte_carlo": MonteCarloOptimizationStrategy,
+        "exact": ExactOptimizationStrategy,
+        "portfolio": PortfolioOptimizationStrategy,
     }
 
     @classmethod
@@ -1,28 +1,22 @@
 """Service for building optimization summary from task data."""
 
+from collections.abc import Collection, Mapping
 from datetime import date, datetime
 
 from taskdog_core.application.dto.optimization_summary import OptimizationSummary
 from taskdog_core.application.dto.task_dto import TaskSummaryDto
 from taskdog_core.domain.entities.task import Task
-from taskdog_core.domain.repositories.task_repository import TaskRepository
 
 
 class OptimizationSummaryBuilder:
-    """Builds optimization summary from modified tasks and repository state.
+    """Builds optimization summary from modified tasks and the loaded task set.
 
     This service analyzes optimization results and calculates metrics like
     new/rescheduled task counts, deadline conflicts, and workload violations.
+    It works entirely in memory, so dry runs (whose results are not saved)
+    are summarized the same way as persisted runs.
     """
 
-    def __init__(self, repository: TaskRepository):
-        """Initialize the summary builder.
-
-        Args:
-            repository: Task repository for querying task state
-        """
-        self.repository = repository
-
     def _analyze_modified_tasks(
         self,
         modified_tasks: list[Task],
@@ -122,24 +116,36 @@ class OptimizationSummaryBuilder:
         max_date = max(end_dates).date()
         return (max_date - min_date).days + 1
 
-    def _find_unscheduled_tasks(self) -> list[TaskSummaryDto]:
-        """Find tasks that couldn't be scheduled.
+    def _find_unscheduled_tasks(
+        self,
+        all_tasks: list[Task],
+        modified_tasks: list[Task],
+        cleared_task_ids: Collection[int],
+    ) -> list[TaskSummaryDto]:
+        """Find tasks that have no schedule once the result is applied.
+
+        Args:
+            all_tasks: All tasks as loaded before optimization
+            modified_tasks: Tasks that were optimized
+            cleared_task_ids: IDs of tasks whose schedule is cleared
 
         Returns:
             List of TaskSummaryDto for unscheduled tasks
         """
-        all_tasks_after = self.repository.get_all()
+        scheduled_ids = {t.id for t in modified_tasks if t.planned_start}
         unscheduled_tasks = []
 
-        for task in all_tasks_after:
+        for task in all_tasks:
             # Skip finished tasks (COMPLETED or CANCELED)
             if task.is_finished:
                 continue
             # Skip tasks without estimated duration
             if not task.estimated_duration:
                 continue
-            # Check if task has no schedule
-            if not task.planned_start:
+            if task.id in scheduled_ids:
+                continue
+            # Check if task has no schedule after the run
+            if task.id in cleared_task_ids or not task.planned_start:
                 unscheduled_tasks.append(task)
 
         # Convert unscheduled tasks to DTOs
@@ -176,6 +182,10 @@ class OptimizationSummaryBuilder:
         task_states_before: dict[int, datetime | None],
         daily_allocations: dict[date, float],
         max_hours_per_day: float,
+        all_tasks: list[Task],
+        cleared_task_ids: Collection[int] = (),
+        lane_allocations: Mapping[str, Mapping[date, float]] | None = None,
+        lane_limits: Mapping[str, float] | None = None,
     ) -> OptimizationSummary:
         """Calculate optimization summary from modified tasks.
 
@@ -184,6 +194,12 @@ class OptimizationSummaryBuilder:
             task_states_before: Mapping of task IDs to their planned_start before optimization
             daily_allocations: Daily workload allocations (date_str -> hours)
             max_hours_per_day: Maximum hours per day constraint
+            all_tasks: All tasks as loaded before optimization
+            cleared_task_ids: IDs of tasks whose schedule is cleared because
+                they failed to reschedule
+            lane_allocations: Allocations per capacity lane; when given,
+                overloaded days are checked per lane against lane_limits
+            lane_limits: Daily limit per capacity lane
 
         Returns:
             OptimizationSummary with calculated metrics
@@ -197,9 +213,22 @@ class OptimizationSummaryBuilder:
             days_span,
         ) = self._analyze_modified_tasks(modified_tasks, task_states_before)
 
-        unscheduled_tasks_dto = self._find_unscheduled_tasks()
+        unscheduled_tasks_dto = self._find_unscheduled_tasks(
+            all_tasks, modified_tasks, cleared_task_ids
+        )
 
-        overloaded_days = self._validate_workload(daily_allocations, max_hours_per_day)
+        if lane_allocations and lane_limits:
+            overloaded_days = sorted(
+                day
+                for name, allocations in lane_allocations.items()
+                for day in self._validate_workload(
+                    dict(allocations), lane_limits.get(name, max_hours_per_day)
+                )
+            )
+        else:
+            overloaded_days = self._validate_workload(
+                daily_allocations, max_hours_per_day
+            )
 
         return OptimizationSummary(
             new_count=new_count,
@@ -10,11 +10,14 @@ from taskdog_core.application.dto.statistics_output import (
     RescheduleStatistics,
 )
 from taskdog_core.domain.entities.audit_log import AuditLog
+from taskdog_core.domain.entities.reschedule_statistics import (
+    LEAD_TIME_BUCKETS,
+    RescheduleAggregates,
+    lead_time_category,
+)
 
 CHRONIC_SLIPPER_THRESHOLD = 3
 
-_LEAD_TIME_CATEGORIES = ("same_day", "1_2_days", "3_7_days", "8_plus_days")
-
 
 @dataclass
 class _TaskHistory:
@@ -38,16 +41,6 @@ def _parse_deadline(value: object) -> datetime | None:
         return None
 
 
-def _lead_time_category(lead_days: int) -> str:
-    if lead_days <= 0:
-        return "same_day"
-    if lead_days <= 2:
-        return "1_2_days"
-    if lead_days <= 7:
-        return "3_7_days"
-    return "8_plus_days"
-
-
 class RescheduleAnalyzer:
     """Calculates deadline reschedule statistics from audit log events.
 
@@ -115,6 +108,48 @@ class RescheduleAnalyzer:
             weekly_reschedule_trend=dict(weekly_trend),
         )
 
+    def calculate_from_aggregates(
+        self, aggregates: RescheduleAggregates
+    ) -> RescheduleStatistics:
+        """Build reschedule statistics from counts aggregated by the repository.
+
+        Args:
+            aggregates: Counts from AuditLogRepository.get_reschedule_aggregates(),
+                with slip histories for at least CHRONIC_SLIPPER_THRESHOLD
+                reschedules
+
+        Returns:
+            RescheduleStatistics equal to calculate() on the same events
+        """
+        tasks_with_deadline = aggregates.tasks_with_deadline
+        return RescheduleStatistics(
+            tasks_with_deadline=tasks_with_deadline,
+            rescheduled_task_count=aggregates.rescheduled_task_count,
+            total_reschedule_events=aggregates.total_reschedule_events,
+            reschedule_rate=(
+                aggregates.rescheduled_task_count / tasks_with_deadline
+                if tasks_with_deadline
+                else 0.0
+            ),
+            moved_earlier_count=aggregates.moved_earlier_count,
+            lead_time_breakdown=self._breakdown_from_counts(
+                aggregates.lead_time_counts
+            ),
+            chronic_slippers=[
+                ChronicSlipperTask(
+                    task_id=history.task_id,
+                    task_name=history.task_name,
+                    reschedule_count=history.reschedule_count,
+                    total_slip_days=round(history.slip_days, 1),
+                    first_deadline=history.first_deadline.isoformat(),
+                    latest_deadline=history.latest_deadline.isoformat(),
+                )
+                for history in aggregates.slip_histories
+                if history.reschedule_count >= CHRONIC_SLIPPER_THRESHOLD
+            ],
+            weekly_reschedule_trend=dict(aggregates.weekly_reschedule_counts),
+        )
+
     def _build_lead_time_breakdown(
         self, histories: dict[int, _TaskHistory]
     ) -> list[LeadTimeBreakdown]:
@@ -132,24 +167,34 @@ class RescheduleAnalyzer:
             lead_days = (
                 history.initial_deadline.date() - history.initial_set_at.date()
             ).days
-            category = _lead_time_category(lead_days)
+            category = lead_time_category(lead_days)
             totals[category] += 1
             if history.reschedule_count > 0:
                 rescheduled[category] += 1
 
-        return [
-            LeadTimeBreakdown(
-                category=category,
-                task_count=totals[category],
-                rescheduled_count=rescheduled[category],
-                reschedule_rate=(
-                    rescheduled[category] / totals[category]
-                    if totals[category]
-                    else 0.0
-                ),
+        return self._breakdown_from_counts(
+            {category: (totals[category], rescheduled[category]) for category in totals}
+        )
+
+    @staticmethod
+    def _breakdown_from_counts(
+        counts: dict[str, tuple[int, int]],
+    ) -> list[LeadTimeBreakdown]:
+        """One breakdown per category from (tasks, rescheduled tasks) counts."""
+        breakdown = []
+        for category, _ in LEAD_TIME_BUCKETS:
+            task_count, rescheduled_count = counts.get(category, (0, 0))
+            breakdown.append(
+                LeadTimeBreakdown(
+                    category=category,
+                    task_count=task_count,
+                    rescheduled_count=rescheduled_count,
+                    reschedule_rate=(
+                        rescheduled_count / task_count if task_count else 0.0
+                    ),
+                )
             )
-            for category in _LEAD_TIME_CATEGORIES
-        ]
+        return breakdown
 
     def _build_chronic_slippers(
         self, histories: dict[int, _TaskHistory]
@@ -0,0 +1,197 @@
+"""Streaming accumulation of the counts task statistics are built from."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from taskdog_core.domain.entities.task import Task, TaskStatus
+from taskdog_core.domain.entities.task_statistics import (
+    TaskStatisticsAggregates,
+    TrackedTaskDuration,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import date, datetime
+
+SECONDS_PER_DAY = 86400
+
+
+@dataclass(frozen=True)
+class TaskContribution:
+    """The fields of a task that statistics count.
+
+    Kept per task by IncrementalTaskStatistics so a task's previous
+    contribution can be taken back out when it changes.
+    """
+
+    id: int | None
+    status: TaskStatus
+    priority: int | None
+    deadline: datetime | None
+    actual_end: datetime | None
+    tracked: TrackedTaskDuration | None
+
+    @classmethod
+    def from_task(cls, task: Task, task_id: int | None = None) -> TaskContribution:
+        """Extract the counted fields of a task.
+
+        Args:
+            task: Task to extract from
+            task_id: ID to use instead of task.id (for tasks just inserted)
+
+        Returns:
+            TaskContribution of the task
+
+        Raises:
+            ValueError: If a task with time tracking data has no ID
+        """
+        task_id = task.id if task_id is None else task_id
+        tracked = None
+        if task.actual_duration_hours is not None:
+            if task_id is None:
+                raise ValueError("Task must have an ID")
+            tracked = TrackedTaskDuration(
+                id=task_id,
+                name=task.name,
+                estimated_duration=task.estimated_duration,
+                actual_duration=task.actual_duration,
+                actual_start=task.actual_start,
+                actual_end=task.actual_end,
+            )
+        return cls(
+            id=task_id,
+            status=task.status,
+            priority=task.priority,
+            deadline=task.deadline,
+            actual_end=task.actual_end,
+            tracked=tracked,
+        )
+
+    @property
+    def finished_end(self) -> datetime | None:
+        """End time of a COMPLETED or CANCELED task, None otherwise."""
+        if self.status in (TaskStatus.COMPLETED, TaskStatus.CANCELED):
+            return self.actual_end
+        return None
+
+    def in_period(self, since: datetime | None) -> bool:
+        """Whether the task counts in a period starting at ``since``.
+
+        Tasks that ended at or after the start count, as do tasks without
+        an end that are still PENDING or IN_PROGRESS.
+
+        Args:
+            since: Start of the period, or None for all tasks
+
+        Returns:
+            True if the task is counted
+        """
+        if since is None:
+            return True
+        if self.actual_end:
+            return self.actual_end >= since
+        return self.status in (TaskStatus.PENDING, TaskStatus.IN_PROGRESS)
+
+
+class StatisticsAccumulator:
+    """Running counts for task statistics, fed one task at a time.
+
+    Every statistic is updated by add() in a single pass over the tasks, and
+    remove() takes a contribution back out, so the counts can be kept up to
+    date as tasks change.
+    """
+
+    def __init__(self, completion_cutoffs: Sequence[datetime] = ()):
+        """Initialize empty counts.
+
+        Args:
+            completion_cutoffs: Datetimes to count finished tasks that ended
+                at or after
+        """
+        self._completion_cutoffs = list(completion_cutoffs)
+        self._status_counts: dict[TaskStatus, int] = defaultdict(int)
+        self._priority_status_counts: dict[tuple[int, TaskStatus], int] = defaultdict(
+            int
+        )
+        self._tracked: dict[int, TrackedTaskDuration] = {}
+        self._deadline_met = 0
+        self._deadline_missed = 0
+        self._delay_days = 0.0
+        self._weekday_hour: dict[tuple[int, int], int] = defaultdict(int)
+        self._by_day: dict[date, int] = defaultdict(int)
+        self._completions_since = [0] * len(self._completion_cutoffs)
+        self.finished_count = 0
+
+    def add(self, contribution: TaskContribution) -> None:
+        """Count a task.
+
+        Args:
+            contribution: Counted fields of the task
+        """
+        self._apply(contribution, 1)
+
+    def remove(self, contribution: TaskContribution) -> None:
+        """Take back a task counted with add().
+
+        Args:
+            contribution: The contribution that was added
+        """
+        self._apply(contribution, -1)
+
+    def _apply(self, contribution: TaskContribution, sign: int) -> None:
+        self._status_counts[contribution.status] += sign
+        if contribution.priority is not None:
+            key = (contribution.priority, contribution.status)
+            self._priority_status_counts[key] += sign
+
+        tracked = contribution.tracked
+        if tracked is not None:
+            if sign > 0:
+                self._tracked[tracked.id] = tracked
+            else:
+                self._tracked.pop(tracked.id, None)
+
+        end = contribution.finished_end
+        if end is None:
+            return
+        self.finished_count += sign
+
+        if contribution.deadline is not None:
+            if end <= contribution.deadline:
+                self._deadline_met += sign
+            else:
+                self._deadline_missed += sign
+                delay = (end - contribution.deadline).total_seconds()
+                self._delay_days += sign * delay / SECONDS_PER_DAY
+
+        self._weekday_hour[(end.weekday(), end.hour)] += sign
+        self._by_day[end.date()] += sign
+        for index, cutoff in enumerate(self._completion_cutoffs):
+            if end >= cutoff:
+                self._completions_since[index] += sign
+
+    def aggregates(self) -> TaskStatisticsAggregates:
+        """Snapshot the counts.
+
+        Returns:
+            TaskStatisticsAggregates for the tasks counted so far
+        """
+        return TaskStatisticsAggregates(
+            status_counts=_nonzero(self._status_counts),
+            priority_status_counts=_nonzero(self._priority_status_counts),
+            tracked_durations=sorted(self._tracked.values(), key=lambda t: t.id),
+            deadline_met_count=self._deadline_met,
+            deadline_missed_count=self._deadline_missed,
+            total_delay_days=self._delay_days if self._deadline_missed else 0.0,
+            completions_by_weekday_hour=_nonzero(self._weekday_hour),
+            completions_by_day=dict(sorted(_nonzero(self._by_day).items())),
+            completions_since=list(self._completions_since),
+        )
+
+
+def _nonzero[K](counts: dict[K, int]) -> dict[K, int]:
+    """Drop the keys whose count went back to zero."""
+    return {key: count for key, count in counts.items() if count}
@@ -1,7 +1,9 @@
 """Service for calculating task statistics."""
 
-from collections import Counter, defaultdict
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from datetime import datetime, timedelta
+from typing import ClassVar
 
 from taskdog_core.application.dto.statistics_output import (
     ActivityPatternStatistics,
@@ -14,7 +16,15 @@ from taskdog_core.application.dto.statistics_output import (
     TrendStatistics,
 )
 from taskdog_core.application.dto.task_dto import TaskSummaryDto
+from taskdog_core.application.services.statistics_accumulator import (
+    StatisticsAccumulator,
+    TaskContribution,
+)
 from taskdog_core.domain.entities.task import Task, TaskStatus
+from taskdog_core.domain.entities.task_statistics import (
+    TaskStatisticsAggregates,
+    TrackedTaskDuration,
+)
 
 
 class TaskStatisticsCalculator:
@@ -23,6 +33,11 @@ class TaskStatisticsCalculator:
     This service analyzes task data and calculates various statistics
     including basic counts, time tracking, estimation accuracy, deadline
     compliance, priority distribution, and trends.
+
+    Tasks are reduced to counts (TaskStatisticsAggregates) in a single pass
+    with a StatisticsAccumulator; every statistics section is then built
+    from those counts, whether they were accumulated here, aggregated by the
+    repository, or kept up to date by IncrementalTaskStatistics.
     """
 
     # Priority thresholds
@@ -32,91 +47,121 @@ class TaskStatisticsCalculator:
     # Estimation accuracy tolerance (±10%)
     ESTIMATION_TOLERANCE = 0.1
 
-    def calculate_all(self, tasks: list[Task], period: str = "all") -> StatisticsOutput:
+    # Days covered by each period filter; trends (period 'all') report the
+    # completions within each of them
+    PERIOD_DAYS: ClassVar[dict[str, int]] = {"7d": 7, "30d": 30}
+
+    def calculate_all(
+        self,
+        tasks: Iterable[Task],
+        period: str = "all",
+        now: datetime | None = None,
+    ) -> StatisticsOutput:
         """Calculate all statistics for the given tasks.
 
+        The tasks are iterated once, so they may be streamed from the
+        repository.
+
         Args:
-            tasks: List of tasks to analyze
+            tasks: Tasks to analyze
             period: Time period filter ('7d', '30d', or 'all')
+            now: Reference time for the period and trends (default: now)
 
         Returns:
             StatisticsOutput containing all calculated statistics
         """
-        # Filter tasks by period if needed
-        filtered_tasks = (
-            self._filter_by_period(tasks, period) if period != "all" else tasks
+        now = now or datetime.now()
+        since = self.period_start(period, now)
+        accumulator = StatisticsAccumulator(
+            self.trend_cutoffs(now) if period == "all" else ()
         )
+        for task in tasks:
+            contribution = TaskContribution.from_task(task)
+            if contribution.in_period(since):
+                accumulator.add(contribution)
 
-        # Calculate each statistics section
-        task_stats = self._calculate_task_statistics(filtered_tasks)
-        time_stats = self._calculate_time_statistics(filtered_tasks)
-        estimation_stats = self._calculate_estimation_accuracy(filtered_tasks)
-        deadline_stats = self._calculate_deadline_compliance(filtered_tasks)
-        priority_stats = self._calculate_priority_distribution(filtered_tasks)
-        trend_stats = (
-            self._calculate_trends(filtered_tasks) if period == "all" else None
-        )
+        return self.calculate_from_aggregates(accumulator.aggregates(), period)
 
-        activity_stats = self._calculate_activity_patterns(filtered_tasks)
+    def calculate_from_aggregates(
+        self, aggregates: TaskStatisticsAggregates, period: str = "all"
+    ) -> StatisticsOutput:
+        """Calculate all statistics from task counts.
 
+        Args:
+            aggregates: Counts for the tasks in the period, with
+                completions_since counted for trend_cutoffs() (for 'all')
+            period: Time period filter ('7d', '30d', or 'all')
+
+        Returns:
+            StatisticsOutput containing all calculated statistics
+        """
+        tracked = aggregates.tracked_durations
         return StatisticsOutput(
-            task_stats=task_stats,
-            time_stats=time_stats,
-            estimation_stats=estimation_stats,
-            deadline_stats=deadline_stats,
-            priority_stats=priority_stats,
-            trend_stats=trend_stats,
-            activity_stats=activity_stats,
+            task_stats=self._calculate_task_statistics(aggregates.status_counts),
+            time_stats=self._calculate_time_statistics(tracked),
+            estimation_stats=self._calculate_estimation_accuracy(tracked),
+            deadline_stats=self._calculate_deadline_compliance(aggregates),
+            priority_stats=self._calculate_priority_distribution(
+                aggregates.priority_status_counts
+            ),
+            trend_stats=(
+                self._calculate_trends(aggregates) if period == "all" else None
+            ),
+            activity_stats=self._calculate_activity_patterns(
+                aggregates.completions_by_weekday_hour
+            ),
         )
 
-    def _filter_by_period(self, tasks: list[Task], period: str) -> list[Task]:
-        """Filter tasks by time period.
+    @classmethod
+    def period_start(cls, period: str, now: datetime) -> datetime | None:
+        """Start of a statistics period.
 
         Args:
-            tasks: List of tasks to filter
-            period: Time period ('7d' or '30d')
+            period: Time period ('7d', '30d', or 'all')
+            now: Reference time
 
         Returns:
-            Filtered list of tasks
+            Earliest end time counted, or None for 'all'
         """
-        now = datetime.now()
-        days = 7 if period == "7d" else 30
-        cutoff = now - timedelta(days=days)
+        if period == "all":
+            return None
+        return now - timedelta(days=cls.PERIOD_DAYS[period])
 
-        filtered = []
-        for task in tasks:
-            # Include tasks that were completed within the period
-            if task.actual_end:
-                end_dt = task.actual_end
-                if end_dt >= cutoff:
-                    filtered.append(task)
-            # Also include active tasks (PENDING, IN_PROGRESS)
-            elif task.status in [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]:
-                filtered.append(task)
-
-        return filtered
-
-    def _calculate_task_statistics(self, tasks: list[Task]) -> TaskStatistics:
+    @classmethod
+    def trend_cutoffs(cls, now: datetime) -> list[datetime]:
+        """Start of each recent-completion window reported in trends.
+
+        Args:
+            now: Reference time
+
+        Returns:
+            Datetimes 7 and 30 days before now
+        """
+        return [now - timedelta(days=days) for days in cls.PERIOD_DAYS.values()]
+
+    @staticmethod
+    def _calculate_task_statistics(
+        status_counts: dict[TaskStatus, int],
+    ) -> TaskStatistics:
         """Calculate basic task statistics.
 
         Args:
-            tasks: List of tasks to analyze
+            status_counts: Number of tasks per status
 
         Returns:
             TaskStatistics with basic counts and completion rate
         """
-        status_counts = Counter(t.status for t in tasks)
-        pending = status_counts[TaskStatus.PENDING]
-        in_progress = status_counts[TaskStatus.IN_PROGRESS]
-        completed = status_counts[TaskStatus.COMPLETED]
-        canceled = status_counts[TaskStatus.CANCELED]
+        pending = status_counts.get(TaskStatus.PENDING, 0)
+        in_progress = status_counts.get(TaskStatus.IN_PROGRESS, 0)
+        completed = status_counts.get(TaskStatus.COMPLETED, 0)
+        canceled = status_counts.get(TaskStatus.CANCELED, 0)
 
         # Calculate completion rate
         finished_tasks = completed + canceled
         completion_rate = (completed / finished_tasks) if finished_tasks > 0 else 0.0
 
         return TaskStatistics(
-            total_tasks=len(tasks),
+            total_tasks=sum(status_counts.values()),
             pending_count=pending,
             in_progress_count=in_progress,
             completed_count=completed,
@@ -124,11 +169,13 @@ class TaskStatisticsCalculator:
             completion_rate=completion_rate,
         )
 
-    def _calculate_time_statistics(self, tasks: list[Task]) -> TimeStatistics | None:
+    def _calculate_time_statistics(
+        self, tasks: Sequence[TrackedTaskDuration]
+    ) -> TimeStatistics | None:
         """Calculate time tracking statistics.
 
         Args:
-            tasks: List of tasks to analyze
+            tasks: Tasks with time tracking data, in ID order
 
         Returns:
             TimeStatistics or None if no time tracking data
@@ -164,7 +211,7 @@ class TaskStatisticsCalculator:
             tasks_with_duration, key=lambda t: t.actual_duration_hours or 0.0
         )
 
-        # Convert to DTOs (tasks must have IDs)
+        # Convert to DTOs
         longest_task_dto = self._to_summary_dto(longest_task)
         shortest_task_dto = self._to_summary_dto(shortest_task)
 
@@ -178,12 +225,12 @@ class TaskStatisticsCalculator:
         )
 
     def _calculate_estimation_accuracy(
-        self, tasks: list[Task]
+        self, tasks: Sequence[TrackedTaskDuration]
     ) -> EstimationAccuracyStatistics | None:
         """Calculate estimation accuracy statistics.
 
         Args:
-            tasks: List of tasks to analyze
+            tasks: Tasks with time tracking data, in ID order
 
         Returns:
             EstimationAccuracyStatistics or None if no estimation data
@@ -192,7 +239,7 @@ class TaskStatisticsCalculator:
         over_estimated = 0
         under_estimated = 0
         exact = 0
-        tasks_with_accuracy: list[tuple[Task, float]] = []
+        tasks_with_accuracy: list[tuple[TrackedTaskDuration, float]] = []
         pairs: list[tuple[float, float]] = []
 
         for task in tasks:
@@ -230,7 +277,7 @@ class TaskStatisticsCalculator:
         best_tasks = [t[0] for t in tasks_with_accuracy[:3]]
         worst_tasks = [t[0] for t in tasks_with_accuracy[-3:][::-1]]
 
-        # Convert to DTOs (tasks must have IDs)
+        # Convert to DTOs
         best_tasks_dto = [self._to_summary_dto(t) for t in best_tasks]
         worst_tasks_dto = [self._to_summary_dto(t) for t in worst_tasks]
 
@@ -245,51 +292,31 @@ class TaskStatisticsCalculator:
             estimation_pairs=pairs,
         )
 
+    @staticmethod
     def _calculate_deadline_compliance(
-        self, tasks: list[Task]
+        aggregates: TaskStatisticsAggregates,
     ) -> DeadlineComplianceStatistics | None:
         """Calculate deadline compliance statistics.
 
         Args:
-            tasks: List of tasks to analyze
+            aggregates: Task counts with the deadline outcomes of finished
+                tasks
 
         Returns:
             DeadlineComplianceStatistics or None if no deadline data
         """
-        # Get completed tasks with deadline
-        tasks_with_deadline = [
-            t
-            for t in tasks
-            if t.deadline is not None and t.actual_end is not None and t.is_finished
-        ]
-
-        if not tasks_with_deadline:
+        met_count = aggregates.deadline_met_count
+        missed_count = aggregates.deadline_missed_count
+        total_delay_days = aggregates.total_delay_days
+        total = met_count + missed_count
+        if total == 0:
             return None
 
-        met_count = 0
-        missed_count = 0
-        total_delay_days = 0.0
-
-        for task in tasks_with_deadline:
-            # Type guard: both are guaranteed to be non-None due to filter
-            if task.deadline is None or task.actual_end is None:
-                continue
-
-            deadline_dt = task.deadline
-            actual_end_dt = task.actual_end
-
-            if actual_end_dt <= deadline_dt:
-                met_count += 1
-            else:
-                missed_count += 1
-                delay_days = (actual_end_dt - deadline_dt).total_seconds() / 86400
-                total_delay_days += delay_days
-
-        compliance_rate = met_count / len(tasks_with_deadline)
+        compliance_rate = met_count / total
         avg_delay = total_delay_days / missed_count if missed_count > 0 else 0.0
 
         return DeadlineComplianceStatistics(
-            total_tasks_with_deadline=len(tasks_with_deadline),
+            total_tasks_with_deadline=total,
             met_deadline_count=met_count,
             missed_deadline_count=missed_count,
             compliance_rate=round(compliance_rate, 2),
@@ -297,12 +324,13 @@ class TaskStatisticsCalculator:
         )
 
     def _calculate_priority_distribution(
-        self, tasks: list[Task]
+        self, priority_status_counts: dict[tuple[int, TaskStatus], int]
     ) -> PriorityDistributionStatistics:
         """Calculate priority distribution statistics.
 
         Args:
-            tasks: List of tasks to analyze
+            priority_status_counts: Number of tasks per (priority, status),
+                for tasks with a priority
 
         Returns:
             PriorityDistributionStatistics
@@ -311,32 +339,29 @@ class TaskStatisticsCalculator:
         medium_count = 0
         low_count = 0
         high_completed = 0
-        high_total = 0
 
         # Map of priority -> completed count
         priority_map: dict[int, int] = defaultdict(int)
 
-        for task in tasks:
-            # Skip tasks without priority for distribution calculation
-            if task.priority is None:
-                continue
+        for (priority, status), count in sorted(
+            priority_status_counts.items(), key=lambda item: item[0][0]
+        ):
+            completed = count if status == TaskStatus.COMPLETED else 0
 
             # Classify by priority level
-            if task.priority >= self.HIGH_PRIORITY_THRESHOLD:
-                high_count += 1
-                high_total += 1
-                if task.status == TaskStatus.COMPLETED:
-                    high_completed += 1
-            elif task.priority >= self.LOW_PRIORITY_THRESHOLD:
-                medium_count += 1
+            if priority >= self.HIGH_PRIORITY_THRESHOLD:
+                high_count += count
+                high_completed += completed
+            elif priority >= self.LOW_PRIORITY_THRESHOLD:
+                medium_count += count
             else:
-                low_count += 1
+                low_count += count
 
             # Track completion by exact priority
-            if task.status == TaskStatus.COMPLETED:
-                priority_map[task.priority] += 1
+            if completed:
+                priority_map[priority] += completed
 
-        high_completion_rate = (high_completed / high_total) if high_total > 0 else 0.0
+        high_completion_rate = (high_completed / high_count) if high_count > 0 else 0.0
 
         return PriorityDistributionStatistics(
             high_priority_count=high_count,
@@ -347,78 +372,65 @@ class TaskStatisticsCalculator:
         )
 
     @staticmethod
-    def _to_summary_dto(task: Task) -> TaskSummaryDto:
-        """Convert a Task to TaskSummaryDto, validating that it has an ID."""
-        if task.id is None:
-            raise ValueError("Task must have an ID")
+    def _to_summary_dto(task: TrackedTaskDuration) -> TaskSummaryDto:
+        """Convert a tracked task to TaskSummaryDto."""
         return TaskSummaryDto(id=task.id, name=task.name)
 
+    @staticmethod
     def _calculate_activity_patterns(
-        self, tasks: list[Task]
+        completions: dict[tuple[int, int], int],
     ) -> ActivityPatternStatistics | None:
-        tasks_with_end = [t for t in tasks if t.actual_end and t.is_finished]
+        """Calculate activity patterns from completion times.
 
-        if not tasks_with_end:
+        Args:
+            completions: Finished tasks per (weekday, hour) of their end
+
+        Returns:
+            ActivityPatternStatistics or None if no completion times
+        """
+        if not completions:
             return None
 
         hourly: dict[int, int] = defaultdict(int)
         daily: dict[int, int] = defaultdict(int)
         heatmap: dict[int, dict[int, int]] = {d: defaultdict(int) for d in range(7)}
 
-        for task in tasks_with_end:
-            assert task.actual_end is not None
-            hour = task.actual_end.hour
-            day = task.actual_end.weekday()
-            hourly[hour] += 1
-            daily[day] += 1
-            heatmap[day][hour] += 1
+        for (day, hour), count in sorted(completions.items()):
+            hourly[hour] += count
+            daily[day] += count
+            heatmap[day][hour] += count
 
         return ActivityPatternStatistics(
             hourly_completions=dict(hourly),
             daily_completions=dict(daily),
             heatmap={d: dict(h) for d, h in heatmap.items()},
-            total_completed_with_time=len(tasks_with_end),
+            total_completed_with_time=sum(completions.values()),
         )
 
-    def _calculate_trends(self, tasks: list[Task]) -> TrendStatistics:
+    @staticmethod
+    def _calculate_trends(aggregates: TaskStatisticsAggregates) -> TrendStatistics:
         """Calculate trend statistics over time.
 
         Args:
-            tasks: List of tasks to analyze
+            aggregates: Task counts with completions per day and within each
+                trend_cutoffs() window
 
         Returns:
             TrendStatistics
         """
-        now = datetime.now()
-        last_7_days = now - timedelta(days=7)
-        last_30_days = now - timedelta(days=30)
-
-        last_7_completed = 0
-        last_30_completed = 0
+        last_7_completed, last_30_completed = aggregates.completions_since
 
         # Weekly and monthly trends
         weekly_trend: dict[str, int] = defaultdict(int)
         monthly_trend: dict[str, int] = defaultdict(int)
 
-        for task in tasks:
-            if task.actual_end and task.is_finished:
-                end_dt = task.actual_end
-
-                # Count for last N days
-                if end_dt >= last_7_days:
-                    last_7_completed += 1
-                if end_dt >= last_30_days:
-                    last_30_completed += 1
-
-                # Weekly trend (ISO week)
-                week_start = end_dt - timedelta(days=end_dt.weekday())
-                iso_week = week_start.isocalendar()
-                week_key = f"{iso_week.year}-W{iso_week.week:02d}"
-                weekly_trend[week_key] += 1
-
-                # Monthly trend
-                month_key = end_dt.strftime("%Y-%m")
-                monthly_trend[month_key] += 1
+        for day, count in aggregates.completions_by_day.items():
+            # Weekly trend (ISO week)
+            iso_week = day.isocalendar()
+            weekly_trend[f"{iso_week.year}-W{iso_week.week:02d}"] += count
+
+            # Monthly trend
+            monthly_trend[day.strftime("%Y-%m")] += count
 
         return TrendStatistics(
             last_7_days_completed=last_7_completed,
@@ -2,6 +2,9 @@
 
 from taskdog_core.application.dto.manage_dependencies_input import AddDependencyInput
 from taskdog_core.application.dto.task_operation_output import TaskOperationOutput
+from taskdog_core.application.services.dependency_graph_index import (
+    DependencyGraphIndex,
+)
 from taskdog_core.application.services.dependency_graph_service import (
     DependencyGraphService,
 )
@@ -13,14 +16,19 @@ from taskdog_core.domain.repositories.task_repository import TaskRepository
 class AddDependencyUseCase(UseCase[AddDependencyInput, TaskOperationOutput]):
     """Use case for adding a dependency to a task."""
 
-    def __init__(self, repository: TaskRepository):
+    def __init__(
+        self,
+        repository: TaskRepository,
+        graph_index: DependencyGraphIndex | None = None,
+    ):
         """Initialize use case with repository.
 
         Args:
             repository: Task repository for data access
+            graph_index: Optional in-memory dependency graph for cycle checks
         """
         self.repository = repository
-        self.graph_service = DependencyGraphService(repository)
+        self.graph_service = DependencyGraphService(repository, graph_index)
 
     def execute(self, input_dto: AddDependencyInput) -> TaskOperationOutput:
         """Execute dependency addition.
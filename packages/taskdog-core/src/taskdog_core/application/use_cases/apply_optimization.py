@@ -0,0 +1,142 @@
+"""Use case for applying a previously computed optimization result."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from taskdog_core.application.dto.apply_optimization_input import (
+    ApplyOptimizationInput,
+)
+from taskdog_core.application.dto.task_dto import TaskSummaryDto
+from taskdog_core.application.services.optimization.data_version import (
+    compute_data_version,
+)
+from taskdog_core.application.use_cases.base import UseCase
+from taskdog_core.domain.exceptions.task_exceptions import (
+    StaleOptimizationPlanError,
+    TaskNotFoundException,
+)
+
+if TYPE_CHECKING:
+    from taskdog_core.domain.entities.task import Task
+    from taskdog_core.domain.repositories.task_repository import TaskRepository
+
+
+class ApplyOptimizationUseCase(UseCase[ApplyOptimizationInput, list[TaskSummaryDto]]):
+    """Use case for persisting the schedules of a dry-run optimization.
+
+    The strategy is not re-run: planned schedules are written as computed.
+    Every task is re-validated first so that a task started, completed,
+    fixed, or archived since the preview is never silently overwritten.
+    When the input carries the plan's data version, any other change to the
+    scheduling state (a task added, deleted, rescheduled or re-estimated)
+    rejects the plan as stale as well. That check and the save run in one
+    repository transaction (TaskRepository.update_all), so a concurrent
+    write cannot be overwritten.
+    """
+
+    def __init__(self, repository: TaskRepository):
+        """Initialize use case.
+
+        Args:
+            repository: Task repository for data access
+        """
+        self.repository = repository
+
+    def execute(self, input_dto: ApplyOptimizationInput) -> list[TaskSummaryDto]:
+        """Persist planned schedules and clear schedules of failed tasks.
+
+        All changes are saved in a single batch so the apply is all-or-nothing.
+
+        Args:
+            input_dto: Planned schedules and IDs of schedules to clear
+
+        Returns:
+            Summaries of the tasks whose schedule was applied
+
+        Raises:
+            TaskNotFoundException: If any referenced task no longer exists
+            TaskNotSchedulableError: If any task is no longer schedulable
+            StaleOptimizationPlanError: If expected_data_version is set and
+                the tasks changed since the plan was computed
+        """
+        applied: list[Task] = []
+
+        def update(
+            task_map: dict[int, Task], current_version: str | None
+        ) -> list[Task]:
+            planned, cleared = self._apply_plan(input_dto, task_map, current_version)
+            applied.extend(planned)
+            return planned + cleared
+
+        if input_dto.expected_data_version is None:
+            all_ids = [plan.task_id for plan in input_dto.planned_schedules]
+            all_ids += input_dto.cleared_task_ids
+            self.repository.save_all(update(self.repository.get_by_ids(all_ids), None))
+        else:
+            # The version covers every task, so the whole set is read once
+            # and the tasks to update are taken from it. The read and the
+            # save share one transaction, so a concurrent write cannot slip
+            # in after the version check.
+            self.repository.update_all(
+                lambda all_tasks: update(
+                    {t.id: t for t in all_tasks if t.id is not None},
+                    compute_data_version(all_tasks),
+                )
+            )
+
+        return [TaskSummaryDto.from_entity(task) for task in applied]
+
+    def _apply_plan(
+        self,
+        input_dto: ApplyOptimizationInput,
+        task_map: dict[int, Task],
+        current_version: str | None,
+    ) -> tuple[list[Task], list[Task]]:
+        """Validate the plan against the current tasks and apply it to them.
+
+        Args:
+            input_dto: Planned schedules and IDs of schedules to clear
+            task_map: Current tasks by ID (may include tasks not in the plan)
+            current_version: Current data version, compared with the plan's
+                expected_data_version when set
+
+        Returns:
+            Tuple of (tasks whose schedule was applied, tasks whose schedule
+            was cleared)
+        """
+        task_ids = [plan.task_id for plan in input_dto.planned_schedules]
+        all_ids = task_ids + input_dto.cleared_task_ids
+
+        missing_ids = [tid for tid in all_ids if tid not in task_map]
+        if missing_ids:
+            if len(missing_ids) == 1:
+                raise TaskNotFoundException(missing_ids[0])
+            raise TaskNotFoundException(
+                f"Tasks with IDs {', '.join(map(str, missing_ids))} not found"
+            )
+
+        # Validate everything before mutating anything
+        for tid in all_ids:
+            task_map[tid].validate_schedulable(force_override=True)
+
+        # Any other change to the scheduling state invalidates the plan too
+        expected_version = input_dto.expected_data_version
+        if current_version is not None and current_version != expected_version:
+            raise StaleOptimizationPlanError(expected_version or "", current_version)
+
+        applied = []
+        for plan in input_dto.planned_schedules:
+            task = task_map[plan.task_id]
+            task.planned_start = plan.planned_start
+            task.planned_end = plan.planned_end
+            task.set_daily_allocations(dict(plan.daily_allocations))
+            applied.append(task)
+
+        cleared = []
+        for tid in input_dto.cleared_task_ids:
+            task = task_map[tid]
+            task.clear_schedule()
+            cleared.append(task)
+
+        return applied, cleared
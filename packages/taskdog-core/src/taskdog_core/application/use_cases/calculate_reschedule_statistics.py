@@ -6,7 +6,10 @@ from taskdog_core.application.dto.statistics_output import (
     CalculateStatisticsInput,
     RescheduleStatistics,
 )
-from taskdog_core.application.services.reschedule_analyzer import RescheduleAnalyzer
+from taskdog_core.application.services.reschedule_analyzer import (
+    CHRONIC_SLIPPER_THRESHOLD,
+    RescheduleAnalyzer,
+)
 from taskdog_core.application.use_cases.base import UseCase
 from taskdog_core.domain.repositories.audit_log_repository import AuditLogRepository
 
@@ -20,7 +23,9 @@ class CalculateRescheduleStatisticsUseCase(
 
     Reads deadline-change events from the audit log and derives
     rescheduling behavior statistics. Period filtering applies to the
-    audit log timestamps, not the task deadlines.
+    audit log timestamps, not the task deadlines. Repositories that
+    aggregate in the database return only the counts; for the others
+    every event is analyzed in Python.
     """
 
     def __init__(self, audit_log_repository: AuditLogRepository):
@@ -43,5 +48,10 @@ class CalculateRescheduleStatisticsUseCase(
         """
         days = _PERIOD_DAYS.get(input_dto.period)
         since = datetime.now() - timedelta(days=days) if days else None
+        aggregates = self.audit_log_repository.get_reschedule_aggregates(
+            since=since, min_reschedules=CHRONIC_SLIPPER_THRESHOLD
+        )
+        if aggregates is not None:
+            return self.analyzer.calculate_from_aggregates(aggregates)
         events = self.audit_log_repository.get_deadline_changes(since=since)
         return self.analyzer.calculate(events)
@@ -1,9 +1,14 @@
 """Calculate statistics use case."""
 
+from datetime import datetime
+
 from taskdog_core.application.dto.statistics_output import (
     CalculateStatisticsInput,
     StatisticsOutput,
 )
+from taskdog_core.application.services.incremental_task_statistics import (
+    IncrementalTaskStatistics,
+)
 from taskdog_core.application.services.task_statistics_calculator import (
     TaskStatisticsCalculator,
 )
@@ -14,19 +19,26 @@ from taskdog_core.domain.repositories.task_repository import TaskRepository
 class CalculateStatisticsUseCase(UseCase[CalculateStatisticsInput, StatisticsOutput]):
     """Use case for calculating task statistics.
 
-    This use case retrieves all tasks from the repository and calculates
-    comprehensive statistics including basic counts, time tracking,
-    estimation accuracy, deadline compliance, priority distribution,
-    and trends.
+    This use case calculates comprehensive statistics including basic
+    counts, time tracking, estimation accuracy, deadline compliance,
+    priority distribution, and trends. The counts come from incremental
+    statistics when given, else from the repository when it aggregates in
+    the database; otherwise all tasks are streamed and counted in Python.
     """
 
-    def __init__(self, repository: TaskRepository):
+    def __init__(
+        self,
+        repository: TaskRepository,
+        incremental: IncrementalTaskStatistics | None = None,
+    ):
         """Initialize the use case.
 
         Args:
             repository: Task repository for retrieving tasks
+            incremental: Statistics kept up to date as tasks change (optional)
         """
         self.repository = repository
+        self.incremental = incremental
         self.calculator = TaskStatisticsCalculator()
 
     def execute(self, input_dto: CalculateStatisticsInput) -> StatisticsOutput:
@@ -38,10 +50,21 @@ class CalculateStatisticsUseCase(UseCase[CalculateStatisticsInput, StatisticsOut
         Returns:
             StatisticsOutput containing all calculated statistics
         """
-        # Get all tasks from repository
-        tasks = self.repository.get_all()
+        period = input_dto.period
+        if self.incremental is not None:
+            return self.incremental.calculate(period)
+
+        now = datetime.now()
 
-        # Calculate statistics using the calculator service
-        result = self.calculator.calculate_all(tasks, period=input_dto.period)
+        aggregates = self.repository.get_statistics_aggregates(
+            since=self.calculator.period_start(period, now),
+            completion_cutoffs=(
+                self.calculator.trend_cutoffs(now) if period == "all" else None
+            ),
+        )
+        if aggregates is not None:
+            return self.calculator.calculate_from_aggregates(aggregates, period)
 
-        return result
+        # Fallback: count all tasks in Python, in a single streamed pass
+        tasks = self.repository.iter_all()
+        return self.calculator.calculate_all(tasks, period=period, now=now)
@@ -0,0 +1,298 @@
+"""Use case for evaluating what-if schedule scenarios."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
+
+from taskdog_core.application.constants.optimization import (
+    OPTIMIZATION_MAX_WORKERS,
+    SCENARIO_MAX_COUNT,
+)
+from taskdog_core.application.dto.evaluate_scenarios_input import (
+    EvaluateScenariosInput,
+    ScheduleScenario,
+    TaskOverride,
+)
+from taskdog_core.application.dto.optimize_params import OptimizeParams
+from taskdog_core.application.dto.scenario_evaluation_output import (
+    ScenarioEvaluationOutput,
+    ScenarioResult,
+)
+from taskdog_core.application.services.optimization.process_pool import (
+    run_in_processes,
+    uses_process_pool,
+)
+from taskdog_core.application.services.optimization.strategy_factory import (
+    StrategyFactory,
+)
+from taskdog_core.application.use_cases.base import UseCase
+from taskdog_core.domain.entities.task import Task, TaskStatus
+from taskdog_core.domain.exceptions.task_exceptions import (
+    TaskNotFoundException,
+    TaskValidationError,
+)
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from taskdog_core.application.dto.optimize_result import OptimizeResult
+    from taskdog_core.application.services.optimization.optimization_strategy import (
+        OptimizationStrategy,
+    )
+    from taskdog_core.domain.repositories.task_repository import TaskRepository
+    from taskdog_core.domain.services.holiday_checker import IHolidayChecker
+
+
+@dataclass(frozen=True)
+class _ScenarioJob:
+    """Picklable inputs of one scenario.
+
+    Attributes:
+        name: Scenario name
+        algorithm: Strategy name
+        tasks: Schedulable tasks with the scenario's overrides applied
+        existing_allocations: Allocations of fixed and in-progress work
+        params: Optimization parameters of the scenario
+    """
+
+    name: str
+    algorithm: str
+    tasks: list[Task]
+    existing_allocations: dict[date, float]
+    params: OptimizeParams
+
+
+class EvaluateScenariosUseCase(
+    UseCase[EvaluateScenariosInput, ScenarioEvaluationOutput]
+):
+    """Evaluate several optimization variants without saving anything.
+
+    Tasks and the allocations of fixed and in-progress work are loaded once
+    and shared by every scenario. Each scenario applies its task overrides to
+    copies of the affected tasks, re-plans all schedulable tasks with its own
+    strategy instance and is reduced to a compact summary. Scenarios run on
+    the shared optimization process pool, at most MAX_WORKERS at a time;
+    a single scenario runs in the calling process.
+    """
+
+    MAX_WORKERS = OPTIMIZATION_MAX_WORKERS
+
+    def __init__(
+        self,
+        repository: TaskRepository,
+        holiday_checker: IHolidayChecker | None = None,
+    ):
+        """Initialize use case.
+
+        Args:
+            repository: Task repository for data access
+            holiday_checker: Holiday checker for workday validation (optional)
+        """
+        self.repository = repository
+        self.holiday_checker = holiday_checker
+
+    def execute(self, input_dto: EvaluateScenariosInput) -> ScenarioEvaluationOutput:
+        """Evaluate every scenario of the request.
+
+        Args:
+            input_dto: Base parameters and scenarios
+
+        Returns:
+            ScenarioEvaluationOutput with one result per scenario, in order
+
+        Raises:
+            TaskValidationError: If there are no or too many scenarios, names
+                repeat, or a limit or override is invalid
+            ValueError: If an algorithm is not recognized
+            TaskNotFoundException: If an override refers to a missing task
+        """
+        self._validate_scenarios(input_dto.scenarios)
+        # Build parameters and strategies up front so invalid input fails
+        # before any work starts
+        algorithms = [
+            scenario.algorithm_name or input_dto.algorithm_name
+            for scenario in input_dto.scenarios
+        ]
+        runs = [
+            (
+                scenario,
+                algorithm,
+                StrategyFactory.create(algorithm),
+                OptimizeParams(
+                    start_date=input_dto.start_date,
+                    max_hours_per_day=(
+                        scenario.max_hours_per_day or input_dto.max_hours_per_day
+                    ),
+                    holiday_checker=self.holiday_checker,
+                    include_all_days=input_dto.include_all_days,
+                ),
+            )
+            for scenario, algorithm in zip(input_dto.scenarios, algorithms, strict=True)
+        ]
+
+        all_tasks = self.repository.get_all()
+        task_ids = {t.id for t in all_tasks if t.id is not None}
+        missing_ids = sorted(
+            {
+                override.task_id
+                for scenario in input_dto.scenarios
+                for override in scenario.task_overrides
+            }
+            - task_ids
+        )
+        if missing_ids:
+            if len(missing_ids) == 1:
+                raise TaskNotFoundException(missing_ids[0])
+            raise TaskNotFoundException(
+                f"Tasks with IDs {', '.join(map(str, missing_ids))} not found"
+            )
+
+        # Fixed and in-progress work stays in place in every scenario
+        existing_allocations = self.repository.get_aggregated_daily_allocations(
+            [
+                t.id
+                for t in all_tasks
+                if t.id is not None
+                and t.should_count_in_workload()
+                and (t.is_fixed or t.status == TaskStatus.IN_PROGRESS)
+            ]
+        )
+        scenario_tasks = [
+            self._apply_overrides(all_tasks, scenario.task_overrides)
+            for scenario in input_dto.scenarios
+        ]
+
+        jobs = [
+            _ScenarioJob(
+                name=scenario.name,
+                algorithm=algorithm,
+                tasks=[t for t in tasks if t.is_schedulable(force_override=True)],
+                existing_allocations=existing_allocations,
+                params=params,
+            )
+            for (scenario, algorithm, _strategy, params), tasks in zip(
+                runs, scenario_tasks, strict=True
+            )
+        ]
+        if uses_process_pool(len(jobs), self.MAX_WORKERS):
+            results = run_in_processes(_evaluate_scenario, jobs, self.MAX_WORKERS)
+        else:
+            results = [
+                _evaluate_scenario(job, strategy)
+                for job, (_scenario, _algorithm, strategy, _params) in zip(
+                    jobs, runs, strict=True
+                )
+            ]
+
+        return ScenarioEvaluationOutput(scenarios=results)
+
+    @staticmethod
+    def _validate_scenarios(scenarios: list[ScheduleScenario]) -> None:
+        """Check the number and names of the scenarios.
+
+        Raises:
+            TaskValidationError: If there are no or too many scenarios, or
+                names repeat
+        """
+        if not scenarios:
+            raise TaskValidationError("At least one scenario is required")
+        if len(scenarios) > SCENARIO_MAX_COUNT:
+            raise TaskValidationError(
+                f"At most {SCENARIO_MAX_COUNT} scenarios can be evaluated at once "
+                f"(got {len(scenarios)})"
+            )
+        names = [scenario.name for scenario in scenarios]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise TaskValidationError(
+                f"Duplicate scenario names: {', '.join(duplicates)}"
+            )
+
+    @staticmethod
+    def _apply_overrides(
+        tasks: list[Task], overrides: tuple[TaskOverride, ...]
+    ) -> list[Task]:
+        """Return the tasks with a scenario's overrides applied to copies.
+
+        Tasks without overrides are shared, not copied; strategies never
+        modify the tasks they are given.
+
+        Raises:
+            TaskValidationError: If an override value is invalid
+        """
+        if not overrides:
+            return tasks
+
+        changes: dict[int | None, dict[str, Any]] = {}
+        for override in overrides:
+            task_changes = changes.setdefault(override.task_id, {})
+            if override.estimated_duration is not None:
+                task_changes["estimated_duration"] = override.estimated_duration
+            if override.deadline is not None:
+                task_changes["deadline"] = override.deadline
+            if override.priority is not None:
+                task_changes["priority"] = override.priority
+        return [
+            replace(task, **changes[task.id]) if changes.get(task.id) else task
+            for task in tasks
+        ]
+
+    @staticmethod
+    def _summarize(
+        name: str,
+        algorithm: str,
+        params: OptimizeParams,
+        tasks: list[Task],
+        result: OptimizeResult,
+    ) -> ScenarioResult:
+        """Reduce a strategy result to the scenario's key figures."""
+        scheduled_ids = {t.id for t in result.tasks}
+        late = sum(
+            1
+            for t in result.tasks
+            if t.deadline is not None
+            and t.planned_end is not None
+            and t.planned_end > t.deadline
+        )
+        unscheduled_with_deadline = sum(
+            1 for t in tasks if t.id not in scheduled_ids and t.deadline is not None
+        )
+        start_day = params.start_date.date()
+        upcoming_loads = [
+            hours for day, hours in result.daily_allocations.items() if day >= start_day
+        ]
+        end_dates: list[date] = [
+            t.planned_end.date() for t in result.tasks if t.planned_end is not None
+        ]
+        return ScenarioResult(
+            name=name,
+            algorithm=algorithm,
+            max_hours_per_day=params.max_hours_per_day,
+            scheduled_count=len(result.tasks),
+            failed_count=len(result.failures),
+            deadline_misses=late + unscheduled_with_deadline,
+            end_date=max(end_dates, default=None),
+            peak_load=max(upcoming_loads, default=0.0),
+            total_hours=sum(t.estimated_duration or 0.0 for t in result.tasks),
+        )
+
+
+def _evaluate_scenario(
+    job: _ScenarioJob, strategy: OptimizationStrategy | None = None
+) -> ScenarioResult:
+    """Re-plan one scenario and summarize it.
+
+    Args:
+        job: Inputs of the scenario
+        strategy: Strategy instance (worker processes create their own)
+
+    Returns:
+        ScenarioResult of the scenario
+    """
+    if strategy is None:
+        strategy = StrategyFactory.create(job.algorithm)
+    result = strategy.optimize_tasks(job.tasks, job.existing_allocations, job.params)
+    return EvaluateScenariosUseCase._summarize(
+        job.name, job.algorithm, job.params, job.tasks, result
+    )
@@ -67,13 +67,19 @@ class ListTasksUseCase(UseCase[ListTasksInput, TaskListOutput]):
             filter_obj=filter_obj,
             sort_by=input_dto.sort_by,
             reverse=input_dto.reverse,
+            limit=input_dto.limit,
         )
         task_dtos = [TaskRowDto.from_entity(task) for task in tasks]
 
+        # A full page may have been cut short by the limit
+        filtered_count = len(task_dtos)
+        if input_dto.limit is not None and filtered_count >= input_dto.limit:
+            filtered_count = self.query_service.count_filtered_tasks(filter_obj)
+
         result = TaskListOutput(
             tasks=task_dtos,
             total_count=total_count,
-            filtered_count=len(task_dtos),
+            filtered_count=filtered_count,
         )
 
         # Optionally build the Gantt overlay from the same fetched task set
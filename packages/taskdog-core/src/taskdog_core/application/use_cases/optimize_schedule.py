@@ -4,10 +4,28 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from taskdog_core.application.dto.optimization_output import OptimizationOutput
+from taskdog_core.application.dto.optimization_output import (
+    OptimizationOutput,
+    OptimizationProfile,
+    PlannedTaskSchedule,
+)
 from taskdog_core.application.dto.optimize_params import OptimizeParams
 from taskdog_core.application.dto.optimize_schedule_input import OptimizeScheduleInput
 from taskdog_core.application.dto.task_dto import TaskSummaryDto
+from taskdog_core.application.services.optimization.capacity_lanes import (
+    optimize_by_lane,
+    partition_by_lane,
+    resolve_lanes,
+)
+from taskdog_core.application.services.optimization.data_version import (
+    compute_data_version,
+)
+from taskdog_core.application.services.optimization.incremental_scope import (
+    collect_allocation_days,
+    find_competing_tasks,
+    find_downstream_dependents,
+)
+from taskdog_core.application.services.optimization.phase_timer import PhaseTimer
 from taskdog_core.application.services.optimization.strategy_factory import (
     StrategyFactory,
 )
@@ -20,11 +38,17 @@ from taskdog_core.domain.exceptions.task_exceptions import (
     NoSchedulableTasksError,
     TaskNotFoundException,
     TaskNotSchedulableError,
+    TaskValidationError,
 )
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+    from taskdog_core.application.dto.capacity_lane import CapacityLane
+    from taskdog_core.application.dto.optimize_result import OptimizeResult
+    from taskdog_core.application.services.optimization.optimization_strategy import (
+        OptimizationStrategy,
+    )
     from taskdog_core.domain.repositories.task_repository import TaskRepository
     from taskdog_core.domain.services.holiday_checker import IHolidayChecker
 
@@ -34,6 +58,11 @@ class OptimizeScheduleUseCase(UseCase[OptimizeScheduleInput, OptimizationOutput]
 
     Analyzes all tasks and generates optimal schedules based on
     priorities, deadlines, and workload constraints.
+
+    Every run times its phases (loading tasks, aggregating existing
+    allocations, the strategy, persisting and building the summary); the
+    timings and the strategy's counters are returned only when
+    input_dto.profile is set.
     """
 
     def __init__(
@@ -48,7 +77,7 @@ class OptimizeScheduleUseCase(UseCase[OptimizeScheduleInput, OptimizationOutput]
             holiday_checker: Holiday checker for workday validation (optional)
         """
         self.repository = repository
-        self.summary_builder = OptimizationSummaryBuilder(repository)
+        self.summary_builder = OptimizationSummaryBuilder()
         self.holiday_checker = holiday_checker
 
     def execute(self, input_dto: OptimizeScheduleInput) -> OptimizationOutput:
@@ -64,37 +93,162 @@ class OptimizeScheduleUseCase(UseCase[OptimizeScheduleInput, OptimizationOutput]
             ValueError: If algorithm_name is not recognized
             TaskNotFoundException: If any specified task_id does not exist
             NoSchedulableTasksError: If no tasks can be scheduled
+            TaskValidationError: If task_ids and changed_task_ids are combined,
+                or capacity lanes are invalid
+            OptimizationCancelledError: If input_dto.cancellation_check requests
+                cancellation while the strategy is running
             Exception: If optimization fails
         """
+        timer = PhaseTimer()
+
         # Create and validate OptimizeParams from input_dto before any strategy work.
         params = OptimizeParams(
             start_date=input_dto.start_date,
             max_hours_per_day=input_dto.max_hours_per_day,
             holiday_checker=self.holiday_checker,
             include_all_days=input_dto.include_all_days,
+            portfolio_algorithms=(
+                tuple(input_dto.portfolio_algorithms)
+                if input_dto.portfolio_algorithms
+                else None
+            ),
+            num_simulations=input_dto.num_simulations,
+            cancellation_check=input_dto.cancellation_check,
+        )
+        lanes = (
+            resolve_lanes(input_dto.lanes, input_dto.max_hours_per_day)
+            if input_dto.lanes
+            else None
         )
 
         # Get all tasks and backup their states before optimization
-        all_tasks = self.repository.get_all()
-        task_states_before: dict[int, datetime | None] = {
-            t.id: t.planned_start for t in all_tasks if t.id is not None
-        }
-
-        # Determine target tasks for optimization
-        if input_dto.task_ids:
-            # Specific tasks requested: validate that all task IDs exist
-            task_map = {t.id: t for t in all_tasks if t.id is not None}
-            missing_ids = [tid for tid in input_dto.task_ids if tid not in task_map]
-            if missing_ids:
-                if len(missing_ids) == 1:
-                    raise TaskNotFoundException(missing_ids[0])
-                raise TaskNotFoundException(
-                    f"Tasks with IDs {', '.join(map(str, missing_ids))} not found"
+        with timer.phase("load_tasks"):
+            all_tasks = self.repository.get_all()
+            task_states_before: dict[int, datetime | None] = {
+                t.id: t.planned_start for t in all_tasks if t.id is not None
+            }
+            # A dry-run result is only valid for the data it was computed from
+            data_version = (
+                compute_data_version(all_tasks) if input_dto.dry_run else None
+            )
+
+        if input_dto.changed_task_ids:
+            if input_dto.task_ids:
+                raise TaskValidationError(
+                    "task_ids and changed_task_ids cannot be combined"
                 )
-            target_tasks = [task_map[tid] for tid in input_dto.task_ids]
+            # Incremental runs always move the affected tasks
+            force_override = True
+            schedulable_tasks, result = self._optimize_incremental(
+                all_tasks,
+                input_dto.changed_task_ids,
+                input_dto.algorithm_name,
+                params,
+                lanes,
+                timer,
+            )
         else:
-            # All tasks are candidates
-            target_tasks = all_tasks
+            force_override = input_dto.force_override
+            schedulable_tasks, result = self._optimize_full(
+                all_tasks, input_dto, params, lanes, timer
+            )
+
+        # Schedulable tasks that failed to schedule keep a stale schedule
+        # unless it is cleared (force_override only)
+        tasks_to_clear = self._find_tasks_to_clear(
+            schedulable_tasks, result.tasks, force_override
+        )
+
+        cleared_task_ids = [t.id for t in tasks_to_clear if t.id is not None]
+
+        # Dry runs leave the repository untouched; the caller can persist the
+        # returned planned_schedules later via ApplyOptimizationUseCase
+        if not input_dto.dry_run:
+            # Clear schedules for failed tasks, then save them together with
+            # the scheduled tasks in one batch
+            with timer.phase("persist"):
+                for task in tasks_to_clear:
+                    task.clear_schedule()
+                self.repository.save_all(result.tasks + tasks_to_clear)
+
+        with timer.phase("summary"):
+            # Build optimization summary from the tasks already in memory
+            summary = self.summary_builder.build(
+                result.tasks,
+                task_states_before,
+                result.daily_allocations,
+                input_dto.max_hours_per_day,
+                all_tasks=all_tasks,
+                cleared_task_ids=set(cleared_task_ids),
+                lane_allocations=result.lane_allocations,
+                lane_limits={lane.name: lane.max_hours_per_day for lane in lanes or ()},
+            )
+            summary = summary.model_copy(
+                update={
+                    "touched_count": len(schedulable_tasks),
+                    # Portfolio runs report which strategy won and how each one scored
+                    "selected_algorithm": result.selected_algorithm,
+                    "portfolio": result.portfolio,
+                    "critical_path": result.critical_path,
+                    "search_stats": result.search_stats,
+                }
+            )
+
+            # Convert Tasks to DTOs
+            successful_tasks_dto = [
+                TaskSummaryDto.from_entity(task) for task in result.tasks
+            ]
+
+            # Create result
+            output = OptimizationOutput(
+                successful_tasks=successful_tasks_dto,
+                failed_tasks=result.failures,
+                daily_allocations=result.daily_allocations,
+                summary=summary,
+                task_states_before=task_states_before,
+                planned_schedules=self._build_planned_schedules(result.tasks),
+                cleared_task_ids=cleared_task_ids,
+                dry_run=input_dto.dry_run,
+                data_version=data_version,
+                lane_allocations=result.lane_allocations,
+            )
+
+        if input_dto.profile:
+            output.profile = OptimizationProfile(
+                phases=timer.phases,
+                total_seconds=timer.elapsed(),
+                counters=dict(result.counters),
+            )
+        return output
+
+    def _optimize_full(
+        self,
+        all_tasks: list[Task],
+        input_dto: OptimizeScheduleInput,
+        params: OptimizeParams,
+        lanes: tuple[CapacityLane, ...] | None,
+        timer: PhaseTimer,
+    ) -> tuple[list[Task], OptimizeResult]:
+        """Optimize all requested tasks, re-allocating each of them.
+
+        Args:
+            all_tasks: All tasks in the system
+            input_dto: Optimization parameters
+            params: Validated strategy parameters
+            lanes: Resolved capacity lanes (None for a single worker)
+            timer: Timer of the run's phases
+
+        Returns:
+            Tuple of (tasks passed to the strategy, strategy result)
+
+        Raises:
+            ValueError: If algorithm_name is not recognized
+            TaskNotFoundException: If any specified task_id does not exist
+            NoSchedulableTasksError: If specific tasks were requested but none
+                can be scheduled
+        """
+        # Determine target tasks for optimization
+        target_tasks = self._resolve_target_tasks(all_tasks, input_dto.task_ids)
 
         # Validate and filter schedulable tasks (common logic for both cases)
         schedulable_tasks = []
@@ -122,69 +276,233 @@ class OptimizeScheduleUseCase(UseCase[OptimizeScheduleInput, OptimizationOutput]
             all_tasks, input_dto.force_override, input_dto.task_ids
         )
 
-        # Pre-compute existing allocations using SQL aggregation (performance optimization)
-        # This avoids Python loops in strategies and uses SQL SUM/GROUP BY instead
-        workload_task_ids = [t.id for t in workload_tasks if t.id is not None]
-        existing_allocations = self.repository.get_aggregated_daily_allocations(
-            workload_task_ids
-        )
-
         # Get optimization strategy
         strategy = StrategyFactory.create(input_dto.algorithm_name)
 
         # Run optimization
         # Strategy responsibility: how to optimize
-        # Pass pre-computed existing_allocations instead of task list
-        result = strategy.optimize_tasks(
-            tasks=schedulable_tasks,
-            existing_allocations=existing_allocations,
-            params=params,
+        result = self._run_strategy(
+            strategy, schedulable_tasks, workload_tasks, params, lanes, timer
         )
+        return schedulable_tasks, result
+
+    def _run_strategy(
+        self,
+        strategy: OptimizationStrategy,
+        tasks: list[Task],
+        workload_tasks: list[Task],
+        params: OptimizeParams,
+        lanes: tuple[CapacityLane, ...] | None,
+        timer: PhaseTimer,
+    ) -> OptimizeResult:
+        """Run the strategy around the allocations of the workload tasks.
+
+        Existing allocations are pre-computed using SQL aggregation
+        (SUM/GROUP BY) instead of passing the task list to the strategy.
+        With capacity lanes, tasks and workload are split by lane and each
+        lane is aggregated and scheduled separately.
+
+        Args:
+            strategy: Strategy to run
+            tasks: Tasks to schedule
+            workload_tasks: Tasks whose allocations stay in place
+            params: Validated strategy parameters
+            lanes: Resolved capacity lanes (None for a single worker)
+            timer: Timer of the run's phases
+
+        Returns:
+            Strategy result
+        """
+        if not lanes:
+            with timer.phase("load_allocations"):
+                existing_allocations = self.repository.get_aggregated_daily_allocations(
+                    [t.id for t in workload_tasks if t.id is not None]
+                )
+            with timer.phase("strategy"):
+                return strategy.optimize_tasks(
+                    tasks=tasks,
+                    existing_allocations=existing_allocations,
+                    params=params,
+                )
+
+        with timer.phase("load_allocations"):
+            allocations_by_lane = {
+                name: self.repository.get_aggregated_daily_allocations(
+                    [t.id for t in lane_tasks if t.id is not None]
+                )
+                for name, lane_tasks in partition_by_lane(workload_tasks, lanes).items()
+                if lane_tasks
+            }
+        with timer.phase("strategy"):
+            return optimize_by_lane(
+                strategy,
+                partition_by_lane(tasks, lanes),
+                allocations_by_lane,
+                params,
+                lanes,
+            )
+
+    def _optimize_incremental(
+        self,
+        all_tasks: list[Task],
+        changed_task_ids: list[int],
+        algorithm_name: str,
+        params: OptimizeParams,
+        lanes: tuple[CapacityLane, ...] | None,
+        timer: PhaseTimer,
+    ) -> tuple[list[Task], OptimizeResult]:
+        """Re-allocate only the tasks whose schedules can change.
+
+        The affected set starts with the changed tasks and their downstream
+        dependents. The strategy then runs on the movable (schedulable) part
+        of the set around every other task's allocations. Days the affected
+        tasks free or consume open a window; reschedulable tasks scheduled
+        within or after it compete for that capacity, so they join the set
+        (with their dependents) and the strategy runs again until the set is
+        stable. Tasks finishing before the window keep their slots.
 
-        # Save successfully scheduled tasks (batch operation for performance)
-        self.repository.save_all(result.tasks)
-
-        # Clear schedules for tasks that couldn't be scheduled
-        # (when force_override is True, schedulable tasks that failed to schedule
-        # should have their old schedules cleared to avoid phantom allocations)
-        if input_dto.force_override:
-            scheduled_task_ids = {t.id for t in result.tasks}
-
-            # Find tasks that were schedulable but failed to schedule
-            # Use already-filtered schedulable_tasks instead of re-filtering
-            tasks_to_clear = [
-                task
-                for task in schedulable_tasks
-                if task.id not in scheduled_task_ids and task.planned_start
+        Args:
+            all_tasks: All tasks in the system
+            changed_task_ids: IDs of tasks added, completed or edited
+            algorithm_name: Optimization algorithm to use
+            params: Validated strategy parameters
+            lanes: Resolved capacity lanes (None for a single worker)
+            timer: Timer of the run's phases
+
+        Returns:
+            Tuple of (tasks passed to the strategy, strategy result)
+
+        Raises:
+            ValueError: If algorithm_name is not recognized
+            TaskNotFoundException: If any changed task ID does not exist
+        """
+        changed_tasks = self._resolve_target_tasks(all_tasks, changed_task_ids)
+        affected_ids = {t.id for t in changed_tasks if t.id is not None}
+        affected_ids |= find_downstream_dependents(all_tasks, affected_ids)
+        strategy = StrategyFactory.create(algorithm_name)
+
+        while True:
+            movable_tasks = [
+                t
+                for t in all_tasks
+                if t.id in affected_ids and t.is_schedulable(force_override=True)
+            ]
+            movable_ids = {t.id for t in movable_tasks}
+            # Everything else that is still active stays where it is
+            workload_tasks = [
+                t
+                for t in all_tasks
+                if t.id is not None
+                and t.id not in movable_ids
+                and t.should_count_in_workload()
             ]
+            result = self._run_strategy(
+                strategy, movable_tasks, workload_tasks, params, lanes, timer
+            )
+
+            freed_days = collect_allocation_days(
+                t for t in all_tasks if t.id in affected_ids
+            )
+            consumed_days = collect_allocation_days(result.tasks)
+            touched_days = [
+                day
+                for day in freed_days | consumed_days
+                if day >= params.start_date.date()
+            ]
+            if not touched_days:
+                return movable_tasks, result
+
+            competing_tasks = find_competing_tasks(
+                all_tasks, affected_ids, min(touched_days)
+            )
+            if not competing_tasks:
+                return movable_tasks, result
+
+            competing_ids = {t.id for t in competing_tasks if t.id is not None}
+            affected_ids |= competing_ids
+            affected_ids |= find_downstream_dependents(all_tasks, competing_ids)
+
+    @staticmethod
+    def _resolve_target_tasks(
+        all_tasks: list[Task], task_ids: list[int] | None
+    ) -> list[Task]:
+        """Select the tasks to optimize.
 
-            # Clear schedules for failed tasks
-            if tasks_to_clear:
-                for task in tasks_to_clear:
-                    task.clear_schedule()
-                self.repository.save_all(tasks_to_clear)
-
-        # Build optimization summary
-        summary = self.summary_builder.build(
-            result.tasks,
-            task_states_before,
-            result.daily_allocations,
-            input_dto.max_hours_per_day,
-        )
+        Args:
+            all_tasks: All tasks in the system
+            task_ids: Specific task IDs requested (None or empty means all tasks)
 
-        # Convert Tasks to DTOs
-        successful_tasks_dto = [
-            TaskSummaryDto.from_entity(task) for task in result.tasks
+        Returns:
+            Requested tasks in request order, or all tasks
+
+        Raises:
+            TaskNotFoundException: If any requested task ID does not exist
+        """
+        if not task_ids:
+            # All tasks are candidates
+            return all_tasks
+
+        # Specific tasks requested: validate that all task IDs exist
+        task_map = {t.id: t for t in all_tasks if t.id is not None}
+        missing_ids = [tid for tid in task_ids if tid not in task_map]
+        if missing_ids:
+            if len(missing_ids) == 1:
+                raise TaskNotFoundException(missing_ids[0])
+            raise TaskNotFoundException(
+                f"Tasks with IDs {', '.join(map(str, missing_ids))} not found"
+            )
+        return [task_map[tid] for tid in task_ids]
+
+    @staticmethod
+    def _find_tasks_to_clear(
+        schedulable_tasks: list[Task],
+        scheduled_tasks: list[Task],
+        force_override: bool,
+    ) -> list[Task]:
+        """Find schedulable tasks whose old schedule must be cleared.
+
+        When force_override is True, schedulable tasks that failed to schedule
+        should have their old schedules cleared to avoid phantom allocations.
+
+        Args:
+            schedulable_tasks: Tasks passed to the strategy
+            scheduled_tasks: Tasks the strategy scheduled successfully
+            force_override: Whether existing schedules are overridden
+
+        Returns:
+            Tasks that failed to schedule but still carry a schedule
+        """
+        if not force_override:
+            return []
+        scheduled_task_ids = {t.id for t in scheduled_tasks}
+        return [
+            task
+            for task in schedulable_tasks
+            if task.id not in scheduled_task_ids and task.planned_start
         ]
 
-        # Create and return result
-        return OptimizationOutput(
-            successful_tasks=successful_tasks_dto,
-            failed_tasks=result.failures,
-            daily_allocations=result.daily_allocations,
-            summary=summary,
-            task_states_before=task_states_before,
-        )
+    @staticmethod
+    def _build_planned_schedules(tasks: list[Task]) -> list[PlannedTaskSchedule]:
+        """Extract the computed schedule of each scheduled task.
+
+        Args:
+            tasks: Tasks returned by the optimization strategy
+
+        Returns:
+            List of PlannedTaskSchedule for tasks with a complete schedule
+        """
+        return [
+            PlannedTaskSchedule(
+                task_id=task.id,
+                planned_start=task.planned_start,
+                planned_end=task.planned_end,
+                daily_allocations=dict(task.daily_allocations),
+            )
+            for task in tasks
+            if task.id is not None
+            and task.planned_start is not None
+            and task.planned_end is not None
+        ]
 
     def _filter_workload_tasks(
         self,
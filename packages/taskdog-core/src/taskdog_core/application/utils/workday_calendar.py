@@ -0,0 +1,202 @@
+"""Precomputed workday index for constant-time workday queries.
+
+is_workday() asks the holiday checker about one day at a time. Callers that
+walk many days (the optimizer, workload distribution, Gantt rendering) build
+a WorkdayCalendar once instead: holidays are fetched per year with
+get_holidays_in_range(), and a bitmap with prefix counts answers the
+common questions in O(1).
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+from taskdog_core.shared.utils.date_utils import is_weekday
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from taskdog_core.domain.services.holiday_checker import IHolidayChecker
+
+
+@dataclass(frozen=True)
+class _WorkdayIndex:
+    """Immutable snapshot of the covered range.
+
+    Attributes:
+        origin: First covered day
+        workdays: 1 for each workday, 0 otherwise (indexed by day offset)
+        prefix: prefix[i] = number of workdays among the first i days
+        offsets: Day offsets of all workdays, ascending
+    """
+
+    origin: date
+    workdays: bytearray
+    prefix: list[int]
+    offsets: list[int]
+
+    @property
+    def days(self) -> int:
+        return len(self.workdays)
+
+
+class WorkdayCalendar:
+    """Workdays (weekdays that are not holidays) indexed for O(1) lookups.
+
+    The covered range starts empty and grows to whole calendar years as days
+    are queried, so one instance can be shared across a request. Holidays
+    are fetched once per year from the holiday checker, or taken from an
+    explicit set (e.g. the holidays of a Gantt overlay).
+
+    Safe to share between threads: growth swaps in a new immutable index.
+
+    Examples:
+        >>> calendar = WorkdayCalendar()
+        >>> calendar.is_workday(date(2025, 1, 4))  # Saturday
+        False
+        >>> calendar.count_workdays(date(2025, 1, 6), date(2025, 1, 12))
+        5
+    """
+
+    def __init__(
+        self,
+        holiday_checker: IHolidayChecker | None = None,
+        holidays: Iterable[date] | None = None,
+    ) -> None:
+        """Initialize the calendar.
+
+        Args:
+            holiday_checker: Optional holiday checker queried per covered year
+            holidays: Optional explicit holiday dates (used with or instead of
+                the checker)
+        """
+        self._holiday_checker = holiday_checker
+        self._holidays: set[date] = set(holidays or ())
+        self._index: _WorkdayIndex | None = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, object]:
+        """Pickle without the lock (OptimizeParams is sent to worker processes)."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        """Restore a pickled calendar with a fresh lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def is_workday(self, day: date) -> bool:
+        """Check if a day is a weekday and not a holiday.
+
+        Args:
+            day: Day to check
+
+        Returns:
+            True if the day is a workday
+        """
+        index = self._cover(day, day)
+        return bool(index.workdays[(day - index.origin).days])
+
+    def is_holiday(self, day: date) -> bool:
+        """Check if a day is a holiday (regardless of weekday).
+
+        Args:
+            day: Day to check
+
+        Returns:
+            True if the day is a known holiday
+        """
+        self._cover(day, day)
+        return day in self._holidays
+
+    def count_workdays(self, start: date, end: date) -> int:
+        """Count workdays in an inclusive range.
+
+        Args:
+            start: First day of the range
+            end: Last day of the range
+
+        Returns:
+            Number of workdays (0 for an empty range)
+        """
+        if end < start:
+            return 0
+        index = self._cover(start, end)
+        lo = (start - index.origin).days
+        hi = (end - index.origin).days
+        return index.prefix[hi + 1] - index.prefix[lo]
+
+    def workdays_between(self, start: date, end: date) -> list[date]:
+        """List the workdays in an inclusive range.
+
+        Args:
+            start: First day of the range
+            end: Last day of the range
+
+        Returns:
+            Workdays in ascending order
+        """
+        if end < start:
+            return []
+        index = self._cover(start, end)
+        lo = (start - index.origin).days
+        hi = (end - index.origin).days
+        return [
+            index.origin + timedelta(days=offset)
+            for offset in index.offsets[index.prefix[lo] : index.prefix[hi + 1]]
+        ]
+
+    def _cover(self, start: date, end: date) -> _WorkdayIndex:
+        """Return an index covering [start, end], growing it if needed."""
+        index = self._index
+        if index is not None and self._covers(index, start, end):
+            return index
+
+        with self._lock:
+            index = self._index
+            if index is not None and self._covers(index, start, end):
+                return index
+
+            first_year, last_year = start.year, end.year
+            if index is not None:
+                first_year = min(first_year, index.origin.year)
+                last_year = max(
+                    last_year,
+                    (index.origin + timedelta(days=index.days - 1)).year,
+                )
+            index = self._build(first_year, last_year)
+            self._index = index
+            return index
+
+    @staticmethod
+    def _covers(index: _WorkdayIndex, start: date, end: date) -> bool:
+        return start >= index.origin and (end - index.origin).days < index.days
+
+    def _build(self, first_year: int, last_year: int) -> _WorkdayIndex:
+        origin = date(first_year, 1, 1)
+        end = date(last_year, 12, 31)
+        if self._holiday_checker is not None:
+            self._holidays = self._holidays | set(
+                self._holiday_checker.get_holidays_in_range(origin, end)
+            )
+
+        days = (end - origin).days + 1
+        workdays = bytearray(days)
+        prefix = [0] * (days + 1)
+        offsets: list[int] = []
+        holidays = self._holidays
+        count = 0
+        for offset in range(days):
+            day = origin + timedelta(days=offset)
+            if is_weekday(day) and day not in holidays:
+                workdays[offset] = 1
+                offsets.append(offset)
+                count += 1
+            prefix[offset + 1] = count
+        return _WorkdayIndex(
+            origin=origin, workdays=workdays, prefix=prefix, offsets=offsets
+        )
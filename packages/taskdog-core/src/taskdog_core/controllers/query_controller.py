@@ -27,6 +27,10 @@ from taskdog_core.domain.repositories.task_repository import TaskRepository
 from taskdog_core.domain.services.time_provider import ITimeProvider
 
 if TYPE_CHECKING:
+    from taskdog_core.application.queries.gantt_overlay_cache import (
+        GanttOverlayCache,
+    )
+    from taskdog_core.application.queries.ready_task_index import ReadyTaskIndex
     from taskdog_core.domain.services.holiday_checker import IHolidayChecker
 
 
@@ -49,6 +53,8 @@ class QueryController:
         repository: TaskRepository,
         notes_repository: NotesRepository | None,
         time_provider: ITimeProvider,
+        overlay_cache: "GanttOverlayCache | None" = None,
+        ready_index: "ReadyTaskIndex | None" = None,
     ):
         """Initialize the query controller.
 
@@ -56,11 +62,13 @@ class QueryController:
             repository: Task repository
             notes_repository: Notes repository (optional, required for get_task_detail)
             time_provider: Provider for current time, supplied by the caller
+            overlay_cache: Optional cache of Gantt overlay data shared across calls
+            ready_index: Optional index of executable tasks for get_executable_tasks
         """
         self.repository = repository
         self.notes_repository = notes_repository
         self.query_service: TaskQueryService = TaskQueryService(
-            repository, time_provider
+            repository, time_provider, overlay_cache, ready_index
         )
 
     def list_tasks(
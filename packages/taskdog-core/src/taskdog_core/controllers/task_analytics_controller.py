@@ -3,22 +3,46 @@
 This controller handles read-heavy analytics and optimization operations:
 - calculate_statistics: Calculate comprehensive task statistics for different periods
 - optimize_schedule: Auto-schedule tasks using various optimization algorithms
+- apply_optimization: Persist the result of a dry-run optimization
+- evaluate_scenarios: Compare what-if optimization variants without saving
 """
 
+from collections.abc import Callable
 from datetime import datetime
 
+from taskdog_core.application.dto.apply_optimization_input import (
+    ApplyOptimizationInput,
+)
+from taskdog_core.application.dto.capacity_lane import CapacityLane
+from taskdog_core.application.dto.evaluate_scenarios_input import (
+    EvaluateScenariosInput,
+    ScheduleScenario,
+)
 from taskdog_core.application.dto.optimization_output import OptimizationOutput
 from taskdog_core.application.dto.optimize_schedule_input import OptimizeScheduleInput
+from taskdog_core.application.dto.scenario_evaluation_output import (
+    ScenarioEvaluationOutput,
+)
 from taskdog_core.application.dto.statistics_output import (
     CalculateStatisticsInput,
     StatisticsOutput,
 )
+from taskdog_core.application.dto.task_dto import TaskSummaryDto
+from taskdog_core.application.services.incremental_task_statistics import (
+    IncrementalTaskStatistics,
+)
+from taskdog_core.application.use_cases.apply_optimization import (
+    ApplyOptimizationUseCase,
+)
 from taskdog_core.application.use_cases.calculate_reschedule_statistics import (
     CalculateRescheduleStatisticsUseCase,
 )
 from taskdog_core.application.use_cases.calculate_statistics import (
     CalculateStatisticsUseCase,
 )
+from taskdog_core.application.use_cases.evaluate_scenarios import (
+    EvaluateScenariosUseCase,
+)
 from taskdog_core.application.use_cases.optimize_schedule import OptimizeScheduleUseCase
 from taskdog_core.controllers.base_controller import BaseTaskController
 from taskdog_core.domain.repositories.audit_log_repository import AuditLogRepository
@@ -48,6 +72,7 @@ class TaskAnalyticsController(BaseTaskController):
         config: Config,
         holiday_checker: IHolidayChecker | None,
         audit_log_repository: AuditLogRepository | None = None,
+        incremental_statistics: IncrementalTaskStatistics | None = None,
     ):
         """Initialize the analytics controller.
 
@@ -57,10 +82,13 @@ class TaskAnalyticsController(BaseTaskController):
             holiday_checker: Holiday checker for workday validation (optional)
             audit_log_repository: Audit log repository for reschedule
                 statistics (optional; reschedule stats are omitted without it)
+            incremental_statistics: Statistics kept up to date as tasks
+                change (optional; statistics are recomputed per call without it)
         """
         super().__init__(repository, config)
         self.holiday_checker = holiday_checker
         self.audit_log_repository = audit_log_repository
+        self.incremental_statistics = incremental_statistics
 
     def calculate_statistics(self, period: str = "all") -> StatisticsOutput:
         """Calculate task statistics.
@@ -79,7 +107,9 @@ class TaskAnalyticsController(BaseTaskController):
         if period not in ["all", "7d", "30d"]:
             raise ValueError(f"Invalid period: {period}. Must be 'all', '7d', or '30d'")
 
-        use_case = CalculateStatisticsUseCase(self.repository)
+        use_case = CalculateStatisticsUseCase(
+            self.repository, self.incremental_statistics
+        )
         request = CalculateStatisticsInput(period=period)
         output = use_case.execute(request)
 
@@ -101,6 +131,13 @@ class TaskAnalyticsController(BaseTaskController):
         force_override: bool = True,
         task_ids: list[int] | None = None,
         include_all_days: bool = False,
+        portfolio_algorithms: list[str] | None = None,
+        changed_task_ids: list[int] | None = None,
+        dry_run: bool = False,
+        cancellation_check: Callable[[], bool] | None = None,
+        lanes: list[CapacityLane] | None = None,
+        num_simulations: int | None = None,
+        profile: bool = False,
     ) -> OptimizationOutput:
         """Optimize task schedules.
 
@@ -111,6 +148,19 @@ class TaskAnalyticsController(BaseTaskController):
             force_override: Force override existing schedules (default: True)
             task_ids: Specific task IDs to optimize (None means all schedulable tasks)
             include_all_days: If True, schedule tasks on weekends and holidays too (default: False)
+            portfolio_algorithms: Strategies evaluated by the "portfolio" algorithm
+                (None uses the default set)
+            changed_task_ids: Tasks changed since the last run; when set, only
+                the tasks whose schedules can change are re-allocated
+            dry_run: If True, compute schedules without persisting them (default: False)
+            cancellation_check: Optional callable polled during optimization;
+                returning True aborts the run
+            lanes: Capacity lanes with their own daily limits and days off
+                (None schedules everything as a single worker)
+            num_simulations: Orderings sampled by the "monte_carlo" algorithm
+                (None uses the default count)
+            profile: If True, report per-phase timings and strategy counters
+                in the output's profile (default: False)
 
         Returns:
             OptimizationOutput containing successful/failed tasks and summary
@@ -119,6 +169,7 @@ class TaskAnalyticsController(BaseTaskController):
             ValidationError: If algorithm is invalid or parameters are invalid
             TaskNotFoundException: If any specified task_id does not exist
             NoSchedulableTasksError: If no tasks can be scheduled
+            OptimizationCancelledError: If cancellation_check requested cancellation
         """
         optimize_input = OptimizeScheduleInput(
             start_date=start_date,
@@ -127,6 +178,13 @@ class TaskAnalyticsController(BaseTaskController):
             algorithm_name=algorithm,
             task_ids=task_ids,
             include_all_days=include_all_days,
+            portfolio_algorithms=portfolio_algorithms,
+            changed_task_ids=changed_task_ids,
+            dry_run=dry_run,
+            cancellation_check=cancellation_check,
+            lanes=lanes,
+            num_simulations=num_simulations,
+            profile=profile,
         )
 
         use_case = OptimizeScheduleUseCase(
@@ -134,3 +192,62 @@ class TaskAnalyticsController(BaseTaskController):
             self.holiday_checker,
         )
         return use_case.execute(optimize_input)
+
+    def apply_optimization(self, output: OptimizationOutput) -> list[TaskSummaryDto]:
+        """Persist the schedules of a dry-run optimization.
+
+        Args:
+            output: Result of optimize_schedule(..., dry_run=True)
+
+        Returns:
+            Summaries of the tasks whose schedule was applied
+
+        Raises:
+            TaskNotFoundException: If any referenced task no longer exists
+            TaskNotSchedulableError: If any task is no longer schedulable
+            StaleOptimizationPlanError: If the tasks changed since the dry run
+        """
+        use_case = ApplyOptimizationUseCase(self.repository)
+        return use_case.execute(
+            ApplyOptimizationInput(
+                planned_schedules=output.planned_schedules,
+                cleared_task_ids=output.cleared_task_ids,
+                expected_data_version=output.data_version,
+            )
+        )
+
+    def evaluate_scenarios(
+        self,
+        algorithm: str,
+        start_date: datetime,
+        max_hours_per_day: float,
+        scenarios: list[ScheduleScenario],
+        include_all_days: bool = False,
+    ) -> ScenarioEvaluationOutput:
+        """Evaluate what-if variants of an optimization without saving them.
+
+        Args:
+            algorithm: Base optimization algorithm name
+            start_date: Start date for optimization
+            max_hours_per_day: Base maximum hours per day
+            scenarios: Variants with their own algorithm, limit or task overrides
+            include_all_days: If True, schedule tasks on weekends and holidays too
+
+        Returns:
+            ScenarioEvaluationOutput with one summary per scenario, in order
+
+        Raises:
+            TaskValidationError: If the scenarios or their values are invalid
+            ValueError: If an algorithm is not recognized
+            TaskNotFoundException: If an override refers to a missing task
+        """
+        use_case = EvaluateScenariosUseCase(self.repository, self.holiday_checker)
+        return use_case.execute(
+            EvaluateScenariosInput(
+                start_date=start_date,
+                max_hours_per_day=max_hours_per_day,
+                algorithm_name=algorithm,
+                scenarios=scenarios,
+                include_all_days=include_all_days,
+            )
+        )
@@ -15,11 +15,16 @@ from taskdog_core.application.dto.manage_dependencies_input import (
 )
 from taskdog_core.application.dto.set_task_tags_input import SetTaskTagsInput
 from taskdog_core.application.dto.task_operation_output import TaskOperationOutput
+from taskdog_core.application.services.dependency_graph_index import (
+    DependencyGraphIndex,
+)
 from taskdog_core.application.use_cases.add_dependency import AddDependencyUseCase
 from taskdog_core.application.use_cases.delete_tag import DeleteTagUseCase
 from taskdog_core.application.use_cases.remove_dependency import RemoveDependencyUseCase
 from taskdog_core.application.use_cases.set_task_tags import SetTaskTagsUseCase
 from taskdog_core.controllers.base_controller import BaseTaskController
+from taskdog_core.domain.repositories.task_repository import TaskRepository
+from taskdog_core.shared.config_manager import Config
 
 
 class TaskRelationshipController(BaseTaskController):
@@ -34,8 +39,26 @@ class TaskRelationshipController(BaseTaskController):
     Attributes:
         repository: Task repository (inherited from BaseTaskController)
         config: Application configuration (inherited from BaseTaskController)
+        graph_index: In-memory dependency graph for cycle checks (optional)
     """
 
+    def __init__(
+        self,
+        repository: TaskRepository,
+        config: Config,
+        graph_index: DependencyGraphIndex | None = None,
+    ):
+        """Initialize the relationship controller.
+
+        Args:
+            repository: Task repository
+            config: Application configuration
+            graph_index: Dependency graph kept up to date as tasks change
+                (optional; cycle checks read the repository without it)
+        """
+        super().__init__(repository, config)
+        self.graph_index = graph_index
+
     def add_dependency(self, task_id: int, depends_on_id: int) -> TaskOperationOutput:
         """Add a dependency to a task.
 
@@ -50,7 +73,7 @@ class TaskRelationshipController(BaseTaskController):
             TaskNotFoundException: If task or dependency not found
             TaskValidationError: If dependency would create a cycle, or task depends on itself
         """
-        use_case = AddDependencyUseCase(self.repository)
+        use_case = AddDependencyUseCase(self.repository, self.graph_index)
         request = AddDependencyInput(task_id=task_id, depends_on_id=depends_on_id)
         return use_case.execute(request)
 
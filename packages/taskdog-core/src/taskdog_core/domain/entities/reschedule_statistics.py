@@ -0,0 +1,88 @@
+"""Deadline reschedule aggregates value objects.
+
+Audit log repositories that can aggregate in the database return these
+instead of every deadline-change event when reschedule statistics are
+calculated. The application layer turns them into its RescheduleStatistics
+DTO (see ``application/services/reschedule_analyzer.py``).
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+# Lead time buckets as (category, inclusive upper bound in days); the last
+# bucket has no upper bound
+LEAD_TIME_BUCKETS: tuple[tuple[str, int | None], ...] = (
+    ("same_day", 0),
+    ("1_2_days", 2),
+    ("3_7_days", 7),
+    ("8_plus_days", None),
+)
+
+
+def lead_time_category(lead_days: int) -> str:
+    """Bucket the days between setting a deadline and the deadline itself.
+
+    Args:
+        lead_days: Calendar days from the initial setting to the deadline
+
+    Returns:
+        Category name from LEAD_TIME_BUCKETS
+    """
+    for category, upper in LEAD_TIME_BUCKETS:
+        if upper is None or lead_days <= upper:
+            return category
+    raise AssertionError("the last lead time bucket is unbounded")
+
+
+@dataclass(frozen=True)
+class TaskSlipHistory:
+    """Deadline history of a repeatedly rescheduled task."""
+
+    task_id: int
+    """Task ID."""
+
+    task_name: str
+    """Task name from the latest event that had one."""
+
+    reschedule_count: int
+    """Number of value-to-value deadline changes."""
+
+    slip_days: float
+    """Net days the deadline moved (positive = pushed later)."""
+
+    first_deadline: datetime
+    """First recorded deadline."""
+
+    latest_deadline: datetime
+    """Last recorded deadline."""
+
+
+@dataclass(frozen=True)
+class RescheduleAggregates:
+    """Deadline reschedule counts, computed by the audit log repository.
+
+    Counts cover successful update_task events whose deadline changed, with
+    the same meaning as the RescheduleStatistics fields of the same name.
+    """
+
+    tasks_with_deadline: int = 0
+    """Distinct tasks with any deadline event."""
+
+    rescheduled_task_count: int = 0
+    """Distinct tasks with at least one reschedule."""
+
+    total_reschedule_events: int = 0
+    """Value-to-value deadline changes."""
+
+    moved_earlier_count: int = 0
+    """Reschedules that moved the deadline earlier."""
+
+    lead_time_counts: dict[str, tuple[int, int]] = field(default_factory=dict)
+    """(tasks, rescheduled tasks) per lead time category with any task."""
+
+    slip_histories: list[TaskSlipHistory] = field(default_factory=list)
+    """Tasks rescheduled at least the requested number of times, most
+    rescheduled first (ties in order of their first event)."""
+
+    weekly_reschedule_counts: dict[str, int] = field(default_factory=dict)
+    """Reschedules per ISO week of the event (e.g. '2026-W28')."""
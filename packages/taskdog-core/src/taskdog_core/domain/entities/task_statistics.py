@@ -0,0 +1,93 @@
+"""Task statistics aggregates value objects.
+
+Repositories that can aggregate in the database return these instead of
+every task when statistics are calculated. They are pure domain types with
+no framework or application-layer dependencies; the application layer turns
+them into its statistics output DTOs (see
+``application/services/task_statistics_calculator.py``).
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+from taskdog_core.domain.constants import SECONDS_PER_HOUR
+from taskdog_core.domain.entities.task import TaskStatus
+
+
+@dataclass(frozen=True)
+class TrackedTaskDuration:
+    """Time tracking columns of a single task.
+
+    Median durations, the longest/shortest task and estimation pairs need
+    every value, so these are fetched per task rather than aggregated.
+    """
+
+    id: int
+    """Task ID."""
+
+    name: str
+    """Task name."""
+
+    estimated_duration: float | None
+    """Estimated duration in hours."""
+
+    actual_duration: float | None
+    """Explicit actual duration in hours."""
+
+    actual_start: datetime | None
+    """When work on the task started."""
+
+    actual_end: datetime | None
+    """When work on the task ended."""
+
+    @property
+    def actual_duration_hours(self) -> float | None:
+        """Actual duration in hours, derived as Task.actual_duration_hours is."""
+        if self.actual_duration is not None:
+            return self.actual_duration
+        if not self.actual_start or not self.actual_end:
+            return None
+        duration = (
+            self.actual_end - self.actual_start
+        ).total_seconds() / SECONDS_PER_HOUR
+        return round(duration, 1)
+
+
+@dataclass(frozen=True)
+class TaskStatisticsAggregates:
+    """Per-group task counts for statistics, computed by the repository.
+
+    "Finished" means COMPLETED or CANCELED with an actual end time, matching
+    the tasks the activity, deadline and trend statistics look at.
+    """
+
+    status_counts: dict[TaskStatus, int] = field(default_factory=dict)
+    """Number of tasks per status."""
+
+    priority_status_counts: dict[tuple[int, TaskStatus], int] = field(
+        default_factory=dict
+    )
+    """Number of tasks per (priority, status), for tasks with a priority."""
+
+    tracked_durations: list[TrackedTaskDuration] = field(default_factory=list)
+    """Tasks with time tracking data, in ID order."""
+
+    deadline_met_count: int = 0
+    """Finished tasks with a deadline that ended on or before it."""
+
+    deadline_missed_count: int = 0
+    """Finished tasks with a deadline that ended after it."""
+
+    total_delay_days: float = 0.0
+    """Sum of the delays of the tasks that missed their deadline."""
+
+    completions_by_weekday_hour: dict[tuple[int, int], int] = field(
+        default_factory=dict
+    )
+    """Finished tasks per (weekday, hour) of their end (0=Mon, 6=Sun)."""
+
+    completions_by_day: dict[date, int] = field(default_factory=dict)
+    """Finished tasks per day of their end, in date order."""
+
+    completions_since: list[int] = field(default_factory=list)
+    """Finished tasks that ended at or after each requested cutoff."""
@@ -161,3 +161,33 @@ class NoSchedulableTasksError(TaskValidationError):
             super().__init__(
                 "No schedulable tasks found. All tasks are either completed, in progress, fixed, or already scheduled."
             )
+
+
+class OptimizationCancelledError(TaskError):
+    """Raised when a running schedule optimization is cancelled cooperatively."""
+
+    def __init__(self, message: str = "Schedule optimization was cancelled") -> None:
+        """Initialize with an optional message.
+
+        Args:
+            message: Human-readable cancellation message
+        """
+        super().__init__(message)
+
+
+class StaleOptimizationPlanError(TaskError):
+    """Raised when applying a dry-run plan whose task data has since changed."""
+
+    def __init__(self, expected_version: str, current_version: str) -> None:
+        """Initialize with the plan's and the repository's data versions.
+
+        Args:
+            expected_version: Data version the plan was computed from
+            current_version: Data version of the tasks now
+        """
+        self.expected_version = expected_version
+        self.current_version = current_version
+        super().__init__(
+            "Tasks changed since the optimization preview was computed; "
+            "run the optimization again"
+        )
@@ -8,6 +8,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 
 from taskdog_core.domain.entities.audit_log import AuditLog, AuditQuery
+from taskdog_core.domain.entities.reschedule_statistics import RescheduleAggregates
 
 
 class AuditLogRepository(ABC):
@@ -72,3 +73,25 @@ class AuditLogRepository(ABC):
         Returns:
             The matching audit logs, oldest first
         """
+
+    def get_reschedule_aggregates(
+        self, since: datetime | None = None, min_reschedules: int = 1
+    ) -> RescheduleAggregates | None:
+        """Get deadline reschedule counts aggregated by the repository.
+
+        Covers the same events as get_deadline_changes().
+
+        Args:
+            since: Only include logs at or after this timestamp (None for all)
+            min_reschedules: Reschedule count from which a task's slip
+                history is included
+
+        Returns:
+            RescheduleAggregates, or None if the repository cannot
+            aggregate (callers then analyze get_deadline_changes())
+
+        Notes:
+            - Default implementation returns None (no optimization)
+            - Repositories should override this for SQL-level aggregation
+        """
+        return None
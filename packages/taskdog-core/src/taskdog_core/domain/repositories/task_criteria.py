@@ -0,0 +1,127 @@
+"""Storage-neutral task selection criteria.
+
+Criteria describe which tasks a query selects as a tree of conditions that
+repositories can translate to their own query language (SQL WHERE clauses
+for the SQLite repository). Every criterion also evaluates itself against a
+Task, which is both the fallback for repositories without a translation
+and the reference a translation must agree with.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from taskdog_core.domain.entities.task import Task, TaskStatus
+
+
+class TaskCriterion(ABC):
+    """A condition on a task."""
+
+    @abstractmethod
+    def matches(self, task: Task) -> bool:
+        """Whether the task satisfies the condition.
+
+        Args:
+            task: Task to check
+
+        Returns:
+            True if the task is selected
+        """
+
+
+@dataclass(frozen=True)
+class StatusIn(TaskCriterion):
+    """Task status is one of ``statuses`` (nothing matches an empty set)."""
+
+    statuses: frozenset[TaskStatus]
+
+    def matches(self, task: Task) -> bool:
+        return task.status in self.statuses
+
+
+@dataclass(frozen=True)
+class NotArchived(TaskCriterion):
+    """Task is not archived."""
+
+    def matches(self, task: Task) -> bool:
+        return not task.is_archived
+
+
+@dataclass(frozen=True)
+class HasTags(TaskCriterion):
+    """Task has any (or, with match_all, every) one of ``tags``.
+
+    Without tags every task matches.
+    """
+
+    tags: tuple[str, ...]
+    match_all: bool = False
+
+    def matches(self, task: Task) -> bool:
+        if not self.tags:
+            return True
+        if self.match_all:
+            return all(tag in task.tags for tag in self.tags)
+        return any(tag in task.tags for tag in self.tags)
+
+
+@dataclass(frozen=True)
+class DateInRange(TaskCriterion):
+    """Any of the task's dates falls within the range (bounds inclusive).
+
+    The dates checked are deadline, planned_start, planned_end, actual_start
+    and actual_end, compared by calendar day. A missing bound is open.
+
+    Attributes:
+        start_date: First day of the range, or None
+        end_date: Last day of the range, or None
+        include_undated: Also match tasks that have none of these dates
+    """
+
+    start_date: date | None = None
+    end_date: date | None = None
+    include_undated: bool = False
+
+    def matches(self, task: Task) -> bool:
+        undated = True
+        for value in (
+            task.deadline,
+            task.planned_start,
+            task.planned_end,
+            task.actual_start,
+            task.actual_end,
+        ):
+            if value is None:
+                continue
+            undated = False
+            value_date = value.date() if isinstance(value, datetime) else value
+            if self.start_date is not None and value_date < self.start_date:
+                continue
+            if self.end_date is not None and value_date > self.end_date:
+                continue
+            return True
+        return undated and self.include_undated
+
+
+@dataclass(frozen=True)
+class AllOf(TaskCriterion):
+    """Every criterion matches (every task matches an empty list)."""
+
+    criteria: tuple[TaskCriterion, ...]
+
+    def matches(self, task: Task) -> bool:
+        return all(criterion.matches(task) for criterion in self.criteria)
+
+
+@dataclass(frozen=True)
+class AnyOf(TaskCriterion):
+    """At least one criterion matches (no task matches an empty list)."""
+
+    criteria: tuple[TaskCriterion, ...]
+
+    def matches(self, task: Task) -> bool:
+        return any(criterion.matches(task) for criterion in self.criteria)
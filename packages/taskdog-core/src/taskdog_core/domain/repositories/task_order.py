@@ -0,0 +1,93 @@
+"""Storage-neutral task ordering.
+
+A TaskOrder names the field a query sorts by. Repositories translate it to
+their own query language (SQL ORDER BY for the SQLite repository) so the
+database can use its indexes and stop after a LIMIT. Like a TaskCriterion,
+it also sorts tasks itself, which is the fallback for repositories without
+a translation and the reference a translation must agree with.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from taskdog_core.shared.constants import SORT_SENTINEL_FUTURE
+
+if TYPE_CHECKING:
+    from taskdog_core.domain.entities.task import Task
+
+
+@dataclass(frozen=True)
+class TaskOrder:
+    """Sort order of a task query.
+
+    Every field sorts ascending except priority, which sorts highest first;
+    ``reverse`` inverts the order. A missing value (priority, dates,
+    estimated_duration) ranks above every present one, so it comes last in
+    ascending order and first in descending order. Tasks with equal values
+    keep their relative (ID) order in both directions. Names compare
+    case-insensitively and statuses by value.
+
+    Attributes:
+        sort_by: Field to sort by, one of SORT_KEYS
+        reverse: Invert the order
+    """
+
+    SORT_KEYS: ClassVar[tuple[str, ...]] = (
+        "id",
+        "priority",
+        "deadline",
+        "name",
+        "status",
+        "planned_start",
+        "estimated_duration",
+        "created_at",
+        "updated_at",
+    )
+
+    sort_by: str = "id"
+    reverse: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the sort key.
+
+        Raises:
+            ValueError: If sort_by is not a valid sort key
+        """
+        if self.sort_by not in self.SORT_KEYS:
+            raise ValueError(
+                f"Invalid sort_by: {self.sort_by}. Must be one of {list(self.SORT_KEYS)}"
+            )
+
+    @property
+    def descending(self) -> bool:
+        """Whether the sort values are ordered largest first."""
+        return self.reverse != (self.sort_by == "priority")
+
+    def sort(self, tasks: list[Task]) -> list[Task]:
+        """Sort tasks in this order (stable).
+
+        Args:
+            tasks: Tasks to sort
+
+        Returns:
+            Sorted list of tasks
+        """
+        return sorted(tasks, key=self._key, reverse=self.descending)
+
+    def _key(self, task: Task) -> Any:
+        if self.sort_by == "priority":
+            # (1, 0) puts tasks without a priority after all prioritized ones
+            return (0, task.priority) if task.priority is not None else (1, 0)
+        if self.sort_by == "name":
+            return task.name.lower()
+        if self.sort_by == "status":
+            return task.status.value
+        if self.sort_by == "estimated_duration":
+            value = task.estimated_duration
+            return float("inf") if value is None else value
+        value = getattr(task, self.sort_by)
+        if value is None and self.sort_by != "id":
+            return SORT_SENTINEL_FUTURE
+        return value
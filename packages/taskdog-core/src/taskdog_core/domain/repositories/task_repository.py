@@ -1,13 +1,23 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
 from datetime import date, datetime
 from typing import Any
 
 from taskdog_core.domain.entities.task import Task, TaskStatus
+from taskdog_core.domain.entities.task_statistics import TaskStatisticsAggregates
+from taskdog_core.domain.repositories.task_criteria import DateInRange, TaskCriterion
+from taskdog_core.domain.repositories.task_order import TaskOrder
+
+# Called with the ID and new state of a saved task, or the ID and None for a
+# deleted one
+TaskChangeListener = Callable[[int, Task | None], None]
 
 
 class TaskRepository(ABC):
     """Abstract interface for task data persistence."""
 
+    _change_listeners: tuple[TaskChangeListener, ...] = ()
+
     @abstractmethod
     def get_all(self) -> list[Task]:
         """Retrieve all tasks.
@@ -16,6 +26,19 @@ class TaskRepository(ABC):
             List of all tasks
         """
 
+    def iter_all(self) -> Iterator[Task]:
+        """Iterate over all tasks.
+
+        Returns:
+            Iterator over all tasks
+
+        Notes:
+            - Default implementation iterates over get_all()
+            - Repositories should override this to stream rows in batches
+              when callers only need a single pass
+        """
+        return iter(self.get_all())
+
     @abstractmethod
     def get_by_id(self, task_id: int) -> Task | None:
         """Retrieve a task by its ID.
@@ -95,6 +118,55 @@ class TaskRepository(ABC):
             result.append(task)
         return result
 
+    def get_matching(
+        self,
+        criterion: TaskCriterion | None = None,
+        order: TaskOrder | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        """Retrieve the tasks matching a criterion tree.
+
+        Unlike get_filtered(), which takes one value per field, the criterion
+        can combine any number of conditions with AND and OR, so a whole
+        filter tree is applied by the repository.
+
+        Args:
+            criterion: Condition the tasks must satisfy, or None for all tasks
+            order: Order to return the tasks in, or None for the repository's
+                default order
+            limit: Return at most this many tasks (default: None, no limit)
+
+        Returns:
+            List of matching tasks
+
+        Notes:
+            - Default implementation evaluates the criterion and order on
+              get_all()
+            - Repositories should override this to translate the criterion
+              and order into their query (e.g. SQL WHERE and ORDER BY)
+        """
+        tasks = self.get_all()
+        if criterion is not None:
+            tasks = [task for task in tasks if criterion.matches(task)]
+        if order is not None:
+            tasks = order.sort(tasks)
+        return tasks if limit is None else tasks[:limit]
+
+    def count_matching(self, criterion: TaskCriterion | None = None) -> int:
+        """Count the tasks matching a criterion tree.
+
+        Args:
+            criterion: Condition the tasks must satisfy, or None for all tasks
+
+        Returns:
+            Number of matching tasks
+
+        Notes:
+            - Default implementation counts get_matching()
+            - Repositories should override this with a count query
+        """
+        return len(self.get_matching(criterion))
+
     @staticmethod
     def _matches_date_filter(
         task: Task, start_date: date | None, end_date: date | None
@@ -115,22 +187,7 @@ class TaskRepository(ABC):
         Returns:
             True if any date field falls within the requested range
         """
-        for value in (
-            task.deadline,
-            task.planned_start,
-            task.planned_end,
-            task.actual_start,
-            task.actual_end,
-        ):
-            if value is None:
-                continue
-            value_date = value.date() if isinstance(value, datetime) else value
-            if start_date is not None and value_date < start_date:
-                continue
-            if end_date is not None and value_date > end_date:
-                continue
-            return True
-        return False
+        return DateInRange(start_date, end_date).matches(task)
 
     def count_tasks(
         self,
@@ -209,6 +266,24 @@ class TaskRepository(ABC):
             - Implementation-specific optimization possible
         """
 
+    def update_all(self, update: Callable[[list[Task]], list[Task]]) -> None:
+        """Read all tasks and save the ones update() returns in one transaction.
+
+        No other writer can change the tasks between the read and the save,
+        so update() may check the current state (e.g. compare a data
+        version) and raise to abort without saving anything.
+
+        Args:
+            update: Receives all current tasks and returns the tasks to save
+
+        Notes:
+            - Default implementation reads with get_all() and saves with
+              save_all(), so it is not isolated from concurrent writers
+            - Repositories should override this to read and save in a
+              single write transaction
+        """
+        self.save_all(update(self.get_all()))
+
     @abstractmethod
     def delete(self, task_id: int) -> None:
         """Delete a task by its ID.
@@ -332,3 +407,59 @@ class TaskRepository(ABC):
         # Default implementation: fallback to empty dict (no optimization)
         # Subclasses should override this method to use SQL aggregation
         return {}
+
+    def get_statistics_aggregates(
+        self,
+        since: datetime | None = None,
+        completion_cutoffs: list[datetime] | None = None,
+    ) -> TaskStatisticsAggregates | None:
+        """Get the per-group counts statistics are calculated from.
+
+        With ``since``, only tasks that ended at or after it, or that have no
+        end and are still PENDING or IN_PROGRESS, are counted.
+
+        Args:
+            since: Optional start of the statistics period
+            completion_cutoffs: Datetimes to count finished tasks that ended
+                at or after (one count per cutoff, in order)
+
+        Returns:
+            TaskStatisticsAggregates, or None if the repository cannot
+            aggregate (callers then calculate from get_all())
+
+        Notes:
+            - Default implementation returns None (no optimization)
+            - Repositories should override this for SQL-level aggregation
+        """
+        # Default implementation: no aggregation, callers fall back to get_all()
+        return None
+
+    def add_change_listener(self, listener: TaskChangeListener) -> None:
+        """Register a callback for tasks saved or deleted through this repository.
+
+        Listeners run after the change is committed, in registration order.
+        This lets a long-lived process (the API server) keep derived state
+        such as indexes and counts up to date per changed task. Such state
+        should be loaded lazily on first use and ignore changes reported
+        before then, as loading already reads the committed state.
+
+        Args:
+            listener: Callback receiving the task ID and the saved task, or
+                None when the task was deleted
+
+        Notes:
+            - Repositories call _notify_changed() after each save/delete,
+              including tasks changed indirectly (e.g. by delete_tag())
+            - Changes made outside this repository instance are not reported
+        """
+        self._change_listeners = (*self._change_listeners, listener)
+
+    def _notify_changed(self, task_id: int, task: Task | None) -> None:
+        """Report a committed change to the registered listeners.
+
+        Args:
+            task_id: ID of the changed task
+            task: The saved task, or None if it was deleted
+        """
+        for listener in self._change_listeners:
+            listener(task_id, task)
@@ -2,16 +2,76 @@
 
 This module provides the concrete implementation of IHolidayChecker interface
 using the external 'holidays' package.
+
+Holidays of a window of years are precomputed into a frozenset. With a cache
+directory, that set is stored in a small JSON file keyed by country and
+holidays package version, so a warm start reads the file and never imports
+the holidays package (the version is read from the installed distribution's
+metadata). Dates outside the window are looked up in a holidays calendar
+created on first use.
 """
 
+from __future__ import annotations
+
+import json
+import logging
+import os
 from datetime import date
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as distribution_version
+from typing import TYPE_CHECKING, Any
 
 from taskdog_core.domain.services.holiday_checker import IHolidayChecker
+from taskdog_core.shared.constants.config_defaults import (
+    DEFAULT_HOLIDAY_CACHE_YEARS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Subdirectory of the cache directory holding the holiday files
+HOLIDAY_CACHE_DIR_NAME = "holidays"
+
 
-try:
-    import holidays as _holidays_module
-except ImportError:
-    _holidays_module = None  # type: ignore[assignment]
+def holiday_years(years_ahead: int, today: date | None = None) -> range:
+    """Get the window of years whose holidays are precomputed.
+
+    Args:
+        years_ahead: Years after the current one to include
+        today: Reference date (default: today)
+
+    Returns:
+        Range from the previous year to years_ahead years after this one
+    """
+    current_year = (today or date.today()).year
+    return range(current_year - 1, current_year + max(years_ahead, 0) + 1)
+
+
+def _country_holidays(country: str, years: Iterable[int] | None = None) -> Any:
+    """Import the holidays package and create a country's calendar.
+
+    Raises:
+        ImportError: If holidays package is not installed
+        NotImplementedError: If country code is not supported
+    """
+    try:
+        import holidays
+    except ImportError as e:
+        raise ImportError(
+            "The 'holidays' package is required for holiday checking. "
+            "Install it with: uv pip install holidays"
+        ) from e
+
+    try:
+        return holidays.country_holidays(country, years=years)
+    except NotImplementedError as e:
+        raise NotImplementedError(
+            f"Country code '{country}' is not supported by the holidays package. "
+            f"See https://github.com/vacanza/holidays#available-countries for supported countries."
+        ) from e
 
 
 class HolidayChecker(IHolidayChecker):
@@ -33,35 +93,50 @@ class HolidayChecker(IHolidayChecker):
         False
     """
 
-    def __init__(self, country: str | None = None):
+    def __init__(
+        self,
+        country: str | None = None,
+        cache_dir: Path | None = None,
+        years: range | None = None,
+    ):
         """Initialize the holiday checker.
 
         Args:
             country: ISO 3166-1 alpha-2 country code (e.g., "JP", "US", "GB")
                      If None, no holiday checking is performed.
+            cache_dir: Directory for the precomputed holiday file
+                     (None to precompute without caching)
+            years: Years whose holidays are precomputed
+                     (default: the previous year to DEFAULT_HOLIDAY_CACHE_YEARS
+                     years after this one)
 
         Raises:
             ImportError: If holidays package is not installed
             NotImplementedError: If country code is not supported
         """
-        if country and _holidays_module is None:
-            raise ImportError(
-                "The 'holidays' package is required for holiday checking. "
-                "Install it with: uv pip install holidays"
-            )
-
         self.country = country
-        self._holidays = None
-
-        if country:
-            assert _holidays_module is not None  # Guaranteed by the check above
-            try:
-                self._holidays = _holidays_module.country_holidays(country)
-            except NotImplementedError as e:
-                raise NotImplementedError(
-                    f"Country code '{country}' is not supported by the holidays package. "
-                    f"See https://github.com/vacanza/holidays#available-countries for supported countries."
-                ) from e
+        self._years = (
+            years if years is not None else holiday_years(DEFAULT_HOLIDAY_CACHE_YEARS)
+        )
+        self._dates: frozenset[date] = frozenset()
+        # Calendar for dates outside the window, created on first use
+        self._holidays: Any = None
+
+        if not country:
+            return
+
+        cache_file = self._cache_file(country, cache_dir)
+        cached = self._read_cache(cache_file) if cache_file else None
+        if cached is not None:
+            self._years, self._dates = cached
+            return
+
+        self._holidays = _country_holidays(country, self._years)
+        self._dates = frozenset(
+            holiday for holiday in self._holidays if holiday.year in self._years
+        )
+        if cache_file:
+            self._write_cache(cache_file)
 
     def is_holiday(self, check_date: date) -> bool:
         """Check if a date is a public holiday.
@@ -73,16 +148,19 @@ class HolidayChecker(IHolidayChecker):
             True if the date is a public holiday in the configured country,
             False if no country is configured or date is not a holiday
         """
-        if self._holidays is None:
+        if not self.country:
             return False
 
-        return check_date in self._holidays
+        if check_date.year in self._years:
+            return check_date in self._dates
+
+        return check_date in self._calendar()
 
     def get_holidays_in_range(self, start_date: date, end_date: date) -> set[date]:
         """Get all holidays within a date range (inclusive).
 
-        Uses year-based batch querying for efficiency instead of checking
-        each date individually.
+        Precomputed years are served from the holiday set; other years are
+        generated in batch by the holidays calendar.
 
         Args:
             start_date: Start date of the range
@@ -91,20 +169,103 @@ class HolidayChecker(IHolidayChecker):
         Returns:
             Set of dates that are public holidays within the range
         """
-        if self._holidays is None:
+        if not self.country:
             return set()
 
         if start_date > end_date:
             return set()
 
-        # Trigger lazy generation for all years in range
-        for year in range(start_date.year, end_date.year + 1):
+        result = {
+            holiday for holiday in self._dates if start_date <= holiday <= end_date
+        }
+
+        other_years = [
+            year
+            for year in range(start_date.year, end_date.year + 1)
+            if year not in self._years
+        ]
+        if other_years:
+            calendar = self._calendar()
             # Accessing a date triggers holiday generation for that year
-            _ = date(year, 1, 1) in self._holidays
+            for year in other_years:
+                _ = date(year, 1, 1) in calendar
+            result.update(
+                holiday
+                for holiday in calendar
+                if holiday.year in other_years and start_date <= holiday <= end_date
+            )
+
+        return result
+
+    def _calendar(self) -> Any:
+        """Get the holidays calendar, importing the package on first use."""
+        if self._holidays is None:
+            assert self.country is not None  # Only called with a country
+            self._holidays = _country_holidays(self.country)
+        return self._holidays
+
+    @staticmethod
+    def _cache_file(country: str, cache_dir: Path | None) -> Path | None:
+        """Get the holiday file path for a country and holidays version.
+
+        Returns:
+            Path of the file, or None without a cache directory, with a
+            country code unusable as a file name or if the holidays package
+            is not installed
+        """
+        if cache_dir is None or not country.isalnum():
+            return None
+
+        try:
+            holidays_version = distribution_version("holidays")
+        except PackageNotFoundError:
+            return None
+
+        return cache_dir / HOLIDAY_CACHE_DIR_NAME / f"{country}-{holidays_version}.json"
+
+    def _read_cache(self, cache_file: Path) -> tuple[range, frozenset[date]] | None:
+        """Load precomputed holidays covering the requested years.
+
+        Returns:
+            (years, holidays) from the file, or None if it is missing,
+            unreadable or does not cover the requested years
+        """
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+            years = range(data["first_year"], data["last_year"] + 1)
+            dates = frozenset(date.fromisoformat(value) for value in data["dates"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring invalid holiday cache %s: %s", cache_file, e)
+            return None
+
+        if not self._years or (
+            years.start <= self._years.start and self._years.stop <= years.stop
+        ):
+            return years, dates
+        return None
 
-        # Now iterate over all generated holidays and filter by date range
-        return {
-            holiday_date
-            for holiday_date in self._holidays
-            if start_date <= holiday_date <= end_date
+    def _write_cache(self, cache_file: Path) -> None:
+        """Store the precomputed holidays, replacing older versions' files.
+
+        The file is written to a temporary name and renamed into place, so
+        concurrent readers never see a partial file. Failures are logged and
+        otherwise ignored: the cache only saves work on the next start.
+        """
+        data = {
+            "first_year": self._years.start,
+            "last_year": self._years.stop - 1,
+            "dates": sorted(holiday.isoformat() for holiday in self._dates),
         }
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file.write_text(json.dumps(data), encoding="utf-8")
+            temp_file.replace(cache_file)
+            for stale in cache_file.parent.glob(f"{self.country}-*.json"):
+                if stale != cache_file:
+                    stale.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Could not write holiday cache %s: %s", cache_file, e)
+            temp_file.unlink(missing_ok=True)
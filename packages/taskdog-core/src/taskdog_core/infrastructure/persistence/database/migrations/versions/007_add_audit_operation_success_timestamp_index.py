@@ -0,0 +1,40 @@
+"""Add (operation, success, timestamp) index to audit_logs.
+
+Revision ID: 007_add_audit_operation_success_timestamp_index
+Revises: 006_remove_daily_allocations_json
+Create Date: 2026-10-18
+
+Reschedule statistics select the successful update_task entries of a
+period. This index lets SQLite find them with a single range scan instead
+of filtering every update_task entry by success.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007_add_audit_operation_success_timestamp_index"
+down_revision: str | None = "006_remove_daily_allocations_json"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_INDEX_NAME = "idx_audit_operation_success_timestamp"
+
+
+def upgrade() -> None:
+    """Create the index unless it already exists."""
+    # Databases created with create_all already have it
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    existing = {index["name"] for index in inspector.get_indexes("audit_logs")}
+    if _INDEX_NAME in existing:
+        return
+
+    op.create_index(_INDEX_NAME, "audit_logs", ["operation", "success", "timestamp"])
+
+
+def downgrade() -> None:
+    """Drop the index."""
+    op.drop_index(_INDEX_NAME, table_name="audit_logs")
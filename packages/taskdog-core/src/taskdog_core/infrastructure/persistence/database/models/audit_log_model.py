@@ -80,6 +80,13 @@ class AuditLogModel(Base):
         Index("idx_audit_client_timestamp", "client_name", "timestamp"),
         # Filter by operation with time ordering (e.g., "show recent completions")
         Index("idx_audit_operation_timestamp", "operation", "timestamp"),
+        # Successful operations of one kind in a time range (reschedule statistics)
+        Index(
+            "idx_audit_operation_success_timestamp",
+            "operation",
+            "success",
+            "timestamp",
+        ),
         # Lookup all logs for a specific resource (e.g., "show history for task 123")
         Index("idx_audit_resource", "resource_type", "resource_id"),
     )
@@ -9,12 +9,23 @@ The builder supports the hybrid filtering architecture where simple filters
 """
 
 from datetime import date, timedelta
+from typing import Any
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import and_, false, func, or_, select, true
 from sqlalchemy.sql.expression import ColumnElement
 from sqlalchemy.sql.selectable import Select
 
 from taskdog_core.domain.entities.task import TaskStatus
+from taskdog_core.domain.repositories.task_criteria import (
+    AllOf,
+    AnyOf,
+    DateInRange,
+    HasTags,
+    NotArchived,
+    StatusIn,
+    TaskCriterion,
+)
+from taskdog_core.domain.repositories.task_order import TaskOrder
 from taskdog_core.infrastructure.persistence.database.models import (
     TagModel,
     TaskModel,
@@ -46,6 +57,11 @@ class TaskQueryBuilder:
         from complex Python-only filters.
     """
 
+    # Sort keys whose column can be NULL
+    _NULLABLE_SORT_KEYS = frozenset(
+        {"priority", "deadline", "planned_start", "estimated_duration"}
+    )
+
     def __init__(self, base_stmt: Select):  # type: ignore[type-arg]
         """Initialize the builder with a base SELECT statement.
 
@@ -113,28 +129,7 @@ class TaskQueryBuilder:
             OR logic: Single subquery with IN clause
         """
         if tags:
-            if match_all:
-                # AND logic: task must have ALL specified tags
-                # Single query with GROUP BY + HAVING COUNT instead of N subqueries
-                unique_tag_count = len(set(tags))
-                tag_subquery = (
-                    select(TaskTagModel.task_id)
-                    .join(TagModel, TaskTagModel.tag_id == TagModel.id)
-                    .where(TagModel.name.in_(tags))  # type: ignore[attr-defined]
-                    .group_by(TaskTagModel.task_id)
-                    .having(
-                        func.count(func.distinct(TagModel.name)) == unique_tag_count
-                    )
-                )
-                self._stmt = self._stmt.where(TaskModel.id.in_(tag_subquery))  # type: ignore[attr-defined]
-            else:
-                # OR logic: task must have ANY of the specified tags
-                tag_subquery = (
-                    select(TaskTagModel.task_id)
-                    .join(TagModel, TaskTagModel.tag_id == TagModel.id)
-                    .where(TagModel.name.in_(tags))  # type: ignore[attr-defined]
-                )
-                self._stmt = self._stmt.where(TaskModel.id.in_(tag_subquery))  # type: ignore[attr-defined]
+            self._stmt = self._stmt.where(self._build_tag_condition(tags, match_all))
 
         return self
 
@@ -167,6 +162,71 @@ class TaskQueryBuilder:
 
         return self
 
+    def with_criterion(self, criterion: TaskCriterion | None) -> "TaskQueryBuilder":
+        """Add a criterion tree to the query as a single WHERE expression.
+
+        Args:
+            criterion: Task criterion to compile (default: None, no filter)
+
+        Returns:
+            Self for method chaining
+
+        Note:
+            StatusIn compiles to an IN list on the indexed status column,
+            AllOf/AnyOf to AND/OR, and HasTags/DateInRange to the same
+            conditions as with_tag_filter()/with_date_filter().
+        """
+        if criterion is not None:
+            self._stmt = self._stmt.where(self._compile(criterion))
+
+        return self
+
+    def with_order(self, order: TaskOrder | None) -> "TaskQueryBuilder":
+        """Add an ORDER BY matching TaskOrder.sort() to the query.
+
+        Args:
+            order: Task order to apply (default: None, no ORDER BY)
+
+        Returns:
+            Self for method chaining
+
+        Note:
+            Missing values are placed with NULLS LAST/FIRST as TaskOrder
+            ranks them, and id is appended so ties keep ID order like the
+            stable Python sort. Names compare with SQLite's lower(), which
+            only folds ASCII letters.
+        """
+        if order is None:
+            return self
+
+        column: Any
+        if order.sort_by == "name":
+            column = func.lower(TaskModel.name)
+        else:
+            column = getattr(TaskModel, order.sort_by)
+        term = column.desc() if order.descending else column.asc()
+        if order.sort_by in self._NULLABLE_SORT_KEYS:
+            term = term.nulls_first() if order.descending else term.nulls_last()
+        self._stmt = self._stmt.order_by(term)
+        if order.sort_by != "id":
+            self._stmt = self._stmt.order_by(TaskModel.id.asc())
+
+        return self
+
+    def with_limit(self, limit: int | None) -> "TaskQueryBuilder":
+        """Limit the number of rows returned.
+
+        Args:
+            limit: Maximum number of rows (default: None, no limit)
+
+        Returns:
+            Self for method chaining
+        """
+        if limit is not None:
+            self._stmt = self._stmt.limit(limit)
+
+        return self
+
     def build(self) -> Select:  # type: ignore[type-arg]
         """Build and return the final SELECT statement.
 
@@ -180,6 +240,97 @@ class TaskQueryBuilder:
         """
         return self._stmt
 
+    def _compile(self, criterion: TaskCriterion) -> ColumnElement[bool]:
+        """Translate a criterion into a SQL boolean expression.
+
+        Args:
+            criterion: Criterion to translate
+
+        Returns:
+            SQLAlchemy expression selecting the same tasks as
+            criterion.matches()
+
+        Raises:
+            TypeError: If the criterion type has no SQL translation
+        """
+        if isinstance(criterion, AllOf):
+            return and_(true(), *(self._compile(c) for c in criterion.criteria))
+        if isinstance(criterion, AnyOf):
+            return or_(false(), *(self._compile(c) for c in criterion.criteria))
+        if isinstance(criterion, StatusIn):
+            statuses = sorted(status.value for status in criterion.statuses)
+            if not statuses:
+                return false()
+            return TaskModel.status.in_(statuses)
+        if isinstance(criterion, NotArchived):
+            return TaskModel.is_archived == False  # noqa: E712
+        if isinstance(criterion, HasTags):
+            if not criterion.tags:
+                return true()
+            return self._build_tag_condition(list(criterion.tags), criterion.match_all)
+        if isinstance(criterion, DateInRange):
+            return self._build_date_range_condition(criterion)
+        raise TypeError(f"No SQL translation for {type(criterion).__name__}")
+
+    def _build_tag_condition(
+        self, tags: list[str], match_all: bool
+    ) -> ColumnElement[bool]:
+        """Build the condition for tasks having any (or all) of the tags.
+
+        Args:
+            tags: Tag names (non-empty)
+            match_all: If True, require all tags (AND logic)
+
+        Returns:
+            SQLAlchemy IN condition on the task id
+        """
+        tag_subquery = (
+            select(TaskTagModel.task_id)
+            .join(TagModel, TaskTagModel.tag_id == TagModel.id)
+            .where(TagModel.name.in_(tags))  # type: ignore[attr-defined]
+        )
+        if match_all:
+            # AND logic: task must have ALL specified tags
+            # Single query with GROUP BY + HAVING COUNT instead of N subqueries
+            tag_subquery = tag_subquery.group_by(TaskTagModel.task_id).having(
+                func.count(func.distinct(TagModel.name)) == len(set(tags))
+            )
+        return TaskModel.id.in_(tag_subquery)
+
+    def _build_date_range_condition(
+        self, criterion: DateInRange
+    ) -> ColumnElement[bool]:
+        """Build the condition for a DateInRange criterion.
+
+        Args:
+            criterion: Date range to match
+
+        Returns:
+            OR of the per-field range conditions, also matching tasks
+            without any date if the criterion includes them
+        """
+        fields = self._date_fields()
+        if criterion.start_date is None and criterion.end_date is None:
+            conditions = [field.is_not(None) for field in fields]
+        else:
+            conditions = self._build_date_filter_conditions(
+                criterion.start_date, criterion.end_date
+            )
+        if criterion.include_undated:
+            conditions.append(and_(*(field.is_(None) for field in fields)))
+        return or_(*conditions)
+
+    @staticmethod
+    def _date_fields() -> list[Any]:
+        """Date columns checked by date range filters."""
+        return [
+            TaskModel.deadline,
+            TaskModel.planned_start,
+            TaskModel.planned_end,
+            TaskModel.actual_start,
+            TaskModel.actual_end,
+        ]
+
     def _build_date_filter_conditions(
         self, start_date: date | None, end_date: date | None
     ) -> list[ColumnElement[bool]]:
@@ -210,17 +361,8 @@ class TaskQueryBuilder:
         """
         date_conditions: list[ColumnElement[bool]] = []
 
-        # Define all date fields to check
-        date_fields = [
-            TaskModel.deadline,
-            TaskModel.planned_start,
-            TaskModel.planned_end,
-            TaskModel.actual_start,
-            TaskModel.actual_end,
-        ]
-
         # Build conditions for each date field
-        for field in date_fields:
+        for field in self._date_fields():
             end_bound = end_date + timedelta(days=1) if end_date else None
             if start_date and end_date:
                 date_conditions.append(
@@ -0,0 +1,284 @@
+"""SQL aggregation of deadline reschedule statistics from the audit log.
+
+Deadlines are read from the JSON old_values/new_values with json_extract()
+and compared and subtracted as julianday() numbers, so no audit log entry is
+loaded or JSON-decoded in Python. Only the final counts, the per-category
+lead time counts, the weekly trend and the chronic slippers' rows are
+returned.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Integer, and_, case, cast, func, or_, select
+
+from taskdog_core.domain.entities.reschedule_statistics import (
+    LEAD_TIME_BUCKETS,
+    RescheduleAggregates,
+    TaskSlipHistory,
+)
+from taskdog_core.infrastructure.persistence.database.models.audit_log_model import (
+    AuditLogModel,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+    from sqlalchemy.sql.expression import ColumnElement
+
+_MS_PER_DAY = 86_400_000
+
+
+def _parsed_deadline(values: Any) -> ColumnElement[Any]:
+    """julianday() of the deadline in a JSON column, NULL unless a date string."""
+    return case(
+        (
+            func.json_type(values, "$.deadline") == "text",
+            func.julianday(func.json_extract(values, "$.deadline")),
+        ),
+        else_=None,
+    )
+
+
+class RescheduleStatisticsAggregator:
+    """Computes RescheduleAggregates with SQL queries on the audit log.
+
+    Events are the successful update_task entries whose deadline changed, as
+    returned by get_deadline_changes(), numbered per task in (timestamp, id)
+    order with row_number(). Entries with neither an old nor a new date
+    string are skipped, as RescheduleAnalyzer skips them. Slips are summed
+    as whole milliseconds, julianday()'s precision.
+    """
+
+    def __init__(self, session: Session, since: datetime | None = None):
+        """Initialize the aggregator.
+
+        Args:
+            session: Open SQLAlchemy session
+            since: Only include logs at or after this timestamp (None for all)
+        """
+        self._session = session
+
+        old_jd = _parsed_deadline(AuditLogModel.old_values)
+        new_jd = _parsed_deadline(AuditLogModel.new_values)
+        conditions: list[ColumnElement[bool]] = [
+            AuditLogModel.operation == "update_task",
+            AuditLogModel.success.is_(True),
+            func.json_extract(AuditLogModel.old_values, "$.deadline").is_distinct_from(
+                func.json_extract(AuditLogModel.new_values, "$.deadline")
+            ),
+            AuditLogModel.resource_id.is_not(None),  # type: ignore[union-attr]
+            or_(old_jd.is_not(None), new_jd.is_not(None)),
+        ]
+        if since is not None:
+            conditions.append(AuditLogModel.timestamp >= since)  # type: ignore[operator]
+
+        self._events = (
+            select(
+                AuditLogModel.id,
+                AuditLogModel.resource_id.label("task_id"),  # type: ignore[union-attr]
+                AuditLogModel.timestamp,
+                AuditLogModel.resource_name,
+                old_jd.label("old_jd"),
+                new_jd.label("new_jd"),
+                case(
+                    (
+                        old_jd.is_not(None),
+                        func.json_extract(AuditLogModel.old_values, "$.deadline"),
+                    )
+                ).label("old_deadline"),
+                case(
+                    (
+                        new_jd.is_not(None),
+                        func.json_extract(AuditLogModel.new_values, "$.deadline"),
+                    )
+                ).label("new_deadline"),
+                func.row_number()
+                .over(
+                    partition_by=AuditLogModel.resource_id,
+                    order_by=(AuditLogModel.timestamp, AuditLogModel.id),
+                )
+                .label("seq"),
+            )
+            .where(*conditions)
+            .cte("deadline_events")
+        )
+        events = self._events.c
+        self._is_reschedule = and_(
+            events.old_jd.is_not(None),
+            events.new_jd.is_not(None),
+            events.old_jd != events.new_jd,
+        )
+        self._histories = (
+            select(
+                events.task_id,
+                func.sum(case((self._is_reschedule, 1), else_=0)).label("reschedules"),
+                func.sum(
+                    case(
+                        (
+                            self._is_reschedule,
+                            func.round((events.new_jd - events.old_jd) * _MS_PER_DAY),
+                        ),
+                        else_=0,
+                    )
+                ).label("slip_ms"),
+                func.sum(
+                    case(
+                        (and_(self._is_reschedule, events.new_jd < events.old_jd), 1),
+                        else_=0,
+                    )
+                ).label("moved_earlier"),
+                func.min(case((events.old_jd.is_(None), events.seq))).label(
+                    "initial_seq"
+                ),
+                func.max(
+                    case((func.coalesce(events.resource_name, "") != "", events.seq))
+                ).label("name_seq"),
+                func.max(events.seq).label("last_seq"),
+            )
+            .group_by(events.task_id)
+            .cte("deadline_histories")
+        )
+
+    def aggregate(self, min_reschedules: int = 1) -> RescheduleAggregates:
+        """Run the aggregation queries.
+
+        Args:
+            min_reschedules: Reschedule count from which a task's slip
+                history is included
+
+        Returns:
+            RescheduleAggregates for the events
+        """
+        histories = self._histories.c
+        tasks, rescheduled, reschedules, moved_earlier = self._session.execute(
+            select(
+                func.count(),
+                func.coalesce(
+                    func.sum(case((histories.reschedules > 0, 1), else_=0)), 0
+                ),
+                func.coalesce(func.sum(histories.reschedules), 0),
+                func.coalesce(func.sum(histories.moved_earlier), 0),
+            )
+        ).one()
+        return RescheduleAggregates(
+            tasks_with_deadline=tasks,
+            rescheduled_task_count=rescheduled,
+            total_reschedule_events=reschedules,
+            moved_earlier_count=moved_earlier,
+            lead_time_counts=self._lead_time_counts(),
+            slip_histories=self._slip_histories(min_reschedules),
+            weekly_reschedule_counts=self._weekly_reschedule_counts(),
+        )
+
+    def _lead_time_counts(self) -> dict[str, tuple[int, int]]:
+        """(tasks, rescheduled tasks) per lead time category.
+
+        The lead time is counted in calendar days from the initial setting
+        (the first null-to-value event) to the deadline it set; tasks whose
+        initial setting is not among the events are left out.
+        """
+        histories = self._histories.c
+        initial = self._events.alias("initial_event")
+        lead_days = cast(
+            func.julianday(func.date(initial.c.new_deadline))
+            - func.julianday(func.date(initial.c.timestamp)),
+            Integer,
+        )
+        category = case(
+            *(
+                (lead_days <= upper, name)
+                for name, upper in LEAD_TIME_BUCKETS
+                if upper is not None
+            ),
+            else_=LEAD_TIME_BUCKETS[-1][0],
+        ).label("category")
+        rows = self._session.execute(
+            select(
+                category,
+                func.count(),
+                func.sum(case((histories.reschedules > 0, 1), else_=0)),
+            )
+            .join_from(
+                self._histories,
+                initial,
+                and_(
+                    initial.c.task_id == histories.task_id,
+                    initial.c.seq == histories.initial_seq,
+                ),
+            )
+            .group_by(category)
+        ).all()
+        return {name: (count, rescheduled) for name, count, rescheduled in rows}
+
+    def _slip_histories(self, min_reschedules: int) -> list[TaskSlipHistory]:
+        """Histories of the tasks rescheduled at least min_reschedules times."""
+        histories = self._histories.c
+        first = self._events.alias("first_event")
+        last = self._events.alias("last_event")
+        named = self._events.alias("named_event")
+        rows = self._session.execute(
+            select(
+                histories.task_id,
+                named.c.resource_name,
+                histories.reschedules,
+                histories.slip_ms,
+                func.coalesce(first.c.old_deadline, first.c.new_deadline),
+                func.coalesce(last.c.new_deadline, last.c.old_deadline),
+            )
+            .join_from(
+                self._histories,
+                first,
+                and_(first.c.task_id == histories.task_id, first.c.seq == 1),
+            )
+            .join(
+                last,
+                and_(
+                    last.c.task_id == histories.task_id,
+                    last.c.seq == histories.last_seq,
+                ),
+            )
+            .outerjoin(
+                named,
+                and_(
+                    named.c.task_id == histories.task_id,
+                    named.c.seq == histories.name_seq,
+                ),
+            )
+            .where(histories.reschedules >= min_reschedules)
+            .order_by(histories.reschedules.desc(), first.c.timestamp, first.c.id)
+        ).all()
+        return [
+            TaskSlipHistory(
+                task_id=task_id,
+                task_name=name or "",
+                reschedule_count=count,
+                slip_days=slip_ms / _MS_PER_DAY,
+                first_deadline=datetime.fromisoformat(first_deadline),
+                latest_deadline=datetime.fromisoformat(latest_deadline),
+            )
+            for task_id, name, count, slip_ms, first_deadline, latest_deadline in rows
+        ]
+
+    def _weekly_reschedule_counts(self) -> dict[str, int]:
+        """Reschedules per ISO week of the event timestamp.
+
+        The ISO week is the one of the week's Thursday: its year is the ISO
+        week-year and its day of the year gives the week number.
+        """
+        events = self._events.c
+        thursday = func.date(events.timestamp, "-3 days", "weekday 4")
+        week = func.printf(
+            "%s-W%02d",
+            func.strftime("%Y", thursday),
+            (cast(func.strftime("%j", thursday), Integer) - 1) // 7 + 1,
+        ).label("week")
+        rows = self._session.execute(
+            select(week, func.count())
+            .select_from(self._events)
+            .where(self._is_reschedule)
+            .group_by(week)
+            .order_by(week)
+        ).all()
+        return dict(rows)  # type: ignore[arg-type]
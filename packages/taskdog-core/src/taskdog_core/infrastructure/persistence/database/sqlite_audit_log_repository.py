@@ -16,6 +16,10 @@ if TYPE_CHECKING:
 
     from sqlalchemy.engine import Engine
 
+    from taskdog_core.domain.entities.reschedule_statistics import (
+        RescheduleAggregates,
+    )
+
 from taskdog_core.domain.entities.audit_log import AuditLog, AuditQuery
 from taskdog_core.domain.repositories.audit_log_repository import AuditLogRepository
 from taskdog_core.infrastructure.persistence.database.base_repository import (
@@ -24,6 +28,9 @@ from taskdog_core.infrastructure.persistence.database.base_repository import (
 from taskdog_core.infrastructure.persistence.database.models.audit_log_model import (
     AuditLogModel,
 )
+from taskdog_core.infrastructure.persistence.database.reschedule_statistics_aggregator import (
+    RescheduleStatisticsAggregator,
+)
 
 
 class SqliteAuditLogRepository(SqliteBaseRepository, AuditLogRepository):
@@ -126,7 +133,8 @@ class SqliteAuditLogRepository(SqliteBaseRepository, AuditLogRepository):
             since: Only include logs at or after this timestamp (None for all)
 
         Returns:
-            The matching audit logs, oldest first
+            The matching audit logs, oldest first (in insertion order for
+            equal timestamps)
         """
         old_deadline = func.json_extract(AuditLogModel.old_values, "$.deadline")
         new_deadline = func.json_extract(AuditLogModel.new_values, "$.deadline")
@@ -137,7 +145,10 @@ class SqliteAuditLogRepository(SqliteBaseRepository, AuditLogRepository):
                 .where(AuditLogModel.operation == "update_task")
                 .where(AuditLogModel.success.is_(True))
                 .where(old_deadline.is_distinct_from(new_deadline))
-                .order_by(AuditLogModel.timestamp.asc())  # type: ignore[attr-defined]
+                .order_by(
+                    AuditLogModel.timestamp.asc(),  # type: ignore[attr-defined]
+                    AuditLogModel.id.asc(),
+                )
             )
             if since is not None:
                 stmt = stmt.where(
@@ -147,6 +158,28 @@ class SqliteAuditLogRepository(SqliteBaseRepository, AuditLogRepository):
             models = session.scalars(stmt).all()
             return [self._model_to_entity(model) for model in models]
 
+    def get_reschedule_aggregates(
+        self, since: datetime | None = None, min_reschedules: int = 1
+    ) -> RescheduleAggregates:
+        """Get deadline reschedule counts with SQL aggregation.
+
+        Deadlines are compared in SQL with json_extract() and julianday()
+        (see RescheduleStatisticsAggregator), using the
+        (operation, success, timestamp) index to find the events.
+
+        Args:
+            since: Only include logs at or after this timestamp (None for all)
+            min_reschedules: Reschedule count from which a task's slip
+                history is included
+
+        Returns:
+            RescheduleAggregates for the matching logs
+        """
+        with self.Session() as session:
+            return RescheduleStatisticsAggregator(session, since).aggregate(
+                min_reschedules
+            )
+
     def _apply_filters(self, stmt: Any, query: AuditQuery) -> Any:
         """Apply query filters to a SELECT statement.
 
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, text
 
 from taskdog_core.domain.entities.task import Task, TaskStatus
 from taskdog_core.domain.exceptions.tag_exceptions import TagNotFoundException
@@ -36,14 +36,23 @@ from taskdog_core.infrastructure.persistence.database.mutation_builders import (
 from taskdog_core.infrastructure.persistence.database.query_builders import (
     TaskQueryBuilder,
 )
+from taskdog_core.infrastructure.persistence.database.task_statistics_aggregator import (
+    TaskStatisticsAggregator,
+)
 from taskdog_core.infrastructure.persistence.mappers.tag_resolver import TagResolver
 from taskdog_core.infrastructure.persistence.mappers.task_db_mapper import TaskDbMapper
 
 if TYPE_CHECKING:
-    from datetime import date
+    from collections.abc import Callable, Iterator
+    from datetime import date, datetime
 
     from sqlalchemy.engine import Engine
 
+    from taskdog_core.domain.entities.task_statistics import (
+        TaskStatisticsAggregates,
+    )
+    from taskdog_core.domain.repositories.task_criteria import TaskCriterion
+    from taskdog_core.domain.repositories.task_order import TaskOrder
     from taskdog_core.domain.services.time_provider import ITimeProvider
 
 
@@ -57,6 +66,9 @@ class SqliteTaskRepository(SqliteBaseRepository, TaskRepository):
     - Uses TaskDbMapper for entity-model conversion
     """
 
+    # Rows fetched per round trip by iter_all()
+    ITER_BATCH_SIZE = 500
+
     def __init__(
         self,
         database_url: str,
@@ -92,6 +104,25 @@ class SqliteTaskRepository(SqliteBaseRepository, TaskRepository):
             models = session.scalars(stmt).all()
             return [self.mapper.from_model(model) for model in models]
 
+    def iter_all(self) -> Iterator[Task]:
+        """Iterate over all tasks, fetching rows in batches.
+
+        Only ITER_BATCH_SIZE rows (and their relationships) are loaded at a
+        time, so a single pass over many tasks does not hold every model and
+        entity in memory at once.
+
+        Yields:
+            Tasks in ID order
+        """
+        with self.Session() as session:
+            stmt = (
+                select(TaskModel)
+                .order_by(TaskModel.id)
+                .execution_options(yield_per=self.ITER_BATCH_SIZE)
+            )
+            for model in session.scalars(stmt):
+                yield self.mapper.from_model(model)
+
     def get_by_id(self, task_id: int) -> Task | None:
         """Retrieve a task by its ID.
 
@@ -172,6 +203,57 @@ class SqliteTaskRepository(SqliteBaseRepository, TaskRepository):
             models = session.scalars(stmt).all()
             return [self.mapper.from_model(model) for model in models]
 
+    def get_matching(
+        self,
+        criterion: TaskCriterion | None = None,
+        order: TaskOrder | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        """Retrieve the tasks matching a criterion tree with one SQL query.
+
+        Args:
+            criterion: Condition the tasks must satisfy, or None for all tasks
+            order: Order to return the tasks in, or None for the database's
+                default order
+            limit: Return at most this many tasks (default: None, no limit)
+
+        Returns:
+            List of matching tasks
+
+        Note:
+            TaskQueryBuilder.with_criterion() compiles the whole tree into a
+            single WHERE expression (IN for status sets, OR for alternatives)
+            and with_order() the order into an ORDER BY, so SQLite can walk
+            an index and stop after ``limit`` rows.
+        """
+        with self.Session() as session:
+            stmt = (
+                TaskQueryBuilder(select(TaskModel))
+                .with_criterion(criterion)
+                .with_order(order)
+                .with_limit(limit)
+                .build()
+            )
+            models = session.scalars(stmt).all()
+            return [self.mapper.from_model(model) for model in models]
+
+    def count_matching(self, criterion: TaskCriterion | None = None) -> int:
+        """Count the tasks matching a criterion tree using SQL COUNT.
+
+        Args:
+            criterion: Condition the tasks must satisfy, or None for all tasks
+
+        Returns:
+            Number of matching tasks
+        """
+        with self.Session() as session:
+            stmt = (
+                TaskQueryBuilder(select(func.count(TaskModel.id)))
+                .with_criterion(criterion)
+                .build()
+            )
+            return session.scalar(stmt) or 0
+
     def count_tasks(
         self,
         include_archived: bool = True,
@@ -273,41 +355,80 @@ class SqliteTaskRepository(SqliteBaseRepository, TaskRepository):
             return
 
         with self.Session() as session:
-            insert_builder, tag_builder, allocation_builder = self._create_builders(
-                session
-            )
-            update_builder = TaskUpdateBuilder(session, self.mapper)
-
-            # Bulk fetch existing tasks to avoid N+1 queries
-            existing_ids = [t.id for t in tasks if t.id is not None]
-            existing_models = {}
-            if existing_ids:
-                stmt = select(TaskModel).where(TaskModel.id.in_(existing_ids))  # type: ignore[attr-defined]
-                existing_models = {m.id: m for m in session.scalars(stmt).all()}
-
-            for task in tasks:
-                # Check for existing task only if task has an ID
-                existing_model = (
-                    existing_models.get(task.id) if task.id is not None else None
-                )
+            saved = self._save_in_session(session, tasks)
+            session.commit()
 
-                if existing_model:
-                    # Update existing task
-                    update_builder.update_task(existing_model, task)
-                else:
-                    # Insert new task
-                    existing_model = insert_builder.insert_task(task)
+        for task_id, task in saved:
+            self._notify_changed(task_id, task)
 
-                # Sync tag relationships
-                tag_builder.sync_task_tags(existing_model, task.tags)
+    def update_all(self, update: Callable[[list[Task]], list[Task]]) -> None:
+        """Read all tasks and save the ones update() returns in one transaction.
 
-                # Sync daily allocations to normalized table
-                allocation_builder.sync_daily_allocations(
-                    existing_model, task.daily_allocations
-                )
+        The transaction starts with BEGIN IMMEDIATE, taking SQLite's write
+        lock before the read, so no other connection can commit between the
+        state update() checks and the save. If update() raises, nothing is
+        saved.
 
+        Args:
+            update: Receives all current tasks and returns the tasks to save
+        """
+        with self.Session() as session:
+            session.execute(text("BEGIN IMMEDIATE"))
+            models = session.scalars(select(TaskModel)).all()
+            tasks = update([self.mapper.from_model(model) for model in models])
+            saved = self._save_in_session(session, tasks)
             session.commit()
 
+        for task_id, task in saved:
+            self._notify_changed(task_id, task)
+
+    def _save_in_session(
+        self, session: Any, tasks: list[Task]
+    ) -> list[tuple[int, Task]]:
+        """Insert or update tasks in an open session without committing.
+
+        Args:
+            session: Session to write in
+            tasks: Tasks to save
+
+        Returns:
+            (task ID, task) pairs to report to the change listeners once the
+            session is committed
+        """
+        insert_builder, tag_builder, allocation_builder = self._create_builders(session)
+        update_builder = TaskUpdateBuilder(session, self.mapper)
+
+        # Bulk fetch existing tasks to avoid N+1 queries
+        existing_ids = [t.id for t in tasks if t.id is not None]
+        existing_models = {}
+        if existing_ids:
+            stmt = select(TaskModel).where(TaskModel.id.in_(existing_ids))  # type: ignore[attr-defined]
+            existing_models = {m.id: m for m in session.scalars(stmt).all()}
+
+        saved = []
+        for task in tasks:
+            # Check for existing task only if task has an ID
+            existing_model = (
+                existing_models.get(task.id) if task.id is not None else None
+            )
+
+            if existing_model:
+                # Update existing task
+                update_builder.update_task(existing_model, task)
+            else:
+                # Insert new task
+                existing_model = insert_builder.insert_task(task)
+
+            # Sync tag relationships
+            tag_builder.sync_task_tags(existing_model, task.tags)
+
+            # Sync daily allocations to normalized table
+            allocation_builder.sync_daily_allocations(
+                existing_model, task.daily_allocations
+            )
+            saved.append((existing_model.id, task))
+        return saved
+
     def delete(self, task_id: int) -> None:
         """Delete a task by its ID.
 
@@ -323,6 +444,8 @@ class SqliteTaskRepository(SqliteBaseRepository, TaskRepository):
             delete_builder.delete_task(task_id)
             session.commit()
 
+        self._notify_changed(task_id, None)
+
     def create(self, name: str, priority: int | None = None, **kwargs: Any) -> Task:
         """Create a new task with auto-generated ID and save it.
 
@@ -366,13 +489,18 @@ class SqliteTaskRepository(SqliteBaseRepository, TaskRepository):
             session.commit()
 
             # Return task with assigned ID
-            return self.mapper.from_model(model)
+            created = self.mapper.from_model(model)
+
+        assert created.id is not None
+        self._notify_changed(created.id, created)
+        return created
 
     def delete_tag(self, tag_name: str) -> int:
         """Delete a tag from the system by name.
 
         Removes the tag record from the tags table. CASCADE delete
-        automatically removes all task_tags associations.
+        automatically removes all task_tags associations. Each task that
+        had the tag is reported to the change listeners afterwards.
 
         Args:
             tag_name: Name of the tag to delete
@@ -391,17 +519,20 @@ class SqliteTaskRepository(SqliteBaseRepository, TaskRepository):
             if tag is None:
                 raise TagNotFoundException(tag_name)
 
-            # Count associated tasks before deletion
-            count_stmt = select(func.count(TaskTagModel.task_id)).where(
+            # Collect associated tasks before deletion
+            task_ids_stmt = select(TaskTagModel.task_id).where(
                 TaskTagModel.tag_id == tag.id
             )
-            affected_count = session.scalar(count_stmt) or 0
+            affected_ids = list(session.scalars(task_ids_stmt).all())
 
             # Delete tag (CASCADE removes task_tags)
             session.delete(tag)
             session.commit()
 
-            return affected_count
+        if self._change_listeners:
+            for task_id, task in self.get_by_ids(affected_ids).items():
+                self._notify_changed(task_id, task)
+        return len(affected_ids)
 
     def get_tag_counts(self) -> dict[str, int]:
         """Get all tags with their task counts using SQL aggregation.
@@ -596,3 +727,28 @@ class SqliteTaskRepository(SqliteBaseRepository, TaskRepository):
                 row[0]: float(row[1]) if row[1] is not None else 0.0  # type: ignore[misc, arg-type]
                 for row in results
             }
+
+    def get_statistics_aggregates(
+        self,
+        since: datetime | None = None,
+        completion_cutoffs: list[datetime] | None = None,
+    ) -> TaskStatisticsAggregates | None:
+        """Get the per-group counts statistics are calculated from, using SQL.
+
+        Counts are computed with GROUP BY on the tasks table (strftime() on
+        actual_end for the hour, weekday and day buckets), so statistics do
+        not load and map every task. Only the time tracking columns of
+        tracked tasks are fetched per row.
+
+        Args:
+            since: Optional start of the statistics period
+            completion_cutoffs: Datetimes to count finished tasks that ended
+                at or after (one count per cutoff, in order)
+
+        Returns:
+            TaskStatisticsAggregates for the tasks in the period
+        """
+        with self.Session() as session:
+            return TaskStatisticsAggregator(session, since).aggregate(
+                completion_cutoffs
+            )
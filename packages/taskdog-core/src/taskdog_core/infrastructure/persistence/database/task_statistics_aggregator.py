@@ -0,0 +1,220 @@
+"""SQL aggregation of the counts task statistics are calculated from.
+
+Counts per status, priority, deadline outcome, completion hour/weekday and
+completion day are computed with GROUP BY on the tasks table, so statistics
+no longer need every task loaded and mapped to an entity. Only the time
+tracking columns are fetched per task, because medians, the longest and
+shortest task and the estimation pairs need every value.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import and_, case, func, or_, select
+
+from taskdog_core.domain.entities.task import TaskStatus
+from taskdog_core.domain.entities.task_statistics import (
+    TaskStatisticsAggregates,
+    TrackedTaskDuration,
+)
+from taskdog_core.infrastructure.persistence.database.models import TaskModel
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+    from sqlalchemy.sql.expression import ColumnElement
+
+_ACTIVE_STATUSES = [TaskStatus.PENDING.value, TaskStatus.IN_PROGRESS.value]
+_FINISHED_STATUSES = [TaskStatus.COMPLETED.value, TaskStatus.CANCELED.value]
+
+# actual_end without fractional seconds: strftime() rounds them to
+# milliseconds, which would move an end at 23:59:59.9995 into the next day
+_END_SECOND = func.substr(TaskModel.actual_end, 1, 19)
+
+
+class TaskStatisticsAggregator:
+    """Computes TaskStatisticsAggregates with SQL GROUP BY queries.
+
+    Datetime columns are stored as 'YYYY-MM-DD HH:MM:SS.ffffff' strings, so
+    strftime() on actual_end yields the local hour, weekday and day the
+    Python calculator buckets by, and string comparison orders datetimes.
+    ISO weeks and months are rolled up from the per-day counts by the
+    caller, as SQLite's strftime() has no ISO week-year.
+    """
+
+    def __init__(self, session: Session, since: datetime | None = None):
+        """Initialize the aggregator.
+
+        Args:
+            session: Open SQLAlchemy session
+            since: Optional start of the statistics period
+        """
+        self._session = session
+        self._in_period: list[ColumnElement[bool]] = []
+        if since is not None:
+            self._in_period.append(
+                or_(
+                    TaskModel.actual_end >= since,  # type: ignore[operator]
+                    and_(
+                        TaskModel.actual_end.is_(None),  # type: ignore[union-attr]
+                        TaskModel.status.in_(_ACTIVE_STATUSES),
+                    ),
+                )
+            )
+        self._finished: list[ColumnElement[bool]] = [
+            *self._in_period,
+            TaskModel.actual_end.is_not(None),  # type: ignore[union-attr]
+            TaskModel.status.in_(_FINISHED_STATUSES),
+        ]
+
+    def aggregate(
+        self, completion_cutoffs: list[datetime] | None = None
+    ) -> TaskStatisticsAggregates:
+        """Run the aggregation queries.
+
+        Args:
+            completion_cutoffs: Datetimes to count finished tasks that ended
+                at or after
+
+        Returns:
+            TaskStatisticsAggregates for the tasks in the period
+        """
+        met, missed, delay_days = self._deadline_outcomes()
+        return TaskStatisticsAggregates(
+            status_counts=self._status_counts(),
+            priority_status_counts=self._priority_status_counts(),
+            tracked_durations=self._tracked_durations(),
+            deadline_met_count=met,
+            deadline_missed_count=missed,
+            total_delay_days=delay_days,
+            completions_by_weekday_hour=self._completions_by_weekday_hour(),
+            completions_by_day=self._completions_by_day(),
+            completions_since=self._completions_since(completion_cutoffs or []),
+        )
+
+    def _status_counts(self) -> dict[TaskStatus, int]:
+        stmt = (
+            select(TaskModel.status, func.count(TaskModel.id))
+            .where(*self._in_period)
+            .group_by(TaskModel.status)
+        )
+        return {
+            TaskStatus(status): count
+            for status, count in self._session.execute(stmt).all()
+        }
+
+    def _priority_status_counts(self) -> dict[tuple[int, TaskStatus], int]:
+        stmt = (
+            select(TaskModel.priority, TaskModel.status, func.count(TaskModel.id))
+            .where(*self._in_period)
+            .where(TaskModel.priority.is_not(None))  # type: ignore[union-attr]
+            .group_by(TaskModel.priority, TaskModel.status)
+        )
+        return {
+            (priority, TaskStatus(status)): count
+            for priority, status, count in self._session.execute(stmt).all()
+        }
+
+    def _tracked_durations(self) -> list[TrackedTaskDuration]:
+        stmt = (
+            select(
+                TaskModel.id,
+                TaskModel.name,
+                TaskModel.estimated_duration,
+                TaskModel.actual_duration,
+                TaskModel.actual_start,
+                TaskModel.actual_end,
+            )
+            .where(*self._in_period)
+            .where(
+                or_(
+                    TaskModel.actual_duration.is_not(None),  # type: ignore[union-attr]
+                    and_(
+                        TaskModel.actual_start.is_not(None),  # type: ignore[union-attr]
+                        TaskModel.actual_end.is_not(None),  # type: ignore[union-attr]
+                    ),
+                )
+            )
+            .order_by(TaskModel.id)
+        )
+        return [
+            TrackedTaskDuration(
+                id=row.id,
+                name=row.name,
+                estimated_duration=row.estimated_duration,
+                actual_duration=row.actual_duration,
+                actual_start=row.actual_start,
+                actual_end=row.actual_end,
+            )
+            for row in self._session.execute(stmt).all()
+        ]
+
+    def _deadline_outcomes(self) -> tuple[int, int, float]:
+        missed = TaskModel.actual_end > TaskModel.deadline  # type: ignore[operator]
+        stmt = (
+            select(
+                func.count(TaskModel.id),
+                func.coalesce(func.sum(case((missed, 1), else_=0)), 0),
+                func.coalesce(
+                    func.sum(
+                        case(
+                            (
+                                missed,
+                                func.julianday(TaskModel.actual_end)
+                                - func.julianday(TaskModel.deadline),
+                            ),
+                            else_=0.0,
+                        )
+                    ),
+                    0.0,
+                ),
+            )
+            .where(*self._finished)
+            .where(TaskModel.deadline.is_not(None))  # type: ignore[union-attr]
+        )
+        total, missed_count, delay_days = self._session.execute(stmt).one()
+        return total - missed_count, missed_count, float(delay_days)
+
+    def _completions_by_weekday_hour(self) -> dict[tuple[int, int], int]:
+        # %w counts from Sunday (0); weekday() counts from Monday
+        weekday = func.strftime("%w", _END_SECOND)
+        hour = func.strftime("%H", _END_SECOND)
+        stmt = (
+            select(weekday, hour, func.count(TaskModel.id))
+            .where(*self._finished)
+            .group_by(weekday, hour)
+        )
+        return {
+            ((int(day) + 6) % 7, int(hour_text)): count
+            for day, hour_text, count in self._session.execute(stmt).all()
+        }
+
+    def _completions_by_day(self) -> dict[date, int]:
+        day = func.strftime("%Y-%m-%d", _END_SECOND)
+        stmt = (
+            select(day, func.count(TaskModel.id))
+            .where(*self._finished)
+            .group_by(day)
+            .order_by(day)
+        )
+        return {
+            date.fromisoformat(day_text): count
+            for day_text, count in self._session.execute(stmt).all()
+        }
+
+    def _completions_since(self, cutoffs: list[datetime]) -> list[int]:
+        if not cutoffs:
+            return []
+        stmt = select(
+            *(
+                func.coalesce(
+                    func.sum(
+                        case((TaskModel.actual_end >= cutoff, 1), else_=0)  # type: ignore[operator]
+                    ),
+                    0,
+                )
+                for cutoff in cutoffs
+            )
+        ).where(*self._finished)
+        return list(self._session.execute(stmt).one())
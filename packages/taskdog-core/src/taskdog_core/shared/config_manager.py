@@ -9,6 +9,9 @@ from datetime import time
 from pathlib import Path
 
 from taskdog_core.shared.config_loader import ConfigLoader
+from taskdog_core.shared.constants.config_defaults import (
+    DEFAULT_HOLIDAY_CACHE_YEARS,
+)
 from taskdog_core.shared.xdg_utils import XDGDirectories
 
 
@@ -92,9 +95,12 @@ class RegionConfig:
     Attributes:
         country: ISO 3166-1 alpha-2 country code (e.g., "JP", "US")
                  None means no holiday checking
+        holiday_cache_years: Years after the current one whose holidays are
+                 precomputed and cached (the previous year is always included)
     """
 
     country: str | None = None
+    holiday_cache_years: int = DEFAULT_HOLIDAY_CACHE_YEARS
 
 
 @dataclass(frozen=True)
@@ -160,6 +166,11 @@ class ConfigManager:
                     region_data.get("country"),
                     str,
                 ),
+                holiday_cache_years=ConfigLoader.get_env(
+                    "REGION_HOLIDAY_CACHE_YEARS",
+                    region_data.get("holiday_cache_years", DEFAULT_HOLIDAY_CACHE_YEARS),
+                    int,
+                ),
             ),
             storage=StorageConfig(
                 backend=ConfigLoader.get_env(
@@ -10,3 +10,7 @@ MAX_ESTIMATED_DURATION_HOURS = 999  # Maximum estimated duration in hours
 DEFAULT_DEADLINE_TIME = time(18, 30)  # Default time for deadline input
 DEFAULT_PLANNED_START_TIME = time(9, 30)  # Default time for planned_start input
 DEFAULT_PLANNED_END_TIME = time(18, 30)  # Default time for planned_end input
+
+# === Region Defaults ===
+# Years after the current one whose holidays are precomputed and cached
+DEFAULT_HOLIDAY_CACHE_YEARS = 5
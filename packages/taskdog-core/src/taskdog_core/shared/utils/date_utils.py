@@ -9,7 +9,7 @@ Note: Monday=0, Tuesday=1, ..., Friday=4, Saturday=5, Sunday=6
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 
 from taskdog_core.shared.constants import WEEKDAY_THRESHOLD
 
@@ -40,10 +40,14 @@ def count_weekdays(start: datetime | date, end: datetime | date) -> int:
     start_date = start.date() if isinstance(start, datetime) else start
     end_date = end.date() if isinstance(end, datetime) else end
 
-    weekday_count = 0
-    current_date = start_date
-    while current_date <= end_date:
-        if is_weekday(current_date):
-            weekday_count += 1
-        current_date += timedelta(days=1)
-    return weekday_count
+    total_days = (end_date - start_date).days + 1
+    if total_days <= 0:
+        return 0
+
+    # Whole weeks contribute WEEKDAY_THRESHOLD weekdays each; count the rest
+    full_weeks, remainder = divmod(total_days, 7)
+    first_weekday = start_date.weekday()
+    extra = sum(
+        1 for i in range(remainder) if (first_weekday + i) % 7 < WEEKDAY_THRESHOLD
+    )
+    return full_weeks * WEEKDAY_THRESHOLD + extra
@@ -50,6 +50,16 @@ class XDGDirectories:
             return Path.home() / "AppData" / "Local"
         return Path.home() / ".local" / "state"
 
+    @classmethod
+    def _default_cache_base(cls) -> Path:
+        """Get platform default base directory for cached, regenerable data."""
+        if platform.system() == "Windows":
+            local_app_data = os.getenv("LOCALAPPDATA")
+            if local_app_data:
+                return Path(local_app_data)
+            return Path.home() / "AppData" / "Local"
+        return Path.home() / ".cache"
+
     @classmethod
     def get_data_home(cls, create: bool = True) -> Path:
         """Get application data directory for taskdog.
@@ -104,6 +114,24 @@ class XDGDirectories:
 
         return state_dir
 
+    @classmethod
+    def get_cache_home(cls, create: bool = True) -> Path:
+        """Get cache directory for taskdog (data that can be regenerated).
+
+        Returns:
+            Path to $XDG_CACHE_HOME/taskdog, or the platform default.
+
+        Args:
+            create: Create directory if it doesn't exist (default: True)
+        """
+        base_dir = Path(os.getenv("XDG_CACHE_HOME") or cls._default_cache_base())
+        cache_dir = Path(base_dir) / cls.APP_NAME
+
+        if create:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+        return cache_dir
+
     @classmethod
     def get_config_file(cls) -> Path:
         """Get path to config.toml file.
@@ -40,3 +40,18 @@ class TestOptimizeParams:
             f"Max hours per day must be greater than 0 (got {max_hours_per_day})"
             == str(exc_info.value)
         )
+
+    @pytest.mark.parametrize("num_simulations", [0, -5])
+    def test_rejects_non_positive_num_simulations(self, num_simulations: int) -> None:
+        """Test non-positive num_simulations raises domain validation error."""
+        with pytest.raises(TaskValidationError) as exc_info:
+            OptimizeParams(
+                start_date=datetime(2025, 1, 1, 9, 0),
+                max_hours_per_day=8.0,
+                num_simulations=num_simulations,
+            )
+
+        assert (
+            f"Number of simulations must be greater than 0 (got {num_simulations})"
+            == str(exc_info.value)
+        )
@@ -0,0 +1,59 @@
+"""Tests for AnyFilter."""
+
+import pytest
+
+from taskdog_core.application.queries.filters.any_filter import AnyFilter
+from taskdog_core.application.queries.filters.status_filter import StatusFilter
+from taskdog_core.application.queries.filters.tag_filter import TagFilter
+from taskdog_core.application.queries.filters.task_filter import TaskFilter
+from taskdog_core.domain.entities.task import Task, TaskStatus
+from taskdog_core.domain.repositories.task_criteria import AnyOf, HasTags, StatusIn
+
+
+class PythonOnlyFilter(TaskFilter):
+    """Filter without a criterion."""
+
+    def filter(self, tasks: list[Task]) -> list[Task]:
+        return tasks
+
+
+class TestAnyFilter:
+    """Test cases for AnyFilter."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Create sample tasks for testing."""
+        self.pending = Task(id=1, name="P", status=TaskStatus.PENDING, priority=1)
+        self.tagged = Task(
+            id=2, name="T", status=TaskStatus.COMPLETED, priority=1, tags=["urgent"]
+        )
+        self.other = Task(id=3, name="O", status=TaskStatus.CANCELED, priority=1)
+        self.tasks = [self.pending, self.tagged, self.other]
+
+    def test_keeps_tasks_passing_any_filter_in_order(self):
+        either = TagFilter(["urgent"]) | StatusFilter(TaskStatus.PENDING)
+
+        assert either.filter(self.tasks) == [self.pending, self.tagged]
+
+    def test_or_operator_flattens(self):
+        either = (
+            StatusFilter(TaskStatus.PENDING)
+            | TagFilter(["urgent"])
+            | StatusFilter(TaskStatus.CANCELED)
+        )
+
+        assert isinstance(either, AnyFilter)
+        assert len(either.filters) == 3
+        assert either.filter(self.tasks) == self.tasks
+
+    def test_to_criterion(self):
+        either = StatusFilter(TaskStatus.PENDING) | TagFilter(["urgent"])
+
+        assert either.to_criterion() == AnyOf(
+            (StatusIn(frozenset({TaskStatus.PENDING})), HasTags(("urgent",)))
+        )
+
+    def test_to_criterion_is_none_with_python_only_filter(self):
+        either = StatusFilter(TaskStatus.PENDING) | PythonOnlyFilter()
+
+        assert either.to_criterion() is None
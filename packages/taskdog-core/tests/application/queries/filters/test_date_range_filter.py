@@ -79,6 +79,17 @@ class TestDateRangeFilter:
         assert len(result) == 2
         assert self.task_no_dates in result
 
+    def test_filter_excludes_tasks_with_no_dates_when_requested(self):
+        """Test include_undated=False drops tasks without date fields."""
+        date_filter = DateRangeFilter(
+            start_date=date(2025, 1, 1), include_undated=False
+        )
+        tasks = [self.task_jan, self.task_no_dates]
+
+        result = date_filter.filter(tasks)
+
+        assert result == [self.task_jan]
+
     def test_filter_checks_all_date_fields(self):
         """Test filter checks planned_start, planned_end, actual_start, actual_end, deadline."""
         # Task with multiple date fields
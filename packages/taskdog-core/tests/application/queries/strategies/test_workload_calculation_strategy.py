@@ -21,6 +21,10 @@ class MockHolidayChecker:
         """Check if a date is a holiday."""
         return check_date in self.holidays
 
+    def get_holidays_in_range(self, start_date: date, end_date: date) -> set[date]:
+        """Get holidays within a date range."""
+        return {d for d in self.holidays if start_date <= d <= end_date}
+
 
 class TestActualScheduleStrategy:
     """Test cases for ActualScheduleStrategy."""
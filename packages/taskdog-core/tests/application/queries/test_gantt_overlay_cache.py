@@ -0,0 +1,218 @@
+"""Tests for GanttOverlayCache."""
+
+import random
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from taskdog_core.application.queries.gantt_overlay_cache import (
+    GanttOverlayCache,
+    GanttOverlayWindow,
+)
+from taskdog_core.application.queries.task_query_service import TaskQueryService
+from taskdog_core.domain.entities.task import TaskStatus
+from tests.helpers.time_provider import FakeTimeProvider
+
+DAY = date(2025, 3, 10)
+
+
+def _window(start: date, end: date) -> GanttOverlayWindow:
+    """Window with one allocation per day for task 1 and one on DAY for task 2."""
+    days = [start + timedelta(days=n) for n in range((end - start).days + 1)]
+    return GanttOverlayWindow(
+        start_date=start,
+        end_date=end,
+        task_daily_hours={1: dict.fromkeys(days, 2.0), 2: {DAY: 3.0}},
+        daily_workload={day: 5.0 if day == DAY else 2.0 for day in days},
+        holidays={start},
+    )
+
+
+class TestGanttOverlayWindow:
+    """Test cases for GanttOverlayWindow."""
+
+    def test_slice_keeps_only_days_in_range(self):
+        window = _window(DAY - timedelta(days=5), DAY + timedelta(days=5))
+
+        sliced = window.slice(DAY + timedelta(days=1), DAY + timedelta(days=2))
+
+        assert sliced.start_date == DAY + timedelta(days=1)
+        assert sliced.end_date == DAY + timedelta(days=2)
+        assert sliced.task_daily_hours == {
+            1: {DAY + timedelta(days=1): 2.0, DAY + timedelta(days=2): 2.0}
+        }
+        assert sliced.daily_workload == {
+            DAY + timedelta(days=1): 2.0,
+            DAY + timedelta(days=2): 2.0,
+        }
+        assert sliced.holidays == set()
+
+    def test_covers(self):
+        window = _window(DAY, DAY + timedelta(days=3))
+
+        assert window.covers(DAY, DAY + timedelta(days=3))
+        assert not window.covers(DAY - timedelta(days=1), DAY)
+        assert not window.covers(DAY, DAY + timedelta(days=4))
+
+
+class TestGanttOverlayCache:
+    """Test cases for GanttOverlayCache."""
+
+    def setup_method(self):
+        self.cache = GanttOverlayCache(max_entries=2, margin_days=7)
+        self.fetch = MagicMock(side_effect=_window)
+
+    def _get(self, task_ids, start=DAY, end=DAY, holiday_checker=None):
+        return self.cache.get_or_fetch(
+            task_ids, start, end, holiday_checker, self.fetch
+        )
+
+    def test_miss_fetches_wider_window_and_returns_range(self):
+        result = self._get([1, 2])
+
+        self.fetch.assert_called_once_with(
+            DAY - timedelta(days=7), DAY + timedelta(days=7)
+        )
+        assert result.start_date == DAY
+        assert result.end_date == DAY
+        assert result.task_daily_hours == {1: {DAY: 2.0}, 2: {DAY: 3.0}}
+        assert self.cache.stats().misses == 1
+
+    def test_range_inside_cached_window_is_a_hit(self):
+        self._get([1, 2])
+
+        result = self._get([2, 1], DAY + timedelta(days=3), DAY + timedelta(days=7))
+
+        assert self.fetch.call_count == 1
+        assert result.task_daily_hours == {
+            1: {DAY + timedelta(days=n): 2.0 for n in range(3, 8)}
+        }
+        stats = self.cache.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_range_outside_cached_window_is_a_miss(self):
+        self._get([1, 2])
+
+        self._get([1, 2], DAY, DAY + timedelta(days=8))
+
+        assert self.fetch.call_count == 2
+
+    def test_different_task_set_is_a_miss(self):
+        self._get([1, 2])
+
+        self._get([1])
+
+        assert self.fetch.call_count == 2
+
+    def test_different_holiday_checker_is_a_miss(self):
+        self._get([1, 2])
+
+        self._get([1, 2], holiday_checker=MagicMock())
+
+        assert self.fetch.call_count == 2
+
+    def test_task_change_invalidates_entries(self):
+        self._get([1, 2])
+
+        self.cache.task_changed(1, None)
+        self._get([1, 2])
+
+        assert self.fetch.call_count == 2
+
+    def test_window_fetched_before_a_change_is_not_stored(self):
+        def fetch_during_change(start, end):
+            self.cache.task_changed(1, None)
+            return _window(start, end)
+
+        self.cache.get_or_fetch([1], DAY, DAY, None, fetch_during_change)
+
+        assert len(self.cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self._get([1])
+        self._get([2])
+        self._get([1])
+        self._get([3])
+
+        self._get([1])
+        self._get([2])
+
+        stats = self.cache.stats()
+        assert stats.entries == 2
+        assert stats.evictions == 2
+        assert self.fetch.call_count == 4
+
+    def test_clear_resets_counters(self):
+        self._get([1])
+
+        self.cache.clear()
+
+        assert self.cache.stats() == GanttOverlayCache(2, 7).stats()
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_entries": 0}, {"margin_days": -1}], ids=["entries", "margin"]
+    )
+    def test_invalid_arguments_raise(self, kwargs):
+        with pytest.raises(ValueError):
+            GanttOverlayCache(**kwargs)
+
+
+class TestTaskQueryServiceOverlayCache:
+    """Cached overlays match overlays built without the cache."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, repository):
+        self.repository = repository
+        self.cache = GanttOverlayCache(margin_days=14)
+        repository.add_change_listener(self.cache.task_changed)
+        self.cached = TaskQueryService(repository, FakeTimeProvider(), self.cache)
+        self.uncached = TaskQueryService(repository, FakeTimeProvider())
+        self.holiday_checker = MagicMock()
+        self.holiday_checker.get_holidays_in_range.side_effect = lambda start, end: {
+            start + timedelta(days=n)
+            for n in range((end - start).days + 1)
+            if (start + timedelta(days=n)).toordinal() % 9 == 0
+        }
+
+        rng = random.Random(7)
+        for index in range(20):
+            first = DAY + timedelta(days=rng.randint(-30, 30))
+            self.repository.create(
+                name=f"Task {index}",
+                priority=1,
+                status=rng.choice([TaskStatus.PENDING, TaskStatus.COMPLETED]),
+                planned_start=datetime.combine(first, datetime.min.time()),
+                estimated_duration=8.0,
+                daily_allocations={
+                    first + timedelta(days=n): rng.choice([1.0, 2.5, 4.0])
+                    for n in range(rng.randint(1, 10))
+                },
+            )
+
+    def _overlays(self, start, end):
+        tasks = self.repository.get_all()
+        return (
+            self.cached.build_gantt_overlay(tasks, start, end, self.holiday_checker),
+            self.uncached.build_gantt_overlay(tasks, start, end, self.holiday_checker),
+        )
+
+    def test_panned_ranges_match_uncached_overlay(self):
+        for offset in range(-21, 22, 3):
+            start = DAY + timedelta(days=offset)
+            cached, uncached = self._overlays(start, start + timedelta(days=13))
+            assert cached == uncached
+
+        assert self.cache.stats().hits > self.cache.stats().misses
+
+    def test_task_change_is_reflected(self):
+        self._overlays(DAY, DAY + timedelta(days=13))
+        task = self.repository.get_by_id(1)
+        task.daily_allocations = {DAY: 6.0}
+        self.repository.save(task)
+
+        cached, uncached = self._overlays(DAY, DAY + timedelta(days=13))
+
+        assert cached == uncached
+        assert cached.task_daily_hours[1] == {DAY: 6.0}
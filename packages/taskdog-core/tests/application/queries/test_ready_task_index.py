@@ -0,0 +1,167 @@
+"""Tests for ReadyTaskIndex."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from taskdog_core.application.queries.ready_task_index import ReadyTaskIndex
+from taskdog_core.application.queries.task_query_service import TaskQueryService
+from taskdog_core.domain.entities.task import TaskStatus
+from tests.helpers.time_provider import FakeTimeProvider
+
+STATUSES = [
+    TaskStatus.PENDING,
+    TaskStatus.IN_PROGRESS,
+    TaskStatus.COMPLETED,
+    TaskStatus.CANCELED,
+]
+
+
+class TestReadyTaskIndex:
+    """Indexed executable tasks match the ones computed from all tasks."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, repository):
+        self.repository = repository
+        self.index = ReadyTaskIndex(repository, TaskQueryService.executable_sort_key)
+        repository.add_change_listener(self.index.task_changed)
+        self.indexed = TaskQueryService(
+            repository, FakeTimeProvider(), ready_index=self.index
+        )
+        self.scanned = TaskQueryService(repository, FakeTimeProvider())
+
+    def _ids(self, service, tags=None, limit=10):
+        return [t.id for t in service.get_executable_tasks(tags=tags, limit=limit)]
+
+    def _assert_parity(self, tags=None, limit=10):
+        assert self._ids(self.indexed, tags, limit) == self._ids(
+            self.scanned, tags, limit
+        )
+
+    def test_completing_dependency_makes_dependent_ready(self):
+        dep = self.repository.create(name="dep", priority=1)
+        blocked = self.repository.create(name="blocked", priority=5, depends_on=[1])
+        assert self._ids(self.indexed) == [dep.id]
+
+        dep.status = TaskStatus.COMPLETED
+        self.repository.save(dep)
+
+        assert self._ids(self.indexed) == [blocked.id]
+
+    def test_reopening_dependency_blocks_dependent_again(self):
+        dep = self.repository.create(
+            name="dep", priority=1, status=TaskStatus.COMPLETED
+        )
+        self.repository.create(name="blocked", priority=1, depends_on=[dep.id])
+        assert self._ids(self.indexed) == [2]
+
+        dep.status = TaskStatus.PENDING
+        self.repository.save(dep)
+
+        assert self._ids(self.indexed) == [dep.id]
+
+    def test_deleted_dependency_blocks_dependent(self):
+        dep = self.repository.create(
+            name="dep", priority=1, status=TaskStatus.COMPLETED
+        )
+        self.repository.create(name="blocked", priority=1, depends_on=[dep.id])
+        self._ids(self.indexed)
+
+        self.repository.delete(dep.id)
+
+        assert self._ids(self.indexed) == []
+
+    def test_changed_sort_key_reorders(self):
+        first = self.repository.create(name="a", priority=1)
+        second = self.repository.create(name="b", priority=2)
+        assert self._ids(self.indexed) == [second.id, first.id]
+
+        first.priority = 3
+        self.repository.save(first)
+
+        assert self._ids(self.indexed) == [first.id, second.id]
+
+    def test_task_leaving_and_reentering_is_listed_once(self):
+        task = self.repository.create(name="a", priority=1)
+        self._ids(self.indexed)
+
+        task.is_archived = True
+        self.repository.save(task)
+        task.is_archived = False
+        self.repository.save(task)
+
+        assert self._ids(self.indexed) == [task.id]
+
+    def test_returned_tasks_are_copies(self):
+        self.repository.create(name="a", priority=1)
+
+        self.indexed.get_executable_tasks()[0].name = "changed"
+
+        assert self.indexed.get_executable_tasks()[0].name == "a"
+
+    def test_tag_filter_and_limit(self):
+        for index in range(6):
+            self.repository.create(
+                name=f"t{index}",
+                priority=index + 1,
+                tags=["work"] if index % 2 else ["home"],
+            )
+
+        self._assert_parity(tags=["work"], limit=2)
+        self._assert_parity(tags=["home", "work"], limit=4)
+        self._assert_parity(limit=3)
+        # The filtered query leaves the heap intact for the next one
+        self._assert_parity()
+
+    def test_random_changes_match_full_scan(self):
+        rng = random.Random(11)
+        base = datetime(2025, 6, 2, 18, 0)
+        for index in range(40):
+            self.repository.create(
+                name=f"t{index}",
+                priority=rng.choice([None, 1, 2, 3]),
+                status=rng.choice(STATUSES),
+                deadline=rng.choice([None, base + timedelta(days=rng.randint(0, 9))]),
+                estimated_duration=rng.choice([None, 2.0, 4.0]),
+                depends_on=rng.sample(range(1, 41), rng.randint(0, 2)),
+                tags=rng.sample(["a", "b", "c"], rng.randint(0, 2)),
+            )
+        self._assert_parity()
+
+        for _ in range(300):
+            task = self.repository.get_by_id(rng.randint(1, 40))
+            if task is None:
+                continue
+            action = rng.random()
+            if action < 0.05:
+                self.repository.delete(task.id)
+            else:
+                if action < 0.6:
+                    task.status = rng.choice(STATUSES)
+                elif action < 0.7:
+                    task.is_archived = not task.is_archived
+                elif action < 0.85:
+                    task.depends_on = rng.sample(range(1, 41), rng.randint(0, 2))
+                else:
+                    task.priority = rng.choice([None, 1, 2, 3])
+                self.repository.save(task)
+            self._assert_parity(tags=rng.choice([None, ["a"], ["b", "c"]]), limit=5)
+
+        self._assert_parity(limit=40)
+
+    def test_deleted_tag_no_longer_matches(self):
+        task = self.repository.create(name="a", priority=1, tags=["x"])
+        assert self._ids(self.indexed, tags=["x"]) == [task.id]
+
+        self.repository.delete_tag("x")
+
+        assert self._ids(self.indexed, tags=["x"]) == []
+        assert self.index.top(10, ["x"]) == []
+
+    def test_changes_before_first_use_are_ignored(self):
+        task = self.repository.create(name="a", priority=1)
+
+        assert len(self.index) == 0
+        assert self._ids(self.indexed) == [task.id]
+        assert len(self.index) == 1
@@ -6,6 +6,9 @@ from taskdog_core.application.dto.optimize_params import OptimizeParams
 from taskdog_core.application.services.optimization.balanced_optimization_strategy import (
     BalancedOptimizationStrategy,
 )
+from taskdog_core.application.services.optimization.capacity_calendar import (
+    CapacityCalendar,
+)
 from taskdog_core.domain.entities.task import Task, TaskStatus
 from taskdog_core.domain.services.holiday_checker import IHolidayChecker
 from tests.application.services.optimization.optimization_strategy_test_base import (
@@ -172,10 +175,10 @@ class TestBalancedOptimizationStrategyWithHolidays:
             max_hours_per_day=6.0,
             holiday_checker=holiday_checker,
         )
-        daily_allocations: dict[date, float] = {}
+        calendar = CapacityCalendar.from_params(params)
 
         strategy = BalancedOptimizationStrategy()
-        result = strategy._allocate_task(task, daily_allocations, params)
+        result = strategy._allocate_task(task, calendar, params)
 
         assert result is not None
         assert result.daily_allocations is not None
@@ -208,10 +211,10 @@ class TestBalancedOptimizationStrategyWithHolidays:
             max_hours_per_day=6.0,
             holiday_checker=None,
         )
-        daily_allocations: dict[date, float] = {}
+        calendar = CapacityCalendar.from_params(params)
 
         strategy = BalancedOptimizationStrategy()
-        result = strategy._allocate_task(task, daily_allocations, params)
+        result = strategy._allocate_task(task, calendar, params)
 
         assert result is not None
         assert result.daily_allocations is not None
@@ -0,0 +1,225 @@
+"""Tests for CapacityCalendar."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from taskdog_core.application.dto.optimize_params import OptimizeParams
+from taskdog_core.application.services.optimization.capacity_calendar import (
+    CapacityCalendar,
+)
+from taskdog_core.application.services.optimization.strategy_factory import (
+    StrategyFactory,
+)
+from taskdog_core.application.utils.workday_calendar import WorkdayCalendar
+from taskdog_core.domain.entities.task import Task
+
+MONDAY = date(2025, 1, 6)
+
+
+class _FixedHolidays:
+    """Holiday checker backed by a fixed set of dates."""
+
+    def __init__(self, holidays: set[date]):
+        self.holidays = holidays
+
+    def is_holiday(self, d: date) -> bool:
+        return d in self.holidays
+
+    def get_holiday_name(self, d: date) -> str | None:
+        return "Holiday" if d in self.holidays else None
+
+    def get_holidays_in_range(self, start: date, end: date) -> set[date]:
+        return {d for d in self.holidays if start <= d <= end}
+
+
+class TestCapacityCalendar:
+    """Test cases for CapacityCalendar queries and updates."""
+
+    def test_free_hours_respects_workdays_and_allocations(self):
+        """Test weekends have no capacity and allocations reduce free hours."""
+        calendar = CapacityCalendar(
+            MONDAY, 8.0, existing_allocations={MONDAY: 3.0, date(2025, 1, 7): 9.0}
+        )
+
+        assert calendar.free_hours(MONDAY) == 5.0
+        assert calendar.free_hours(date(2025, 1, 7)) == 0.0
+        assert calendar.free_hours(date(2025, 1, 11)) == 0.0  # Saturday
+        assert calendar.free_hours(MONDAY - timedelta(days=1)) == 0.0
+
+    def test_holidays_and_include_all_days(self):
+        """Test holidays are masked unless all days are included."""
+        holiday = date(2025, 1, 8)
+        checker = _FixedHolidays({holiday})
+
+        workdays = WorkdayCalendar(checker)
+        weekdays_only = CapacityCalendar(MONDAY, 8.0, workdays=workdays)
+        assert weekdays_only.free_hours(holiday) == 0.0
+        all_days = CapacityCalendar(
+            MONDAY, 8.0, workdays=workdays, include_all_days=True
+        )
+        assert all_days.free_hours(holiday) == 8.0
+        assert all_days.free_hours(date(2025, 1, 11)) == 8.0
+
+    def test_first_fit_skips_full_days_and_weekends(self):
+        """Test first_fit returns the first day with enough free hours."""
+        calendar = CapacityCalendar(
+            MONDAY,
+            8.0,
+            existing_allocations={MONDAY + timedelta(days=d): 8.0 for d in range(5)},
+        )
+
+        assert calendar.first_fit(MONDAY) == date(2025, 1, 13)
+        assert calendar.first_fit(MONDAY, end=date(2025, 1, 12)) is None
+
+    def test_first_fit_min_free(self):
+        """Test first_fit only accepts days with more than min_free hours."""
+        calendar = CapacityCalendar(
+            MONDAY, 8.0, existing_allocations={MONDAY: 5.0, date(2025, 1, 7): 2.0}
+        )
+
+        assert calendar.first_fit(MONDAY, min_free=4.0) == date(2025, 1, 7)
+        assert calendar.first_fit(MONDAY, min_free=8.0) is None
+
+    def test_first_fit_beyond_horizon(self):
+        """Test an unbounded first_fit finds capacity past the initial horizon."""
+        booked = {MONDAY + timedelta(days=d): 8.0 for d in range(500)}
+        calendar = CapacityCalendar(MONDAY, 8.0, existing_allocations=booked)
+
+        assert calendar.first_fit(MONDAY) == date(2026, 5, 21)
+
+    def test_last_fit(self):
+        """Test last_fit returns the latest day with capacity, not before origin."""
+        calendar = CapacityCalendar(
+            MONDAY, 8.0, existing_allocations={date(2025, 1, 10): 8.0}
+        )
+
+        assert calendar.last_fit(date(2025, 1, 12)) == date(2025, 1, 9)
+        assert calendar.last_fit(MONDAY - timedelta(days=1)) is None
+        assert calendar.last_fit(date(2025, 1, 12), start=date(2025, 1, 10)) is None
+
+    def test_total_free_hours(self):
+        """Test total_free_hours sums free hours over an inclusive range."""
+        calendar = CapacityCalendar(MONDAY, 8.0, existing_allocations={MONDAY: 6.0})
+
+        # Mon 2h + Tue-Fri 32h, weekend 0h
+        assert calendar.total_free_hours(MONDAY, date(2025, 1, 12)) == 34.0
+        assert calendar.total_free_hours(date(2025, 1, 12), MONDAY) == 0.0
+        # A full year of weekdays, growing the horizon
+        assert calendar.total_free_hours(date(2025, 1, 13), date(2026, 1, 11)) == (
+            52 * 5 * 8.0
+        )
+
+    def test_allocate_and_release(self):
+        """Test allocate and release keep allocations and queries in sync."""
+        calendar = CapacityCalendar(MONDAY, 8.0)
+
+        calendar.allocate(MONDAY, 8.0)
+        assert calendar.allocations == {MONDAY: 8.0}
+        assert calendar.first_fit(MONDAY) == date(2025, 1, 7)
+
+        calendar.release(MONDAY, 8.0)
+        assert calendar.allocations == {MONDAY: 0.0}
+        assert calendar.first_fit(MONDAY) == MONDAY
+
+    def test_iter_free_days(self):
+        """Test iter_free_days yields days with capacity in date order."""
+        calendar = CapacityCalendar(
+            MONDAY, 8.0, existing_allocations={date(2025, 1, 7): 8.0, MONDAY: 3.0}
+        )
+
+        assert list(calendar.iter_free_days(MONDAY, date(2025, 1, 13))) == [
+            (MONDAY, 5.0),
+            (date(2025, 1, 8), 8.0),
+            (date(2025, 1, 9), 8.0),
+            (date(2025, 1, 10), 8.0),
+            (date(2025, 1, 13), 8.0),
+        ]
+        assert list(calendar.iter_free_days(date(2025, 1, 11), date(2025, 1, 12))) == []
+
+    def test_allocate_many_matches_allocate(self):
+        """Test a batched update leaves the calendar as individual updates do."""
+        hours = {MONDAY + timedelta(days=d): 1.5 * (d % 4) for d in range(0, 200, 3)}
+        batched = CapacityCalendar(MONDAY, 8.0, existing_allocations={MONDAY: 1.0})
+        single = CapacityCalendar(MONDAY, 8.0, existing_allocations={MONDAY: 1.0})
+
+        batched.allocate_many(hours)
+        for day, value in hours.items():
+            single.allocate(day, value)
+
+        end = MONDAY + timedelta(days=255)
+        assert batched.allocations == single.allocations
+        assert batched.total_free_hours(MONDAY, end) == single.total_free_hours(
+            MONDAY, end
+        )
+        assert list(batched.iter_free_days(MONDAY, end, min_free=6.0)) == list(
+            single.iter_free_days(MONDAY, end, min_free=6.0)
+        )
+
+    def test_existing_allocations_are_copied(self):
+        """Test the calendar does not mutate the allocations it was given."""
+        existing = {MONDAY: 2.0}
+        calendar = CapacityCalendar(MONDAY, 8.0, existing_allocations=existing)
+
+        calendar.allocate(MONDAY, 4.0)
+
+        assert existing == {MONDAY: 2.0}
+        assert calendar.allocations == {MONDAY: 6.0}
+
+    def test_from_params(self):
+        """Test from_params uses the start date and daily limit."""
+        params = OptimizeParams(
+            start_date=datetime(2025, 1, 11, 9, 0), max_hours_per_day=6.0
+        )
+        calendar = CapacityCalendar.from_params(params)
+
+        assert calendar.origin == date(2025, 1, 11)
+        assert calendar.first_fit(calendar.origin) == date(2025, 1, 13)
+        assert calendar.free_hours(date(2025, 1, 13)) == 6.0
+
+
+class TestMultiYearSchedules:
+    """Strategies on schedules spanning several years of calendar."""
+
+    @pytest.mark.parametrize(
+        "algorithm",
+        ["greedy", "balanced", "backward", "round_robin", "earliest_deadline"],
+    )
+    def test_schedules_after_multi_year_booking(self, algorithm):
+        """Test tasks land after three years of fully booked days."""
+        start = datetime(2025, 1, 6, 9, 0)
+        booked = {MONDAY + timedelta(days=d): 8.0 for d in range(3 * 365)}
+        first_free = MONDAY + timedelta(days=3 * 365)
+        deadline = datetime.combine(
+            first_free + timedelta(days=60), datetime.min.time()
+        )
+        tasks = [
+            Task(id=i, name=f"Task {i}", estimated_duration=16.0, deadline=deadline)
+            for i in range(1, 6)
+        ]
+        params = OptimizeParams(start_date=start, max_hours_per_day=8.0)
+
+        result = StrategyFactory.create(algorithm).optimize_tasks(tasks, booked, params)
+
+        assert result.failures == []
+        assert len(result.tasks) == 5
+        for task in result.tasks:
+            assert task.planned_start is not None
+            assert task.planned_start.date() >= first_free
+            assert sum(task.daily_allocations.values()) == pytest.approx(16.0)
+
+    def test_long_backlog_spans_years(self):
+        """Test a backlog needing over two years of capacity is fully placed."""
+        start = datetime(2025, 1, 6, 9, 0)
+        tasks = [
+            Task(id=i, name=f"Task {i}", priority=i, estimated_duration=40.0)
+            for i in range(1, 121)
+        ]
+        params = OptimizeParams(start_date=start, max_hours_per_day=8.0)
+
+        result = StrategyFactory.create("greedy").optimize_tasks(tasks, {}, params)
+
+        assert len(result.tasks) == 120
+        last_end = max(t.planned_end for t in result.tasks if t.planned_end)
+        # 120 weeks of work
+        assert last_end.date() == MONDAY + timedelta(weeks=119, days=4)
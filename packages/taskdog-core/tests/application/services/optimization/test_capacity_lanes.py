@@ -0,0 +1,165 @@
+"""Tests for capacity lane partitioning and per-lane optimization."""
+
+from datetime import date, datetime
+
+import pytest
+
+from taskdog_core.application.constants.optimization import DEFAULT_CAPACITY_LANE
+from taskdog_core.application.dto.capacity_lane import CapacityLane
+from taskdog_core.application.dto.optimize_params import OptimizeParams
+from taskdog_core.application.services.optimization.capacity_lanes import (
+    optimize_by_lane,
+    partition_by_lane,
+    resolve_lanes,
+)
+from taskdog_core.application.services.optimization.strategy_factory import (
+    StrategyFactory,
+)
+from taskdog_core.domain.entities.task import Task
+from taskdog_core.domain.exceptions.task_exceptions import TaskValidationError
+
+# Monday
+START = datetime(2025, 10, 20, 9, 0, 0)
+
+
+def _task(task_id: int, hours: float, *tags: str) -> Task:
+    return Task(
+        id=task_id,
+        name=f"Task {task_id}",
+        priority=100 - task_id,
+        estimated_duration=hours,
+        tags=list(tags),
+    )
+
+
+class TestResolveLanes:
+    """Test cases for resolve_lanes."""
+
+    def test_adds_default_lane(self):
+        """Test tasks without a lane fall back to the run's daily limit."""
+        lanes = resolve_lanes([CapacityLane("alice", 6.0, ("alice",))], 8.0)
+
+        assert [(lane.name, lane.max_hours_per_day) for lane in lanes] == [
+            ("alice", 6.0),
+            (DEFAULT_CAPACITY_LANE, 8.0),
+        ]
+
+    def test_configured_default_lane_wins(self):
+        """Test a lane named like the default lane replaces it."""
+        lanes = resolve_lanes([CapacityLane(DEFAULT_CAPACITY_LANE, 4.0)], 8.0)
+
+        assert [lane.max_hours_per_day for lane in lanes] == [4.0]
+
+    def test_rejects_duplicates_and_invalid_limits(self):
+        """Test invalid lane definitions raise validation errors."""
+        with pytest.raises(TaskValidationError):
+            resolve_lanes([CapacityLane("a", 4.0), CapacityLane("a", 2.0)], 8.0)
+        with pytest.raises(TaskValidationError):
+            CapacityLane("a", 0.0)
+
+
+class TestPartitionByLane:
+    """Test cases for partition_by_lane."""
+
+    def test_first_matching_lane_wins(self):
+        """Test tasks go to the first lane sharing a tag, else the default."""
+        lanes = resolve_lanes(
+            [
+                CapacityLane("alice", 6.0, ("alice", "backend")),
+                CapacityLane("bob", 6.0, ("bob", "backend")),
+            ],
+            8.0,
+        )
+        tasks = [
+            _task(1, 4.0, "bob"),
+            _task(2, 4.0, "backend"),
+            _task(3, 4.0, "docs"),
+            _task(4, 4.0),
+        ]
+
+        groups = partition_by_lane(tasks, lanes)
+
+        assert {name: [t.id for t in group] for name, group in groups.items()} == {
+            "alice": [2],
+            "bob": [1],
+            DEFAULT_CAPACITY_LANE: [3, 4],
+        }
+
+
+class TestOptimizeByLane:
+    """Test cases for optimize_by_lane."""
+
+    def _run(self, lanes, tasks, allocations_by_lane=None, algorithm="greedy"):
+        resolved = resolve_lanes(lanes, 8.0)
+        return optimize_by_lane(
+            StrategyFactory.create(algorithm),
+            partition_by_lane(tasks, resolved),
+            allocations_by_lane or {},
+            OptimizeParams(start_date=START, max_hours_per_day=8.0),
+            resolved,
+        )
+
+    def test_lanes_work_in_parallel_with_own_limits(self):
+        """Test each lane fills its own capacity on the same days."""
+        result = self._run(
+            [
+                CapacityLane("alice", 6.0, ("alice",)),
+                CapacityLane("bob", 4.0, ("bob",)),
+            ],
+            [_task(1, 12.0, "alice"), _task(2, 8.0, "bob")],
+        )
+
+        assert not result.failures
+        assert result.lane_allocations["alice"] == {
+            date(2025, 10, 20): 6.0,
+            date(2025, 10, 21): 6.0,
+        }
+        assert result.lane_allocations["bob"] == {
+            date(2025, 10, 20): 4.0,
+            date(2025, 10, 21): 4.0,
+        }
+        assert result.daily_allocations == {
+            date(2025, 10, 20): 10.0,
+            date(2025, 10, 21): 10.0,
+        }
+
+    def test_lane_days_off_and_existing_allocations(self):
+        """Test a lane skips its days off and respects its booked hours."""
+        result = self._run(
+            [
+                CapacityLane(
+                    "alice", 8.0, ("alice",), days_off=frozenset({date(2025, 10, 20)})
+                )
+            ],
+            [_task(1, 8.0, "alice"), _task(2, 8.0)],
+            {DEFAULT_CAPACITY_LANE: {date(2025, 10, 20): 8.0}},
+        )
+
+        scheduled = {t.id: t.planned_start.date() for t in result.tasks}
+        assert scheduled == {1: date(2025, 10, 21), 2: date(2025, 10, 21)}
+        assert result.lane_allocations[DEFAULT_CAPACITY_LANE][date(2025, 10, 20)] == 8.0
+
+    def test_empty_lane_keeps_existing_allocations(self):
+        """Test a lane without tasks still reports its booked hours."""
+        result = self._run(
+            [CapacityLane("alice", 8.0, ("alice",))],
+            [_task(1, 4.0)],
+            {"alice": {date(2025, 10, 20): 3.0}},
+        )
+
+        assert result.lane_allocations["alice"] == {date(2025, 10, 20): 3.0}
+        assert result.daily_allocations[date(2025, 10, 20)] == 7.0
+
+    def test_counters_are_summed_over_lanes(self):
+        """Test strategy counters of all lanes add up."""
+        lanes = [CapacityLane("alice", 8.0, ("alice",))]
+        single = self._run(lanes, [_task(1, 4.0, "alice")], algorithm="exact")
+
+        result = self._run(
+            lanes, [_task(1, 4.0, "alice"), _task(2, 4.0)], algorithm="exact"
+        )
+
+        assert single.counters["nodes_explored"] > 0
+        assert (
+            result.counters["nodes_explored"] == 2 * (single.counters["nodes_explored"])
+        )
@@ -0,0 +1,61 @@
+"""Tests for compute_data_version."""
+
+from datetime import date, datetime
+
+from taskdog_core.application.services.optimization.data_version import (
+    compute_data_version,
+)
+from taskdog_core.domain.entities.task import Task, TaskStatus
+
+
+def _tasks() -> list[Task]:
+    return [
+        Task(id=1, name="Task 1", priority=1, estimated_duration=8.0),
+        Task(
+            id=2,
+            name="Task 2",
+            priority=2,
+            estimated_duration=4.0,
+            planned_start=datetime(2025, 10, 15, 9, 0, 0),
+            planned_end=datetime(2025, 10, 15, 13, 0, 0),
+            daily_allocations={date(2025, 10, 15): 4.0},
+            depends_on=[1],
+        ),
+    ]
+
+
+class TestComputeDataVersion:
+    """Test cases for compute_data_version."""
+
+    def test_independent_of_task_order(self):
+        """Test the version does not depend on repository order."""
+        tasks = _tasks()
+
+        assert compute_data_version(tasks) == compute_data_version(tasks[::-1])
+
+    def test_ignores_fields_optimizers_do_not_read(self):
+        """Test renaming or tagging a task keeps the version."""
+        before = compute_data_version(_tasks())
+        tasks = _tasks()
+        tasks[0].name = "Renamed"
+        tasks[0].tags = ["docs"]
+
+        assert compute_data_version(tasks) == before
+
+    def test_changes_with_scheduling_state(self):
+        """Test each scheduling-relevant change produces a new version."""
+        before = compute_data_version(_tasks())
+        edits = [
+            lambda t: setattr(t[0], "status", TaskStatus.IN_PROGRESS),
+            lambda t: setattr(t[0], "estimated_duration", 6.0),
+            lambda t: setattr(t[0], "deadline", datetime(2025, 10, 20, 18, 0, 0)),
+            lambda t: setattr(t[0], "is_fixed", True),
+            lambda t: t[1].clear_schedule(),
+            lambda t: t[1].depends_on.clear(),
+            lambda t: t.pop(),
+        ]
+
+        for edit in edits:
+            tasks = _tasks()
+            edit(tasks)
+            assert compute_data_version(tasks) != before
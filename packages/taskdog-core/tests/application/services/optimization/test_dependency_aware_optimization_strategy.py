@@ -186,3 +186,87 @@ class TestDependencyAwareOptimizationStrategy(BaseOptimizationStrategyTest):
         assert updated_medium.planned_start == datetime(2025, 10, 21, 0, 0, 0)
         # Latest deadline should be last
         assert updated_high.planned_start == datetime(2025, 10, 22, 0, 0, 0)
+
+    def _add_dependency(self, task, prerequisite):
+        task.add_dependency(prerequisite.id)
+        self.repository.save(task)
+
+    def test_dependent_starts_after_prerequisite_finishes(self):
+        """Test a dependent is planned after its prerequisite's last day."""
+        dependent = self.create_task(
+            "Dependent",
+            priority=100,
+            estimated_duration=3.0,
+            deadline=datetime(2025, 10, 22, 18, 0, 0),
+        )
+        prerequisite = self.create_task(
+            "Prerequisite", priority=10, estimated_duration=9.0
+        )
+        self._add_dependency(dependent, prerequisite)
+
+        result = self.optimize_schedule(start_date=datetime(2025, 10, 20, 9, 0, 0))
+
+        assert len(result.successful_tasks) == 2
+        updated_prereq = self.repository.get_by_id(prerequisite.id)
+        updated_dependent = self.repository.get_by_id(dependent.id)
+        assert updated_prereq is not None and updated_dependent is not None
+        assert updated_prereq.planned_end == datetime(2025, 10, 21, 23, 59, 59)
+        assert updated_dependent.planned_start == datetime(2025, 10, 22, 0, 0, 0)
+
+    def test_least_slack_chain_goes_first(self):
+        """Test prerequisites of an urgent chain are scheduled before idle work."""
+        idle = self.create_task(
+            "Idle", priority=100, estimated_duration=6.0, deadline=None
+        )
+        first = self.create_task("Chain 1", priority=1, estimated_duration=6.0)
+        second = self.create_task(
+            "Chain 2",
+            priority=1,
+            estimated_duration=6.0,
+            deadline=datetime(2025, 10, 21, 18, 0, 0),
+        )
+        self._add_dependency(second, first)
+
+        result = self.optimize_schedule(start_date=datetime(2025, 10, 20, 9, 0, 0))
+
+        assert len(result.successful_tasks) == 3
+        planned = {
+            task.id: self.repository.get_by_id(task.id).planned_start  # type: ignore[union-attr]
+            for task in (idle, first, second)
+        }
+        assert planned[first.id] == datetime(2025, 10, 20, 0, 0, 0)
+        assert planned[second.id] == datetime(2025, 10, 21, 0, 0, 0)
+        assert planned[idle.id] == datetime(2025, 10, 22, 0, 0, 0)
+
+    def test_dependent_of_failed_prerequisite_fails(self):
+        """Test a dependent is not scheduled when its prerequisite fails."""
+        prerequisite = self.create_task(
+            "Impossible",
+            estimated_duration=30.0,
+            deadline=datetime(2025, 10, 21, 18, 0, 0),
+        )
+        dependent = self.create_task("Dependent", estimated_duration=2.0)
+        self._add_dependency(dependent, prerequisite)
+
+        result = self.optimize_schedule(start_date=datetime(2025, 10, 20, 9, 0, 0))
+
+        assert result.successful_tasks == []
+        reasons = {failure.task.id: failure.reason for failure in result.failed_tasks}
+        assert str(prerequisite.id) in reasons[dependent.id]
+
+    def test_summary_reports_critical_path(self):
+        """Test the optimization summary carries the longest chain."""
+        a = self.create_task("A", estimated_duration=12.0)
+        b = self.create_task("B", estimated_duration=6.0)
+        c = self.create_task("C", estimated_duration=3.0)
+        self.create_task("Independent", estimated_duration=6.0)
+        self._add_dependency(b, a)
+        self._add_dependency(c, b)
+
+        result = self.optimize_schedule(start_date=datetime(2025, 10, 20, 9, 0, 0))
+
+        critical_path = result.summary.critical_path
+        assert critical_path is not None
+        assert critical_path.task_ids == [a.id, b.id, c.id]
+        assert critical_path.total_hours == 21.0
+        assert critical_path.length_days == 4
@@ -0,0 +1,210 @@
+"""Tests for ExactOptimizationStrategy."""
+
+import itertools
+from datetime import datetime
+
+import pytest
+
+from taskdog_core.application.dto.optimize_params import OptimizeParams
+from taskdog_core.application.services.optimization.capacity_calendar import (
+    CapacityCalendar,
+)
+from taskdog_core.application.services.optimization.exact_optimization_strategy import (
+    ExactOptimizationStrategy,
+)
+from taskdog_core.application.services.optimization.greedy_optimization_strategy import (
+    GreedyOptimizationStrategy,
+)
+from taskdog_core.application.services.optimization.monte_carlo_optimization_strategy import (
+    MonteCarloOptimizationStrategy,
+)
+from taskdog_core.application.services.optimization.schedule_fitness_calculator import (
+    ScheduleFitnessCalculator,
+)
+from taskdog_core.domain.entities.task import Task
+from taskdog_core.domain.exceptions.task_exceptions import OptimizationCancelledError
+from tests.application.services.optimization.optimization_strategy_test_base import (
+    BaseOptimizationStrategyTest,
+)
+
+START = datetime(2025, 10, 20, 9, 0, 0)  # Monday
+
+
+def _params(**kwargs) -> OptimizeParams:
+    return OptimizeParams(start_date=START, max_hours_per_day=6.0, **kwargs)
+
+
+def _score(order: list[Task], existing: dict, params: OptimizeParams) -> float:
+    """Fitness of scheduling the tasks greedily in the given order."""
+    greedy = GreedyOptimizationStrategy()
+    calendar = CapacityCalendar.from_params(params, existing)
+    scheduled = [
+        scheduled_task
+        for task in order
+        if (scheduled_task := greedy._allocate_task(task, calendar, params))
+    ]
+    return ScheduleFitnessCalculator().calculate_fitness(
+        scheduled, calendar.allocations, include_scheduling_bonus=True
+    )
+
+
+def _backlog() -> list[Task]:
+    """Tasks whose greedy (deadline-first) order is not the best one."""
+    deadline = datetime(2025, 10, 23, 18, 0, 0)
+    return [
+        Task(id=1, name="A", priority=10, estimated_duration=6.0, deadline=deadline),
+        Task(id=2, name="B", priority=50, estimated_duration=12.0),
+        Task(id=3, name="C", priority=10, estimated_duration=6.0, deadline=deadline),
+    ]
+
+
+class TestExactOptimizationStrategy(BaseOptimizationStrategyTest):
+    """Test cases for ExactOptimizationStrategy through the use case."""
+
+    algorithm_name = "exact"
+
+    def test_exact_schedules_tasks_within_deadlines(self):
+        """Test that all tasks are scheduled and deadlines are met."""
+        deadline = datetime(2025, 10, 24, 18, 0, 0)
+        tasks = [
+            self.create_task(f"Task {i}", priority=10 * i, deadline=deadline)
+            for i in range(1, 4)
+        ]
+
+        result = self.optimize_schedule(start_date=START)
+
+        assert len(result.successful_tasks) == 3
+        for task in tasks:
+            self.assert_task_scheduled(task)
+            self.assert_total_allocated_hours(task, 10.0)
+            updated = self.repository.get_by_id(task.id)
+            assert updated.planned_end <= datetime(2025, 10, 24, 23, 59, 59)
+
+    def test_exact_reports_search_stats(self):
+        """Test the summary reports the nodes explored and optimality."""
+        self.create_task("Task 1", priority=100, estimated_duration=6.0)
+        self.create_task("Task 2", priority=50, estimated_duration=6.0)
+
+        result = self.optimize_schedule(start_date=START)
+
+        stats = result.summary.search_stats
+        assert stats is not None
+        assert stats.optimal is True
+        assert stats.fallback is None
+        assert stats.nodes_explored > 0
+        assert stats.nodes_per_second >= 0.0
+
+    def test_exact_fails_impossible_deadlines(self):
+        """Test that tasks which cannot meet their deadline fail."""
+        self.create_task(
+            "Too big",
+            estimated_duration=30.0,
+            deadline=datetime(2025, 10, 21, 18, 0, 0),
+        )
+
+        result = self.optimize_schedule(start_date=START)
+
+        assert len(result.failed_tasks) == 1
+
+    def test_non_exact_run_has_no_search_stats(self):
+        """Test other algorithms leave search_stats empty."""
+        self.create_task("Task", estimated_duration=6.0)
+        self.algorithm_name = "greedy"
+
+        result = self.optimize_schedule(start_date=START)
+
+        assert result.summary.search_stats is None
+
+
+class TestExactOptimizationStrategyUnit:
+    """Unit tests for the branch and bound search."""
+
+    def test_finds_better_order_than_greedy(self):
+        """Test the high-priority task without deadline is moved first."""
+        params = _params()
+
+        result = ExactOptimizationStrategy().optimize_tasks(_backlog(), {}, params)
+
+        assert [t.id for t in result.tasks] == [2, 1, 3]
+        greedy = GreedyOptimizationStrategy().optimize_tasks(_backlog(), {}, params)
+        assert _score(result.tasks, {}, params) > _score(greedy.tasks, {}, params)
+
+    def test_matches_best_of_all_orderings(self):
+        """Test the result scores as high as the best permutation."""
+        deadline = datetime(2025, 10, 27, 18, 0, 0)
+        tasks = [
+            Task(id=1, name="A", priority=30, estimated_duration=8.0),
+            Task(id=2, name="B", priority=90, estimated_duration=14.0),
+            Task(
+                id=3, name="C", priority=60, estimated_duration=5.0, deadline=deadline
+            ),
+            Task(id=4, name="D", priority=20, estimated_duration=3.0),
+            Task(
+                id=5, name="E", priority=70, estimated_duration=9.0, deadline=deadline
+            ),
+        ]
+        existing = {START.date(): 4.0}
+        params = _params()
+
+        result = ExactOptimizationStrategy().optimize_tasks(tasks, existing, params)
+
+        best = max(
+            _score(list(order), existing, params)
+            for order in itertools.permutations(tasks)
+        )
+        assert _score(result.tasks, existing, params) == pytest.approx(best)
+        monte_carlo = MonteCarloOptimizationStrategy().optimize_tasks(
+            tasks, existing, params
+        )
+        assert _score(result.tasks, existing, params) >= _score(
+            monte_carlo.tasks, existing, params
+        )
+
+    def test_memoization_prunes_equivalent_orderings(self):
+        """Test identical tasks are not explored in every permutation."""
+        tasks = [
+            Task(id=i, name=f"Task {i}", priority=50, estimated_duration=6.0)
+            for i in range(1, 8)
+        ]
+
+        result = ExactOptimizationStrategy().optimize_tasks(tasks, {}, _params())
+
+        assert len(result.tasks) == 7
+        assert result.search_stats.optimal is True
+        # 7! = 5040 orderings, but only 2^7 scheduled sets
+        assert result.search_stats.nodes_explored <= 2**7 * 7
+
+    def test_too_many_tasks_fall_back_to_greedy(self, monkeypatch):
+        """Test backlogs above MAX_TASKS use the greedy ordering."""
+        monkeypatch.setattr(ExactOptimizationStrategy, "MAX_TASKS", 2)
+
+        result = ExactOptimizationStrategy().optimize_tasks(_backlog(), {}, _params())
+
+        assert [t.id for t in result.tasks] == [1, 3, 2]
+        assert result.search_stats.fallback == "size"
+        assert result.search_stats.optimal is False
+        assert result.search_stats.nodes_explored == 0
+
+    def test_time_limit_keeps_best_order_so_far(self, monkeypatch):
+        """Test a search cut short still returns a full schedule."""
+        monkeypatch.setattr(ExactOptimizationStrategy, "TIME_LIMIT_SECONDS", 0.0)
+
+        result = ExactOptimizationStrategy().optimize_tasks(_backlog(), {}, _params())
+
+        assert len(result.tasks) == 3
+        assert result.search_stats.fallback == "time"
+        assert result.search_stats.optimal is False
+
+    def test_empty_task_list(self):
+        """Test an empty backlog returns an empty result."""
+        result = ExactOptimizationStrategy().optimize_tasks([], {}, _params())
+
+        assert result.tasks == []
+        assert result.search_stats is None
+
+    def test_cancellation_propagates(self):
+        """Test a cancelled run stops the search."""
+        with pytest.raises(OptimizationCancelledError):
+            ExactOptimizationStrategy().optimize_tasks(
+                _backlog(), {}, _params(cancellation_check=lambda: True)
+            )
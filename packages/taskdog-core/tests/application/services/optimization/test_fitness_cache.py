@@ -0,0 +1,181 @@
+"""Tests for FitnessCache and the strategies sharing it."""
+
+from datetime import date, datetime
+
+import pytest
+
+from taskdog_core.application.dto.optimize_params import OptimizeParams
+from taskdog_core.application.services.optimization.fitness_cache import (
+    FitnessCache,
+    fitness_fingerprint,
+)
+from taskdog_core.application.services.optimization.genetic_optimization_strategy import (
+    GeneticOptimizationStrategy,
+)
+from taskdog_core.application.services.optimization.monte_carlo_optimization_strategy import (
+    MonteCarloOptimizationStrategy,
+)
+from taskdog_core.domain.entities.task import Task
+
+START = datetime(2025, 1, 6, 9, 0)
+
+
+def _tasks() -> list[Task]:
+    return [
+        Task(
+            id=i,
+            name=f"Task {i}",
+            priority=i * 10,
+            estimated_duration=4.0 + i,
+            deadline=datetime(2025, 1, 17, 18, 0),
+        )
+        for i in range(1, 7)
+    ]
+
+
+def _params(**overrides) -> OptimizeParams:
+    values = {"start_date": START, "max_hours_per_day": 6.0}
+    values.update(overrides)
+    return OptimizeParams(**values)
+
+
+class TestFitnessCache:
+    """Test cases for the LRU cache itself."""
+
+    def test_get_put_and_hit_rate(self):
+        """Test hits and misses are counted per lookup."""
+        cache = FitnessCache(max_entries=4)
+        key = cache.ordering_key(b"inputs", _tasks())
+
+        assert cache.get(key) is None
+        cache.put(key, 12.5)
+        assert cache.get(key) == 12.5
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_evicts_least_recently_used(self):
+        """Test the cache never exceeds max_entries."""
+        cache = FitnessCache(max_entries=2)
+        keys = [cache.ordering_key(bytes([i]), []) for i in range(3)]
+
+        cache.put(keys[0], 0.0)
+        cache.put(keys[1], 1.0)
+        cache.get(keys[0])  # keys[1] is now least recently used
+        cache.put(keys[2], 2.0)
+
+        assert len(cache) == 2
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == 0.0
+        assert cache.get(keys[2]) == 2.0
+
+    def test_rejects_non_positive_size(self):
+        """Test the cache must hold at least one entry."""
+        with pytest.raises(ValueError):
+            FitnessCache(max_entries=0)
+
+    def test_ordering_key_depends_on_order_and_fingerprint(self):
+        """Test keys differ for other orderings and other inputs."""
+        tasks = _tasks()
+        key = FitnessCache.ordering_key(b"a", tasks)
+
+        assert key == FitnessCache.ordering_key(b"a", list(tasks))
+        assert key != FitnessCache.ordering_key(b"a", tasks[::-1])
+        assert key != FitnessCache.ordering_key(b"b", tasks)
+
+    def test_clear_resets_entries_and_counters(self):
+        """Test clear() empties the cache."""
+        cache = FitnessCache()
+        key = cache.ordering_key(b"", [])
+        cache.put(key, 1.0)
+        cache.get(key)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats().hits == 0
+
+
+class TestFitnessFingerprint:
+    """Test cases for the input fingerprint."""
+
+    def test_independent_of_task_order(self):
+        """Test the fingerprint covers the task set, not its order."""
+        tasks = _tasks()
+        params = _params()
+
+        assert fitness_fingerprint("x", tasks, params) == fitness_fingerprint(
+            "x", tasks[::-1], params
+        )
+
+    def test_changes_with_inputs(self):
+        """Test estimates, allocations, parameters and namespace all count."""
+        tasks = _tasks()
+        params = _params()
+        base = fitness_fingerprint("x", tasks, params)
+
+        changed = _tasks()
+        changed[0].estimated_duration = 20.0
+
+        assert fitness_fingerprint("y", tasks, params) != base
+        assert fitness_fingerprint("x", changed, params) != base
+        assert fitness_fingerprint("x", tasks, params, {date(2025, 1, 6): 2.0}) != base
+        assert fitness_fingerprint("x", tasks, _params(max_hours_per_day=8.0)) != base
+        assert fitness_fingerprint("x", tasks, _params(include_all_days=True)) != base
+
+    def test_seed_is_not_part_of_fingerprint(self):
+        """Test runs with other seeds can reuse evaluations."""
+        tasks = _tasks()
+
+        assert fitness_fingerprint("x", tasks, _params(seed=1)) == (
+            fitness_fingerprint("x", tasks, _params(seed=2))
+        )
+
+
+class TestCrossRunReuse:
+    """Strategies reuse evaluations across runs through a shared cache."""
+
+    @pytest.mark.parametrize(
+        "strategy_class",
+        [GeneticOptimizationStrategy, MonteCarloOptimizationStrategy],
+    )
+    def test_second_run_is_served_from_cache(self, strategy_class):
+        """Test re-optimizing unchanged input only hits the cache."""
+        cache = FitnessCache()
+        existing = {date(2025, 1, 7): 3.0}
+
+        first = strategy_class(cache).optimize_tasks(_tasks(), existing, _params())
+        misses = cache.stats().misses
+        second = strategy_class(cache).optimize_tasks(_tasks(), existing, _params())
+
+        assert cache.stats().misses == misses
+        assert cache.stats().hits > 0
+        assert [
+            (t.id, t.planned_start, t.planned_end, t.daily_allocations)
+            for t in second.tasks
+        ] == [
+            (t.id, t.planned_start, t.planned_end, t.daily_allocations)
+            for t in first.tasks
+        ]
+        assert second.daily_allocations == first.daily_allocations
+
+    def test_changed_input_is_evaluated_again(self):
+        """Test a changed estimate does not reuse stale scores."""
+        cache = FitnessCache()
+        GeneticOptimizationStrategy(cache).optimize_tasks(_tasks(), {}, _params())
+        misses = cache.stats().misses
+
+        changed = _tasks()
+        changed[2].estimated_duration = 30.0
+        GeneticOptimizationStrategy(cache).optimize_tasks(changed, {}, _params())
+
+        assert cache.stats().misses > misses
+
+    def test_cache_stays_bounded(self):
+        """Test a small cache evicts instead of growing."""
+        cache = FitnessCache(max_entries=5)
+
+        MonteCarloOptimizationStrategy(cache).optimize_tasks(_tasks(), {}, _params())
+
+        assert len(cache) == 5
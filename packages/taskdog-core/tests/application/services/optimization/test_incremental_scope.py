@@ -0,0 +1,104 @@
+"""Tests for incremental re-optimization scoping helpers."""
+
+from datetime import date, datetime
+
+from taskdog_core.application.services.optimization.incremental_scope import (
+    collect_allocation_days,
+    find_competing_tasks,
+    find_downstream_dependents,
+)
+from taskdog_core.domain.entities.task import Task, TaskStatus
+
+
+class TestFindDownstreamDependents:
+    """Test cases for find_downstream_dependents."""
+
+    def test_transitive_dependents(self):
+        """Test dependents of dependents are included."""
+        tasks = [
+            Task(id=1, name="A"),
+            Task(id=2, name="B", depends_on=[1]),
+            Task(id=3, name="C", depends_on=[2]),
+            Task(id=4, name="D"),
+        ]
+
+        assert find_downstream_dependents(tasks, [1]) == {2, 3}
+
+    def test_no_dependents(self):
+        """Test a leaf task has no dependents."""
+        tasks = [Task(id=1, name="A"), Task(id=2, name="B", depends_on=[1])]
+
+        assert find_downstream_dependents(tasks, [2]) == set()
+
+    def test_diamond_visits_each_task_once(self):
+        """Test shared dependents are reported once."""
+        tasks = [
+            Task(id=1, name="A"),
+            Task(id=2, name="B", depends_on=[1]),
+            Task(id=3, name="C", depends_on=[1]),
+            Task(id=4, name="D", depends_on=[2, 3]),
+        ]
+
+        assert find_downstream_dependents(tasks, [1]) == {2, 3, 4}
+
+
+class TestCollectAllocationDays:
+    """Test cases for collect_allocation_days."""
+
+    def test_ignores_zero_hour_days(self):
+        """Test days with no allocated hours are skipped."""
+        tasks = [
+            Task(
+                id=1,
+                name="A",
+                daily_allocations={date(2025, 10, 20): 4.0, date(2025, 10, 21): 0.0},
+            ),
+            Task(id=2, name="B", daily_allocations={date(2025, 10, 22): 2.0}),
+        ]
+
+        assert collect_allocation_days(tasks) == {
+            date(2025, 10, 20),
+            date(2025, 10, 22),
+        }
+
+
+class TestFindCompetingTasks:
+    """Test cases for find_competing_tasks."""
+
+    def _scheduled(self, task_id, day, **kwargs):
+        return Task(
+            id=task_id,
+            name=f"Task {task_id}",
+            estimated_duration=4.0,
+            planned_start=datetime.combine(day, datetime.min.time()),
+            planned_end=datetime.combine(day, datetime.max.time()),
+            daily_allocations={day: 4.0},
+            **kwargs,
+        )
+
+    def test_tasks_reaching_window_compete(self):
+        """Test tasks scheduled on or after the window start compete."""
+        tasks = [
+            self._scheduled(1, date(2025, 10, 20)),
+            self._scheduled(2, date(2025, 10, 21)),
+            self._scheduled(3, date(2025, 10, 22)),
+        ]
+
+        competing = find_competing_tasks(tasks, set(), date(2025, 10, 21))
+
+        assert [t.id for t in competing] == [2, 3]
+
+    def test_excludes_affected_and_unmovable_tasks(self):
+        """Test affected, fixed, in-progress and unscheduled tasks never compete."""
+        day = date(2025, 10, 21)
+        tasks = [
+            self._scheduled(1, day),
+            self._scheduled(2, day, is_fixed=True),
+            self._scheduled(3, day, status=TaskStatus.IN_PROGRESS),
+            Task(id=4, name="Unscheduled", estimated_duration=4.0),
+            self._scheduled(5, day),
+        ]
+
+        competing = find_competing_tasks(tasks, {1}, day)
+
+        assert [t.id for t in competing] == [5]
@@ -2,6 +2,10 @@
 
 from datetime import date, datetime
 
+from taskdog_core.application.dto.optimize_params import OptimizeParams
+from taskdog_core.application.services.optimization.monte_carlo_optimization_strategy import (
+    MonteCarloOptimizationStrategy,
+)
 from tests.application.services.optimization.optimization_strategy_test_base import (
     BaseOptimizationStrategyTest,
 )
@@ -223,3 +227,24 @@ class TestMonteCarloOptimizationStrategy(BaseOptimizationStrategyTest):
                 assert updated_task.planned_end <= updated_task.deadline, (
                     f"Task {updated_task.name} exceeds deadline"
                 )
+
+    def test_monte_carlo_reports_counters(self):
+        """Test the run counts its simulations and evaluations."""
+        for i in range(3):
+            self.create_task(f"Task {i}", priority=10 * (i + 1), estimated_duration=4.0)
+
+        result = MonteCarloOptimizationStrategy().optimize_tasks(
+            self.repository.get_all(),
+            {},
+            OptimizeParams(
+                start_date=datetime(2025, 10, 20, 9, 0, 0),
+                max_hours_per_day=6.0,
+                num_simulations=40,
+            ),
+        )
+
+        counters = result.counters
+        assert counters["simulations"] == 40
+        # 3 tasks only have 6 orderings, the other draws are duplicates
+        assert counters["evaluations"] + counters["cache_hits"] <= 6
+        assert counters["duplicates_skipped"] >= 34
@@ -1,10 +1,13 @@
 """Determinism tests for randomized optimization strategies (issue #963)."""
 
+from dataclasses import replace
 from datetime import datetime
 
 import pytest
 
 from taskdog_core.application.dto.optimize_params import OptimizeParams
+from taskdog_core.application.dto.optimize_result import OptimizeResult
+from taskdog_core.application.services.optimization.fitness_cache import FitnessCache
 from taskdog_core.application.services.optimization.genetic_optimization_strategy import (
     GeneticOptimizationStrategy,
 )
@@ -12,6 +15,7 @@ from taskdog_core.application.services.optimization.monte_carlo_optimization_str
     MonteCarloOptimizationStrategy,
 )
 from taskdog_core.domain.entities.task import Task
+from taskdog_core.domain.exceptions.task_exceptions import OptimizationCancelledError
 
 
 def _make_tasks() -> list[Task]:
@@ -73,3 +77,81 @@ class TestOptimizationDeterminism:
             .tasks
         ]
         assert order_a == order_b
+
+
+class TestChunkedMonteCarloDeterminism:
+    """Chunked Monte Carlo runs depend on the seed and simulation count only."""
+
+    @staticmethod
+    def _run(
+        seed: int,
+        num_simulations: int,
+        max_workers: int = 1,
+        fitness_cache: FitnessCache | None = None,
+    ) -> OptimizeResult:
+        strategy = MonteCarloOptimizationStrategy(fitness_cache=fitness_cache)
+        strategy.MAX_WORKERS = max_workers
+        params = replace(_params(seed), num_simulations=num_simulations)
+        return strategy.optimize_tasks(_make_tasks(), {}, params)
+
+    @pytest.mark.usefixtures("process_pool")
+    def test_worker_count_does_not_change_result(self):
+        sequential = self._run(seed=7, num_simulations=300, max_workers=1)
+        parallel = self._run(seed=7, num_simulations=300, max_workers=4)
+
+        assert [t.id for t in sequential.tasks] == [t.id for t in parallel.tasks]
+        for result in (sequential, parallel):
+            counters = result.counters
+            assert counters["simulations"] == 300
+            # Every simulation is either a duplicate, a cache hit or evaluated
+            assert (
+                counters["duplicates_skipped"]
+                + counters["evaluations"]
+                + counters["cache_hits"]
+                == 300
+            )
+        assert (
+            sequential.counters["duplicates_skipped"]
+            == parallel.counters["duplicates_skipped"]
+        )
+
+    def test_warm_cache_does_not_change_result(self):
+        cache = FitnessCache()
+        cold = self._run(seed=7, num_simulations=300, fitness_cache=cache)
+        warm = self._run(seed=7, num_simulations=300, fitness_cache=cache)
+        assert [t.id for t in cold.tasks] == [t.id for t in warm.tasks]
+        assert warm.counters["evaluations"] == 0
+
+    @pytest.mark.usefixtures("process_pool")
+    def test_cancellation_is_checked_between_chunks(self):
+        checks = []
+
+        def cancel_after_first_chunk() -> bool:
+            checks.append(1)
+            return len(checks) > 2
+
+        strategy = MonteCarloOptimizationStrategy(fitness_cache=FitnessCache())
+        params = replace(
+            _params(7),
+            num_simulations=300,
+            cancellation_check=cancel_after_first_chunk,
+        )
+
+        with pytest.raises(OptimizationCancelledError):
+            strategy.optimize_tasks(_make_tasks(), {}, params)
+
+    def test_simulation_count_is_configurable(self):
+        calls = []
+        strategy = MonteCarloOptimizationStrategy(fitness_cache=FitnessCache())
+        original = strategy._evaluate_ordering
+
+        def counting(*args):
+            calls.append(1)
+            return original(*args)
+
+        strategy._evaluate_ordering = counting  # type: ignore[method-assign]
+        tasks = _make_tasks()
+        strategy.optimize_tasks(tasks, {}, replace(_params(1), num_simulations=3))
+
+        # Each simulation evaluates at most one new ordering
+        assert 1 <= len(calls) <= 3
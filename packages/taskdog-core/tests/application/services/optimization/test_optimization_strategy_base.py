@@ -5,7 +5,6 @@ from datetime import date, datetime
 from taskdog_core.application.services.optimization.allocation_helpers import (
     SCHEDULE_END_TIME,
     SCHEDULE_START_TIME,
-    calculate_available_hours,
     prepare_task_for_allocation,
     set_planned_times,
 )
@@ -19,48 +18,6 @@ class TestOptimizationStrategyHelpers:
     from individual strategy classes to eliminate code duplication.
     """
 
-    def test_calculate_available_hours_with_no_allocation(self):
-        """Test available hours calculation when no hours are allocated."""
-        daily_allocations: dict[date, float] = {}
-        date_obj = date(2025, 10, 20)
-        max_hours_per_day = 8.0
-
-        available = calculate_available_hours(
-            daily_allocations,
-            date_obj,
-            max_hours_per_day,
-        )
-
-        assert available == 8.0
-
-    def test_calculate_available_hours_with_partial_allocation(self):
-        """Test available hours when some hours are already allocated."""
-        daily_allocations = {date(2025, 10, 20): 3.0}
-        date_obj = date(2025, 10, 20)
-        max_hours_per_day = 8.0
-
-        available = calculate_available_hours(
-            daily_allocations,
-            date_obj,
-            max_hours_per_day,
-        )
-
-        assert available == 5.0  # 8.0 - 3.0
-
-    def test_calculate_available_hours_fully_allocated(self):
-        """Test available hours when day is fully allocated."""
-        daily_allocations = {date(2025, 10, 20): 8.0}
-        date_obj = date(2025, 10, 20)
-        max_hours_per_day = 8.0
-
-        available = calculate_available_hours(
-            daily_allocations,
-            date_obj,
-            max_hours_per_day,
-        )
-
-        assert available == 0.0
-
     def test_set_planned_times(self):
         """Test setting planned start, end, and daily allocations on task."""
         task = Task(
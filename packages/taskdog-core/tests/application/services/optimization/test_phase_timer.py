@@ -0,0 +1,50 @@
+"""Tests for PhaseTimer."""
+
+from unittest.mock import patch
+
+from taskdog_core.application.services.optimization.phase_timer import PhaseTimer
+
+_CLOCK = "taskdog_core.application.services.optimization.phase_timer.time.perf_counter"
+
+
+class TestPhaseTimer:
+    """Test cases for PhaseTimer."""
+
+    def test_repeated_phases_accumulate_in_first_run_order(self):
+        """Test a phase timed twice reports the sum of both runs."""
+        ticks = iter([0.0, 1.0, 1.5, 2.0, 4.0, 5.0, 5.25, 6.0])
+        with patch(_CLOCK, side_effect=lambda: next(ticks)):
+            timer = PhaseTimer()
+            with timer.phase("strategy"):
+                pass
+            with timer.phase("persist"):
+                pass
+            with timer.phase("strategy"):
+                pass
+
+            assert timer.phases == {"strategy": 0.75, "persist": 2.0}
+            assert list(timer.phases) == ["strategy", "persist"]
+            assert timer.elapsed() == 6.0
+
+    def test_phase_is_recorded_when_block_raises(self):
+        """Test the time of a failing phase is still counted."""
+        timer = PhaseTimer()
+
+        try:
+            with timer.phase("strategy"):
+                raise ValueError("boom")
+        except ValueError:
+            pass
+
+        assert "strategy" in timer.phases
+        assert timer.phases["strategy"] >= 0.0
+
+    def test_phases_returns_a_copy(self):
+        """Test callers cannot change the recorded timings."""
+        timer = PhaseTimer()
+        with timer.phase("load_tasks"):
+            pass
+
+        timer.phases["load_tasks"] = 99.0
+
+        assert timer.phases["load_tasks"] != 99.0
@@ -0,0 +1,236 @@
+"""Tests for PortfolioOptimizationStrategy."""
+
+from datetime import date, datetime
+
+import pytest
+
+from taskdog_core.application.constants.optimization import (
+    PORTFOLIO_DEFAULT_ALGORITHMS,
+)
+from taskdog_core.application.dto.optimize_params import OptimizeParams
+from taskdog_core.application.dto.optimize_schedule_input import OptimizeScheduleInput
+from taskdog_core.application.services.optimization.portfolio_optimization_strategy import (
+    PortfolioOptimizationStrategy,
+)
+from taskdog_core.application.services.optimization.schedule_fitness_calculator import (
+    ScheduleFitnessCalculator,
+)
+from taskdog_core.application.services.optimization.strategy_factory import (
+    StrategyFactory,
+)
+from taskdog_core.domain.exceptions.task_exceptions import OptimizationCancelledError
+from tests.application.services.optimization.optimization_strategy_test_base import (
+    BaseOptimizationStrategyTest,
+)
+
+START = datetime(2025, 10, 20, 9, 0, 0)  # Monday
+
+
+class TestPortfolioOptimizationStrategy(BaseOptimizationStrategyTest):
+    """Test cases for PortfolioOptimizationStrategy."""
+
+    algorithm_name = "portfolio"
+
+    def _optimize(self, portfolio_algorithms=None):
+        return self.optimize_use_case.execute(
+            OptimizeScheduleInput(
+                start_date=START,
+                max_hours_per_day=6.0,
+                force_override=False,
+                algorithm_name=self.algorithm_name,
+                portfolio_algorithms=portfolio_algorithms,
+            )
+        )
+
+    def _preview(self, algorithm):
+        """Dry-run a single strategy and return its planned (start, end) by ID."""
+        output = self.optimize_use_case.execute(
+            OptimizeScheduleInput(
+                start_date=START,
+                max_hours_per_day=6.0,
+                force_override=False,
+                algorithm_name=algorithm,
+                dry_run=True,
+            )
+        )
+        return {
+            plan.task_id: (plan.planned_start, plan.planned_end)
+            for plan in output.planned_schedules
+        }
+
+    def test_reports_every_default_algorithm(self):
+        """Test the summary lists fitness and runtime for each default strategy."""
+        self.create_task("Task", estimated_duration=6.0)
+
+        result = self.optimize_schedule(start_date=START)
+
+        portfolio = result.summary.portfolio
+        assert [c.algorithm for c in portfolio] == list(PORTFOLIO_DEFAULT_ALGORITHMS)
+        assert all(c.fitness is not None for c in portfolio)
+        assert all(c.runtime_seconds >= 0 for c in portfolio)
+        assert [c.algorithm for c in portfolio if c.selected] == [
+            result.summary.selected_algorithm
+        ]
+
+    def test_persists_schedule_of_winner(self):
+        """Test the persisted schedule is exactly the winning strategy's."""
+        self.create_task(
+            "Urgent",
+            priority=10,
+            estimated_duration=12.0,
+            deadline=datetime(2025, 10, 24, 18, 0, 0),
+        )
+        self.create_task("Important", priority=100, estimated_duration=12.0)
+        previews = {name: self._preview(name) for name in ("greedy", "backward")}
+        assert previews["greedy"] != previews["backward"]
+
+        result = self._optimize(["greedy", "backward"])
+
+        persisted = {
+            task.id: (task.planned_start, task.planned_end)
+            for task in self.repository.get_all()
+        }
+        assert persisted == previews[result.summary.selected_algorithm]
+
+    def test_winner_has_highest_fitness(self):
+        """Test the selected strategy has the maximum reported fitness."""
+        self.create_task("A", priority=10, estimated_duration=8.0)
+        self.create_task(
+            "B",
+            priority=90,
+            estimated_duration=8.0,
+            deadline=datetime(2025, 10, 22, 18, 0, 0),
+        )
+
+        result = self._optimize(["greedy", "balanced", "backward", "round_robin"])
+
+        best = max(c.fitness for c in result.summary.portfolio)
+        selected = next(c for c in result.summary.portfolio if c.selected)
+        assert selected.fitness == best
+
+    def test_ties_go_to_first_configured_algorithm(self):
+        """Test identical schedules select the earliest listed strategy."""
+        self.create_task("Task", estimated_duration=6.0)
+
+        result = self._optimize(["priority_first", "greedy"])
+
+        assert result.summary.selected_algorithm == "priority_first"
+
+    def test_duplicate_algorithms_are_evaluated_once(self):
+        """Test repeated names in the configuration are ignored."""
+        self.create_task("Task", estimated_duration=6.0)
+
+        result = self._optimize(["greedy", "greedy"])
+
+        assert [c.algorithm for c in result.summary.portfolio] == ["greedy"]
+
+    @pytest.mark.parametrize("algorithms", [["greedy", "portfolio"], ["nope"]])
+    def test_invalid_algorithms_raise(self, algorithms):
+        """Test unknown names and self-reference are rejected."""
+        self.create_task("Task", estimated_duration=6.0)
+
+        with pytest.raises(ValueError):
+            self._optimize(algorithms)
+
+    def test_non_portfolio_run_has_no_portfolio_report(self):
+        """Test regular algorithms leave the portfolio fields empty."""
+        self.create_task("Task", estimated_duration=6.0)
+
+        result = self.optimize_use_case.execute(
+            OptimizeScheduleInput(
+                start_date=START,
+                max_hours_per_day=6.0,
+                force_override=False,
+                algorithm_name="greedy",
+            )
+        )
+
+        assert result.summary.selected_algorithm is None
+        assert result.summary.portfolio == []
+
+
+class TestPortfolioOptimizationStrategyUnit:
+    """Unit tests that call the strategy directly."""
+
+    def test_fitness_matches_calculator_on_start_order(self, repository):
+        """Test candidates are scored with ScheduleFitnessCalculator."""
+        tasks = [
+            repository.create(name="A", priority=5, estimated_duration=4.0),
+            repository.create(name="B", priority=50, estimated_duration=4.0),
+        ]
+        params = OptimizeParams(
+            start_date=START, max_hours_per_day=4.0, portfolio_algorithms=("greedy",)
+        )
+
+        result = PortfolioOptimizationStrategy().optimize_tasks(tasks, {}, params)
+        expected = StrategyFactory.create("greedy").optimize_tasks(tasks, {}, params)
+        ordered = sorted(expected.tasks, key=lambda t: t.planned_start)
+
+        assert result.portfolio[
+            0
+        ].fitness == ScheduleFitnessCalculator().calculate_fitness(
+            ordered, expected.daily_allocations, include_scheduling_bonus=True
+        )
+        assert result.daily_allocations == {
+            date(2025, 10, 20): 4.0,
+            date(2025, 10, 21): 4.0,
+        }
+
+    def test_cancellation_propagates(self, repository):
+        """Test cancellation aborts the whole portfolio."""
+        tasks = [repository.create(name="A", priority=5, estimated_duration=4.0)]
+        params = OptimizeParams(
+            start_date=START, max_hours_per_day=4.0, cancellation_check=lambda: True
+        )
+
+        with pytest.raises(OptimizationCancelledError):
+            PortfolioOptimizationStrategy().optimize_tasks(tasks, {}, params)
+
+    @pytest.mark.usefixtures("process_pool")
+    def test_process_pool_matches_sequential_run(self, repository):
+        """Test members run in worker processes give the in-process result."""
+        tasks = [
+            repository.create(name="A", priority=5, estimated_duration=8.0),
+            repository.create(
+                name="B",
+                priority=50,
+                estimated_duration=4.0,
+                deadline=datetime(2025, 10, 21, 18, 0, 0),
+            ),
+        ]
+        params = OptimizeParams(
+            start_date=START,
+            max_hours_per_day=4.0,
+            portfolio_algorithms=("greedy", "backward", "priority_first"),
+        )
+        sequential = PortfolioOptimizationStrategy()
+        sequential.MAX_WORKERS = 1
+
+        expected = sequential.optimize_tasks(tasks, {}, params)
+        result = PortfolioOptimizationStrategy().optimize_tasks(tasks, {}, params)
+
+        assert result.selected_algorithm == expected.selected_algorithm
+        assert [c.fitness for c in result.portfolio] == [
+            c.fitness for c in expected.portfolio
+        ]
+        assert result.daily_allocations == expected.daily_allocations
+
+    @pytest.mark.usefixtures("process_pool")
+    def test_cancellation_is_checked_between_members(self, repository):
+        """Test the caller checks cancellation while members run in workers."""
+        tasks = [repository.create(name="A", priority=5, estimated_duration=4.0)]
+        checks = []
+
+        def cancel_after_first_member() -> bool:
+            checks.append(1)
+            return len(checks) > 2
+
+        params = OptimizeParams(
+            start_date=START,
+            max_hours_per_day=4.0,
+            portfolio_algorithms=("greedy", "backward", "balanced"),
+            cancellation_check=cancel_after_first_member,
+        )
+
+        with pytest.raises(OptimizationCancelledError):
+            PortfolioOptimizationStrategy().optimize_tasks(tasks, {}, params)
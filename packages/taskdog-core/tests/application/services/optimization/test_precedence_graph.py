@@ -0,0 +1,115 @@
+"""Tests for PrecedenceGraph."""
+
+import random
+
+from taskdog_core.application.services.optimization.precedence_graph import (
+    PrecedenceGraph,
+)
+from taskdog_core.domain.entities.task import Task
+
+
+def _task(task_id: int, *depends_on: int) -> Task:
+    return Task(
+        id=task_id,
+        name=f"Task {task_id}",
+        estimated_duration=8.0,
+        depends_on=list(depends_on),
+    )
+
+
+def _diamond() -> PrecedenceGraph:
+    """1 -> (2, 3) -> 4, listed out of dependency order."""
+    return PrecedenceGraph([_task(4, 2, 3), _task(3, 1), _task(2, 1), _task(1)])
+
+
+def _assert_topological(graph: PrecedenceGraph) -> None:
+    position = {node: i for i, node in enumerate(graph.order)}
+    assert sorted(graph.order) == list(range(len(graph)))
+    for node, preds in enumerate(graph.predecessors):
+        for pred in preds:
+            assert position[pred] < position[node]
+
+
+class TestPrecedenceGraph:
+    """Test cases for graph construction and CPM passes."""
+
+    def test_topological_order(self):
+        """Test prerequisites come before dependents."""
+        graph = _diamond()
+
+        _assert_topological(graph)
+        assert graph.order[0] == 3  # Task 1
+
+    def test_ignores_dependencies_outside_the_run(self):
+        """Test dependencies on tasks not being optimized add no edges."""
+        graph = PrecedenceGraph([_task(1, 99), _task(2, 1, 1)])
+
+        assert graph.predecessors == [[], [0]]
+
+    def test_timings_and_slack(self):
+        """Test earliest/latest times and slack on a diamond."""
+        graph = _diamond()
+        # Nodes: 0=task 4, 1=task 3, 2=task 2, 3=task 1
+        timings = graph.compute_timings([1, 3, 1, 2], [None] * 4)
+
+        assert [(t.earliest_start, t.earliest_finish) for t in timings] == [
+            (5, 6),
+            (2, 5),
+            (2, 3),
+            (0, 2),
+        ]
+        assert [t.slack for t in timings] == [0, 0, 2, 0]
+        assert timings[2].latest_start == 4
+
+    def test_deadlines_tighten_latest_finish(self):
+        """Test deadlines propagate backwards and can make slack negative."""
+        graph = PrecedenceGraph([_task(1), _task(2, 1), _task(3)])
+        timings = graph.compute_timings([2, 2, 1], [None, 3, 10])
+
+        assert timings[1].latest_finish == 3
+        assert timings[0].latest_finish == 1
+        assert timings[0].slack == -1
+        assert timings[2].slack == 9
+
+    def test_critical_path(self):
+        """Test the longest chain is traced through the driving prerequisites."""
+        graph = _diamond()
+        timings = graph.compute_timings([1, 3, 1, 2], [None] * 4)
+
+        chain = [graph.tasks[node].id for node in graph.critical_path(timings)]
+
+        assert chain == [1, 3, 4]
+        assert PrecedenceGraph([]).critical_path([]) == []
+
+    def test_cycle_does_not_hang(self):
+        """Test cyclic tasks are still ordered and timed."""
+        graph = PrecedenceGraph([_task(1, 2), _task(2, 1), _task(3)])
+        timings = graph.compute_timings([1, 1, 1], [None] * 3)
+
+        assert graph.order == [2, 0, 1]  # Cyclic tasks appended in input order
+        assert len(timings) == 3
+
+    def test_deep_chain(self):
+        """Test a 10,000-task chain is handled without recursion."""
+        size = 10_000
+        tasks = [_task(1)] + [_task(i, i - 1) for i in range(2, size + 1)]
+        graph = PrecedenceGraph(tasks[::-1])
+        timings = graph.compute_timings([1] * size, [None] * size)
+
+        assert len(graph.critical_path(timings)) == size
+        assert max(t.earliest_finish for t in timings) == size
+        assert all(t.slack == 0 for t in timings)
+
+    def test_random_dag_order(self):
+        """Test random DAGs always get a valid topological order."""
+        rng = random.Random(7)
+        tasks = [
+            _task(i, *rng.sample(range(1, i), min(i - 1, rng.randint(0, 3))))
+            for i in range(1, 500)
+        ]
+        rng.shuffle(tasks)
+
+        graph = PrecedenceGraph(tasks)
+
+        _assert_topological(graph)
+        assert len(graph.order) == len(tasks)
@@ -1,8 +1,12 @@
 """Tests for RoundRobinOptimizationStrategy."""
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 
-from taskdog_core.domain.entities.task import TaskStatus
+from taskdog_core.application.dto.optimize_params import OptimizeParams
+from taskdog_core.application.services.optimization.round_robin_optimization_strategy import (
+    RoundRobinOptimizationStrategy,
+)
+from taskdog_core.domain.entities.task import Task, TaskStatus
 from tests.application.services.optimization.optimization_strategy_test_base import (
     BaseOptimizationStrategyTest,
 )
@@ -266,3 +270,44 @@ class TestRoundRobinOptimizationStrategy(BaseOptimizationStrategyTest):
 
         assert quick_end < medium_end
         assert medium_end < long_end
+
+    def test_round_robin_expired_task_frees_its_share(self):
+        """Test a task leaving at its deadline hands its share to the others."""
+        expiring = self.create_task(
+            "Expiring", estimated_duration=30.0, deadline=datetime(2025, 10, 21, 18)
+        )
+        other = self.create_task("Other", estimated_duration=12.0)
+
+        result = self.optimize_schedule(start_date=datetime(2025, 10, 20, 9, 0, 0))
+
+        assert [f.task.id for f in result.failed_tasks] == [expiring.id]
+        assert "(24.0h remaining)" in result.failed_tasks[0].reason
+        updated_other = self.repository.get_by_id(other.id)
+        assert updated_other.daily_allocations == {
+            date(2025, 10, 20): 3.0,
+            date(2025, 10, 21): 3.0,
+            date(2025, 10, 22): 6.0,
+        }
+
+
+class TestRoundRobinLongHorizon:
+    """Test cases for rotations spanning many years."""
+
+    def test_schedules_beyond_ten_thousand_days(self):
+        """Test long horizons are scheduled completely instead of truncated."""
+        days = 12_000
+        task = Task(id=1, name="Decades", priority=1, estimated_duration=6.0 * days)
+        params = OptimizeParams(
+            start_date=datetime(2025, 1, 1, 9, 0, 0),
+            max_hours_per_day=6.0,
+            include_all_days=True,
+        )
+
+        result = RoundRobinOptimizationStrategy().optimize_tasks([task], {}, params)
+
+        assert not result.failures
+        scheduled = result.tasks[0]
+        assert len(scheduled.daily_allocations) == days
+        assert scheduled.planned_end.date() == date(2025, 1, 1) + timedelta(
+            days=days - 1
+        )
@@ -14,6 +14,9 @@ from taskdog_core.application.services.optimization.dependency_aware_optimizatio
 from taskdog_core.application.services.optimization.earliest_deadline_optimization_strategy import (
     EarliestDeadlineOptimizationStrategy,
 )
+from taskdog_core.application.services.optimization.exact_optimization_strategy import (
+    ExactOptimizationStrategy,
+)
 from taskdog_core.application.services.optimization.genetic_optimization_strategy import (
     GeneticOptimizationStrategy,
 )
@@ -23,6 +26,9 @@ from taskdog_core.application.services.optimization.greedy_optimization_strategy
 from taskdog_core.application.services.optimization.monte_carlo_optimization_strategy import (
     MonteCarloOptimizationStrategy,
 )
+from taskdog_core.application.services.optimization.portfolio_optimization_strategy import (
+    PortfolioOptimizationStrategy,
+)
 from taskdog_core.application.services.optimization.priority_first_optimization_strategy import (
     PriorityFirstOptimizationStrategy,
 )
@@ -49,6 +55,8 @@ class TestStrategyFactory:
             ("dependency_aware", DependencyAwareOptimizationStrategy),
             ("genetic", GeneticOptimizationStrategy),
             ("monte_carlo", MonteCarloOptimizationStrategy),
+            ("exact", ExactOptimizationStrategy),
+            ("portfolio", PortfolioOptimizationStrategy),
         ],
         ids=[
             "greedy",
@@ -60,6 +68,8 @@ class TestStrategyFactory:
             "dependency_aware",
             "genetic",
             "monte_carlo",
+            "exact",
+            "portfolio",
         ],
     )
     def test_create_all_strategy_types(self, algo_name, expected_class):
@@ -84,10 +94,10 @@ class TestStrategyFactory:
         assert isinstance(strategy, GreedyOptimizationStrategy)
 
     def test_get_algorithm_metadata_returns_metadata_for_all_algorithms(self):
-        """Test get_algorithm_metadata returns metadata for all 9 algorithms."""
+        """Test get_algorithm_metadata returns metadata for all 11 algorithms."""
         metadata = StrategyFactory.get_algorithm_metadata()
 
-        assert len(metadata) == 9
+        assert len(metadata) == 11
 
         # Each metadata entry is a tuple of (id, display_name, description)
         for entry in metadata:
@@ -0,0 +1,147 @@
+"""Tests for DependencyGraphIndex."""
+
+import random
+from itertools import pairwise
+from unittest.mock import patch
+
+import pytest
+
+from taskdog_core.application.services.dependency_graph_index import (
+    DependencyGraphIndex,
+    find_dependency_path,
+)
+from taskdog_core.application.services.dependency_graph_service import (
+    DependencyGraphService,
+)
+
+
+class TestFindDependencyPath:
+    """Test cases for find_dependency_path."""
+
+    def test_follows_edges_in_stored_order(self):
+        edges = {1: [2, 3], 2: [4], 3: [4], 4: [5]}
+
+        assert find_dependency_path(1, 5, edges) == [1, 2, 4, 5]
+
+    def test_unreachable_goal_returns_none(self):
+        assert find_dependency_path(1, 9, {1: [2], 2: [1]}) is None
+
+    def test_within_limits_explored_tasks(self):
+        visited: set[int] = set()
+
+        path = find_dependency_path(
+            1, 5, {1: [2, 3], 3: [5]}, within=lambda t: t != 3, visited=visited
+        )
+
+        assert path is None
+        assert visited == {1, 2}
+
+    def test_long_chain_does_not_recurse(self):
+        edges = {n: [n + 1] for n in range(20000)}
+
+        path = find_dependency_path(0, 20000, edges)
+
+        assert path is not None
+        assert len(path) == 20001
+
+
+class TestDependencyGraphIndex:
+    """Indexed cycle checks match the ones reading the repository."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, repository):
+        self.repository = repository
+        self.index = DependencyGraphIndex(repository)
+        repository.add_change_listener(self.index.task_changed)
+        self.indexed = DependencyGraphService(repository, self.index)
+        self.scanned = DependencyGraphService(repository)
+
+    def _chain(self, count):
+        tasks = [
+            self.repository.create(name=f"Task {i}", priority=1) for i in range(count)
+        ]
+        self.index.detect_cycle(tasks[0].id, tasks[0].id)  # load before changes
+        for upstream, downstream in pairwise(tasks):
+            upstream.depends_on = [downstream.id]
+            self.repository.save(upstream)
+        return tasks
+
+    def _assert_parity(self, start_id, target_id):
+        assert self.indexed.detect_cycle(
+            start_id, target_id
+        ) == self.scanned.detect_cycle(start_id, target_id)
+
+    def test_detects_cycle_added_after_load(self):
+        tasks = self._chain(4)
+
+        assert self.indexed.detect_cycle(tasks[-1].id, tasks[0].id) == [
+            task.id for task in tasks
+        ]
+        assert self.indexed.detect_cycle(tasks[0].id, tasks[-1].id) is None
+
+    def test_removed_dependency_no_longer_closes_cycle(self):
+        tasks = self._chain(3)
+        tasks[1].depends_on = []
+        self.repository.save(tasks[1])
+
+        assert self.indexed.detect_cycle(tasks[2].id, tasks[0].id) is None
+
+    def test_deleted_task_keeps_incoming_edges(self):
+        tasks = self._chain(3)
+        self.repository.delete(tasks[2].id)
+
+        self._assert_parity(tasks[2].id, tasks[0].id)
+
+    def test_does_not_read_repository_after_load(self):
+        tasks = self._chain(5)
+
+        with (
+            patch.object(self.repository, "get_by_ids") as get_by_ids,
+            patch.object(self.repository, "iter_all") as iter_all,
+        ):
+            assert self.indexed.detect_cycle(tasks[-1].id, tasks[0].id) is not None
+
+        get_by_ids.assert_not_called()
+        iter_all.assert_not_called()
+
+    def test_stored_cycle_falls_back_to_full_search(self):
+        tasks = self._chain(3)
+        tasks[2].depends_on = [tasks[0].id]
+        self.repository.save(tasks[2])
+
+        self._assert_parity(tasks[1].id, tasks[0].id)
+        self._assert_parity(tasks[0].id, tasks[2].id)
+
+        # Breaking the cycle restores the order
+        tasks[2].depends_on = []
+        self.repository.save(tasks[2])
+        self._assert_parity(tasks[2].id, tasks[0].id)
+        self._assert_parity(tasks[0].id, tasks[2].id)
+
+    def test_random_changes_match_repository_search(self):
+        rng = random.Random(5)
+        ids = [
+            self.repository.create(name=f"Task {i}", priority=1).id for i in range(30)
+        ]
+        self.index.detect_cycle(ids[0], ids[1])
+
+        for _ in range(400):
+            start_id, target_id = rng.choice(ids), rng.choice(ids)
+            self._assert_parity(start_id, target_id)
+
+            task = self.repository.get_by_id(start_id)
+            if rng.random() < 0.2 and task.depends_on:
+                task.depends_on = task.depends_on[1:]
+                self.repository.save(task)
+            elif (
+                target_id not in task.depends_on
+                and self.scanned.detect_cycle(start_id, target_id) is None
+            ):
+                # Dependencies are only added when they keep the graph acyclic,
+                # as AddDependencyUseCase does
+                task.depends_on = [*task.depends_on, target_id]
+                self.repository.save(task)
+
+        for start_id in ids:
+            for target_id in ids:
+                self._assert_parity(start_id, target_id)
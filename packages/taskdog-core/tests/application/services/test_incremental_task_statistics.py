@@ -0,0 +1,122 @@
+"""Tests for IncrementalTaskStatistics."""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from taskdog_core.application.services.incremental_task_statistics import (
+    IncrementalTaskStatistics,
+)
+from taskdog_core.application.services.task_statistics_calculator import (
+    TaskStatisticsCalculator,
+)
+from taskdog_core.domain.entities.task import Task, TaskStatus
+from taskdog_core.infrastructure.persistence.database.sqlite_task_repository import (
+    SqliteTaskRepository,
+)
+from taskdog_core.infrastructure.persistence.mappers.task_db_mapper import TaskDbMapper
+from tests.helpers.time_provider import FakeTimeProvider
+
+NOW = datetime(2026, 3, 15, 12, 0)
+PERIODS = ["all", "7d", "30d"]
+
+
+class TestIncrementalTaskStatistics:
+    """Incremental counts match a full recomputation after every change."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Set up a repository with a listening IncrementalTaskStatistics."""
+        self.repository = SqliteTaskRepository(
+            f"sqlite:///{tmp_path / 'test_tasks.db'}", TaskDbMapper()
+        )
+        self.clock = FakeTimeProvider(NOW)
+        self.statistics = IncrementalTaskStatistics(self.repository, self.clock)
+        self.repository.add_change_listener(self.statistics.task_changed)
+        self.calculator = TaskStatisticsCalculator()
+        yield
+        self.repository.close()
+
+    def _create(self, name: str, days_ago: float | None = None, **kwargs) -> Task:
+        """Create a task, completed ``days_ago`` days before the clock."""
+        task = self.repository.create(name, priority=kwargs.pop("priority", 50))
+        if days_ago is not None:
+            end = self.clock.now() - timedelta(days=days_ago)
+            task.start(end - timedelta(hours=2))
+            task.complete(end)
+        for key, value in kwargs.items():
+            setattr(task, key, value)
+        self.repository.save(task)
+        return task
+
+    def _assert_matches_recomputation(self):
+        for period in PERIODS:
+            expected = self.calculator.calculate_all(
+                self.repository.get_all(), period=period, now=self.clock.now()
+            )
+            assert self.statistics.calculate(period) == expected, period
+
+    def test_initial_load_matches_recomputation(self):
+        """Test counts loaded on first use match a full recomputation."""
+        self._create("Old", days_ago=20, deadline=NOW - timedelta(days=21))
+        self._create("Recent", days_ago=2, estimated_duration=2.5)
+        self._create("Pending", priority=90)
+
+        self._assert_matches_recomputation()
+
+    def test_lifecycle_transitions_update_counts(self):
+        """Test complete, cancel and reopen move a task between the counts."""
+        self._create("Done", days_ago=3)
+        task = self._create("Open", estimated_duration=1.0)
+        self._assert_matches_recomputation()
+
+        task.start(NOW - timedelta(hours=1))
+        task.complete(NOW)
+        self.repository.save(task)
+        self._assert_matches_recomputation()
+
+        # Reopen clears the end, then cancel sets a new one
+        task.status = TaskStatus.PENDING
+        task.actual_end = None
+        self.repository.save(task)
+        self._assert_matches_recomputation()
+
+        task.cancel(NOW)
+        self.repository.save(task)
+        self._assert_matches_recomputation()
+
+    def test_create_and_delete_update_counts(self):
+        """Test created and deleted tasks are counted and taken back out."""
+        self._create("Done", days_ago=1)
+        self._assert_matches_recomputation()
+
+        task = self._create("Later", days_ago=0.5, actual_duration=3.0)
+        self._assert_matches_recomputation()
+
+        self.repository.delete(task.id)
+        self._assert_matches_recomputation()
+
+    def test_completions_leave_periods_as_time_passes(self):
+        """Test a completion drops out of 7d and the trends after 7 days."""
+        self._create("Done", days_ago=6)
+        assert self.statistics.calculate("7d").task_stats.completed_count == 1
+
+        self.clock.advance(timedelta(days=2))
+
+        assert self.statistics.calculate("7d").task_stats.completed_count == 0
+        assert self.statistics.calculate("30d").task_stats.completed_count == 1
+        trends = self.statistics.calculate("all").trend_stats
+        assert trends.last_7_days_completed == 0
+        assert trends.last_30_days_completed == 1
+        self._assert_matches_recomputation()
+
+    def test_counts_load_once(self):
+        """Test the repository is read on first use only."""
+        self._create("Done", days_ago=1)
+        self.statistics.calculate()
+        self.repository.iter_all = Mock(side_effect=AssertionError("reloaded"))
+
+        self._create("Another", days_ago=1)
+
+        assert self.statistics.calculate().task_stats.completed_count == 2
@@ -14,10 +14,9 @@ class TestOptimizationSummaryBuilder:
     """Test cases for OptimizationSummaryBuilder."""
 
     @pytest.fixture(autouse=True)
-    def setup(self, repository):
+    def setup(self):
         """Set up test fixtures."""
-        self.repository = repository
-        self.builder = OptimizationSummaryBuilder(self.repository)
+        self.builder = OptimizationSummaryBuilder()
 
     def test_build_with_new_tasks(self):
         """Test build calculates correct counts for newly scheduled tasks."""
@@ -40,8 +39,6 @@ class TestOptimizationSummaryBuilder:
             planned_end=datetime(2025, 10, 15, 17, 0, 0),
             estimated_duration=8.0,
         )
-        self.repository.save(task1)
-        self.repository.save(task2)
 
         modified_tasks = [task1, task2]
         task_states_before = {1: None, 2: None}  # Both were unscheduled
@@ -49,7 +46,11 @@ class TestOptimizationSummaryBuilder:
         max_hours_per_day = 8.0
 
         summary = self.builder.build(
-            modified_tasks, task_states_before, daily_allocations, max_hours_per_day
+            modified_tasks,
+            task_states_before,
+            daily_allocations,
+            max_hours_per_day,
+            all_tasks=[task1, task2],
         )
 
         assert summary.new_count == 2
@@ -69,7 +70,6 @@ class TestOptimizationSummaryBuilder:
             planned_end=datetime(2025, 10, 15, 17, 0, 0),
             estimated_duration=8.0,
         )
-        self.repository.save(task)
 
         modified_tasks = [task]
         task_states_before = {1: "2025-10-14 09:00:00"}  # Was previously scheduled
@@ -77,7 +77,11 @@ class TestOptimizationSummaryBuilder:
         max_hours_per_day = 8.0
 
         summary = self.builder.build(
-            modified_tasks, task_states_before, daily_allocations, max_hours_per_day
+            modified_tasks,
+            task_states_before,
+            daily_allocations,
+            max_hours_per_day,
+            all_tasks=[task],
         )
 
         assert summary.new_count == 0
@@ -95,7 +99,6 @@ class TestOptimizationSummaryBuilder:
             deadline=datetime(2025, 10, 15, 18, 0, 0),
             estimated_duration=16.0,
         )
-        self.repository.save(task)
 
         modified_tasks = [task]
         task_states_before = {1: None}
@@ -103,7 +106,11 @@ class TestOptimizationSummaryBuilder:
         max_hours_per_day = 8.0
 
         summary = self.builder.build(
-            modified_tasks, task_states_before, daily_allocations, max_hours_per_day
+            modified_tasks,
+            task_states_before,
+            daily_allocations,
+            max_hours_per_day,
+            all_tasks=[task],
         )
 
         assert summary.deadline_conflicts == 1
@@ -119,7 +126,6 @@ class TestOptimizationSummaryBuilder:
             planned_end=datetime(2025, 10, 14, 17, 0, 0),
             estimated_duration=10.0,
         )
-        self.repository.save(task)
 
         modified_tasks = [task]
         task_states_before = {1: None}
@@ -127,7 +133,11 @@ class TestOptimizationSummaryBuilder:
         max_hours_per_day = 8.0
 
         summary = self.builder.build(
-            modified_tasks, task_states_before, daily_allocations, max_hours_per_day
+            modified_tasks,
+            task_states_before,
+            daily_allocations,
+            max_hours_per_day,
+            all_tasks=[task],
         )
 
         assert len(summary.overloaded_days) == 1
@@ -154,8 +164,6 @@ class TestOptimizationSummaryBuilder:
             estimated_duration=8.0,
             # No planned_start/end
         )
-        self.repository.save(scheduled_task)
-        self.repository.save(unscheduled_task)
 
         modified_tasks = [scheduled_task]
         task_states_before = {1: None}
@@ -163,7 +171,11 @@ class TestOptimizationSummaryBuilder:
         max_hours_per_day = 8.0
 
         summary = self.builder.build(
-            modified_tasks, task_states_before, daily_allocations, max_hours_per_day
+            modified_tasks,
+            task_states_before,
+            daily_allocations,
+            max_hours_per_day,
+            all_tasks=[scheduled_task, unscheduled_task],
         )
 
         assert len(summary.unscheduled_tasks) == 1
@@ -180,7 +192,6 @@ class TestOptimizationSummaryBuilder:
             estimated_duration=8.0,
             # No planned_start/end
         )
-        self.repository.save(completed_task)
 
         modified_tasks = []
         task_states_before = {}
@@ -188,7 +199,41 @@ class TestOptimizationSummaryBuilder:
         max_hours_per_day = 8.0
 
         summary = self.builder.build(
-            modified_tasks, task_states_before, daily_allocations, max_hours_per_day
+            modified_tasks,
+            task_states_before,
+            daily_allocations,
+            max_hours_per_day,
+            all_tasks=[completed_task],
         )
 
         assert len(summary.unscheduled_tasks) == 0
+
+    def test_build_uses_result_not_persisted_state(self):
+        """Test unscheduled tasks reflect the result without reloading tasks."""
+        # Loaded state: task 1 unscheduled, task 2 scheduled
+        task1 = Task(id=1, name="Newly scheduled", estimated_duration=8.0)
+        task2 = Task(
+            id=2,
+            name="Cleared",
+            estimated_duration=8.0,
+            planned_start=datetime(2025, 10, 14, 9, 0, 0),
+            planned_end=datetime(2025, 10, 14, 17, 0, 0),
+        )
+        scheduled = Task(
+            id=1,
+            name="Newly scheduled",
+            estimated_duration=8.0,
+            planned_start=datetime(2025, 10, 15, 9, 0, 0),
+            planned_end=datetime(2025, 10, 15, 17, 0, 0),
+        )
+
+        summary = self.builder.build(
+            [scheduled],
+            {1: None, 2: task2.planned_start},
+            {date(2025, 10, 15): 8.0},
+            8.0,
+            all_tasks=[task1, task2],
+            cleared_task_ids={2},
+        )
+
+        assert [t.id for t in summary.unscheduled_tasks] == [2]
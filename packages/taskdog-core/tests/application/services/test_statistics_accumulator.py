@@ -0,0 +1,123 @@
+"""Tests for StatisticsAccumulator and TaskContribution."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from taskdog_core.application.services.statistics_accumulator import (
+    StatisticsAccumulator,
+    TaskContribution,
+)
+from taskdog_core.domain.entities.task import Task, TaskStatus
+
+END = datetime(2026, 3, 10, 15, 30)
+
+
+def _completed(task_id: int, **kwargs) -> TaskContribution:
+    return TaskContribution.from_task(
+        Task(
+            id=task_id,
+            name=f"Task {task_id}",
+            priority=80,
+            status=TaskStatus.COMPLETED,
+            actual_end=END,
+            **kwargs,
+        )
+    )
+
+
+class TestTaskContribution:
+    """Test cases for TaskContribution."""
+
+    def test_tracked_only_with_actual_duration(self):
+        """Test only tasks with time tracking data carry a tracked record."""
+        tracked = _completed(1, actual_start=END - timedelta(hours=2))
+        untracked = _completed(2)
+
+        assert tracked.tracked is not None
+        assert tracked.tracked.actual_duration_hours == 2.0
+        assert untracked.tracked is None
+
+    def test_task_id_overrides_missing_id(self):
+        """Test an explicit ID is used for tasks that were just inserted."""
+        task = Task(name="New", priority=1, actual_duration=1.5)
+
+        contribution = TaskContribution.from_task(task, task_id=7)
+
+        assert contribution.id == 7
+        assert contribution.tracked.id == 7
+
+    def test_tracked_task_without_id_raises(self):
+        """Test a tracked task without an ID cannot be counted."""
+        with pytest.raises(ValueError, match="must have an ID"):
+            TaskContribution.from_task(Task(name="New", actual_duration=1.5))
+
+    @pytest.mark.parametrize(
+        ("status", "actual_end", "expected"),
+        [
+            (TaskStatus.COMPLETED, END, True),
+            (TaskStatus.COMPLETED, END - timedelta(days=8), False),
+            (TaskStatus.PENDING, None, True),
+            (TaskStatus.IN_PROGRESS, None, True),
+            (TaskStatus.CANCELED, None, False),
+        ],
+    )
+    def test_in_period(self, status, actual_end, expected):
+        """Test which tasks count in a period."""
+        contribution = TaskContribution.from_task(
+            Task(id=1, name="Task", status=status, actual_end=actual_end)
+        )
+
+        assert contribution.in_period(END - timedelta(days=7)) is expected
+        assert contribution.in_period(None) is True
+
+
+class TestStatisticsAccumulator:
+    """Test cases for StatisticsAccumulator."""
+
+    def test_add_counts_every_statistic(self):
+        """Test one add() updates all counts."""
+        accumulator = StatisticsAccumulator([END - timedelta(days=1), END])
+
+        accumulator.add(
+            _completed(
+                1,
+                deadline=END - timedelta(days=2),
+                actual_start=END - timedelta(hours=3),
+            )
+        )
+
+        aggregates = accumulator.aggregates()
+        assert aggregates.status_counts == {TaskStatus.COMPLETED: 1}
+        assert aggregates.priority_status_counts == {(80, TaskStatus.COMPLETED): 1}
+        assert [t.id for t in aggregates.tracked_durations] == [1]
+        assert aggregates.deadline_missed_count == 1
+        assert aggregates.total_delay_days == pytest.approx(2.0)
+        assert aggregates.completions_by_weekday_hour == {(END.weekday(), 15): 1}
+        assert aggregates.completions_by_day == {END.date(): 1}
+        assert aggregates.completions_since == [1, 1]
+        assert accumulator.finished_count == 1
+
+    def test_remove_restores_previous_counts(self):
+        """Test remove() takes back exactly what add() counted."""
+        accumulator = StatisticsAccumulator([END])
+        kept = _completed(1, deadline=END)
+        removed = _completed(2, deadline=END - timedelta(days=1), actual_duration=4.0)
+        accumulator.add(kept)
+        before = accumulator.aggregates()
+
+        accumulator.add(removed)
+        accumulator.remove(removed)
+
+        assert accumulator.aggregates() == before
+        assert accumulator.finished_count == 1
+
+    def test_tracked_durations_in_id_order(self):
+        """Test tracked tasks are reported by ID, not by insertion."""
+        accumulator = StatisticsAccumulator()
+        for task_id in (3, 1, 2):
+            accumulator.add(_completed(task_id, actual_duration=1.0))
+
+        ids = [t.id for t in accumulator.aggregates().tracked_durations]
+
+        assert ids == [1, 2, 3]
@@ -0,0 +1,157 @@
+"""Tests for ApplyOptimizationUseCase."""
+
+from datetime import date, datetime
+
+import pytest
+
+from taskdog_core.application.dto.apply_optimization_input import (
+    ApplyOptimizationInput,
+)
+from taskdog_core.application.dto.optimization_output import PlannedTaskSchedule
+from taskdog_core.application.services.optimization.data_version import (
+    compute_data_version,
+)
+from taskdog_core.application.use_cases.apply_optimization import (
+    ApplyOptimizationUseCase,
+)
+from taskdog_core.domain.entities.task import TaskStatus
+from taskdog_core.domain.exceptions.task_exceptions import (
+    StaleOptimizationPlanError,
+    TaskNotFoundException,
+    TaskNotSchedulableError,
+)
+
+
+class TestApplyOptimizationUseCase:
+    """Test cases for ApplyOptimizationUseCase."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, repository):
+        """Initialize use case for each test."""
+        self.repository = repository
+        self.use_case = ApplyOptimizationUseCase(self.repository)
+
+    def _plan(self, task_id):
+        return PlannedTaskSchedule(
+            task_id=task_id,
+            planned_start=datetime(2025, 10, 15, 0, 0, 0),
+            planned_end=datetime(2025, 10, 16, 23, 59, 59),
+            daily_allocations={date(2025, 10, 15): 6.0, date(2025, 10, 16): 2.0},
+        )
+
+    def test_execute_persists_planned_schedules(self):
+        """Test planned schedules are written to the repository."""
+        task = self.repository.create(name="Task", priority=1, estimated_duration=8.0)
+
+        result = self.use_case.execute(
+            ApplyOptimizationInput(planned_schedules=[self._plan(task.id)])
+        )
+
+        assert [t.id for t in result] == [task.id]
+        stored = self.repository.get_by_id(task.id)
+        assert stored.planned_start == datetime(2025, 10, 15, 0, 0, 0)
+        assert stored.planned_end == datetime(2025, 10, 16, 23, 59, 59)
+        assert stored.daily_allocations == {
+            date(2025, 10, 15): 6.0,
+            date(2025, 10, 16): 2.0,
+        }
+
+    def test_execute_clears_failed_task_schedules(self):
+        """Test schedules listed in cleared_task_ids are removed."""
+        task = self.repository.create(
+            name="Task",
+            priority=1,
+            estimated_duration=8.0,
+            planned_start=datetime(2025, 10, 20, 9, 0, 0),
+            planned_end=datetime(2025, 10, 20, 18, 0, 0),
+        )
+
+        self.use_case.execute(
+            ApplyOptimizationInput(planned_schedules=[], cleared_task_ids=[task.id])
+        )
+
+        stored = self.repository.get_by_id(task.id)
+        assert stored.planned_start is None
+        assert stored.planned_end is None
+
+    def test_execute_raises_for_deleted_task(self):
+        """Test applying a plan for a task deleted since the preview fails."""
+        with pytest.raises(TaskNotFoundException):
+            self.use_case.execute(
+                ApplyOptimizationInput(planned_schedules=[self._plan(999)])
+            )
+
+    def test_execute_rejects_task_started_since_preview(self):
+        """Test nothing is written if any task is no longer schedulable."""
+        pending = self.repository.create(
+            name="Pending", priority=1, estimated_duration=8.0
+        )
+        started = self.repository.create(
+            name="Started",
+            priority=1,
+            estimated_duration=8.0,
+            status=TaskStatus.IN_PROGRESS,
+        )
+
+        with pytest.raises(TaskNotSchedulableError):
+            self.use_case.execute(
+                ApplyOptimizationInput(
+                    planned_schedules=[self._plan(pending.id), self._plan(started.id)]
+                )
+            )
+
+        assert self.repository.get_by_id(pending.id).planned_start is None
+
+    def test_execute_applies_plan_with_current_data_version(self):
+        """Test a plan computed from the current data is applied."""
+        task = self.repository.create(name="Task", priority=1, estimated_duration=8.0)
+        version = compute_data_version(self.repository.get_all())
+
+        self.use_case.execute(
+            ApplyOptimizationInput(
+                planned_schedules=[self._plan(task.id)],
+                expected_data_version=version,
+            )
+        )
+
+        assert self.repository.get_by_id(task.id).planned_start is not None
+
+    def test_execute_rejects_stale_plan(self):
+        """Test nothing is written if any task changed since the preview."""
+        task = self.repository.create(name="Task", priority=1, estimated_duration=8.0)
+        version = compute_data_version(self.repository.get_all())
+        # A task the plan does not touch is added after the preview
+        self.repository.create(name="Other", priority=1, estimated_duration=4.0)
+
+        with pytest.raises(StaleOptimizationPlanError):
+            self.use_case.execute(
+                ApplyOptimizationInput(
+                    planned_schedules=[self._plan(task.id)],
+                    expected_data_version=version,
+                )
+            )
+
+        assert self.repository.get_by_id(task.id).planned_start is None
+
+    def test_execute_checks_version_in_the_saving_transaction(self):
+        """Test the version is checked inside update_all, not before it."""
+        task = self.repository.create(name="Task", priority=1, estimated_duration=8.0)
+        version = compute_data_version(self.repository.get_all())
+        update_all = self.repository.update_all
+
+        def concurrent_write_then_update(update):
+            # A write committed before the transaction starts is seen by it
+            self.repository.create(name="Other", priority=1)
+            update_all(update)
+
+        self.repository.update_all = concurrent_write_then_update
+
+        with pytest.raises(StaleOptimizationPlanError):
+            self.use_case.execute(
+                ApplyOptimizationInput(
+                    planned_schedules=[self._plan(task.id)],
+                    expected_data_version=version,
+                )
+            )
+
+        assert self.repository.get_by_id(task.id).planned_start is None
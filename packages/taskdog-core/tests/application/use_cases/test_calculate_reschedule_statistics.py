@@ -4,10 +4,14 @@ from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
 from taskdog_core.application.dto.statistics_output import CalculateStatisticsInput
+from taskdog_core.application.services.reschedule_analyzer import (
+    CHRONIC_SLIPPER_THRESHOLD,
+)
 from taskdog_core.application.use_cases.calculate_reschedule_statistics import (
     CalculateRescheduleStatisticsUseCase,
 )
 from taskdog_core.domain.entities.audit_log import AuditLog
+from taskdog_core.domain.entities.reschedule_statistics import RescheduleAggregates
 
 
 def _event(task_id: int, old: str | None, new: str | None) -> AuditLog:
@@ -26,6 +30,8 @@ def _event(task_id: int, old: str | None, new: str | None) -> AuditLog:
 class TestCalculateRescheduleStatisticsUseCase:
     def setup_method(self) -> None:
         self.audit_repository = MagicMock()
+        # Repository without SQL aggregation: events are analyzed in Python
+        self.audit_repository.get_reschedule_aggregates.return_value = None
         self.use_case = CalculateRescheduleStatisticsUseCase(self.audit_repository)
 
     def test_all_period_queries_without_since(self) -> None:
@@ -64,3 +70,24 @@ class TestCalculateRescheduleStatisticsUseCase:
 
         assert result.tasks_with_deadline == 1
         assert result.total_reschedule_events == 1
+
+    def test_uses_repository_aggregates(self) -> None:
+        self.audit_repository.get_reschedule_aggregates.return_value = (
+            RescheduleAggregates(
+                tasks_with_deadline=2,
+                rescheduled_task_count=1,
+                total_reschedule_events=3,
+                lead_time_counts={"3_7_days": (2, 1)},
+                weekly_reschedule_counts={"2026-W29": 3},
+            )
+        )
+
+        result = self.use_case.execute(CalculateStatisticsInput(period="all"))
+
+        self.audit_repository.get_deadline_changes.assert_not_called()
+        self.audit_repository.get_reschedule_aggregates.assert_called_once_with(
+            since=None, min_reschedules=CHRONIC_SLIPPER_THRESHOLD
+        )
+        assert result.reschedule_rate == 0.5
+        assert [b.task_count for b in result.lead_time_breakdown] == [0, 0, 2, 0]
+        assert result.weekly_reschedule_trend == {"2026-W29": 3}
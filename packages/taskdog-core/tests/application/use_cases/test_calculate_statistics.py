@@ -10,6 +10,7 @@ from taskdog_core.application.use_cases.calculate_statistics import (
     CalculateStatisticsUseCase,
 )
 from taskdog_core.domain.entities.task import Task, TaskStatus
+from taskdog_core.domain.entities.task_statistics import TaskStatisticsAggregates
 
 
 class TestCalculateStatisticsUseCase:
@@ -19,16 +20,18 @@ class TestCalculateStatisticsUseCase:
     def setup(self):
         """Set up test fixtures."""
         self.repository = Mock()
+        # Repository without SQL aggregation: statistics are counted in Python
+        self.repository.get_statistics_aggregates.return_value = None
         self.use_case = CalculateStatisticsUseCase(self.repository)
 
     def test_execute_with_empty_tasks(self):
         """Test execute with empty task list."""
-        self.repository.get_all.return_value = []
+        self.repository.iter_all.return_value = iter([])
 
         result = self.use_case.execute(CalculateStatisticsInput())
 
         assert result.task_stats.total_tasks == 0
-        self.repository.get_all.assert_called_once()
+        self.repository.iter_all.assert_called_once()
 
     def test_execute_with_basic_tasks(self):
         """Test execute with basic tasks."""
@@ -36,14 +39,14 @@ class TestCalculateStatisticsUseCase:
             Task(name="Task 1", priority=10, id=1, status=TaskStatus.PENDING),
             Task(name="Task 2", priority=20, id=2, status=TaskStatus.COMPLETED),
         ]
-        self.repository.get_all.return_value = tasks
+        self.repository.iter_all.return_value = iter(tasks)
 
         result = self.use_case.execute(CalculateStatisticsInput())
 
         assert result.task_stats.total_tasks == 2
         assert result.task_stats.pending_count == 1
         assert result.task_stats.completed_count == 1
-        self.repository.get_all.assert_called_once()
+        self.repository.iter_all.assert_called_once()
 
     def test_execute_with_period_filter(self):
         """Test execute with period filter."""
@@ -64,14 +67,14 @@ class TestCalculateStatisticsUseCase:
                 status=TaskStatus.COMPLETED,
             ),
         ]
-        self.repository.get_all.return_value = tasks
+        self.repository.iter_all.return_value = iter(tasks)
 
         result = self.use_case.execute(CalculateStatisticsInput(period="7d"))
 
         # Only the recent task should be counted
         assert result.task_stats.total_tasks == 1
         assert result.task_stats.completed_count == 1
-        self.repository.get_all.assert_called_once()
+        self.repository.iter_all.assert_called_once()
 
     def test_execute_calculates_all_statistics(self):
         """Test that execute calculates all statistics sections."""
@@ -88,7 +91,7 @@ class TestCalculateStatisticsUseCase:
                 actual_end=now,
             ),
         ]
-        self.repository.get_all.return_value = tasks
+        self.repository.iter_all.return_value = iter(tasks)
 
         result = self.use_case.execute(CalculateStatisticsInput())
 
@@ -99,3 +102,32 @@ class TestCalculateStatisticsUseCase:
         assert result.deadline_stats is not None
         assert result.priority_stats is not None
         assert result.trend_stats is not None
+
+    def test_execute_uses_repository_aggregates(self):
+        """Test aggregates from the repository are used instead of get_all()."""
+        self.repository.get_statistics_aggregates.return_value = (
+            TaskStatisticsAggregates(
+                status_counts={TaskStatus.PENDING: 2, TaskStatus.COMPLETED: 1},
+                completions_since=[1, 1],
+            )
+        )
+
+        result = self.use_case.execute(CalculateStatisticsInput())
+
+        assert result.task_stats.total_tasks == 3
+        assert result.task_stats.completed_count == 1
+        assert result.trend_stats.last_7_days_completed == 1
+        self.repository.iter_all.assert_not_called()
+
+    def test_execute_passes_period_start_to_repository(self):
+        """Test a period filter is passed to the repository as its start."""
+        self.repository.iter_all.return_value = iter([])
+
+        self.use_case.execute(CalculateStatisticsInput(period="30d"))
+
+        kwargs = self.repository.get_statistics_aggregates.call_args.kwargs
+        since = kwargs["since"]
+        assert datetime.now() - since == pytest.approx(
+            timedelta(days=30), abs=timedelta(seconds=5)
+        )
+        assert kwargs["completion_cutoffs"] is None
@@ -0,0 +1,159 @@
+"""Tests for EvaluateScenariosUseCase."""
+
+from datetime import date, datetime
+
+import pytest
+
+from taskdog_core.application.constants.optimization import SCENARIO_MAX_COUNT
+from taskdog_core.application.dto.evaluate_scenarios_input import (
+    EvaluateScenariosInput,
+    ScheduleScenario,
+    TaskOverride,
+)
+from taskdog_core.application.use_cases.evaluate_scenarios import (
+    EvaluateScenariosUseCase,
+)
+from taskdog_core.domain.exceptions.task_exceptions import (
+    TaskNotFoundException,
+    TaskValidationError,
+)
+
+START = datetime(2025, 10, 20, 9, 0, 0)  # Monday
+
+
+class TestEvaluateScenariosUseCase:
+    """Test cases for EvaluateScenariosUseCase."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, repository):
+        """Initialize use case for each test."""
+        self.repository = repository
+        self.use_case = EvaluateScenariosUseCase(self.repository)
+
+    def _input(self, *scenarios, max_hours_per_day=8.0):
+        return EvaluateScenariosInput(
+            start_date=START,
+            max_hours_per_day=max_hours_per_day,
+            algorithm_name="greedy",
+            scenarios=list(scenarios),
+        )
+
+    def test_scenarios_share_tasks_and_differ_by_parameters(self):
+        """Test each scenario reports its own end date and peak load."""
+        for name in ("A", "B"):
+            self.repository.create(name=name, priority=1, estimated_duration=8.0)
+
+        result = self.use_case.execute(
+            self._input(
+                ScheduleScenario(name="baseline"),
+                ScheduleScenario(name="six hours", max_hours_per_day=6.0),
+            )
+        )
+
+        baseline, reduced = result.scenarios
+        assert baseline.name == "baseline"
+        assert baseline.algorithm == "greedy"
+        assert baseline.scheduled_count == 2
+        assert baseline.end_date == date(2025, 10, 21)
+        assert baseline.peak_load == 8.0
+        assert baseline.total_hours == 16.0
+        assert reduced.max_hours_per_day == 6.0
+        assert reduced.end_date == date(2025, 10, 22)
+        assert reduced.peak_load == 6.0
+
+    @pytest.mark.usefixtures("process_pool")
+    def test_process_pool_matches_sequential_run(self):
+        """Test scenarios evaluated in worker processes give the same results."""
+        for name in ("A", "B", "C"):
+            self.repository.create(name=name, priority=1, estimated_duration=8.0)
+        input_dto = self._input(
+            ScheduleScenario(name="baseline"),
+            ScheduleScenario(name="six hours", max_hours_per_day=6.0),
+            ScheduleScenario(name="backward", algorithm_name="backward"),
+        )
+        sequential = EvaluateScenariosUseCase(self.repository)
+        sequential.MAX_WORKERS = 1
+
+        assert self.use_case.execute(input_dto) == sequential.execute(input_dto)
+
+    def test_task_overrides_do_not_modify_tasks(self):
+        """Test overrides only apply within their scenario and nothing is saved."""
+        task = self.repository.create(
+            name="Task",
+            priority=1,
+            estimated_duration=8.0,
+            deadline=datetime(2025, 10, 21, 18, 0, 0),
+        )
+
+        result = self.use_case.execute(
+            self._input(
+                ScheduleScenario(name="on time"),
+                ScheduleScenario(
+                    name="slips",
+                    task_overrides=(
+                        TaskOverride(task_id=task.id, estimated_duration=24.0),
+                    ),
+                ),
+            )
+        )
+
+        on_time, slips = result.scenarios
+        assert on_time.deadline_misses == 0
+        assert slips.deadline_misses == 1
+        stored = self.repository.get_by_id(task.id)
+        assert stored.estimated_duration == 8.0
+        assert stored.planned_start is None
+
+    def test_fixed_work_is_kept_in_every_scenario(self):
+        """Test fixed tasks' allocations count toward the peak load."""
+        fixed = self.repository.create(
+            name="Fixed",
+            priority=1,
+            estimated_duration=4.0,
+            is_fixed=True,
+            planned_start=datetime(2025, 10, 20, 9, 0, 0),
+            planned_end=datetime(2025, 10, 20, 18, 0, 0),
+        )
+        fixed.set_daily_allocations({date(2025, 10, 20): 4.0})
+        self.repository.save(fixed)
+        self.repository.create(name="Movable", priority=1, estimated_duration=4.0)
+
+        result = self.use_case.execute(self._input(ScheduleScenario(name="base")))
+
+        (scenario,) = result.scenarios
+        assert scenario.scheduled_count == 1
+        assert scenario.end_date == date(2025, 10, 20)
+        assert scenario.peak_load == 8.0
+
+    def test_unknown_override_task_raises(self):
+        """Test overrides must refer to existing tasks."""
+        with pytest.raises(TaskNotFoundException):
+            self.use_case.execute(
+                self._input(
+                    ScheduleScenario(
+                        name="ghost",
+                        task_overrides=(TaskOverride(task_id=999, priority=5),),
+                    )
+                )
+            )
+
+    def test_unknown_algorithm_raises(self):
+        """Test an unknown scenario algorithm is rejected."""
+        with pytest.raises(ValueError):
+            self.use_case.execute(
+                self._input(ScheduleScenario(name="x", algorithm_name="nope"))
+            )
+
+    @pytest.mark.parametrize(
+        "scenarios",
+        [
+            [],
+            [ScheduleScenario(name="same"), ScheduleScenario(name="same")],
+            [ScheduleScenario(name=str(i)) for i in range(SCENARIO_MAX_COUNT + 1)],
+        ],
+        ids=["empty", "duplicate-names", "too-many"],
+    )
+    def test_invalid_scenario_lists_raise(self, scenarios):
+        """Test empty, duplicate-named and oversized scenario lists are rejected."""
+        with pytest.raises(TaskValidationError):
+            self.use_case.execute(self._input(*scenarios))
@@ -220,3 +220,17 @@ class TestListTasksUseCase:
         assert result.filtered_count == 0
         assert len(result.tasks) == 0
         assert result.total_count == 1
+
+    def test_execute_limit_keeps_filtered_count(self):
+        """Test execute returns the first tasks but counts all matches."""
+        for priority in range(1, 6):
+            self.repository.create(
+                name=f"Task {priority}", priority=priority, status=TaskStatus.PENDING
+            )
+
+        input_dto = ListTasksInput(sort_by="priority", limit=2)
+        result = self.use_case.execute(input_dto)
+
+        assert [task.name for task in result.tasks] == ["Task 5", "Task 4"]
+        assert result.filtered_count == 5
+        assert result.total_count == 5
@@ -1,10 +1,15 @@
 """Tests for OptimizeScheduleUseCase."""
 
 from datetime import date, datetime
+from unittest.mock import patch
 
 import pytest
 
+from taskdog_core.application.dto.capacity_lane import CapacityLane
 from taskdog_core.application.dto.create_task_input import CreateTaskInput
+from taskdog_core.application.services.optimization.data_version import (
+    compute_data_version,
+)
 from taskdog_core.application.use_cases.create_task import CreateTaskUseCase
 from taskdog_core.application.use_cases.optimize_schedule import (
     OptimizeScheduleInput,
@@ -14,6 +19,7 @@ from taskdog_core.application.use_cases.optimize_schedule import (
 from taskdog_core.domain.entities.task import TaskStatus
 from taskdog_core.domain.exceptions.task_exceptions import (
     NoSchedulableTasksError,
+    OptimizationCancelledError,
     TaskNotFoundException,
     TaskValidationError,
 )
@@ -855,3 +861,387 @@ class TestOptimizeScheduleUseCase:
         # Total hours should be 5.0
         total_hours = sum(task.daily_allocations.values())
         assert total_hours == 5.0
+
+
+class TestOptimizeScheduleDryRunAndCancellation:
+    """Test cases for dry-run previews and cooperative cancellation."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, repository):
+        """Initialize use cases for each test."""
+        self.repository = repository
+        self.create_use_case = CreateTaskUseCase(self.repository)
+        self.optimize_use_case = OptimizeScheduleUseCase(self.repository)
+
+    def _input(self, **kwargs):
+        return OptimizeScheduleInput(
+            start_date=datetime(2025, 10, 15, 9, 0, 0),  # Wednesday
+            max_hours_per_day=6.0,
+            force_override=True,
+            algorithm_name=kwargs.pop("algorithm_name", "greedy"),
+            **kwargs,
+        )
+
+    def test_dry_run_does_not_persist(self):
+        """Test dry run returns planned schedules without saving them."""
+        task = self.create_use_case.execute(
+            CreateTaskInput(name="Task 1", priority=1, estimated_duration=4.0)
+        )
+
+        result = self.optimize_use_case.execute(self._input(dry_run=True))
+
+        assert result.dry_run is True
+        assert len(result.planned_schedules) == 1
+        plan = result.planned_schedules[0]
+        assert plan.task_id == task.id
+        assert plan.planned_start == datetime(2025, 10, 15, 0, 0, 0)
+        assert plan.daily_allocations == {date(2025, 10, 15): 4.0}
+
+        stored = self.repository.get_by_id(task.id)
+        assert stored.planned_start is None
+        assert stored.daily_allocations == {}
+        assert result.data_version == compute_data_version(self.repository.get_all())
+        # The summary describes the plan, not the unchanged repository
+        assert result.summary.unscheduled_tasks == []
+
+    def test_summary_does_not_reload_tasks(self):
+        """Test the summary is built from the tasks loaded for the run."""
+        self.create_use_case.execute(
+            CreateTaskInput(name="Task 1", priority=1, estimated_duration=4.0)
+        )
+
+        with patch.object(
+            self.repository, "get_all", wraps=self.repository.get_all
+        ) as get_all:
+            self.optimize_use_case.execute(self._input(dry_run=True))
+
+        get_all.assert_called_once()
+
+    def test_planned_schedules_match_persisted_schedule(self):
+        """Test a regular run reports the schedules it persisted."""
+        task = self.create_use_case.execute(
+            CreateTaskInput(name="Task 1", priority=1, estimated_duration=8.0)
+        )
+
+        result = self.optimize_use_case.execute(self._input())
+
+        stored = self.repository.get_by_id(task.id)
+        plan = result.planned_schedules[0]
+        assert result.dry_run is False
+        assert result.data_version is None
+        assert plan.planned_start == stored.planned_start
+        assert plan.planned_end == stored.planned_end
+        assert plan.daily_allocations == stored.daily_allocations
+
+    def test_dry_run_reports_schedules_to_clear_without_clearing(self):
+        """Test dry run lists failed tasks whose schedule would be cleared."""
+        task = self.create_use_case.execute(
+            CreateTaskInput(
+                name="Impossible",
+                priority=1,
+                estimated_duration=20.0,
+                planned_start=datetime(2025, 10, 20, 9, 0, 0),
+                planned_end=datetime(2025, 10, 20, 18, 0, 0),
+                deadline=datetime(2025, 10, 15, 18, 0, 0),
+            )
+        )
+
+        result = self.optimize_use_case.execute(self._input(dry_run=True))
+
+        assert result.cleared_task_ids == [task.id]
+        assert self.repository.get_by_id(task.id).planned_start is not None
+
+    @pytest.mark.parametrize("algorithm_name", ["greedy", "genetic", "monte_carlo"])
+    def test_cancellation_aborts_without_persisting(self, algorithm_name):
+        """Test a cancellation request aborts the run before anything is saved."""
+        task = self.create_use_case.execute(
+            CreateTaskInput(name="Task 1", priority=1, estimated_duration=4.0)
+        )
+
+        with pytest.raises(OptimizationCancelledError):
+            self.optimize_use_case.execute(
+                self._input(
+                    algorithm_name=algorithm_name, cancellation_check=lambda: True
+                )
+            )
+
+        assert self.repository.get_by_id(task.id).planned_start is None
+
+
+class TestOptimizeScheduleIncremental:
+    """Test cases for incremental re-optimization (changed_task_ids)."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, repository):
+        """Create and fully optimize three chained-priority tasks."""
+        self.repository = repository
+        self.create_use_case = CreateTaskUseCase(self.repository)
+        self.optimize_use_case = OptimizeScheduleUseCase(self.repository)
+        self.ids = [
+            self.create_use_case.execute(
+                CreateTaskInput(name=name, priority=priority, estimated_duration=12.0)
+            ).id
+            for name, priority in (("A", 300), ("B", 200), ("C", 100))
+        ]
+        self.optimize_use_case.execute(self._input())
+
+    def _input(self, **kwargs):
+        return OptimizeScheduleInput(
+            start_date=datetime(2025, 10, 20, 9, 0, 0),  # Monday
+            max_hours_per_day=6.0,
+            force_override=True,
+            algorithm_name=kwargs.pop("algorithm_name", "greedy"),
+            **kwargs,
+        )
+
+    def _update(self, task_id, **fields):
+        task = self.repository.get_by_id(task_id)
+        for name, value in fields.items():
+            setattr(task, name, value)
+        self.repository.save(task)
+
+    def _schedules(self):
+        return {
+            t.id: (t.planned_start, t.planned_end, t.daily_allocations)
+            for t in self.repository.get_all()
+            if t.status == TaskStatus.PENDING
+        }
+
+    def _assert_matches_full_run(self, changed_task_ids, algorithm_name="greedy"):
+        full = self.optimize_use_case.execute(
+            self._input(algorithm_name=algorithm_name, dry_run=True)
+        )
+        expected = {
+            plan.task_id: (
+                plan.planned_start,
+                plan.planned_end,
+                plan.daily_allocations,
+            )
+            for plan in full.planned_schedules
+        }
+
+        result = self.optimize_use_case.execute(
+            self._input(
+                algorithm_name=algorithm_name, changed_task_ids=changed_task_ids
+            )
+        )
+
+        assert self._schedules() == expected
+        return result
+
+    def test_completed_task_pulls_later_tasks_forward(self):
+        """Test completing the first task frees days for the following tasks."""
+        self._update(self.ids[0], status=TaskStatus.COMPLETED)
+
+        result = self._assert_matches_full_run([self.ids[0]])
+
+        assert result.summary.touched_count == 2
+        assert self.repository.get_by_id(self.ids[1]).planned_start == datetime(
+            2025, 10, 20, 0, 0, 0
+        )
+
+    def test_estimate_change_of_last_task_touches_only_it(self):
+        """Test growing the last task leaves earlier tasks untouched."""
+        self._update(self.ids[2], estimated_duration=18.0)
+
+        result = self._assert_matches_full_run([self.ids[2]])
+
+        assert result.summary.touched_count == 1
+        assert [t.id for t in result.successful_tasks] == [self.ids[2]]
+
+    def test_estimate_change_shifts_following_tasks(self):
+        """Test shrinking the first task pulls the competing tasks earlier."""
+        self._update(self.ids[0], estimated_duration=6.0)
+
+        result = self._assert_matches_full_run([self.ids[0]])
+
+        assert result.summary.touched_count == 3
+
+    def test_added_low_priority_task_is_appended(self):
+        """Test a new lowest-priority task is scheduled without moving others."""
+        new_id = self.create_use_case.execute(
+            CreateTaskInput(name="D", priority=1, estimated_duration=6.0)
+        ).id
+
+        result = self._assert_matches_full_run([new_id])
+
+        assert result.summary.touched_count == 1
+        assert result.summary.new_count == 1
+
+    def test_downstream_dependents_are_rescheduled(self):
+        """Test dependents of a changed task join the affected set."""
+        self._update(self.ids[2], depends_on=[self.ids[1]])
+        self._update(self.ids[1], estimated_duration=6.0)
+
+        result = self._assert_matches_full_run([self.ids[1]])
+
+        assert {t.id for t in result.successful_tasks} == set(self.ids[1:])
+
+    @pytest.mark.parametrize(
+        "algorithm_name", ["greedy", "priority_first", "earliest_deadline"]
+    )
+    def test_matches_full_run_for_front_loading_strategies(self, algorithm_name):
+        """Test incremental and full runs agree across front-loading strategies."""
+        self.optimize_use_case.execute(self._input(algorithm_name=algorithm_name))
+        self._update(self.ids[1], status=TaskStatus.COMPLETED)
+
+        self._assert_matches_full_run([self.ids[1]], algorithm_name)
+
+    def test_unknown_changed_task_raises(self):
+        """Test an unknown changed task ID raises TaskNotFoundException."""
+        with pytest.raises(TaskNotFoundException):
+            self.optimize_use_case.execute(self._input(changed_task_ids=[999]))
+
+    def test_cannot_combine_with_task_ids(self):
+        """Test task_ids and changed_task_ids are mutually exclusive."""
+        with pytest.raises(TaskValidationError):
+            self.optimize_use_case.execute(
+                self._input(task_ids=[self.ids[0]], changed_task_ids=[self.ids[0]])
+            )
+
+    def test_full_run_reports_touched_count(self):
+        """Test a full run reports every task passed to the strategy."""
+        result = self.optimize_use_case.execute(self._input())
+
+        assert result.summary.touched_count == 3
+
+
+class TestOptimizeScheduleCapacityLanes:
+    """Test cases for multi-resource runs with capacity lanes."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, repository):
+        """Initialize use cases for each test."""
+        self.repository = repository
+        self.create_use_case = CreateTaskUseCase(self.repository)
+        self.optimize_use_case = OptimizeScheduleUseCase(self.repository)
+
+    def _create(self, name, hours, *tags, **fields):
+        return self.create_use_case.execute(
+            CreateTaskInput(
+                name=name,
+                priority=1,
+                estimated_duration=hours,
+                tags=list(tags),
+                **fields,
+            )
+        )
+
+    def _input(self, lanes, **kwargs):
+        return OptimizeScheduleInput(
+            start_date=datetime(2025, 10, 20, 9, 0, 0),  # Monday
+            max_hours_per_day=8.0,
+            force_override=True,
+            algorithm_name="greedy",
+            lanes=lanes,
+            **kwargs,
+        )
+
+    def test_lanes_schedule_in_parallel(self):
+        """Test each lane is filled up to its own limit on the same day."""
+        alice = self._create("Alice's task", 6.0, "alice")
+        bob = self._create("Bob's task", 6.0, "bob")
+
+        result = self.optimize_use_case.execute(
+            self._input(
+                [
+                    CapacityLane("alice", 6.0, ("alice",)),
+                    CapacityLane("bob", 6.0, ("bob",)),
+                ]
+            )
+        )
+
+        monday = date(2025, 10, 20)
+        for task in (alice, bob):
+            assert self.repository.get_by_id(task.id).daily_allocations == {monday: 6.0}
+        assert result.lane_allocations["alice"] == {monday: 6.0}
+        assert result.lane_allocations["bob"] == {monday: 6.0}
+        # 12h in total exceeds max_hours_per_day, but no lane is overloaded
+        assert result.daily_allocations == {monday: 12.0}
+        assert result.summary.overloaded_days == []
+
+    def test_existing_allocations_only_block_their_lane(self):
+        """Test a fixed task occupies its own lane's capacity only."""
+        self._create(
+            "Alice's meeting",
+            6.0,
+            "alice",
+            is_fixed=True,
+            planned_start=datetime(2025, 10, 20, 9, 0, 0),
+            planned_end=datetime(2025, 10, 20, 15, 0, 0),
+        )
+        alice = self._create("Alice's task", 6.0, "alice")
+        other = self._create("Untagged task", 6.0)
+
+        self.optimize_use_case.execute(
+            self._input([CapacityLane("alice", 6.0, ("alice",))])
+        )
+
+        assert self.repository.get_by_id(alice.id).planned_start.date() == date(
+            2025, 10, 21
+        )
+        assert self.repository.get_by_id(other.id).planned_start.date() == date(
+            2025, 10, 20
+        )
+
+
+class TestOptimizeScheduleProfile:
+    """Test cases for per-phase timings and strategy counters."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, repository):
+        """Initialize use cases for each test."""
+        self.repository = repository
+        self.create_use_case = CreateTaskUseCase(self.repository)
+        self.optimize_use_case = OptimizeScheduleUseCase(self.repository)
+        for i in range(3):
+            self.create_use_case.execute(
+                CreateTaskInput(
+                    name=f"Task {i}", priority=10 * (i + 1), estimated_duration=4.0
+                )
+            )
+
+    def _input(self, **kwargs):
+        return OptimizeScheduleInput(
+            start_date=datetime(2025, 10, 20, 9, 0, 0),  # Monday
+            max_hours_per_day=6.0,
+            force_override=True,
+            algorithm_name=kwargs.pop("algorithm_name", "greedy"),
+            **kwargs,
+        )
+
+    def test_profile_is_off_by_default(self):
+        """Test regular runs carry no profile."""
+        result = self.optimize_use_case.execute(self._input())
+
+        assert result.profile is None
+
+    def test_profile_reports_every_phase(self):
+        """Test a profiled run times each phase of the use case."""
+        result = self.optimize_use_case.execute(self._input(profile=True))
+
+        profile = result.profile
+        assert profile is not None
+        assert list(profile.phases) == [
+            "load_tasks",
+            "load_allocations",
+            "strategy",
+            "persist",
+            "summary",
+        ]
+        assert all(seconds >= 0.0 for seconds in profile.phases.values())
+        assert profile.total_seconds >= sum(profile.phases.values())
+        # Greedy has no counters to report
+        assert profile.counters == {}
+
+    def test_profile_reports_genetic_counters(self):
+        """Test the genetic algorithm reports its evaluation effort."""
+        result = self.optimize_use_case.execute(
+            self._input(algorithm_name="genetic", profile=True)
+        )
+
+        counters = result.profile.counters
+        assert counters["generations"] > 0
+        assert counters["evaluations"] > 0
+        assert counters["cache_hits"] > 0
+        assert isinstance(counters["early_terminated"], bool)
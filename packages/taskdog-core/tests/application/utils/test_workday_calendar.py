@@ -0,0 +1,112 @@
+"""Tests for WorkdayCalendar."""
+
+import threading
+from datetime import date, timedelta
+
+from taskdog_core.application.utils.date_helper import is_workday
+from taskdog_core.application.utils.workday_calendar import WorkdayCalendar
+from taskdog_core.infrastructure.holiday_checker import HolidayChecker
+
+
+class _CountingHolidayChecker:
+    """Holiday checker that records how often it is queried."""
+
+    def __init__(self, holidays: set[date]):
+        self.holidays = holidays
+        self.range_calls = 0
+
+    def is_holiday(self, check_date: date) -> bool:
+        raise AssertionError("WorkdayCalendar should fetch holidays in batches")
+
+    def get_holidays_in_range(self, start_date: date, end_date: date) -> set[date]:
+        self.range_calls += 1
+        return {d for d in self.holidays if start_date <= d <= end_date}
+
+
+class TestWorkdayCalendar:
+    """Test cases for WorkdayCalendar."""
+
+    def test_is_workday_without_holidays(self):
+        """Test weekdays are workdays and weekends are not."""
+        calendar = WorkdayCalendar()
+
+        assert calendar.is_workday(date(2025, 1, 6)) is True  # Monday
+        assert calendar.is_workday(date(2025, 1, 4)) is False  # Saturday
+
+    def test_holidays_from_explicit_set(self):
+        """Test explicit holidays are excluded from workdays."""
+        calendar = WorkdayCalendar(holidays={date(2025, 1, 7), date(2025, 1, 11)})
+
+        assert calendar.is_workday(date(2025, 1, 7)) is False
+        assert calendar.is_holiday(date(2025, 1, 7)) is True
+        assert calendar.is_holiday(date(2025, 1, 11)) is True  # Saturday holiday
+        assert calendar.is_holiday(date(2025, 1, 8)) is False
+
+    def test_matches_is_workday_with_holiday_checker(self):
+        """Test the index agrees with is_workday() for a real calendar."""
+        checker = HolidayChecker("JP")
+        calendar = WorkdayCalendar(checker)
+        start = date(2024, 12, 1)
+
+        for offset in range(500):
+            day = start + timedelta(days=offset)
+            assert calendar.is_workday(day) == is_workday(day, checker), day
+
+    def test_holidays_fetched_once_per_range(self):
+        """Test holidays are fetched in batches, not per day."""
+        checker = _CountingHolidayChecker({date(2025, 5, 5)})
+        calendar = WorkdayCalendar(checker)
+
+        for offset in range(365):
+            calendar.is_workday(date(2025, 1, 1) + timedelta(days=offset))
+
+        assert calendar.is_workday(date(2025, 5, 5)) is False
+        assert checker.range_calls == 1
+
+    def test_count_workdays(self):
+        """Test workdays are counted over inclusive ranges, spanning years."""
+        calendar = WorkdayCalendar(holidays={date(2025, 1, 8)})
+
+        assert calendar.count_workdays(date(2025, 1, 6), date(2025, 1, 12)) == 4
+        assert calendar.count_workdays(date(2025, 1, 12), date(2025, 1, 6)) == 0
+        assert calendar.count_workdays(date(2024, 12, 30), date(2025, 1, 3)) == 5
+
+    def test_workdays_between(self):
+        """Test workdays are listed in order, skipping weekends and holidays."""
+        calendar = WorkdayCalendar(holidays={date(2025, 1, 8)})
+
+        assert calendar.workdays_between(date(2025, 1, 6), date(2025, 1, 13)) == [
+            date(2025, 1, 6),
+            date(2025, 1, 7),
+            date(2025, 1, 9),
+            date(2025, 1, 10),
+            date(2025, 1, 13),
+        ]
+        assert calendar.workdays_between(date(2025, 1, 11), date(2025, 1, 12)) == []
+
+    def test_grows_backwards(self):
+        """Test queries before the covered range extend it."""
+        calendar = WorkdayCalendar()
+
+        assert calendar.is_workday(date(2030, 1, 1)) is True
+        assert calendar.is_workday(date(2020, 1, 4)) is False  # Saturday
+        assert calendar.count_workdays(date(2020, 1, 6), date(2020, 1, 10)) == 5
+
+    def test_concurrent_growth(self):
+        """Test concurrent queries over different years stay correct."""
+        calendar = WorkdayCalendar()
+        errors: list[date] = []
+
+        def check(year: int) -> None:
+            for offset in range(366):
+                day = date(year, 1, 1) + timedelta(days=offset)
+                if calendar.is_workday(day) != is_workday(day):
+                    errors.append(day)
+
+        threads = [threading.Thread(target=check, args=(y,)) for y in range(2020, 2030)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
@@ -44,3 +44,22 @@ def repository():
     repo = InMemoryTaskRepository()
     yield repo
     repo.clear()
+
+
+# =============================================================================
+# Optimization Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def process_pool(monkeypatch):
+    """Run multi-job optimizations on the process pool, even on one CPU.
+
+    The pool is capped at the CPU count, so without this fixture the pooled
+    path is skipped on single-CPU machines.
+    """
+    from taskdog_core.application.services.optimization import (
+        process_pool as process_pool_module,
+    )
+
+    monkeypatch.setattr(process_pool_module, "pool_size", lambda: 2)
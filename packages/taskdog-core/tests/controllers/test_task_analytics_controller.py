@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, Mock
 import pytest
 
 from taskdog_core.controllers.task_analytics_controller import TaskAnalyticsController
+from taskdog_core.domain.entities.task_statistics import TaskStatisticsAggregates
 from taskdog_core.infrastructure.persistence.database.sqlite_task_repository import (
     SqliteTaskRepository,
 )
@@ -28,44 +29,55 @@ class TestTaskAnalyticsController:
     def test_calculate_statistics_with_valid_period_all(self):
         """Test calculate_statistics with 'all' period."""
         # Arrange
-        self.repository.get_all.return_value = []
+        self.repository.get_statistics_aggregates.return_value = (
+            TaskStatisticsAggregates(completions_since=[0, 0])
+        )
 
         # Act
         result = self.controller.calculate_statistics(period="all")
 
         # Assert
         assert result is not None
-        self.repository.get_all.assert_called_once()
+        self.repository.get_statistics_aggregates.assert_called_once()
+        self.repository.get_all.assert_not_called()
 
     def test_calculate_statistics_with_valid_period_7d(self):
         """Test calculate_statistics with '7d' period."""
         # Arrange
-        self.repository.get_all.return_value = []
+        self.repository.get_statistics_aggregates.return_value = (
+            TaskStatisticsAggregates(completions_since=[0, 0])
+        )
 
         # Act
         result = self.controller.calculate_statistics(period="7d")
 
         # Assert
         assert result is not None
-        self.repository.get_all.assert_called_once()
+        self.repository.get_statistics_aggregates.assert_called_once()
+        self.repository.get_all.assert_not_called()
 
     def test_calculate_statistics_with_valid_period_30d(self):
         """Test calculate_statistics with '30d' period."""
         # Arrange
-        self.repository.get_all.return_value = []
+        self.repository.get_statistics_aggregates.return_value = (
+            TaskStatisticsAggregates(completions_since=[0, 0])
+        )
 
         # Act
         result = self.controller.calculate_statistics(period="30d")
 
         # Assert
         assert result is not None
-        self.repository.get_all.assert_called_once()
+        self.repository.get_statistics_aggregates.assert_called_once()
+        self.repository.get_all.assert_not_called()
 
     def test_calculate_statistics_without_audit_repository_has_no_reschedule_stats(
         self,
     ):
         """Reschedule stats are omitted when no audit repository is provided."""
-        self.repository.get_all.return_value = []
+        self.repository.get_statistics_aggregates.return_value = (
+            TaskStatisticsAggregates(completions_since=[0, 0])
+        )
 
         result = self.controller.calculate_statistics(period="all")
 
@@ -75,9 +87,12 @@ class TestTaskAnalyticsController:
         self,
     ):
         """Reschedule stats are calculated when an audit repository is provided."""
-        self.repository.get_all.return_value = []
+        self.repository.get_statistics_aggregates.return_value = (
+            TaskStatisticsAggregates(completions_since=[0, 0])
+        )
         audit_repository = MagicMock()
         audit_repository.get_deadline_changes.return_value = []
+        audit_repository.get_reschedule_aggregates.return_value = None
         controller = TaskAnalyticsController(
             repository=self.repository,
             config=self.config,
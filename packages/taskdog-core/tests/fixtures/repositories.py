@@ -44,6 +44,7 @@ class InMemoryTaskRepository(TaskRepository):
         # Track tags
         for tag in task.tags:
             self._tags.add(tag)
+        self._notify_changed(task.id, deepcopy(task))
 
     def save_all(self, tasks: list[Task]) -> None:
         for task in tasks:
@@ -54,6 +55,7 @@ class InMemoryTaskRepository(TaskRepository):
         if task is not None:
             # Clean up tags that no longer have any tasks
             self._rebuild_tags()
+            self._notify_changed(task_id, None)
 
     def create(self, name: str, priority: int | None = None, **kwargs: Any) -> Task:
         now = datetime.now()
@@ -108,6 +110,7 @@ class InMemoryTaskRepository(TaskRepository):
                 updated = deepcopy(task)
                 updated.tags.remove(tag_name)
                 self._tasks[tid] = updated
+                self._notify_changed(tid, deepcopy(updated))
                 count += 1
         self._tags.discard(tag_name)
         return count
@@ -0,0 +1,159 @@
+"""Property tests: filter trees compiled to SQL select what filter() keeps.
+
+Random task sets are stored in SQLite and random TaskFilter trees are
+compiled with to_criterion() into a single TaskQueryBuilder WHERE
+expression; the rows returned must be the tasks the Python filters keep.
+"""
+
+import random
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+
+from taskdog_core.application.queries.filters.date_range_filter import DateRangeFilter
+from taskdog_core.application.queries.filters.incomplete_filter import (
+    IncompleteFilter,
+)
+from taskdog_core.application.queries.filters.non_archived_filter import (
+    NonArchivedFilter,
+)
+from taskdog_core.application.queries.filters.status_filter import StatusFilter
+from taskdog_core.application.queries.filters.tag_filter import TagFilter
+from taskdog_core.application.queries.task_query_service import TaskQueryService
+from taskdog_core.domain.entities.task import Task, TaskStatus
+from taskdog_core.domain.repositories.task_criteria import AllOf, AnyOf, StatusIn
+from taskdog_core.infrastructure.persistence.database.models import TaskModel
+from taskdog_core.infrastructure.persistence.database.query_builders import (
+    TaskQueryBuilder,
+)
+from taskdog_core.infrastructure.persistence.database.sqlite_task_repository import (
+    SqliteTaskRepository,
+)
+from taskdog_core.infrastructure.persistence.mappers.task_db_mapper import TaskDbMapper
+from tests.helpers.time_provider import FakeTimeProvider
+
+BASE = date(2025, 3, 10)
+TAGS = ["work", "home", "urgent", "later"]
+
+
+def _random_datetime(rng):
+    if rng.random() < 0.5:
+        return None
+    day = BASE + timedelta(days=rng.randint(-10, 10))
+    return datetime.combine(day, datetime.min.time()) + timedelta(
+        hours=rng.choice([0, 9, 23]), minutes=rng.choice([0, 59])
+    )
+
+
+def _random_task(rng, index):
+    return Task(
+        name=f"Task {index}",
+        priority=rng.randint(1, 3),
+        status=rng.choice(list(TaskStatus)),
+        deadline=_random_datetime(rng),
+        planned_start=_random_datetime(rng),
+        planned_end=_random_datetime(rng),
+        actual_start=_random_datetime(rng),
+        actual_end=_random_datetime(rng),
+        tags=rng.sample(TAGS, rng.randint(0, 3)),
+        is_archived=rng.random() < 0.3,
+    )
+
+
+def _random_leaf(rng):
+    kind = rng.randrange(5)
+    if kind == 0:
+        return StatusFilter(rng.choice(list(TaskStatus)))
+    if kind == 1:
+        return IncompleteFilter()
+    if kind == 2:
+        return NonArchivedFilter()
+    if kind == 3:
+        return TagFilter(
+            rng.sample(TAGS, rng.randint(0, 3)), match_all=rng.random() < 0.5
+        )
+    start = BASE + timedelta(days=rng.randint(-12, 8)) if rng.random() < 0.7 else None
+    end = BASE + timedelta(days=rng.randint(-8, 12)) if start is None else None
+    if start is not None and rng.random() < 0.6:
+        end = start + timedelta(days=rng.randint(0, 6))
+    return DateRangeFilter(start, end, include_undated=rng.random() < 0.5)
+
+
+def _random_filter(rng, depth=0):
+    if depth >= 3 or rng.random() < 0.4:
+        return _random_leaf(rng)
+    left, right = _random_filter(rng, depth + 1), _random_filter(rng, depth + 1)
+    return left >> right if rng.random() < 0.5 else left | right
+
+
+class TestTaskCriteriaSql:
+    """SQL results of compiled filter trees match Python filtering."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        database_url = f"sqlite:///{Path(tmp_path) / 'tasks.db'}"
+        self.repository = SqliteTaskRepository(database_url, TaskDbMapper())
+        yield
+        self.repository.close()
+
+    def _store(self, seed, count=40):
+        rng = random.Random(seed)
+        for index in range(count):
+            self.repository.save(_random_task(rng, index))
+        return self.repository.get_all()
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_filter_trees_match_python(self, seed):
+        tasks = self._store(seed)
+        rng = random.Random(1000 + seed)
+
+        for _ in range(60):
+            task_filter = _random_filter(rng)
+            criterion = task_filter.to_criterion()
+            assert criterion is not None
+
+            sql_ids = sorted(t.id for t in self.repository.get_matching(criterion))
+            python_ids = sorted(t.id for t in task_filter.filter(tasks))
+
+            assert sql_ids == python_ids
+            assert python_ids == sorted(t.id for t in tasks if criterion.matches(t))
+
+    def test_query_service_pushes_whole_tree_to_sql(self):
+        tasks = self._store(42)
+        service = TaskQueryService(self.repository, FakeTimeProvider())
+        task_filter = (
+            NonArchivedFilter()
+            >> IncompleteFilter()
+            >> (TagFilter(["work"]) | StatusFilter(TaskStatus.IN_PROGRESS))
+        )
+
+        criterion, remaining = service._split_filter(task_filter)
+        result = service.get_filtered_tasks(task_filter)
+
+        assert remaining is None
+        assert criterion is not None
+        assert [t.id for t in result] == [t.id for t in task_filter.filter(tasks)]
+
+    def test_several_statuses_compile_to_in_and_or(self):
+        criterion = AnyOf(
+            (
+                AllOf((StatusIn(frozenset(TaskStatus)),)),
+                StatusIn(frozenset({TaskStatus.PENDING, TaskStatus.IN_PROGRESS})),
+            )
+        )
+
+        sql = str(
+            TaskQueryBuilder(select(TaskModel)).with_criterion(criterion).build()
+        ).lower()
+
+        assert "status in" in sql
+        assert " or " in sql
+
+    def test_empty_status_set_selects_nothing(self):
+        self._store(3, count=5)
+
+        assert self.repository.get_matching(StatusIn(frozenset())) == []
+        assert len(self.repository.get_matching(AllOf(()))) == 5
+        assert self.repository.get_matching(AnyOf(())) == []
@@ -0,0 +1,136 @@
+"""Property tests: TaskOrder compiled to ORDER BY sorts like TaskSorter.
+
+Random task sets with missing values and ties are stored in SQLite; every
+sort key in both directions must come back from the database in the order
+TaskSorter gives the same tasks, with and without a limit.
+"""
+
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+
+from taskdog_core.application.queries.filters.incomplete_filter import (
+    IncompleteFilter,
+)
+from taskdog_core.application.queries.filters.task_filter import TaskFilter
+from taskdog_core.application.queries.task_query_service import TaskQueryService
+from taskdog_core.application.sorters.task_sorter import TaskSorter
+from taskdog_core.domain.entities.task import Task, TaskStatus
+from taskdog_core.domain.repositories.task_criteria import NotArchived
+from taskdog_core.domain.repositories.task_order import TaskOrder
+from taskdog_core.infrastructure.persistence.database.models import TaskModel
+from taskdog_core.infrastructure.persistence.database.query_builders import (
+    TaskQueryBuilder,
+)
+from taskdog_core.infrastructure.persistence.database.sqlite_task_repository import (
+    SqliteTaskRepository,
+)
+from taskdog_core.infrastructure.persistence.mappers.task_db_mapper import TaskDbMapper
+from tests.helpers.time_provider import FakeTimeProvider
+
+BASE = datetime(2025, 3, 10, 9, 0)
+NAMES = ["alpha", "Alpha", "beta", "BETA", "Gamma", "delta"]
+
+
+def _maybe(rng, value):
+    return None if rng.random() < 0.3 else value
+
+
+def _random_task(rng):
+    return Task(
+        name=rng.choice(NAMES),
+        priority=_maybe(rng, rng.randint(1, 3)),
+        status=rng.choice(list(TaskStatus)),
+        deadline=_maybe(rng, BASE + timedelta(days=rng.randint(0, 3))),
+        planned_start=_maybe(rng, BASE + timedelta(hours=rng.randint(0, 3))),
+        estimated_duration=_maybe(rng, rng.choice([0.5, 2.0, 8.0])),
+        created_at=BASE + timedelta(minutes=rng.randint(0, 3)),
+        updated_at=BASE + timedelta(minutes=rng.randint(0, 3)),
+        is_archived=rng.random() < 0.3,
+    )
+
+
+class _OddIdFilter(TaskFilter):
+    """A filter without a criterion, so it is applied in Python."""
+
+    def filter(self, tasks):
+        return [task for task in tasks if task.id % 2]
+
+
+class TestTaskOrderSql:
+    """ORDER BY results match TaskSorter."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        database_url = f"sqlite:///{Path(tmp_path) / 'tasks.db'}"
+        self.repository = SqliteTaskRepository(database_url, TaskDbMapper())
+        yield
+        self.repository.close()
+
+    def _store(self, seed, count=40):
+        rng = random.Random(seed)
+        for _ in range(count):
+            self.repository.save(_random_task(rng))
+        return sorted(self.repository.get_all(), key=lambda task: task.id)
+
+    @pytest.mark.parametrize("seed", range(3))
+    @pytest.mark.parametrize("reverse", [False, True])
+    @pytest.mark.parametrize("sort_by", TaskOrder.SORT_KEYS)
+    def test_order_matches_task_sorter(self, seed, sort_by, reverse):
+        tasks = self._store(seed)
+        expected = [t.id for t in TaskSorter().sort(tasks, sort_by, reverse)]
+        order = TaskOrder(sort_by, reverse)
+
+        result = self.repository.get_matching(order=order)
+        limited = self.repository.get_matching(order=order, limit=7)
+
+        assert [t.id for t in result] == expected
+        assert [t.id for t in limited] == expected[:7]
+
+    def test_order_applies_after_criterion(self):
+        tasks = self._store(7)
+        active = [t for t in tasks if not t.is_archived]
+
+        result = self.repository.get_matching(
+            NotArchived(), TaskOrder("deadline", reverse=True), limit=5
+        )
+
+        expected = TaskSorter().sort(active, "deadline", reverse=True)[:5]
+        assert [t.id for t in result] == [t.id for t in expected]
+
+    def test_count_matching(self):
+        tasks = self._store(8)
+
+        assert self.repository.count_matching() == len(tasks)
+        assert self.repository.count_matching(NotArchived()) == len(
+            [t for t in tasks if not t.is_archived]
+        )
+
+    def test_missing_values_go_last_ascending(self):
+        sql = str(
+            TaskQueryBuilder(select(TaskModel))
+            .with_order(TaskOrder("deadline"))
+            .with_limit(3)
+            .build()
+        ).lower()
+
+        assert "order by tasks.deadline asc nulls last, tasks.id asc" in sql
+        assert "limit" in sql
+
+    @pytest.mark.parametrize("task_filter", [IncompleteFilter(), _OddIdFilter()])
+    def test_query_service_limit_with_and_without_sql_filter(self, task_filter):
+        tasks = self._store(9)
+        service = TaskQueryService(self.repository, FakeTimeProvider())
+
+        result = service.get_filtered_tasks(task_filter, "priority", limit=4)
+
+        expected = TaskSorter().sort(task_filter.filter(tasks), "priority")
+        assert [t.id for t in result] == [t.id for t in expected[:4]]
+        assert service.count_filtered_tasks(task_filter) == len(expected)
+
+    def test_invalid_sort_key_raises(self):
+        with pytest.raises(ValueError, match="Invalid sort_by"):
+            TaskOrder("unknown")
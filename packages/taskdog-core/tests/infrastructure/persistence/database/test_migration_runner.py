@@ -86,7 +86,10 @@ class TestRunMigrations:
             # Should now have alembic_version stamped
             inspector = inspect(engine)
             assert "alembic_version" in inspector.get_table_names()
-            assert get_current_revision(engine) == "006_remove_daily_allocations_json"
+            assert (
+                get_current_revision(engine)
+                == "007_add_audit_operation_success_timestamp_index"
+            )
         finally:
             engine.dispose()
 
@@ -100,7 +103,10 @@ class TestRunMigrations:
             run_migrations(engine)
 
             # Should still work and have correct revision
-            assert get_current_revision(engine) == "006_remove_daily_allocations_json"
+            assert (
+                get_current_revision(engine)
+                == "007_add_audit_operation_success_timestamp_index"
+            )
         finally:
             engine.dispose()
 
@@ -276,6 +282,26 @@ class TestRunMigrations:
         finally:
             engine.dispose()
 
+    def test_creates_audit_operation_success_timestamp_index(self) -> None:
+        """Test that audit_logs has the reschedule statistics index."""
+        engine = create_engine("sqlite:///:memory:")
+        try:
+            run_migrations(engine)
+
+            inspector = inspect(engine)
+            indexes = {
+                idx["name"]: idx["column_names"]
+                for idx in inspector.get_indexes("audit_logs")
+            }
+
+            assert indexes["idx_audit_operation_success_timestamp"] == [
+                "operation",
+                "success",
+                "timestamp",
+            ]
+        finally:
+            engine.dispose()
+
 
 class TestGetCurrentRevision:
     """Tests for get_current_revision function."""
@@ -294,7 +320,10 @@ class TestGetCurrentRevision:
         try:
             run_migrations(engine)
 
-            assert get_current_revision(engine) == "006_remove_daily_allocations_json"
+            assert (
+                get_current_revision(engine)
+                == "007_add_audit_operation_success_timestamp_index"
+            )
         finally:
             engine.dispose()
 
@@ -0,0 +1,149 @@
+"""Parity tests: SQL reschedule aggregates vs RescheduleAnalyzer in Python.
+
+Random deadline histories are written to a real SQLite audit log; the
+statistics built from get_reschedule_aggregates() must equal the ones
+RescheduleAnalyzer.calculate() derives from get_deadline_changes().
+"""
+
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from taskdog_core.application.services.reschedule_analyzer import (
+    CHRONIC_SLIPPER_THRESHOLD,
+    RescheduleAnalyzer,
+)
+from taskdog_core.domain.entities.audit_log import AuditLog
+from taskdog_core.infrastructure.persistence.database.models.task_model import Base
+from taskdog_core.infrastructure.persistence.database.sqlite_audit_log_repository import (
+    SqliteAuditLogRepository,
+)
+
+# Spans an ISO week-year boundary (2026-12-31 is in 2026-W53)
+BASE = datetime(2026, 12, 20, 9, 0)
+
+
+def _random_deadline(rng):
+    roll = rng.random()
+    if roll < 0.2:
+        return None
+    if roll < 0.25:
+        return rng.choice([42, "not a date", ""])
+    deadline = BASE + timedelta(
+        days=rng.randint(-2, 20),
+        hours=rng.choice([0, 6, 18]),
+        minutes=rng.randint(0, 59),
+    )
+    if roll < 0.3:
+        return deadline.date().isoformat()
+    return deadline.isoformat()
+
+
+class TestRescheduleAggregatesParity:
+    """SQL aggregates give the same statistics as the Python analyzer."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        db_path = Path(tmp_path) / "test_audit.db"
+        self.repository = SqliteAuditLogRepository(f"sqlite:///{db_path}")
+        Base.metadata.create_all(self.repository.engine)
+        self.analyzer = RescheduleAnalyzer()
+        yield
+        self.repository.close()
+
+    def _save(self, task_id, old, new, timestamp, **overrides):
+        fields = {
+            "timestamp": timestamp,
+            "operation": "update_task",
+            "resource_type": "task",
+            "success": True,
+            "resource_id": task_id,
+            "resource_name": f"Task {task_id}",
+            "old_values": {"deadline": old},
+            "new_values": {"deadline": new},
+        }
+        fields.update(overrides)
+        self.repository.save(AuditLog(**fields))
+
+    def _store_random(self, seed):
+        rng = random.Random(seed)
+        current: dict[int, object] = {}
+        timestamp = BASE - timedelta(days=10)
+        for _ in range(300):
+            task_id = rng.randint(1, 15)
+            old = current.get(task_id)
+            new = _random_deadline(rng)
+            if rng.random() < 0.15:
+                # A slip repeated so chronic slippers appear
+                new = old
+                if isinstance(old, str) and len(old) > 10:
+                    new = (datetime.fromisoformat(old) + timedelta(days=1)).isoformat()
+            # Equal timestamps check the ordering of ties
+            if rng.random() < 0.8:
+                timestamp += timedelta(hours=rng.randint(1, 30))
+            overrides = {}
+            roll = rng.random()
+            if roll < 0.05:
+                overrides["success"] = False
+            elif roll < 0.1:
+                overrides["operation"] = "create_task"
+            elif roll < 0.2:
+                overrides["resource_name"] = rng.choice([None, ""])
+            self._save(task_id, old, new, timestamp, **overrides)
+            if overrides.get("success", True) and "operation" not in overrides:
+                current[task_id] = new
+
+    def _assert_parity(self, since=None):
+        expected = self.analyzer.calculate(
+            self.repository.get_deadline_changes(since=since)
+        )
+        aggregates = self.repository.get_reschedule_aggregates(
+            since=since, min_reschedules=CHRONIC_SLIPPER_THRESHOLD
+        )
+
+        assert self.analyzer.calculate_from_aggregates(aggregates) == expected
+        return expected
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_random_histories_match_python(self, seed):
+        self._store_random(seed)
+
+        stats = self._assert_parity()
+        self._assert_parity(since=BASE)
+        self._assert_parity(since=BASE + timedelta(days=10))
+
+        assert stats.total_reschedule_events > 0
+        assert stats.chronic_slippers
+
+    def test_empty_log(self):
+        stats = self._assert_parity()
+
+        assert stats.tasks_with_deadline == 0
+        assert all(b.task_count == 0 for b in stats.lead_time_breakdown)
+
+    def test_equal_deadlines_in_other_format_are_not_reschedules(self):
+        self._save(1, None, "2026-07-20", datetime(2026, 7, 14, 10, 0))
+        self._save(1, "2026-07-20", "2026-07-20T00:00:00", datetime(2026, 7, 15, 10, 0))
+
+        stats = self._assert_parity()
+
+        assert stats.tasks_with_deadline == 1
+        assert stats.total_reschedule_events == 0
+
+    def test_chronic_slippers_ranked_by_count_then_first_event(self):
+        timestamp = datetime(2026, 7, 14, 10, 0)
+        for task_id, slips in ((1, 3), (2, 4), (3, 3)):
+            deadline = datetime(2026, 8, 1)
+            self._save(task_id, None, deadline.isoformat(), timestamp)
+            for _ in range(slips):
+                timestamp += timedelta(hours=1)
+                later = deadline + timedelta(hours=30)
+                self._save(task_id, deadline.isoformat(), later.isoformat(), timestamp)
+                deadline = later
+
+        stats = self._assert_parity()
+
+        assert [s.task_id for s in stats.chronic_slippers] == [2, 1, 3]
+        assert stats.chronic_slippers[0].total_slip_days == 5.0
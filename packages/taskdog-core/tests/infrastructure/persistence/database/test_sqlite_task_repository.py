@@ -1,5 +1,6 @@
 """Tests for SqliteTaskRepository."""
 
+import sqlite3
 from datetime import date, datetime
 from pathlib import Path
 
@@ -1101,3 +1102,107 @@ class TestSqliteTaskRepository:
         # Only task1 should be in result
         assert 1 in allocations
         assert 2 not in allocations
+
+    def test_iter_all_streams_tasks_in_id_order(self, monkeypatch):
+        """Test iter_all yields every task across fetch batches."""
+        monkeypatch.setattr(SqliteTaskRepository, "ITER_BATCH_SIZE", 2)
+        self.repository.save_all(
+            [
+                Task(id=i, name=f"Task {i}", priority=1, tags=[f"tag{i}"])
+                for i in (3, 1, 5, 2, 4)
+            ]
+        )
+
+        tasks = list(self.repository.iter_all())
+
+        assert [t.id for t in tasks] == [1, 2, 3, 4, 5]
+        assert [t.tags for t in tasks] == [[f"tag{i}"] for i in range(1, 6)]
+
+    def test_change_listeners_receive_saves_and_deletes(self):
+        """Test listeners are called with committed creates, saves and deletes."""
+        changes = []
+        self.repository.add_change_listener(
+            lambda task_id, task: changes.append((task_id, task and task.name))
+        )
+
+        created = self.repository.create("Created", priority=1)
+        self.repository.save_all(
+            [Task(id=created.id, name="Renamed", priority=1), Task(name="New")]
+        )
+        self.repository.delete(created.id)
+
+        assert changes == [
+            (created.id, "Created"),
+            (created.id, "Renamed"),
+            (created.id + 1, "New"),
+            (created.id, None),
+        ]
+
+    def test_delete_tag_notifies_tagged_tasks(self):
+        """Test delete_tag reports each task that lost the tag."""
+        tagged = self.repository.create("Tagged", priority=1, tags=["x", "y"])
+        self.repository.create("Other", priority=1, tags=["y"])
+        changes = []
+        self.repository.add_change_listener(
+            lambda task_id, task: changes.append((task_id, task and task.tags))
+        )
+
+        assert self.repository.delete_tag("x") == 1
+
+        assert changes == [(tagged.id, ["y"])]
+
+    def test_update_all_saves_returned_tasks(self):
+        """Test update_all saves what update() returns and notifies listeners."""
+        self.repository.create("A", priority=1)
+        self.repository.create("B", priority=1)
+        changes = []
+        self.repository.add_change_listener(
+            lambda task_id, task: changes.append((task_id, task and task.name))
+        )
+
+        def update(tasks):
+            assert [t.name for t in tasks] == ["A", "B"]
+            tasks[1].name = "Renamed"
+            return [tasks[1]]
+
+        self.repository.update_all(update)
+
+        assert [t.name for t in self.repository.get_all()] == ["A", "Renamed"]
+        assert changes == [(2, "Renamed")]
+
+    def test_update_all_saves_nothing_when_update_raises(self):
+        """Test an exception from update() aborts the transaction."""
+        self.repository.create("A", priority=1)
+
+        def update(tasks):
+            tasks[0].name = "Renamed"
+            raise ValueError("stale")
+
+        with pytest.raises(ValueError, match="stale"):
+            self.repository.update_all(update)
+
+        assert [t.name for t in self.repository.get_all()] == ["A"]
+
+    def test_update_all_holds_write_lock_while_checking(self):
+        """Test other writers cannot commit between update()'s read and save."""
+        self.repository.create("A", priority=1)
+        errors = []
+
+        def update(tasks):
+            other = sqlite3.connect(self.db_path, timeout=0.1)
+            try:
+                other.execute("UPDATE tasks SET name = 'Concurrent'")
+                other.commit()
+            except sqlite3.OperationalError as e:
+                errors.append(str(e))
+            finally:
+                other.close()
+            tasks[0].priority = 2
+            return tasks
+
+        self.repository.update_all(update)
+
+        assert errors == ["database is locked"]
+        task = self.repository.get_by_id(1)
+        assert task is not None
+        assert (task.name, task.priority) == ("A", 2)
@@ -0,0 +1,145 @@
+"""Tests for SQL-aggregated task statistics in SqliteTaskRepository."""
+
+import random
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import pytest
+
+from taskdog_core.application.services.task_statistics_calculator import (
+    TaskStatisticsCalculator,
+)
+from taskdog_core.domain.entities.task import Task, TaskStatus
+from taskdog_core.infrastructure.persistence.database.sqlite_task_repository import (
+    SqliteTaskRepository,
+)
+from taskdog_core.infrastructure.persistence.mappers.task_db_mapper import TaskDbMapper
+
+NOW = datetime(2026, 3, 15, 12, 30, 15, 250000)
+
+
+def _random_task(task_id: int, rng: random.Random) -> Task:
+    """A task with a random mix of status, priority, timing and deadline."""
+    status = rng.choice(list(TaskStatus))
+    end = None
+    start = None
+    if status != TaskStatus.PENDING or rng.random() < 0.1:
+        start = NOW - timedelta(days=rng.uniform(0, 90))
+    if status in (TaskStatus.COMPLETED, TaskStatus.CANCELED) and rng.random() < 0.9:
+        end = NOW - timedelta(days=rng.uniform(0, 60), microseconds=rng.randint(0, 999))
+        if start is None or start > end:
+            start = end - timedelta(hours=rng.uniform(0.1, 30)) if start else None
+    deadline = None
+    if rng.random() < 0.6:
+        deadline = NOW - timedelta(days=rng.uniform(-10, 60))
+    return Task(
+        id=task_id,
+        name=f"Task {task_id}",
+        priority=rng.choice([None, *range(1, 101)]),
+        status=status,
+        estimated_duration=rng.choice([None, 0.5, 2.0, 4.0, 8.0, 13.5]),
+        actual_duration=rng.choice([None, None, None, 1.0, 3.5, 9.0]),
+        actual_start=start,
+        actual_end=end,
+        deadline=deadline,
+        is_archived=rng.random() < 0.1,
+    )
+
+
+class TestSqliteTaskStatistics:
+    """Parity of SQL aggregates with the Python statistics calculator."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Set up a repository with a temporary database."""
+        self.repository = SqliteTaskRepository(
+            f"sqlite:///{tmp_path / 'test_tasks.db'}", TaskDbMapper()
+        )
+        self.calculator = TaskStatisticsCalculator()
+        yield
+        self.repository.close()
+
+    def _both(self, period: str):
+        aggregates = self.repository.get_statistics_aggregates(
+            since=self.calculator.period_start(period, NOW),
+            completion_cutoffs=self.calculator.trend_cutoffs(NOW),
+        )
+        from_sql = self.calculator.calculate_from_aggregates(aggregates, period)
+        from_tasks = self.calculator.calculate_all(
+            self.repository.get_all(), period=period, now=NOW
+        )
+        return from_sql, from_tasks
+
+    @pytest.mark.parametrize("period", ["all", "7d", "30d"])
+    def test_matches_python_calculator(self, period):
+        """Test every statistics section matches the Python calculator."""
+        rng = random.Random(41)
+        self.repository.save_all([_random_task(i, rng) for i in range(1, 301)])
+
+        from_sql, from_tasks = self._both(period)
+
+        assert from_sql.model_dump() == from_tasks.model_dump()
+        assert from_sql.task_stats.total_tasks > 0
+        assert from_sql.activity_stats is not None
+
+    @pytest.mark.parametrize("period", ["all", "7d", "30d"])
+    def test_empty_repository(self, period):
+        """Test an empty repository gives the same empty statistics."""
+        from_sql, from_tasks = self._both(period)
+
+        assert from_sql == from_tasks
+        assert from_sql.task_stats.total_tasks == 0
+        assert from_sql.time_stats is None
+
+    def test_buckets_by_end_time(self):
+        """Test weekday/hour, ISO week and month buckets of actual_end."""
+        # Sunday 2024-12-29 23:59 and Monday 2024-12-30 00:00 straddle ISO weeks
+        for task_id, end in enumerate(
+            [datetime(2024, 12, 29, 23, 59, 59, 999999), datetime(2024, 12, 30)],
+            start=1,
+        ):
+            self.repository.save(
+                Task(
+                    id=task_id,
+                    name=f"Task {task_id}",
+                    priority=50,
+                    status=TaskStatus.COMPLETED,
+                    actual_end=end,
+                )
+            )
+
+        aggregates = self.repository.get_statistics_aggregates()
+
+        assert aggregates.completions_by_weekday_hour == {(6, 23): 1, (0, 0): 1}
+        stats = self.calculator.calculate_from_aggregates(
+            replace(aggregates, completions_since=[0, 0])
+        )
+        assert stats.trend_stats.weekly_completion_trend == {
+            "2024-W52": 1,
+            "2025-W01": 1,
+        }
+        assert stats.trend_stats.monthly_completion_trend == {"2024-12": 2}
+
+    def test_deadline_delay(self):
+        """Test met/missed counts and the delay of missed deadlines."""
+        deadline = datetime(2026, 3, 1, 18, 0)
+        for task_id, end in enumerate(
+            [deadline, deadline + timedelta(days=1), deadline + timedelta(days=2)],
+            start=1,
+        ):
+            self.repository.save(
+                Task(
+                    id=task_id,
+                    name=f"Task {task_id}",
+                    priority=50,
+                    status=TaskStatus.COMPLETED,
+                    actual_end=end,
+                    deadline=deadline,
+                )
+            )
+
+        aggregates = self.repository.get_statistics_aggregates()
+
+        assert aggregates.deadline_met_count == 1
+        assert aggregates.deadline_missed_count == 2
+        assert aggregates.total_delay_days == pytest.approx(3.0)
@@ -1,10 +1,14 @@
 """Tests for HolidayChecker utility."""
 
+import json
 from datetime import date
+from unittest.mock import patch
 
 import pytest
 
-from taskdog_core.infrastructure.holiday_checker import HolidayChecker
+from taskdog_core.infrastructure.holiday_checker import HolidayChecker, holiday_years
+
+YEARS = range(2025, 2028)
 
 
 class TestHolidayCheckerJapan:
@@ -120,3 +124,92 @@ class TestHolidayCheckerInvalidCountry:
 
         assert "INVALID" in str(exc_info.value)
         assert "not supported" in str(exc_info.value)
+
+
+class TestHolidayCheckerCache:
+    """Test cases for the precomputed holiday cache."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Set up test fixtures."""
+        self.cache_dir = tmp_path
+        self.reference = HolidayChecker("JP", years=range(2024, 2030))
+
+    def _checker(self, years=YEARS):
+        return HolidayChecker("JP", cache_dir=self.cache_dir, years=years)
+
+    def _cache_files(self):
+        return sorted((self.cache_dir / "holidays").glob("JP-*.json"))
+
+    def test_holiday_years_window(self):
+        """Test the window spans the previous year to years_ahead after this one."""
+        assert holiday_years(2, today=date(2026, 10, 18)) == range(2025, 2029)
+        assert holiday_years(-1, today=date(2026, 10, 18)) == range(2025, 2027)
+
+    def test_cold_start_writes_cache(self):
+        """Test the first checker stores the window's holidays."""
+        self._checker()
+
+        [cache_file] = self._cache_files()
+        data = json.loads(cache_file.read_text())
+        assert (data["first_year"], data["last_year"]) == (2025, 2027)
+        assert "2025-01-01" in data["dates"]
+
+    def test_warm_start_skips_holidays_package(self):
+        """Test a cached window is served without creating a calendar."""
+        self._checker()
+
+        with patch(
+            "taskdog_core.infrastructure.holiday_checker._country_holidays"
+        ) as country_holidays:
+            checker = self._checker()
+
+            assert checker.is_holiday(date(2025, 1, 1)) is True
+            assert checker.is_holiday(date(2025, 1, 7)) is False
+            assert checker.get_holidays_in_range(
+                date(2025, 1, 1), date(2027, 12, 31)
+            ) == self.reference.get_holidays_in_range(
+                date(2025, 1, 1), date(2027, 12, 31)
+            )
+            country_holidays.assert_not_called()
+
+    def test_dates_outside_window_use_calendar(self):
+        """Test years outside the cached window still give holidays."""
+        self._checker()
+        checker = self._checker()
+
+        assert checker.is_holiday(date(2029, 1, 1)) is True
+        assert checker.get_holidays_in_range(
+            date(2024, 12, 1), date(2025, 1, 31)
+        ) == self.reference.get_holidays_in_range(date(2024, 12, 1), date(2025, 1, 31))
+
+    def test_uncovered_window_rebuilds_cache(self):
+        """Test a cache not covering the requested years is replaced."""
+        self._checker()
+        self._checker(years=range(2025, 2030))
+
+        [cache_file] = self._cache_files()
+        assert json.loads(cache_file.read_text())["last_year"] == 2029
+
+    def test_cache_is_keyed_by_holidays_version(self):
+        """Test another holidays version ignores and replaces the old file."""
+        self._checker()
+
+        with patch(
+            "taskdog_core.infrastructure.holiday_checker.distribution_version",
+            return_value="0.0.1",
+        ):
+            self._checker()
+
+        assert [f.name for f in self._cache_files()] == ["JP-0.0.1.json"]
+
+    def test_corrupt_cache_is_rebuilt(self):
+        """Test an unreadable cache file is regenerated."""
+        self._checker()
+        [cache_file] = self._cache_files()
+        cache_file.write_text("{not json")
+
+        checker = self._checker()
+
+        assert checker.is_holiday(date(2025, 1, 1)) is True
+        assert json.loads(cache_file.read_text())["first_year"] == 2025
@@ -195,6 +195,13 @@ class TestConfigManagerEnvVars:
         "env_key,env_value,section,field,expected",
         [
             ("TASKDOG_REGION_COUNTRY", "US", "region", "country", "US"),
+            (
+                "TASKDOG_REGION_HOLIDAY_CACHE_YEARS",
+                "2",
+                "region",
+                "holiday_cache_years",
+                2,
+            ),
             ("TASKDOG_STORAGE_BACKEND", "postgres", "storage", "backend", "postgres"),
             (
                 "TASKDOG_STORAGE_DATABASE_URL",
@@ -206,6 +213,7 @@ class TestConfigManagerEnvVars:
         ],
         ids=[
             "country",
+            "holiday_cache_years",
             "backend",
             "database_url",
         ],
@@ -233,4 +241,5 @@ class TestConfigManagerEnvVars:
 
         # Should use defaults
         assert config.region.country is None
+        assert config.region.holiday_cache_years == 5
         assert config.storage.backend == "sqlite"
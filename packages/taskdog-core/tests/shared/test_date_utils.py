@@ -1,10 +1,10 @@
 """Tests for date utility functions."""
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 
 import pytest
 
-from taskdog_core.shared.utils.date_utils import is_weekday
+from taskdog_core.shared.utils.date_utils import count_weekdays, is_weekday
 
 
 class TestWeekdayHelpers:
@@ -31,3 +31,41 @@ class TestWeekdayHelpers:
 
         assert is_weekday(monday_dt) is True
         assert is_weekday(saturday_dt) is False
+
+
+class TestCountWeekdays:
+    """Test cases for count_weekdays."""
+
+    @pytest.mark.parametrize(
+        "start,end,expected",
+        [
+            (date(2025, 1, 6), date(2025, 1, 12), 5),  # Mon-Sun
+            (date(2025, 1, 10), date(2025, 1, 13), 2),  # Fri-Mon
+            (date(2025, 1, 11), date(2025, 1, 12), 0),  # Sat-Sun
+            (date(2025, 1, 8), date(2025, 1, 8), 1),  # single weekday
+            (date(2025, 1, 8), date(2025, 1, 7), 0),  # empty range
+        ],
+    )
+    def test_count_weekdays(self, start, end, expected):
+        """Test weekday counts over short ranges."""
+        assert count_weekdays(start, end) == expected
+
+    def test_count_weekdays_matches_day_by_day_count(self):
+        """Test the closed form agrees with counting each day."""
+        start = date(2025, 1, 1)
+        for start_offset in range(7):
+            first = start + timedelta(days=start_offset)
+            for length in range(40):
+                last = first + timedelta(days=length)
+                expected = sum(
+                    1
+                    for i in range(length + 1)
+                    if is_weekday(first + timedelta(days=i))
+                )
+                assert count_weekdays(first, last) == expected
+
+    def test_count_weekdays_with_datetime(self):
+        """Test datetimes are compared by date."""
+        assert (
+            count_weekdays(datetime(2025, 1, 6, 23, 0), datetime(2025, 1, 7, 1, 0)) == 2
+        )
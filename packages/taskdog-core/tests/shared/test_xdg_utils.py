@@ -55,6 +55,27 @@ class TestXDGDirectories:
             state_home = XDGDirectories.get_state_home(create=False)
             assert state_home == Path("/home/test/.local/state/taskdog")
 
+    def test_get_cache_home_custom(self):
+        """Test get_cache_home with custom XDG_CACHE_HOME."""
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": "/tmp/test_cache"}):
+            cache_home = XDGDirectories.get_cache_home(create=False)
+            assert cache_home == Path("/tmp/test_cache/taskdog")
+
+    def test_get_cache_home_default(self):
+        """Test get_cache_home defaults to ~/.cache on Linux."""
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            patch(
+                "taskdog_core.shared.xdg_utils.platform.system", return_value="Linux"
+            ),
+            patch(
+                "taskdog_core.shared.xdg_utils.Path.home",
+                return_value=Path("/home/test"),
+            ),
+        ):
+            cache_home = XDGDirectories.get_cache_home(create=False)
+            assert cache_home == Path("/home/test/.cache/taskdog")
+
     def test_get_config_home_default(self):
         """Test get_config_home with default XDG_CONFIG_HOME."""
         # Use patch.dict with clear=True to ensure complete environment isolation
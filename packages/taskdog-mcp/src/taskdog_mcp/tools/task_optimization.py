@@ -31,6 +31,7 @@ def register_tools(mcp: MCPServer, client: TaskdogApiClient) -> None:
         task_ids: list[int] | None = None,
         force_override: bool = False,
         include_all_days: bool = False,
+        portfolio_algorithms: list[str] | None = None,
     ) -> dict[str, Any]:
         """Auto-generate optimal task schedules.
 
@@ -43,7 +44,9 @@ def register_tools(mcp: MCPServer, client: TaskdogApiClient) -> None:
                 balanced (even distribution), backward (JIT from deadline),
                 priority_first (priority only), earliest_deadline (EDF),
                 round_robin (parallel progress), dependency_aware (CPM),
-                genetic (evolutionary), monte_carlo (random sampling).
+                genetic (evolutionary), monte_carlo (random sampling),
+                exact (branch and bound, small backlogs),
+                portfolio (runs several algorithms, keeps the best).
                 Use list_algorithms() to discover available algorithms.
             max_hours_per_day: Maximum work hours per day (e.g., 6.0 or 8.0)
             start_date: Optimization start date in ISO format
@@ -53,6 +56,8 @@ def register_tools(mcp: MCPServer, client: TaskdogApiClient) -> None:
                 schedulable tasks are considered.
             force_override: If True, override existing schedules
             include_all_days: If True, schedule on weekends and holidays too
+            portfolio_algorithms: Algorithms compared when algorithm is
+                'portfolio'. Defaults to all fast heuristics when omitted.
 
         Returns:
             Optimization result with successful_tasks, failed_tasks,
@@ -70,6 +75,7 @@ def register_tools(mcp: MCPServer, client: TaskdogApiClient) -> None:
             force_override=force_override,
             task_ids=task_ids,
             include_all_days=include_all_days,
+            portfolio_algorithms=portfolio_algorithms,
         )
 
         successful = [{"id": t.id, "name": t.name} for t in result.successful_tasks]
@@ -115,6 +121,20 @@ def register_tools(mcp: MCPServer, client: TaskdogApiClient) -> None:
                 "overloaded_days": [
                     {"date": d, "hours": h} for d, h in result.summary.overloaded_days
                 ],
+                "selected_algorithm": result.summary.selected_algorithm,
+                "portfolio": [
+                    candidate.model_dump() for candidate in result.summary.portfolio
+                ],
+                "critical_path": (
+                    result.summary.critical_path.model_dump()
+                    if result.summary.critical_path
+                    else None
+                ),
+                "search_stats": (
+                    result.summary.search_stats.model_dump()
+                    if result.summary.search_stats
+                    else None
+                ),
             },
             "message": message,
         }
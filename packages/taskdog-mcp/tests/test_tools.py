@@ -1852,6 +1852,7 @@ class TestTaskOptimizationTools:
             force_override=False,
             task_ids=None,
             include_all_days=False,
+            portfolio_algorithms=None,
         )
         assert result["algorithm"] == "greedy"
         assert len(result["successful_tasks"]) == 2
@@ -1861,6 +1862,8 @@ class TestTaskOptimizationTools:
         assert result["summary"]["new_count"] == 2
         assert result["summary"]["total_hours"] == 10.0
         assert result["summary"]["days_span"] == 2
+        assert result["summary"]["selected_algorithm"] is None
+        assert result["summary"]["portfolio"] == []
         assert "Optimized 2 task(s)" in result["message"]
 
     def test_optimize_schedule_with_failures(self) -> None:
@@ -1944,21 +1947,23 @@ class TestTaskOptimizationTools:
 
         optimize_fn = mcp._tool_manager._tools["optimize_schedule"].fn
         optimize_fn(
-            algorithm="dependency_aware",
+            algorithm="portfolio",
             max_hours_per_day=4.0,
             start_date="2025-12-15T09:00:00",
             task_ids=[1, 2, 3],
             force_override=True,
             include_all_days=True,
+            portfolio_algorithms=["greedy", "dependency_aware"],
         )
 
         client.optimize_schedule.assert_called_once_with(
-            algorithm="dependency_aware",
+            algorithm="portfolio",
             start_date=datetime(2025, 12, 15, 9, 0, 0),
             max_hours_per_day=4.0,
             force_override=True,
             task_ids=[1, 2, 3],
             include_all_days=True,
+            portfolio_algorithms=["greedy", "dependency_aware"],
         )
 
     @pytest.mark.parametrize(
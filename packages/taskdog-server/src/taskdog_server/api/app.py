@@ -24,6 +24,7 @@ from taskdog_server.api.routers import (
     bulk_router,
     lifecycle_router,
     notes_router,
+    optimization_jobs_router,
     relationships_router,
     tags_router,
     tasks_router,
@@ -31,6 +32,7 @@ from taskdog_server.api.routers import (
 )
 from taskdog_server.config.server_config_manager import ServerConfigManager
 from taskdog_server.infrastructure.logging.config import configure_logging
+from taskdog_server.jobs.optimization_job_manager import OptimizationJobManager
 from taskdog_server.websocket.connection_manager import ConnectionManager
 
 
@@ -48,7 +50,8 @@ def create_app() -> FastAPI:
     async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         """FastAPI lifespan context manager.
 
-        Initializes logging, API context, and connection manager on startup.
+        Initializes logging, API context, connection manager, and the
+        optimization job pool on startup.
         Stores all state in app.state for proper scoping.
         """
         # Startup: Configure logging first
@@ -67,7 +70,9 @@ def create_app() -> FastAPI:
             )
 
         # Initialize API context and store in app.state
-        api_context = initialize_api_context(config)
+        api_context = initialize_api_context(
+            config, incremental_statistics=server_config.statistics.incremental
+        )
         app.state.api_context = api_context
 
         # Store server config in app.state (for authentication)
@@ -76,8 +81,26 @@ def create_app() -> FastAPI:
         # Initialize ConnectionManager in app.state (for WebSocket)
         app.state.connection_manager = ConnectionManager()
 
+        # Initialize worker pool for background optimization jobs
+        job_manager = OptimizationJobManager(api_context.time_provider)
+        app.state.optimization_job_manager = job_manager
+
         yield
 
+        # Shutdown: Stop background jobs before the engine goes away
+        job_manager.shutdown()
+
+        if api_context.gantt_overlay_cache is not None:
+            stats = api_context.gantt_overlay_cache.stats()
+            logging.getLogger(__name__).info(
+                "Gantt overlay cache: %d hits, %d misses (%.0f%% hit rate), "
+                "%d evictions",
+                stats.hits,
+                stats.misses,
+                stats.hit_rate * 100,
+                stats.evictions,
+            )
+
         # Shutdown: Dispose shared database engine
         api_context.close()
 
@@ -103,6 +126,9 @@ def create_app() -> FastAPI:
     )
     app.include_router(notes_router, prefix="/api/v1/tasks", tags=["notes"])
     app.include_router(analytics_router, prefix="/api/v1", tags=["analytics"])
+    app.include_router(
+        optimization_jobs_router, prefix="/api/v1/optimize/jobs", tags=["analytics"]
+    )
     app.include_router(tags_router, prefix="/api/v1/tags", tags=["tags"])
     app.include_router(audit_router, prefix="/api/v1/audit-logs", tags=["audit"])
     app.include_router(backup_router, prefix="/api/v1", tags=["backup"])
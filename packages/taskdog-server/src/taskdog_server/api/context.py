@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 
 from sqlalchemy.engine import Engine
 
+from taskdog_core.application.queries.gantt_overlay_cache import GanttOverlayCache
 from taskdog_core.application.services.bulk_operation_service import (
     BulkOperationService,
 )
@@ -40,6 +41,7 @@ class ApiContext:
         holiday_checker: Holiday checker for workday validation (optional)
         time_provider: Time provider for current time (optional, defaults to SystemTimeProvider)
         audit_log_controller: Controller for audit log operations
+        gantt_overlay_cache: Gantt overlay cache shared by the query controller
         engine: Shared SQLAlchemy engine (owned by this context)
     """
 
@@ -57,6 +59,7 @@ class ApiContext:
     notes_controller: NotesController
     bulk_service: BulkOperationService
     backup_controller: BackupController
+    gantt_overlay_cache: GanttOverlayCache | None = None
     engine: Engine | None = field(default=None, repr=False)
 
     def close(self) -> None:
@@ -7,9 +7,18 @@ from typing import Annotated
 from fastapi import BackgroundTasks, Depends, HTTPException, Request, WebSocket
 from fastapi.security import APIKeyHeader
 
+from taskdog_core.application.queries.gantt_overlay_cache import GanttOverlayCache
+from taskdog_core.application.queries.ready_task_index import ReadyTaskIndex
+from taskdog_core.application.queries.task_query_service import TaskQueryService
 from taskdog_core.application.services.bulk_operation_service import (
     BulkOperationService,
 )
+from taskdog_core.application.services.dependency_graph_index import (
+    DependencyGraphIndex,
+)
+from taskdog_core.application.services.incremental_task_statistics import (
+    IncrementalTaskStatistics,
+)
 from taskdog_core.controllers.audit_log_controller import AuditLogController
 from taskdog_core.controllers.backup_controller import BackupController
 from taskdog_core.controllers.notes_controller import NotesController
@@ -22,7 +31,10 @@ from taskdog_core.controllers.task_relationship_controller import (
 )
 from taskdog_core.domain.services.holiday_checker import IHolidayChecker
 from taskdog_core.domain.services.time_provider import ITimeProvider
-from taskdog_core.infrastructure.holiday_checker import HolidayChecker
+from taskdog_core.infrastructure.holiday_checker import (
+    HolidayChecker,
+    holiday_years,
+)
 from taskdog_core.infrastructure.persistence.database.engine_factory import (
     create_sqlite_engine,
 )
@@ -41,6 +53,7 @@ from taskdog_core.shared.config_manager import Config, ConfigManager
 from taskdog_core.shared.xdg_utils import XDGDirectories
 from taskdog_server.api.context import ApiContext
 from taskdog_server.config.server_config_manager import ServerConfig
+from taskdog_server.jobs.optimization_job_manager import OptimizationJobManager
 from taskdog_server.websocket.broadcaster import WebSocketEventBroadcaster
 from taskdog_server.websocket.connection_manager import ConnectionManager
 
@@ -66,6 +79,7 @@ def resolve_database_url(config: Config) -> str:
 def initialize_api_context(
     config: Config | None = None,
     time_provider: ITimeProvider | None = None,
+    incremental_statistics: bool = False,
 ) -> ApiContext:
     """Initialize API context with all dependencies.
 
@@ -74,6 +88,8 @@ def initialize_api_context(
     Args:
         config: Optional pre-loaded configuration. If None, loads from file.
         time_provider: Optional time provider. If None, uses SystemTimeProvider.
+        incremental_statistics: Keep task statistics up to date on each task
+            change instead of recomputing them per request.
 
     Returns:
         ApiContext: Initialized context with all controllers
@@ -99,7 +115,12 @@ def initialize_api_context(
     holiday_checker = None
     if config.region.country:
         with suppress(ImportError, NotImplementedError):
-            holiday_checker = HolidayChecker(config.region.country)
+            # Holidays are cached so warm starts skip the holidays package
+            holiday_checker = HolidayChecker(
+                config.region.country,
+                cache_dir=XDGDirectories.get_cache_home(create=False),
+                years=holiday_years(config.region.holiday_cache_years),
+            )
 
     # Initialize repository using factory based on storage config (shared engine)
     repository = RepositoryFactory.create(config.storage, engine=engine)
@@ -107,12 +128,38 @@ def initialize_api_context(
     # Initialize audit log repository (shared engine)
     audit_log_repository = SqliteAuditLogRepository(db_url, engine=engine)
 
+    # Statistics updated from every task saved or deleted through the repository
+    statistics_tracker = None
+    if incremental_statistics:
+        statistics_tracker = IncrementalTaskStatistics(repository, time_provider)
+        repository.add_change_listener(statistics_tracker.task_changed)
+
+    # Gantt overlay data shared across requests, invalidated on every change
+    gantt_overlay_cache = GanttOverlayCache()
+    repository.add_change_listener(gantt_overlay_cache.task_changed)
+
+    # Executable tasks for the "next" query, updated per changed task
+    ready_index = ReadyTaskIndex(repository, TaskQueryService.executable_sort_key)
+    repository.add_change_listener(ready_index.task_changed)
+
+    # Dependency graph for cycle checks, updated per changed task
+    graph_index = DependencyGraphIndex(repository)
+    repository.add_change_listener(graph_index.task_changed)
+
     # Initialize controllers
-    query_controller = QueryController(repository, notes_repository, time_provider)
+    query_controller = QueryController(
+        repository, notes_repository, time_provider, gantt_overlay_cache, ready_index
+    )
     lifecycle_controller = TaskLifecycleController(repository, config)
-    relationship_controller = TaskRelationshipController(repository, config)
+    relationship_controller = TaskRelationshipController(
+        repository, config, graph_index
+    )
     analytics_controller = TaskAnalyticsController(
-        repository, config, holiday_checker, audit_log_repository
+        repository,
+        config,
+        holiday_checker,
+        audit_log_repository,
+        incremental_statistics=statistics_tracker,
     )
     crud_controller = TaskCrudController(repository, config, holiday_checker)
     audit_log_controller = AuditLogController(audit_log_repository, time_provider)
@@ -138,6 +185,7 @@ def initialize_api_context(
         notes_controller=notes_controller,
         bulk_service=bulk_service,
         backup_controller=backup_controller,
+        gantt_overlay_cache=gantt_overlay_cache,
         engine=engine,
     )
 
@@ -313,6 +361,35 @@ EventBroadcasterDep = Annotated[
 ]
 
 
+def get_optimization_job_manager(
+    request: Request, context: ApiContextDep
+) -> OptimizationJobManager:
+    """Get the OptimizationJobManager instance from app.state.
+
+    Args:
+        request: FastAPI request object (injected automatically)
+        context: API context (provides the time provider)
+
+    Returns:
+        OptimizationJobManager: The job manager instance from app.state
+
+    Note:
+        The instance is lazily initialized on first access if not already
+        set in app.state (e.g., by lifespan).
+    """
+    if not hasattr(request.app.state, "optimization_job_manager"):
+        request.app.state.optimization_job_manager = OptimizationJobManager(
+            context.time_provider
+        )
+    manager: OptimizationJobManager = request.app.state.optimization_job_manager
+    return manager
+
+
+OptimizationJobManagerDep = Annotated[
+    OptimizationJobManager, Depends(get_optimization_job_manager)
+]
+
+
 # Server config dependency
 def get_server_config(request: Request) -> ServerConfig:
     """Get the server config from app.state.
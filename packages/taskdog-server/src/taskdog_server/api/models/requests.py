@@ -1,9 +1,18 @@
 """Pydantic request models for FastAPI endpoints."""
 
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from taskdog_core.application.constants.optimization import (
+    MONTE_CARLO_MAX_SIMULATIONS,
+    SCENARIO_MAX_COUNT,
+)
+from taskdog_core.application.dto.capacity_lane import CapacityLane
+from taskdog_core.application.dto.evaluate_scenarios_input import (
+    ScheduleScenario,
+    TaskOverride,
+)
 from taskdog_core.domain.entities.task import TaskStatus
 from taskdog_core.shared.constants import MAX_TASK_NAME_LENGTH
 from taskdog_server.api.validators import validate_tags as _validate_tags
@@ -151,6 +160,23 @@ class BulkTaskIdsRequest(BaseModel):
     )
 
 
+class CapacityLaneRequest(BaseModel):
+    """A worker or team scheduled with its own capacity."""
+
+    name: str = Field(..., min_length=1, description="Unique lane name")
+    max_hours_per_day: float = Field(
+        ..., gt=0, le=24, description="Daily work hour limit of the lane"
+    )
+    tags: list[str] = Field(
+        default_factory=list,
+        description="Tasks with any of these tags are scheduled in this lane",
+    )
+    days_off: list[date] = Field(
+        default_factory=list,
+        description="Extra non-working dates of the lane (e.g. vacation)",
+    )
+
+
 class OptimizeScheduleRequest(BaseModel):
     """Request model for schedule optimization."""
 
@@ -172,6 +198,122 @@ class OptimizeScheduleRequest(BaseModel):
         False,
         description="If True, schedule tasks on weekends and holidays too (default: False)",
     )
+    portfolio_algorithms: list[str] | None = Field(
+        None,
+        description="Algorithms evaluated by the 'portfolio' algorithm "
+        "(None means the default set)",
+    )
+    num_simulations: int | None = Field(
+        None,
+        gt=0,
+        le=MONTE_CARLO_MAX_SIMULATIONS,
+        description="Orderings sampled by the 'monte_carlo' algorithm "
+        "(None means the default count)",
+    )
+    changed_task_ids: list[int] | None = Field(
+        None,
+        description="Tasks added, completed or edited since the last run. When set, "
+        "only tasks whose schedules can change are re-allocated "
+        "(cannot be combined with task_ids)",
+    )
+    lanes: list[CapacityLaneRequest] | None = Field(
+        None,
+        description="Capacity lanes with their own daily limits and days off. "
+        "Each task goes to the first lane sharing one of its tags; other tasks "
+        "use max_hours_per_day (None means a single worker)",
+    )
+    dry_run: bool = Field(
+        False,
+        description="If True, compute a preview without saving it; the response's "
+        "plan_id can be applied later via POST /optimize/jobs/{plan_id}/apply "
+        "(ignored by POST /optimize/jobs, which always previews)",
+    )
+    profile: bool = Field(
+        False,
+        description="If True, the response includes per-phase timings and "
+        "strategy counters of the run",
+    )
+
+    def capacity_lanes(self) -> list[CapacityLane] | None:
+        """Convert the requested lanes to the optimizer's lane definitions."""
+        if not self.lanes:
+            return None
+        return [
+            CapacityLane(
+                name=lane.name,
+                max_hours_per_day=lane.max_hours_per_day,
+                tags=tuple(lane.tags),
+                days_off=frozenset(lane.days_off),
+            )
+            for lane in self.lanes
+        ]
+
+
+class TaskOverrideRequest(BaseModel):
+    """Hypothetical change to one task within a what-if scenario."""
+
+    task_id: int = Field(..., description="ID of the task to change")
+    estimated_duration: float | None = Field(
+        None, gt=0, description="Replacement estimate in hours"
+    )
+    deadline: datetime | None = Field(None, description="Replacement deadline")
+    priority: int | None = Field(None, gt=0, description="Replacement priority")
+
+
+class ScenarioRequest(BaseModel):
+    """One what-if variant of an optimization run."""
+
+    name: str = Field(..., min_length=1, description="Unique scenario label")
+    algorithm: str | None = Field(
+        None, description="Algorithm to use (None means the base algorithm)"
+    )
+    max_hours_per_day: float | None = Field(
+        None, gt=0, le=24, description="Daily limit (None means the base limit)"
+    )
+    task_overrides: list[TaskOverrideRequest] = Field(
+        default_factory=list, description="Task changes assumed by this scenario"
+    )
+
+
+class EvaluateScenariosRequest(BaseModel):
+    """Request model for evaluating what-if scenarios without saving."""
+
+    algorithm: str = Field(..., description="Base algorithm name")
+    max_hours_per_day: float = Field(
+        ..., gt=0, le=24, description="Base maximum hours per day"
+    )
+    start_date: datetime | None = Field(
+        None, description="Optimization start date (None means server current time)"
+    )
+    include_all_days: bool = Field(
+        False, description="If True, schedule tasks on weekends and holidays too"
+    )
+    scenarios: list[ScenarioRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=SCENARIO_MAX_COUNT,
+        description="Variants to evaluate against the same tasks",
+    )
+
+    def schedule_scenarios(self) -> list[ScheduleScenario]:
+        """Convert the requested scenarios to the use case's definitions."""
+        return [
+            ScheduleScenario(
+                name=scenario.name,
+                algorithm_name=scenario.algorithm,
+                max_hours_per_day=scenario.max_hours_per_day,
+                task_overrides=tuple(
+                    TaskOverride(
+                        task_id=override.task_id,
+                        estimated_duration=override.estimated_duration,
+                        deadline=override.deadline,
+                        priority=override.priority,
+                    )
+                    for override in scenario.task_overrides
+                ),
+            )
+            for scenario in self.scenarios
+        ]
 
 
 class UpdateNotesRequest(BaseModel):
@@ -12,6 +12,10 @@ from taskdog_core.shared.utils.datetime_parser import format_date_dict
 
 if TYPE_CHECKING:
     from taskdog_core.application.dto.gantt_overlay import GanttOverlay
+    from taskdog_core.application.dto.optimization_output import OptimizationOutput
+    from taskdog_core.application.dto.scenario_evaluation_output import (
+        ScenarioEvaluationOutput,
+    )
     from taskdog_core.application.dto.task_detail_output import TaskDetailOutput
     from taskdog_core.application.dto.task_list_output import TaskListOutput
     from taskdog_core.application.dto.task_operation_output import TaskOperationOutput
@@ -377,6 +381,36 @@ class SchedulingFailure(BaseModel):
     reason: str
 
 
+class PortfolioCandidateResponse(BaseModel):
+    """Result of one algorithm evaluated by the portfolio algorithm."""
+
+    algorithm: str
+    fitness: float | None = None
+    runtime_seconds: float
+    scheduled_count: int = 0
+    failed_count: int = 0
+    selected: bool = False
+    error: str | None = None
+
+
+class CriticalPathResponse(BaseModel):
+    """Longest dependency chain among the optimized tasks."""
+
+    task_ids: list[int]
+    total_hours: float
+    length_days: int
+
+
+class SearchStatsResponse(BaseModel):
+    """Effort and outcome of the exact algorithm's search."""
+
+    nodes_explored: int
+    runtime_seconds: float
+    nodes_per_second: float
+    optimal: bool
+    fallback: str | None = None
+
+
 class OptimizationSummary(BaseModel):
     """Summary of optimization results."""
 
@@ -387,14 +421,192 @@ class OptimizationSummary(BaseModel):
     start_date: date
     end_date: date
     algorithm: str
+    selected_algorithm: str | None = None
+    portfolio: list[PortfolioCandidateResponse] = Field(default_factory=list)
+    touched_count: int = 0
+    critical_path: CriticalPathResponse | None = None
+    search_stats: SearchStatsResponse | None = None
+
+
+class OptimizationProfileResponse(BaseModel):
+    """Per-phase timings and strategy counters of a profiled run."""
+
+    phases: dict[str, float] = Field(default_factory=dict)
+    total_seconds: float = 0.0
+    counters: dict[str, int | bool] = Field(default_factory=dict)
 
 
 class OptimizationResponse(BaseModel):
-    """Response model for schedule optimization."""
+    """Response model for schedule optimization.
+
+    Previews (dry runs) also carry the ID under which the plan can be applied
+    and the version of the task data it was computed from. Runs with
+    capacity lanes report the allocated hours per lane and day, and runs
+    requested with ``profile`` report where the time went.
+    """
 
     summary: OptimizationSummary
     failures: list[SchedulingFailure] = Field(default_factory=list)
     message: str
+    plan_id: str | None = None
+    data_version: str | None = None
+    lane_allocations: dict[str, dict[str, float]] = Field(default_factory=dict)
+    profile: OptimizationProfileResponse | None = None
+
+    @classmethod
+    def from_dto(
+        cls,
+        dto: OptimizationOutput,
+        algorithm: str,
+        start_date: datetime,
+        plan_id: str | None = None,
+    ) -> OptimizationResponse:
+        """Convert OptimizationOutput DTO to response model.
+
+        Args:
+            dto: OptimizationOutput from use case
+            algorithm: Name of the algorithm that produced the result
+            start_date: Optimization start date, used as the date range when
+                nothing was allocated
+            plan_id: ID under which a dry-run result is kept for applying
+
+        Returns:
+            OptimizationResponse for API response
+        """
+        failures = [
+            SchedulingFailure(task_id=f.task.id, task_name=f.task.name, reason=f.reason)
+            for f in dto.failed_tasks
+        ]
+
+        # Calculate date range from daily allocations
+        if dto.daily_allocations:
+            dates = list(dto.daily_allocations.keys())
+            opt_start_date = min(dates)
+            opt_end_date = max(dates)
+        else:
+            opt_start_date = start_date.date()
+            opt_end_date = start_date.date()
+
+        # Build optimization message
+        if dto.all_failed():
+            message = (
+                f"No tasks were scheduled. {len(dto.failed_tasks)} task(s) failed."
+            )
+        elif dto.has_failures():
+            message = f"Partially optimized: {len(dto.successful_tasks)} succeeded, {len(dto.failed_tasks)} failed."
+        else:
+            message = f"Successfully optimized {len(dto.successful_tasks)} task(s)."
+
+        return cls(
+            summary=OptimizationSummary(
+                total_tasks=len(dto.successful_tasks) + len(dto.failed_tasks),
+                scheduled_tasks=len(dto.successful_tasks),
+                failed_tasks=len(dto.failed_tasks),
+                total_hours=dto.summary.total_hours,
+                start_date=opt_start_date,
+                end_date=opt_end_date,
+                algorithm=algorithm,
+                selected_algorithm=dto.summary.selected_algorithm,
+                touched_count=dto.summary.touched_count,
+                portfolio=[
+                    PortfolioCandidateResponse.model_validate(candidate.model_dump())
+                    for candidate in dto.summary.portfolio
+                ],
+                critical_path=(
+                    CriticalPathResponse.model_validate(
+                        dto.summary.critical_path.model_dump()
+                    )
+                    if dto.summary.critical_path
+                    else None
+                ),
+                search_stats=(
+                    SearchStatsResponse.model_validate(
+                        dto.summary.search_stats.model_dump()
+                    )
+                    if dto.summary.search_stats
+                    else None
+                ),
+            ),
+            failures=failures,
+            message=message,
+            plan_id=plan_id,
+            data_version=dto.data_version,
+            lane_allocations={
+                name: format_date_dict(allocations)
+                for name, allocations in dto.lane_allocations.items()
+            },
+            profile=(
+                OptimizationProfileResponse.model_validate(dto.profile.model_dump())
+                if dto.profile
+                else None
+            ),
+        )
+
+
+class ScenarioResultResponse(BaseModel):
+    """Compact outcome of one what-if scenario."""
+
+    name: str
+    algorithm: str
+    max_hours_per_day: float
+    scheduled_count: int
+    failed_count: int
+    deadline_misses: int
+    end_date: date | None = None
+    peak_load: float = 0.0
+    total_hours: float = 0.0
+
+
+class ScenarioEvaluationResponse(BaseModel):
+    """Response model for what-if scenario evaluation, in request order."""
+
+    scenarios: list[ScenarioResultResponse] = Field(default_factory=list)
+
+    @classmethod
+    def from_dto(cls, dto: ScenarioEvaluationOutput) -> ScenarioEvaluationResponse:
+        """Convert ScenarioEvaluationOutput DTO to response model.
+
+        Args:
+            dto: ScenarioEvaluationOutput from use case
+
+        Returns:
+            ScenarioEvaluationResponse for API response
+        """
+        return cls(
+            scenarios=[
+                ScenarioResultResponse.model_validate(result.model_dump())
+                for result in dto.scenarios
+            ]
+        )
+
+
+class PlannedScheduleResponse(BaseModel):
+    """Schedule computed for one task by a background optimization job."""
+
+    task_id: int
+    planned_start: datetime
+    planned_end: datetime
+    daily_allocations: dict[str, float] = Field(default_factory=dict)
+
+
+class OptimizationJobResponse(BaseModel):
+    """Response model for a background optimization job.
+
+    ``result`` and ``planned_schedules`` form the preview and are only set
+    once the job has finished successfully; nothing is persisted until the
+    job is applied.
+    """
+
+    job_id: str
+    status: str
+    algorithm: str
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    cancel_requested: bool = False
+    error: str | None = None
+    result: OptimizationResponse | None = None
+    planned_schedules: list[PlannedScheduleResponse] = Field(default_factory=list)
 
 
 class NotesResponse(BaseModel):
@@ -6,6 +6,9 @@ from taskdog_server.api.routers.backup import router as backup_router
 from taskdog_server.api.routers.bulk import router as bulk_router
 from taskdog_server.api.routers.lifecycle import router as lifecycle_router
 from taskdog_server.api.routers.notes import router as notes_router
+from taskdog_server.api.routers.optimization_jobs import (
+    router as optimization_jobs_router,
+)
 from taskdog_server.api.routers.relationships import router as relationships_router
 from taskdog_server.api.routers.tags import router as tags_router
 from taskdog_server.api.routers.tasks import router as tasks_router
@@ -18,6 +21,7 @@ __all__ = [
     "bulk_router",
     "lifecycle_router",
     "notes_router",
+    "optimization_jobs_router",
     "relationships_router",
     "tags_router",
     "tasks_router",
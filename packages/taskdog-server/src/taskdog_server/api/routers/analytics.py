@@ -20,20 +20,23 @@ from taskdog_server.api.dependencies import (
     AuthenticatedClientDep,
     EventBroadcasterDep,
     HolidayCheckerDep,
+    OptimizationJobManagerDep,
     QueryControllerDep,
     TimeProviderDep,
 )
-from taskdog_server.api.models.requests import OptimizeScheduleRequest
+from taskdog_server.api.models.requests import (
+    EvaluateScenariosRequest,
+    OptimizeScheduleRequest,
+)
 from taskdog_server.api.models.responses import (
     ActivityPattern,
     CompletionStatistics,
     DeadlineStatistics,
     EstimationStatistics,
     OptimizationResponse,
-    OptimizationSummary,
     PriorityDistribution,
     RescheduleStatisticsData,
-    SchedulingFailure,
+    ScenarioEvaluationResponse,
     StatisticsResponse,
     TagStatisticsItem,
     TagStatisticsResponse,
@@ -299,15 +302,21 @@ def optimize_schedule(
     broadcaster: EventBroadcasterDep,
     audit_controller: AuditLogControllerDep,
     time_provider: TimeProviderDep,
+    job_manager: OptimizationJobManagerDep,
     client_name: AuthenticatedClientDep,
 ) -> OptimizationResponse:
     """Optimize task schedules using specified algorithm.
 
+    With ``dry_run`` the schedule is computed but not saved. The preview is
+    kept under the returned ``plan_id`` and can be applied later via
+    POST /optimize/jobs/{plan_id}/apply, as long as no task changes first.
+
     Args:
         request: Optimization parameters
         controller: Analytics controller dependency
         broadcaster: Event broadcaster dependency
         time_provider: Time provider dependency
+        job_manager: Optimization job manager dependency (keeps previews)
         client_name: Authenticated client name (used for broadcast exclusion)
 
     Returns:
@@ -328,8 +337,21 @@ def optimize_schedule(
             force_override=request.force_override,
             task_ids=request.task_ids,
             include_all_days=request.include_all_days,
+            portfolio_algorithms=request.portfolio_algorithms,
+            num_simulations=request.num_simulations,
+            profile=request.profile,
+            changed_task_ids=request.changed_task_ids,
+            lanes=request.capacity_lanes(),
+            dry_run=request.dry_run,
         )
 
+        if request.dry_run:
+            # Nothing changed yet: no broadcast or audit entry until applied
+            plan = job_manager.store(request.algorithm, start_date, result)
+            return OptimizationResponse.from_dto(
+                result, request.algorithm, start_date, plan_id=plan.job_id
+            )
+
         # Broadcast WebSocket event in background (exclude the requester by client name)
         broadcaster.schedule_optimized(
             len(result.successful_tasks),
@@ -351,58 +373,67 @@ def optimize_schedule(
                 "failed_tasks": len(result.failed_tasks),
                 "total_hours": result.summary.total_hours,
                 "task_ids": request.task_ids,
+                "changed_task_ids": request.changed_task_ids,
             },
             success=True,
         )
 
         # Convert DTO to response model
-        failures = [
-            SchedulingFailure(task_id=f.task.id, task_name=f.task.name, reason=f.reason)
-            for f in result.failed_tasks
-        ]
-
-        # Calculate date range from daily allocations
-        if result.daily_allocations:
-            dates = list(result.daily_allocations.keys())
-            opt_start_date = min(dates)
-            opt_end_date = max(dates)
-        else:
-            opt_start_date = start_date.date()
-            opt_end_date = start_date.date()
-
-        # Build optimization message
-        if result.all_failed():
-            message = (
-                f"No tasks were scheduled. {len(result.failed_tasks)} task(s) failed."
-            )
-        elif result.has_failures():
-            message = f"Partially optimized: {len(result.successful_tasks)} succeeded, {len(result.failed_tasks)} failed."
-        else:
-            message = f"Successfully optimized {len(result.successful_tasks)} task(s)."
-
-        return OptimizationResponse(
-            summary=OptimizationSummary(
-                total_tasks=len(result.successful_tasks) + len(result.failed_tasks),
-                scheduled_tasks=len(result.successful_tasks),
-                failed_tasks=len(result.failed_tasks),
-                total_hours=result.summary.total_hours,
-                start_date=opt_start_date,
-                end_date=opt_end_date,
-                algorithm=request.algorithm,
-            ),
-            failures=failures,
-            message=message,
-        )
+        return OptimizationResponse.from_dto(result, request.algorithm, start_date)
     except TaskNotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
     except NoSchedulableTasksError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
         ) from e
-    except TaskValidationError as e:
+    except (TaskValidationError, ValueError) as e:
+        # ValueError: unknown algorithm or invalid portfolio configuration
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+
+@router.post("/optimize/scenarios", response_model=ScenarioEvaluationResponse)
+def evaluate_scenarios(
+    request: EvaluateScenariosRequest,
+    controller: AnalyticsControllerDep,
+    time_provider: TimeProviderDep,
+    _client_name: AuthenticatedClientDep,
+) -> ScenarioEvaluationResponse:
+    """Evaluate what-if variants of an optimization without saving anything.
+
+    Tasks are loaded once and every scenario re-plans all schedulable tasks
+    with its own algorithm, daily limit and task overrides. Nothing is
+    written, broadcast or audited.
+
+    Args:
+        request: Base parameters and scenarios
+        controller: Analytics controller dependency
+        time_provider: Time provider dependency
+
+    Returns:
+        One compact summary per scenario, in request order
+
+    Raises:
+        HTTPException: 404 if an override refers to a missing task,
+            400 if validation fails
+    """
+    try:
+        result = controller.evaluate_scenarios(
+            algorithm=request.algorithm,
+            start_date=request.start_date or time_provider.now(),
+            max_hours_per_day=request.max_hours_per_day,
+            scenarios=request.schedule_scenarios(),
+            include_all_days=request.include_all_days,
+        )
+    except TaskNotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except (TaskValidationError, ValueError) as e:
+        # ValueError: unknown algorithm
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
         ) from e
+    return ScenarioEvaluationResponse.from_dto(result)
 
 
 @router.get("/algorithms", response_model=list[dict[str, str]])
@@ -0,0 +1,252 @@
+"""Background schedule optimization endpoints.
+
+Jobs compute a dry-run schedule on the server's worker pool, so long runs are
+not bound by HTTP client timeouts. Results are previewed via GET and only
+persisted when the client applies them.
+"""
+
+from collections.abc import Callable
+
+from fastapi import APIRouter, HTTPException, status
+
+from taskdog_core.application.dto.optimization_output import OptimizationOutput
+from taskdog_core.domain.exceptions.task_exceptions import StaleOptimizationPlanError
+from taskdog_core.shared.utils.datetime_parser import format_date_dict
+from taskdog_server.api.dependencies import (
+    AnalyticsControllerDep,
+    AuditLogControllerDep,
+    AuthenticatedClientDep,
+    EventBroadcasterDep,
+    OptimizationJobManagerDep,
+    QueryControllerDep,
+    TimeProviderDep,
+)
+from taskdog_server.api.models.requests import OptimizeScheduleRequest
+from taskdog_server.api.models.responses import (
+    OptimizationJobResponse,
+    OptimizationResponse,
+    PlannedScheduleResponse,
+)
+from taskdog_server.jobs.optimization_job_manager import (
+    OptimizationJob,
+    OptimizationJobManager,
+    OptimizationJobNotFoundError,
+    OptimizationJobStateError,
+)
+
+router = APIRouter()
+
+
+def _to_response(job: OptimizationJob) -> OptimizationJobResponse:
+    """Convert a job to its API representation, including the preview."""
+    result = None
+    planned_schedules: list[PlannedScheduleResponse] = []
+    if job.result is not None:
+        result = OptimizationResponse.from_dto(
+            job.result, job.algorithm, job.start_date, plan_id=job.job_id
+        )
+        planned_schedules = [
+            PlannedScheduleResponse(
+                task_id=plan.task_id,
+                planned_start=plan.planned_start,
+                planned_end=plan.planned_end,
+                daily_allocations=format_date_dict(plan.daily_allocations),
+            )
+            for plan in job.result.planned_schedules
+        ]
+    return OptimizationJobResponse(
+        job_id=job.job_id,
+        status=job.status.value,
+        algorithm=job.algorithm,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        cancel_requested=job.cancel_requested,
+        error=job.error,
+        result=result,
+        planned_schedules=planned_schedules,
+    )
+
+
+def _get_job_or_404(manager: OptimizationJobManager, job_id: str) -> OptimizationJob:
+    try:
+        return manager.get(job_id)
+    except OptimizationJobNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+
+@router.post(
+    "",
+    response_model=OptimizationJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def submit_optimization_job(
+    request: OptimizeScheduleRequest,
+    controller: AnalyticsControllerDep,
+    query_controller: QueryControllerDep,
+    manager: OptimizationJobManagerDep,
+    time_provider: TimeProviderDep,
+    _client_name: AuthenticatedClientDep,
+) -> OptimizationJobResponse:
+    """Start a background optimization that computes a preview.
+
+    Args:
+        request: Optimization parameters (same as POST /optimize)
+        controller: Analytics controller dependency
+        query_controller: Query controller dependency (algorithm validation)
+        manager: Optimization job manager dependency
+        time_provider: Time provider dependency
+
+    Returns:
+        The queued job
+
+    Raises:
+        HTTPException: 400 if the algorithm is unknown
+    """
+    algorithms = [name for name, _, _ in query_controller.get_algorithm_metadata()]
+    if request.algorithm not in algorithms:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown optimization algorithm: '{request.algorithm}'. "
+            f"Available algorithms: {', '.join(algorithms)}",
+        )
+
+    start_date = request.start_date or time_provider.now()
+
+    def run(cancellation_check: Callable[[], bool]) -> OptimizationOutput:
+        return controller.optimize_schedule(
+            algorithm=request.algorithm,
+            start_date=start_date,
+            max_hours_per_day=request.max_hours_per_day,
+            force_override=request.force_override,
+            task_ids=request.task_ids,
+            include_all_days=request.include_all_days,
+            portfolio_algorithms=request.portfolio_algorithms,
+            num_simulations=request.num_simulations,
+            profile=request.profile,
+            changed_task_ids=request.changed_task_ids,
+            lanes=request.capacity_lanes(),
+            dry_run=True,
+            cancellation_check=cancellation_check,
+        )
+
+    job = manager.submit(request.algorithm, start_date, run)
+    return _to_response(job)
+
+
+@router.get("/{job_id}", response_model=OptimizationJobResponse)
+def get_optimization_job(
+    job_id: str,
+    manager: OptimizationJobManagerDep,
+    _client_name: AuthenticatedClientDep,
+) -> OptimizationJobResponse:
+    """Get job status and, once finished, the schedule preview.
+
+    Args:
+        job_id: Job identifier
+        manager: Optimization job manager dependency
+
+    Returns:
+        Job status with preview
+
+    Raises:
+        HTTPException: 404 if the job is unknown or has been evicted
+    """
+    return _to_response(_get_job_or_404(manager, job_id))
+
+
+@router.post("/{job_id}/cancel", response_model=OptimizationJobResponse)
+def cancel_optimization_job(
+    job_id: str,
+    manager: OptimizationJobManagerDep,
+    _client_name: AuthenticatedClientDep,
+) -> OptimizationJobResponse:
+    """Request cancellation of a queued or running job.
+
+    Running jobs stop at the strategy's next checkpoint (between tasks,
+    generations, or simulations), so the status may still read "running".
+
+    Args:
+        job_id: Job identifier
+        manager: Optimization job manager dependency
+
+    Returns:
+        Job state after the cancellation request
+
+    Raises:
+        HTTPException: 404 if the job is unknown or has been evicted
+    """
+    try:
+        job = manager.cancel(job_id)
+    except OptimizationJobNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    return _to_response(job)
+
+
+@router.post("/{job_id}/apply", response_model=OptimizationResponse)
+def apply_optimization_job(
+    job_id: str,
+    controller: AnalyticsControllerDep,
+    manager: OptimizationJobManagerDep,
+    broadcaster: EventBroadcasterDep,
+    audit_controller: AuditLogControllerDep,
+    client_name: AuthenticatedClientDep,
+) -> OptimizationResponse:
+    """Persist the schedule computed by a finished job.
+
+    Also applies previews from POST /optimize with dry_run, whose plan_id is
+    a job ID. All schedules are saved in one batch, and only if no task
+    changed since the preview was computed.
+
+    Args:
+        job_id: Job identifier
+        controller: Analytics controller dependency
+        manager: Optimization job manager dependency
+        broadcaster: Event broadcaster dependency
+        audit_controller: Audit log controller dependency
+        client_name: Authenticated client name (used for broadcast exclusion)
+
+    Returns:
+        Optimization results with summary and failures
+
+    Raises:
+        HTTPException: 404 if the job or a scheduled task no longer exists,
+            409 if the job has not succeeded, is being or was already
+            applied, or the tasks changed since the preview, 400 if a task
+            is no longer schedulable
+    """
+    job = _get_job_or_404(manager, job_id)
+    try:
+        manager.apply(job_id, controller.apply_optimization)
+    except OptimizationJobNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except (OptimizationJobStateError, StaleOptimizationPlanError) as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+
+    result = job.result
+    assert result is not None
+
+    broadcaster.schedule_optimized(
+        len(result.successful_tasks),
+        len(result.failed_tasks),
+        job.algorithm,
+        client_name,
+    )
+
+    audit_controller.log_operation(
+        operation="optimize_schedule",
+        resource_type="schedule",
+        resource_id=None,
+        resource_name=None,
+        client_name=client_name,
+        new_values={
+            "algorithm": job.algorithm,
+            "scheduled_tasks": len(result.successful_tasks),
+            "failed_tasks": len(result.failed_tasks),
+            "total_hours": result.summary.total_hours,
+            "job_id": job_id,
+        },
+        success=True,
+    )
+
+    return OptimizationResponse.from_dto(result, job.algorithm, job.start_date)
@@ -112,6 +112,9 @@ def list_tasks(
     gantt_end_date: Annotated[
         str | None, Query(description="Gantt chart end date (ISO format)")
     ] = None,
+    limit: Annotated[
+        int | None, Query(ge=1, description="Maximum number of tasks to return")
+    ] = None,
 ) -> TaskListResponse:
     """List tasks with optional filtering and sorting.
 
@@ -128,6 +131,7 @@ def list_tasks(
         include_gantt: Include Gantt chart data
         gantt_start_date: Gantt chart start date (ISO format)
         gantt_end_date: Gantt chart end date (ISO format)
+        limit: Maximum number of tasks to return, after sorting
 
     Returns:
         List of tasks with metadata, optionally including Gantt data
@@ -147,6 +151,7 @@ def list_tasks(
         end_date=end,
         sort_by=sort,
         reverse=reverse,
+        limit=limit,
     )
 
     # Query tasks using Use Case pattern
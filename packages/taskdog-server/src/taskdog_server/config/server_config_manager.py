@@ -40,15 +40,29 @@ class AuthConfig:
     api_keys: tuple[ApiKeyEntry, ...] = ()
 
 
+@dataclass(frozen=True)
+class StatisticsConfig:
+    """Statistics configuration.
+
+    Attributes:
+        incremental: Whether task statistics are kept up to date as tasks
+                     change instead of recomputed per request. Default is False.
+    """
+
+    incremental: bool = False
+
+
 @dataclass(frozen=True)
 class ServerConfig:
     """Server-specific configuration.
 
     Attributes:
         auth: Authentication configuration
+        statistics: Statistics configuration
     """
 
     auth: AuthConfig = field(default_factory=AuthConfig)
+    statistics: StatisticsConfig = field(default_factory=StatisticsConfig)
 
 
 class ServerConfigManager:
@@ -70,8 +84,12 @@ class ServerConfigManager:
         name = "webhook-github"
         key = "sk-yyyyyyyyyyyyyyyy"
 
+        [statistics]
+        incremental = true  # optional, default false
+
     Environment variables:
         TASKDOG_AUTH_ENABLED: Override auth.enabled (true/false)
+        TASKDOG_STATISTICS_INCREMENTAL: Override statistics.incremental (true/false)
     """
 
     @classmethod
@@ -106,6 +124,15 @@ class ServerConfigManager:
             if isinstance(entry, dict) and "name" in entry and "key" in entry
         )
 
+        # Parse statistics mode with environment variable override
+        statistics_data = data.get("statistics", {})
+        incremental = ConfigLoader.get_env(
+            "STATISTICS_INCREMENTAL",
+            statistics_data.get("incremental", False),
+            bool,
+        )
+
         return ServerConfig(
             auth=AuthConfig(enabled=enabled, api_keys=api_keys),
+            statistics=StatisticsConfig(incremental=incremental),
         )
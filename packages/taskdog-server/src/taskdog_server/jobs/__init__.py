@@ -0,0 +1,17 @@
+"""Background job execution for long-running operations."""
+
+from taskdog_server.jobs.optimization_job_manager import (
+    OptimizationJob,
+    OptimizationJobManager,
+    OptimizationJobNotFoundError,
+    OptimizationJobStateError,
+    OptimizationJobStatus,
+)
+
+__all__ = [
+    "OptimizationJob",
+    "OptimizationJobManager",
+    "OptimizationJobNotFoundError",
+    "OptimizationJobStateError",
+    "OptimizationJobStatus",
+]
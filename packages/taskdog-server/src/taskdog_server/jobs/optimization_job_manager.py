@@ -0,0 +1,342 @@
+"""Background execution of schedule optimizations.
+
+Long optimizations (genetic, monte_carlo on large backlogs) can outlive HTTP
+client timeouts. This module runs them as dry-run jobs on a bounded worker
+pool; clients poll for a preview and explicitly apply it afterwards.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, TypeVar
+
+from taskdog_core.domain.exceptions.task_exceptions import (
+    OptimizationCancelledError,
+    TaskError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+    from datetime import datetime
+
+    from taskdog_core.application.dto.optimization_output import OptimizationOutput
+    from taskdog_core.domain.services.time_provider import ITimeProvider
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_MAX_FINISHED_JOBS = 32
+
+
+class OptimizationJobStatus(Enum):
+    """Lifecycle states of an optimization job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    APPLYING = "applying"
+    APPLIED = "applied"
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job will not run (again)."""
+        return self not in (
+            OptimizationJobStatus.QUEUED,
+            OptimizationJobStatus.RUNNING,
+        )
+
+
+class OptimizationJobNotFoundError(Exception):
+    """Raised when a job ID is unknown or its result has been evicted."""
+
+    def __init__(self, job_id: str) -> None:
+        """Initialize with the missing job ID.
+
+        Args:
+            job_id: ID of the job that was not found
+        """
+        self.job_id = job_id
+        super().__init__(f"Optimization job {job_id} not found")
+
+
+class OptimizationJobStateError(Exception):
+    """Raised when an operation is not allowed in the job's current state."""
+
+
+@dataclass
+class OptimizationJob:
+    """A single background optimization run.
+
+    Attributes:
+        job_id: Unique job identifier
+        algorithm: Optimization algorithm name
+        start_date: Optimization start date
+        created_at: When the job was submitted
+        status: Current lifecycle state
+        started_at: When a worker picked the job up
+        finished_at: When the job reached a finished state
+        result: Dry-run optimization result (set on success)
+        error: Error message (set on failure)
+    """
+
+    job_id: str
+    algorithm: str
+    start_date: datetime
+    created_at: datetime
+    status: OptimizationJobStatus = OptimizationJobStatus.QUEUED
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: OptimizationOutput | None = None
+    error: str | None = None
+    _cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+    _future: Future[None] | None = field(default=None, repr=False)
+
+    @property
+    def cancel_requested(self) -> bool:
+        """Whether cancellation has been requested for this job."""
+        return self._cancel_event.is_set()
+
+
+class OptimizationJobManager:
+    """Runs optimization jobs on a bounded thread pool and keeps their results.
+
+    Active jobs are always retained. Finished jobs are kept in an LRU of at
+    most ``max_finished_jobs`` entries; reading a job refreshes its position.
+    """
+
+    def __init__(
+        self,
+        time_provider: ITimeProvider,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_finished_jobs: int = DEFAULT_MAX_FINISHED_JOBS,
+    ) -> None:
+        """Initialize the job manager.
+
+        Args:
+            time_provider: Time provider for job timestamps
+            max_workers: Maximum number of optimizations running concurrently
+            max_finished_jobs: Maximum number of finished jobs to retain
+        """
+        self._time_provider = time_provider
+        self._max_finished_jobs = max_finished_jobs
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="optimize-job"
+        )
+        self._jobs: OrderedDict[str, OptimizationJob] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        algorithm: str,
+        start_date: datetime,
+        run: Callable[[Callable[[], bool]], OptimizationOutput],
+    ) -> OptimizationJob:
+        """Queue an optimization for background execution.
+
+        Args:
+            algorithm: Optimization algorithm name
+            start_date: Optimization start date
+            run: Callable performing a dry-run optimization; receives a
+                cancellation check to forward to the optimizer
+
+        Returns:
+            The queued job
+        """
+        job = OptimizationJob(
+            job_id=uuid.uuid4().hex,
+            algorithm=algorithm,
+            start_date=start_date,
+            created_at=self._time_provider.now(),
+        )
+        with self._lock:
+            self._jobs[job.job_id] = job
+            job._future = self._executor.submit(self._execute, job, run)
+        return job
+
+    def store(
+        self,
+        algorithm: str,
+        start_date: datetime,
+        result: OptimizationOutput,
+    ) -> OptimizationJob:
+        """Keep a dry-run result computed outside the pool as a finished job.
+
+        Synchronous previews are stored this way so they can be fetched and
+        applied by ID exactly like background jobs.
+
+        Args:
+            algorithm: Optimization algorithm name
+            start_date: Optimization start date
+            result: Dry-run optimization result
+
+        Returns:
+            The succeeded job holding the result
+        """
+        now = self._time_provider.now()
+        job = OptimizationJob(
+            job_id=uuid.uuid4().hex,
+            algorithm=algorithm,
+            start_date=start_date,
+            created_at=now,
+            started_at=now,
+            result=result,
+        )
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._finish_locked(job, OptimizationJobStatus.SUCCEEDED)
+        return job
+
+    def get(self, job_id: str) -> OptimizationJob:
+        """Look up a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The job
+
+        Raises:
+            OptimizationJobNotFoundError: If the job is unknown or evicted
+        """
+        with self._lock:
+            return self._get_locked(job_id)
+
+    def cancel(self, job_id: str) -> OptimizationJob:
+        """Request cancellation of a job.
+
+        Queued jobs are cancelled immediately. Running jobs stop at the
+        strategy's next cancellation checkpoint. Finished jobs are unchanged.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The job after the cancellation request
+
+        Raises:
+            OptimizationJobNotFoundError: If the job is unknown or evicted
+        """
+        with self._lock:
+            job = self._get_locked(job_id)
+            if job.status.is_finished:
+                return job
+            job._cancel_event.set()
+            if job._future is not None and job._future.cancel():
+                self._finish_locked(job, OptimizationJobStatus.CANCELLED)
+            return job
+
+    def apply(self, job_id: str, apply: Callable[[OptimizationOutput], T]) -> T:
+        """Persist a successful job's result exactly once.
+
+        The job is claimed (SUCCEEDED -> APPLYING) under the lock, so a
+        result is never persisted twice, but ``apply`` runs without it so
+        status polls and finishing workers are not blocked by the write. If
+        ``apply`` raises, the job is SUCCEEDED again and can be retried.
+
+        Args:
+            job_id: Job identifier
+            apply: Callable that persists the result
+
+        Returns:
+            Whatever ``apply`` returns
+
+        Raises:
+            OptimizationJobNotFoundError: If the job is unknown or evicted
+            OptimizationJobStateError: If the job has not succeeded, or is
+                being or was already applied
+        """
+        with self._lock:
+            job = self._get_locked(job_id)
+            result = job.result
+            if job.status != OptimizationJobStatus.SUCCEEDED or result is None:
+                raise OptimizationJobStateError(
+                    f"Optimization job {job_id} cannot be applied "
+                    f"(status: {job.status.value})"
+                )
+            job.status = OptimizationJobStatus.APPLYING
+
+        try:
+            applied = apply(result)
+        except BaseException:
+            with self._lock:
+                job.status = OptimizationJobStatus.SUCCEEDED
+            raise
+        with self._lock:
+            job.status = OptimizationJobStatus.APPLIED
+        return applied
+
+    def shutdown(self) -> None:
+        """Cancel outstanding jobs and stop the worker pool without waiting."""
+        with self._lock:
+            for job in self._jobs.values():
+                job._cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _execute(
+        self,
+        job: OptimizationJob,
+        run: Callable[[Callable[[], bool]], OptimizationOutput],
+    ) -> None:
+        """Worker entry point for a single job."""
+        with self._lock:
+            if job._cancel_event.is_set():
+                self._finish_locked(job, OptimizationJobStatus.CANCELLED)
+                return
+            job.status = OptimizationJobStatus.RUNNING
+            job.started_at = self._time_provider.now()
+
+        try:
+            result = run(job._cancel_event.is_set)
+        except OptimizationCancelledError:
+            with self._lock:
+                self._finish_locked(job, OptimizationJobStatus.CANCELLED)
+        except (TaskError, ValueError) as e:
+            with self._lock:
+                job.error = str(e)
+                self._finish_locked(job, OptimizationJobStatus.FAILED)
+        except Exception as e:
+            logger.exception("Optimization job %s failed", job.job_id)
+            with self._lock:
+                job.error = str(e)
+                self._finish_locked(job, OptimizationJobStatus.FAILED)
+        else:
+            with self._lock:
+                job.result = result
+                self._finish_locked(job, OptimizationJobStatus.SUCCEEDED)
+
+    def _get_locked(self, job_id: str) -> OptimizationJob:
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise OptimizationJobNotFoundError(job_id)
+        self._jobs.move_to_end(job_id)
+        return job
+
+    def _finish_locked(
+        self, job: OptimizationJob, status: OptimizationJobStatus
+    ) -> None:
+        job.status = status
+        job.finished_at = self._time_provider.now()
+        self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        # A job being applied is kept until apply() has recorded the outcome
+        finished_ids = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.status.is_finished and job.status != OptimizationJobStatus.APPLYING
+        ]
+        for job_id in finished_ids[
+            : max(0, len(finished_ids) - self._max_finished_jobs)
+        ]:
+            del self._jobs[job_id]
@@ -384,6 +384,322 @@ class TestAnalyticsRouter:
         data = response.json()
         assert "summary" in data
 
+    def test_optimize_schedule_portfolio_reports_candidates(self, client, task_factory):
+        """Test the portfolio algorithm reports every evaluated algorithm."""
+        task_factory.create(
+            name="Task",
+            priority=1,
+            estimated_duration=4.0,
+            status=TaskStatus.PENDING,
+        )
+        request_data = {
+            "algorithm": "portfolio",
+            "max_hours_per_day": 6.0,
+            "portfolio_algorithms": ["greedy", "balanced"],
+        }
+
+        response = client.post("/api/v1/optimize", json=request_data)
+
+        assert response.status_code == 200
+        summary = response.json()["summary"]
+        assert summary["algorithm"] == "portfolio"
+        assert [c["algorithm"] for c in summary["portfolio"]] == [
+            "greedy",
+            "balanced",
+        ]
+        assert summary["selected_algorithm"] in ("greedy", "balanced")
+        assert all(c["runtime_seconds"] >= 0 for c in summary["portfolio"])
+
+    def test_optimize_schedule_dependency_aware_reports_critical_path(
+        self, client, task_factory
+    ):
+        """Test dependency_aware returns the longest dependency chain."""
+        first = task_factory.create(
+            name="First", priority=1, estimated_duration=6.0, status=TaskStatus.PENDING
+        )
+        second = task_factory.create(
+            name="Second",
+            priority=1,
+            estimated_duration=6.0,
+            status=TaskStatus.PENDING,
+            depends_on=[first.id],
+        )
+        request_data = {"algorithm": "dependency_aware", "max_hours_per_day": 6.0}
+
+        response = client.post("/api/v1/optimize", json=request_data)
+
+        assert response.status_code == 200
+        critical_path = response.json()["summary"]["critical_path"]
+        assert critical_path == {
+            "task_ids": [first.id, second.id],
+            "total_hours": 12.0,
+            "length_days": 2,
+        }
+
+    def test_optimize_schedule_with_capacity_lanes(self, client, task_factory):
+        """Test lanes are scheduled in parallel and reported per lane."""
+        for name, tag in (("Alice's task", "alice"), ("Bob's task", "bob")):
+            task_factory.create(
+                name=name,
+                priority=1,
+                estimated_duration=6.0,
+                status=TaskStatus.PENDING,
+                tags=[tag],
+            )
+        request_data = {
+            "algorithm": "greedy",
+            "max_hours_per_day": 8.0,
+            "start_date": "2025-10-20T09:00:00",
+            "lanes": [
+                {"name": "alice", "max_hours_per_day": 6.0, "tags": ["alice"]},
+                {
+                    "name": "bob",
+                    "max_hours_per_day": 6.0,
+                    "tags": ["bob"],
+                    "days_off": ["2025-10-20"],
+                },
+            ],
+        }
+
+        response = client.post("/api/v1/optimize", json=request_data)
+
+        assert response.status_code == 200
+        lane_allocations = response.json()["lane_allocations"]
+        assert lane_allocations["alice"] == {"2025-10-20": 6.0}
+        assert lane_allocations["bob"] == {"2025-10-21": 6.0}
+
+    def test_optimize_schedule_duplicate_lanes_rejected(self, client, task_factory):
+        """Test duplicate lane names are rejected with 400."""
+        task_factory.create(name="Task", priority=1, estimated_duration=4.0)
+        lane = {"name": "alice", "max_hours_per_day": 6.0}
+        request_data = {
+            "algorithm": "greedy",
+            "max_hours_per_day": 8.0,
+            "lanes": [lane, lane],
+        }
+
+        response = client.post("/api/v1/optimize", json=request_data)
+
+        assert response.status_code == 400
+
+    def test_optimize_schedule_portfolio_unknown_algorithm(self, client, task_factory):
+        """Test an unknown portfolio member is rejected with 400."""
+        task_factory.create(
+            name="Task",
+            priority=1,
+            estimated_duration=4.0,
+            status=TaskStatus.PENDING,
+        )
+        request_data = {
+            "algorithm": "portfolio",
+            "max_hours_per_day": 6.0,
+            "portfolio_algorithms": ["greedy", "nonexistent"],
+        }
+
+        response = client.post("/api/v1/optimize", json=request_data)
+
+        assert response.status_code == 400
+
+    def test_optimize_schedule_monte_carlo_simulations(self, client, task_factory):
+        """Test num_simulations is accepted for monte_carlo."""
+        task_factory.create(
+            name="Task",
+            priority=1,
+            estimated_duration=4.0,
+            status=TaskStatus.PENDING,
+        )
+        request_data = {
+            "algorithm": "monte_carlo",
+            "max_hours_per_day": 6.0,
+            "num_simulations": 200,
+        }
+
+        response = client.post("/api/v1/optimize", json=request_data)
+
+        assert response.status_code == 200
+        assert response.json()["summary"]["scheduled_tasks"] == 1
+
+    def test_optimize_schedule_exact_reports_search_stats(self, client, task_factory):
+        """Test the exact algorithm reports its search statistics."""
+        for name, priority in (("First", 2), ("Second", 1)):
+            task_factory.create(
+                name=name,
+                priority=priority,
+                estimated_duration=4.0,
+                status=TaskStatus.PENDING,
+            )
+        request_data = {"algorithm": "exact", "max_hours_per_day": 6.0}
+
+        response = client.post("/api/v1/optimize", json=request_data)
+
+        assert response.status_code == 200
+        summary = response.json()["summary"]
+        assert summary["scheduled_tasks"] == 2
+        assert summary["search_stats"]["optimal"] is True
+        assert summary["search_stats"]["nodes_explored"] > 0
+        assert summary["search_stats"]["fallback"] is None
+
+    def test_optimize_schedule_profile(self, client, task_factory):
+        """Test profile=True adds phase timings and counters to the response."""
+        task_factory.create(
+            name="Task", priority=1, estimated_duration=4.0, status=TaskStatus.PENDING
+        )
+        request_data = {"algorithm": "exact", "max_hours_per_day": 6.0}
+
+        plain = client.post("/api/v1/optimize", json=request_data)
+        profiled = client.post(
+            "/api/v1/optimize", json={**request_data, "profile": True}
+        )
+
+        assert plain.json()["profile"] is None
+        profile = profiled.json()["profile"]
+        assert set(profile["phases"]) == {
+            "load_tasks",
+            "load_allocations",
+            "strategy",
+            "persist",
+            "summary",
+        }
+        assert profile["total_seconds"] >= 0.0
+        assert profile["counters"]["nodes_explored"] > 0
+
+    @pytest.mark.parametrize("num_simulations", [0, 10001])
+    def test_optimize_schedule_num_simulations_out_of_range(
+        self, client, num_simulations
+    ):
+        """Test num_simulations outside 1..10000 is rejected."""
+        request_data = {
+            "algorithm": "monte_carlo",
+            "max_hours_per_day": 6.0,
+            "num_simulations": num_simulations,
+        }
+
+        response = client.post("/api/v1/optimize", json=request_data)
+
+        assert response.status_code == 422
+
+    def test_optimize_schedule_incremental(self, client, task_factory):
+        """Test changed_task_ids re-allocates only the affected tasks."""
+        for name, priority in (("First", 200), ("Second", 100)):
+            task_factory.create(
+                name=name,
+                priority=priority,
+                estimated_duration=6.0,
+                status=TaskStatus.PENDING,
+            )
+        base = {
+            "algorithm": "greedy",
+            "start_date": datetime(2025, 10, 20, 9, 0, 0).isoformat(),
+            "max_hours_per_day": 6.0,
+        }
+        assert client.post("/api/v1/optimize", json=base).status_code == 200
+        added = task_factory.create(
+            name="Added",
+            priority=1,
+            estimated_duration=6.0,
+            status=TaskStatus.PENDING,
+        )
+
+        response = client.post(
+            "/api/v1/optimize", json={**base, "changed_task_ids": [added.id]}
+        )
+
+        assert response.status_code == 200
+        summary = response.json()["summary"]
+        assert summary["touched_count"] == 1
+        assert summary["scheduled_tasks"] == 1
+
+    def test_optimize_schedule_incremental_with_task_ids_rejected(
+        self, client, task_factory
+    ):
+        """Test changed_task_ids cannot be combined with task_ids."""
+        task = task_factory.create(
+            name="Task", estimated_duration=4.0, status=TaskStatus.PENDING
+        )
+        request_data = {
+            "algorithm": "greedy",
+            "max_hours_per_day": 6.0,
+            "task_ids": [task.id],
+            "changed_task_ids": [task.id],
+        }
+
+        response = client.post("/api/v1/optimize", json=request_data)
+
+        assert response.status_code == 400
+
+    # ===== POST /optimize/scenarios Tests =====
+
+    def test_evaluate_scenarios(self, client, task_factory, repository):
+        """Test scenarios are summarized in order and nothing is saved."""
+        task = task_factory.create(
+            name="Task",
+            priority=1,
+            estimated_duration=8.0,
+            deadline=datetime(2025, 10, 21, 18, 0, 0),
+            status=TaskStatus.PENDING,
+        )
+        request_data = {
+            "algorithm": "greedy",
+            "start_date": datetime(2025, 10, 20, 9, 0, 0).isoformat(),
+            "max_hours_per_day": 8.0,
+            "scenarios": [
+                {"name": "baseline"},
+                {
+                    "name": "slips",
+                    "max_hours_per_day": 4.0,
+                    "task_overrides": [{"task_id": task.id, "estimated_duration": 16}],
+                },
+            ],
+        }
+
+        response = client.post("/api/v1/optimize/scenarios", json=request_data)
+
+        assert response.status_code == 200
+        baseline, slips = response.json()["scenarios"]
+        assert baseline["name"] == "baseline"
+        assert baseline["end_date"] == "2025-10-20"
+        assert baseline["deadline_misses"] == 0
+        assert baseline["peak_load"] == 8.0
+        assert slips["max_hours_per_day"] == 4.0
+        assert slips["failed_count"] == 1
+        assert slips["deadline_misses"] == 1
+        assert repository.get_by_id(task.id).planned_start is None
+
+    def test_evaluate_scenarios_unknown_override_task(self, client):
+        """Test an override for a missing task returns 404."""
+        request_data = {
+            "algorithm": "greedy",
+            "max_hours_per_day": 8.0,
+            "scenarios": [
+                {"name": "ghost", "task_overrides": [{"task_id": 999, "priority": 3}]}
+            ],
+        }
+
+        response = client.post("/api/v1/optimize/scenarios", json=request_data)
+
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize(
+        ("scenarios", "expected_status"),
+        [
+            ([], 422),
+            ([{"name": "same"}, {"name": "same"}], 400),
+            ([{"name": "bad", "algorithm": "nonexistent"}], 400),
+        ],
+        ids=["empty", "duplicate-names", "unknown-algorithm"],
+    )
+    def test_evaluate_scenarios_invalid(self, client, scenarios, expected_status):
+        """Test invalid scenario lists are rejected."""
+        request_data = {
+            "algorithm": "greedy",
+            "max_hours_per_day": 8.0,
+            "scenarios": scenarios,
+        }
+
+        response = client.post("/api/v1/optimize/scenarios", json=request_data)
+
+        assert response.status_code == expected_status
+
     # ===== GET /algorithms Tests =====
 
     def test_list_algorithms(self, client):
@@ -0,0 +1,196 @@
+"""Tests for background optimization job endpoints."""
+
+import time
+from datetime import datetime
+
+from taskdog_core.domain.entities.task import TaskStatus
+
+JOBS_URL = "/api/v1/optimize/jobs"
+
+
+def _wait_for_job(client, job_id, timeout=5.0):
+    """Poll the job until it leaves the queued/running states."""
+    deadline = time.monotonic() + timeout
+    while True:
+        data = client.get(f"{JOBS_URL}/{job_id}").json()
+        if data["status"] not in ("queued", "running"):
+            return data
+        assert time.monotonic() < deadline, "job did not finish in time"
+        time.sleep(0.01)
+
+
+def _request_data(**overrides):
+    data = {
+        "algorithm": "greedy",
+        "start_date": datetime(2025, 10, 15, 9, 0, 0).isoformat(),
+        "max_hours_per_day": 8.0,
+        "force_override": True,
+    }
+    data.update(overrides)
+    return data
+
+
+class TestOptimizationJobsRouter:
+    """Test cases for optimization job endpoints."""
+
+    def test_submit_returns_accepted_job(self, client, task_factory):
+        task_factory.create(name="Task", priority=1, estimated_duration=4.0)
+
+        response = client.post(JOBS_URL, json=_request_data())
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["job_id"]
+        assert data["algorithm"] == "greedy"
+        assert data["status"] in ("queued", "running", "succeeded")
+
+    def test_submit_rejects_unknown_algorithm(self, client):
+        response = client.post(JOBS_URL, json=_request_data(algorithm="nope"))
+
+        assert response.status_code == 400
+        assert "Unknown optimization algorithm" in response.json()["detail"]
+
+    def test_preview_does_not_persist(self, client, repository, task_factory):
+        task = task_factory.create(name="Task", priority=1, estimated_duration=4.0)
+
+        job_id = client.post(JOBS_URL, json=_request_data()).json()["job_id"]
+        data = _wait_for_job(client, job_id)
+
+        assert data["status"] == "succeeded"
+        assert data["result"]["summary"]["scheduled_tasks"] == 1
+        assert data["planned_schedules"][0]["task_id"] == task.id
+        assert data["planned_schedules"][0]["daily_allocations"] == {"2025-10-15": 4.0}
+        assert repository.get_by_id(task.id).planned_start is None
+
+    def test_apply_persists_preview(self, client, repository, task_factory):
+        task = task_factory.create(name="Task", priority=1, estimated_duration=4.0)
+        job_id = client.post(JOBS_URL, json=_request_data()).json()["job_id"]
+        _wait_for_job(client, job_id)
+
+        response = client.post(f"{JOBS_URL}/{job_id}/apply")
+
+        assert response.status_code == 200
+        assert response.json()["summary"]["scheduled_tasks"] == 1
+        stored = repository.get_by_id(task.id)
+        assert stored.planned_start == datetime(2025, 10, 15, 0, 0, 0)
+        assert client.get(f"{JOBS_URL}/{job_id}").json()["status"] == "applied"
+
+    def test_apply_twice_conflicts(self, client, task_factory):
+        task_factory.create(name="Task", priority=1, estimated_duration=4.0)
+        job_id = client.post(JOBS_URL, json=_request_data()).json()["job_id"]
+        _wait_for_job(client, job_id)
+        client.post(f"{JOBS_URL}/{job_id}/apply")
+
+        response = client.post(f"{JOBS_URL}/{job_id}/apply")
+
+        assert response.status_code == 409
+
+    def test_apply_rejects_task_started_since_preview(
+        self, client, repository, task_factory
+    ):
+        task = task_factory.create(name="Task", priority=1, estimated_duration=4.0)
+        job_id = client.post(JOBS_URL, json=_request_data()).json()["job_id"]
+        _wait_for_job(client, job_id)
+        stored = repository.get_by_id(task.id)
+        stored.status = TaskStatus.IN_PROGRESS
+        repository.save(stored)
+
+        response = client.post(f"{JOBS_URL}/{job_id}/apply")
+
+        assert response.status_code == 400
+        assert client.get(f"{JOBS_URL}/{job_id}").json()["status"] == "succeeded"
+
+    def test_failed_job_reports_error(self, client, task_factory):
+        done = task_factory.create(name="Done", priority=1, status=TaskStatus.COMPLETED)
+
+        response = client.post(JOBS_URL, json=_request_data(task_ids=[done.id]))
+        job_id = response.json()["job_id"]
+        data = _wait_for_job(client, job_id)
+
+        assert data["status"] == "failed"
+        assert data["error"]
+        assert data["result"] is None
+
+    def test_cancel_finished_job_is_noop(self, client, task_factory):
+        task_factory.create(name="Task", priority=1, estimated_duration=4.0)
+        job_id = client.post(JOBS_URL, json=_request_data()).json()["job_id"]
+        _wait_for_job(client, job_id)
+
+        response = client.post(f"{JOBS_URL}/{job_id}/cancel")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "succeeded"
+
+    def test_unknown_job_returns_404(self, client):
+        assert client.get(f"{JOBS_URL}/missing").status_code == 404
+        assert client.post(f"{JOBS_URL}/missing/cancel").status_code == 404
+        assert client.post(f"{JOBS_URL}/missing/apply").status_code == 404
+
+    def test_apply_rejects_preview_when_tasks_changed(
+        self, client, repository, task_factory
+    ):
+        task = task_factory.create(name="Task", priority=1, estimated_duration=4.0)
+        job_id = client.post(JOBS_URL, json=_request_data()).json()["job_id"]
+        _wait_for_job(client, job_id)
+        task_factory.create(name="Added later", priority=1, estimated_duration=2.0)
+
+        response = client.post(f"{JOBS_URL}/{job_id}/apply")
+
+        assert response.status_code == 409
+        assert repository.get_by_id(task.id).planned_start is None
+
+
+class TestOptimizeDryRun:
+    """Test cases for synchronous previews applied through the jobs API."""
+
+    def test_dry_run_returns_plan_without_persisting(
+        self, client, repository, task_factory
+    ):
+        task = task_factory.create(name="Task", priority=1, estimated_duration=4.0)
+
+        response = client.post("/api/v1/optimize", json=_request_data(dry_run=True))
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["plan_id"]
+        assert data["data_version"]
+        assert data["summary"]["scheduled_tasks"] == 1
+        assert repository.get_by_id(task.id).planned_start is None
+        plan = client.get(f"{JOBS_URL}/{data['plan_id']}").json()
+        assert plan["status"] == "succeeded"
+        assert plan["planned_schedules"][0]["task_id"] == task.id
+
+    def test_regular_run_has_no_plan(self, client, task_factory):
+        task_factory.create(name="Task", priority=1, estimated_duration=4.0)
+
+        data = client.post("/api/v1/optimize", json=_request_data()).json()
+
+        assert data["plan_id"] is None
+        assert data["data_version"] is None
+
+    def test_apply_plan(self, client, repository, task_factory):
+        task = task_factory.create(name="Task", priority=1, estimated_duration=4.0)
+        plan_id = client.post(
+            "/api/v1/optimize", json=_request_data(dry_run=True)
+        ).json()["plan_id"]
+
+        response = client.post(f"{JOBS_URL}/{plan_id}/apply")
+
+        assert response.status_code == 200
+        stored = repository.get_by_id(task.id)
+        assert stored.planned_start == datetime(2025, 10, 15, 0, 0, 0)
+
+    def test_apply_stale_plan_conflicts(self, client, repository, task_factory):
+        task = task_factory.create(name="Task", priority=1, estimated_duration=4.0)
+        plan_id = client.post(
+            "/api/v1/optimize", json=_request_data(dry_run=True)
+        ).json()["plan_id"]
+        stored = repository.get_by_id(task.id)
+        stored.estimated_duration = 6.0
+        repository.save(stored)
+
+        response = client.post(f"{JOBS_URL}/{plan_id}/apply")
+
+        assert response.status_code == 409
+        assert repository.get_by_id(task.id).planned_start is None
+        assert client.get(f"{JOBS_URL}/{plan_id}").json()["status"] == "succeeded"
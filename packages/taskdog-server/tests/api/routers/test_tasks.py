@@ -178,6 +178,29 @@ class TestTasksRouter:
         assert data["tasks"][0]["priority"] == 3
         assert data["tasks"][1]["priority"] == 1
 
+    def test_list_tasks_with_limit(self, client, task_factory):
+        """Test limit returns the first sorted tasks and the full count."""
+        # Arrange
+        for priority in (1, 3, 2):
+            task_factory.create(
+                name=f"P{priority}", priority=priority, status=TaskStatus.PENDING
+            )
+
+        # Act
+        response = client.get("/api/v1/tasks?sort=priority&limit=2")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert [task["priority"] for task in data["tasks"]] == [3, 2]
+        assert data["filtered_count"] == 3
+
+    def test_list_tasks_rejects_non_positive_limit(self, client):
+        """Test limit must be at least 1."""
+        response = client.get("/api/v1/tasks?limit=0")
+
+        assert response.status_code == 422
+
     def test_get_tasks_by_ids_returns_requested_in_order(self, client, task_factory):
         """Test batch retrieval returns requested tasks in input id order."""
         # Arrange
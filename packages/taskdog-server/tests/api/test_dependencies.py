@@ -1,5 +1,6 @@
 """Tests for FastAPI dependency injection."""
 
+import os
 import tempfile
 from contextlib import suppress
 from pathlib import Path
@@ -82,6 +83,7 @@ class TestDependencyInjection:
                 assert context.relationship_controller is not None
                 assert context.analytics_controller is not None
                 assert context.crud_controller is not None
+                assert context.gantt_overlay_cache is not None
         finally:
             # Cleanup
             config_file = Path(config_path)
@@ -265,7 +267,7 @@ class TestInitializeApiContext:
                 with suppress(Exception):
                     context.close()
 
-    def test_initialize_creates_holiday_checker_when_country_configured(self):
+    def test_initialize_creates_holiday_checker_when_country_configured(self, tmp_path):
         """Test that holiday checker is created when country is configured."""
         # Arrange - create config with country
         with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".toml") as f:
@@ -274,6 +276,38 @@ class TestInitializeApiContext:
             f.write('database_url = "sqlite:///:memory:"\n')
             f.write('[region]\ncountry = "US"\n')
 
+        context = None
+        try:
+            with (
+                patch(
+                    "taskdog_core.shared.xdg_utils.XDGDirectories.get_config_file",
+                    return_value=Path(config_path),
+                ),
+                patch.dict(os.environ, {"XDG_CACHE_HOME": str(tmp_path)}),
+            ):
+                # Act
+                context = initialize_api_context()
+
+                # Assert - holiday checker should be created and cached
+                assert context.holiday_checker is not None
+                assert list((tmp_path / "taskdog" / "holidays").glob("US-*.json"))
+        finally:
+            config_file = Path(config_path)
+            if config_file.exists():
+                config_file.unlink()
+            if context is not None:
+                with suppress(Exception):
+                    context.close()
+
+    @pytest.mark.parametrize("incremental", [False, True])
+    def test_initialize_wires_incremental_statistics(self, incremental):
+        """Test that incremental statistics are only tracked when enabled."""
+        # Arrange
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".toml") as f:
+            config_path = f.name
+            f.write('[storage]\nbackend = "sqlite"\n')
+            f.write('database_url = "sqlite:///:memory:"\n')
+
         context = None
         try:
             with patch(
@@ -281,10 +315,11 @@ class TestInitializeApiContext:
                 return_value=Path(config_path),
             ):
                 # Act
-                context = initialize_api_context()
+                context = initialize_api_context(incremental_statistics=incremental)
 
-                # Assert - holiday checker should be created
-                assert context.holiday_checker is not None
+                # Assert
+                tracker = context.analytics_controller.incremental_statistics
+                assert (tracker is not None) is incremental
         finally:
             config_file = Path(config_path)
             if config_file.exists():
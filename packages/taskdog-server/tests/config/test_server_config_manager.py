@@ -141,6 +141,22 @@ enabled = {config_enabled}
 
         assert config.auth.enabled is expected
 
+    def test_load_statistics_incremental(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Load [statistics] incremental, overridable by environment."""
+        config_path = tmp_path / "server.toml"
+        config_path.write_text("""
+[statistics]
+incremental = true
+""")
+
+        assert ServerConfigManager.load(config_path).statistics.incremental is True
+
+        monkeypatch.setenv("TASKDOG_STATISTICS_INCREMENTAL", "false")
+
+        assert ServerConfigManager.load(config_path).statistics.incremental is False
+
 
 class TestApiKeyEntry:
     """Tests for ApiKeyEntry dataclass."""
@@ -187,6 +203,7 @@ class TestServerConfig:
 
         assert config.auth.enabled is False
         assert config.auth.api_keys == ()
+        assert config.statistics.incremental is False
 
     def test_frozen_dataclass(self) -> None:
         """ServerConfig is immutable."""
@@ -270,6 +270,7 @@ def app(
         bulk_router,
         lifecycle_router,
         notes_router,
+        optimization_jobs_router,
         relationships_router,
         tags_router,
         tasks_router,
@@ -286,6 +287,9 @@ def app(
     )
     test_app.include_router(notes_router, prefix="/api/v1/tasks", tags=["notes"])
     test_app.include_router(analytics_router, prefix="/api/v1", tags=["analytics"])
+    test_app.include_router(
+        optimization_jobs_router, prefix="/api/v1/optimize/jobs", tags=["analytics"]
+    )
     test_app.include_router(tags_router, prefix="/api/v1/tags", tags=["tags"])
     test_app.include_router(audit_router, prefix="/api/v1/audit-logs", tags=["audit"])
     test_app.include_router(websocket_router, tags=["websocket"])
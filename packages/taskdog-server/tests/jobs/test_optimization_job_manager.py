@@ -0,0 +1,168 @@
+"""Tests for OptimizationJobManager."""
+
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from taskdog_core.domain.exceptions.task_exceptions import (
+    OptimizationCancelledError,
+    TaskValidationError,
+)
+from taskdog_server.jobs.optimization_job_manager import (
+    OptimizationJobManager,
+    OptimizationJobNotFoundError,
+    OptimizationJobStateError,
+    OptimizationJobStatus,
+)
+
+START = datetime(2025, 10, 15, 9, 0, 0)
+
+
+def _wait(job, timeout=5.0):
+    """Block until the job's worker future completes."""
+    if job._future is not None:
+        job._future.exception(timeout=timeout)
+
+
+@pytest.fixture
+def manager():
+    time_provider = MagicMock()
+    time_provider.now.return_value = START
+    manager = OptimizationJobManager(time_provider, max_workers=1, max_finished_jobs=2)
+    yield manager
+    manager.shutdown()
+
+
+class TestOptimizationJobManager:
+    """Test cases for OptimizationJobManager."""
+
+    def test_successful_job_stores_result(self, manager):
+        output = MagicMock()
+
+        job = manager.submit("greedy", START, lambda _check: output)
+        _wait(job)
+
+        job = manager.get(job.job_id)
+        assert job.status == OptimizationJobStatus.SUCCEEDED
+        assert job.result is output
+        assert job.started_at == START
+        assert job.finished_at == START
+
+    def test_store_keeps_precomputed_result(self, manager):
+        output = MagicMock()
+
+        job = manager.store("greedy", START, output)
+
+        assert manager.get(job.job_id) is job
+        assert job.status == OptimizationJobStatus.SUCCEEDED
+        assert job.result is output
+        assert manager.apply(job.job_id, lambda result: result) is output
+
+    def test_failed_job_records_error(self, manager):
+        def run(_check):
+            raise TaskValidationError("bad input")
+
+        job = manager.submit("greedy", START, run)
+        _wait(job)
+
+        assert job.status == OptimizationJobStatus.FAILED
+        assert job.error == "bad input"
+
+    def test_cancel_running_job_is_cooperative(self, manager):
+        started = threading.Event()
+
+        def run(check):
+            started.set()
+            while not check():
+                threading.Event().wait(0.01)
+            raise OptimizationCancelledError()
+
+        job = manager.submit("genetic", START, run)
+        assert started.wait(5.0)
+
+        manager.cancel(job.job_id)
+        assert job.cancel_requested is True
+        _wait(job)
+
+        assert job.status == OptimizationJobStatus.CANCELLED
+
+    def test_cancel_queued_job_never_runs(self, manager):
+        release = threading.Event()
+        blocker = manager.submit("greedy", START, lambda _check: release.wait(5.0))
+        queued_run = MagicMock()
+        queued = manager.submit("greedy", START, queued_run)
+
+        manager.cancel(queued.job_id)
+        release.set()
+        _wait(blocker)
+
+        assert queued.status == OptimizationJobStatus.CANCELLED
+        queued_run.assert_not_called()
+
+    def test_apply_runs_once(self, manager):
+        output = MagicMock()
+        job = manager.submit("greedy", START, lambda _check: output)
+        _wait(job)
+        apply = MagicMock(return_value="applied")
+
+        assert manager.apply(job.job_id, apply) == "applied"
+        apply.assert_called_once_with(output)
+        assert job.status == OptimizationJobStatus.APPLIED
+
+        with pytest.raises(OptimizationJobStateError):
+            manager.apply(job.job_id, apply)
+
+    def test_apply_persists_without_holding_the_lock(self, manager):
+        job = manager.store("greedy", START, MagicMock())
+        seen = {}
+
+        def apply(_result):
+            # Polls and concurrent applies do not wait for the write
+            seen["status"] = manager.get(job.job_id).status
+            with pytest.raises(OptimizationJobStateError):
+                manager.apply(job.job_id, MagicMock())
+            return "applied"
+
+        assert manager.apply(job.job_id, apply) == "applied"
+        assert seen["status"] == OptimizationJobStatus.APPLYING
+        assert job.status == OptimizationJobStatus.APPLIED
+
+    def test_job_being_applied_is_not_evicted(self, manager):
+        job = manager.store("greedy", START, MagicMock())
+
+        def apply(_result):
+            for _ in range(3):
+                manager.store("greedy", START, MagicMock())
+            return manager.get(job.job_id)
+
+        assert manager.apply(job.job_id, apply) is job
+
+    def test_apply_failure_keeps_job_applicable(self, manager):
+        job = manager.submit("greedy", START, lambda _check: MagicMock())
+        _wait(job)
+
+        with pytest.raises(TaskValidationError):
+            manager.apply(job.job_id, MagicMock(side_effect=TaskValidationError("x")))
+
+        assert job.status == OptimizationJobStatus.SUCCEEDED
+
+    def test_unknown_job_raises(self, manager):
+        with pytest.raises(OptimizationJobNotFoundError):
+            manager.get("missing")
+
+    def test_finished_jobs_are_evicted_lru(self, manager):
+        jobs = []
+        for _ in range(3):
+            job = manager.submit("greedy", START, lambda _check: MagicMock())
+            _wait(job)
+            jobs.append(job)
+            if len(jobs) == 2:
+                # Touch the first job so the second becomes least recently used
+                manager.get(jobs[0].job_id)
+
+        manager.get(jobs[0].job_id)
+        manager.get(jobs[2].job_id)
+        with pytest.raises(OptimizationJobNotFoundError):
+            manager.get(jobs[1].job_id)
@@ -31,6 +31,101 @@ def _show_failed_tasks(
         console_writer.print(f"  → {failure.reason}")
 
 
+def _show_portfolio(console_writer: ConsoleWriter, result: OptimizationOutput) -> None:
+    """Show per-algorithm results of a portfolio optimization.
+
+    Args:
+        console_writer: Console writer for output
+        result: Optimization result whose summary holds the portfolio
+    """
+    portfolio = result.summary.portfolio
+    if not portfolio:
+        return
+
+    console_writer.empty_line()
+    console_writer.print(f"Selected algorithm: {result.summary.selected_algorithm}")
+    for candidate in portfolio:
+        marker = "*" if candidate.selected else " "
+        if candidate.error is not None:
+            outcome = f"error: {candidate.error}"
+        else:
+            outcome = (
+                f"fitness {candidate.fitness:.2f}, "
+                f"{candidate.scheduled_count} scheduled, "
+                f"{candidate.failed_count} failed"
+            )
+        console_writer.print(
+            f" {marker} {candidate.algorithm}: {outcome} "
+            f"({candidate.runtime_seconds * 1000:.1f} ms)"
+        )
+
+
+def _show_critical_path(
+    console_writer: ConsoleWriter, result: OptimizationOutput
+) -> None:
+    """Show the longest dependency chain of a dependency-aware optimization.
+
+    Args:
+        console_writer: Console writer for output
+        result: Optimization result whose summary holds the critical path
+    """
+    critical_path = result.summary.critical_path
+    if critical_path is None or len(critical_path.task_ids) < 2:
+        return
+
+    chain = " → ".join(f"#{task_id}" for task_id in critical_path.task_ids)
+    console_writer.empty_line()
+    console_writer.print(
+        f"Critical path: {chain} "
+        f"({critical_path.total_hours:.1f}h, {critical_path.length_days} day(s))"
+    )
+
+
+def _show_search_stats(
+    console_writer: ConsoleWriter, result: OptimizationOutput
+) -> None:
+    """Show how much of the search space an exact optimization explored.
+
+    Args:
+        console_writer: Console writer for output
+        result: Optimization result whose summary holds the search statistics
+    """
+    stats = result.summary.search_stats
+    if stats is None:
+        return
+
+    if stats.optimal:
+        outcome = "optimal"
+    elif stats.fallback == "size":
+        outcome = "too many tasks, used the greedy order"
+    else:
+        outcome = "time limit reached, best order found so far"
+    console_writer.empty_line()
+    console_writer.print(
+        f"Exact search: {stats.nodes_explored} nodes "
+        f"({int(stats.nodes_per_second)} nodes/s), {outcome}"
+    )
+
+
+def _show_profile(console_writer: ConsoleWriter, result: OptimizationOutput) -> None:
+    """Show per-phase timings and strategy counters of a profiled run.
+
+    Args:
+        console_writer: Console writer for output
+        result: Optimization result holding the profile
+    """
+    profile = result.profile
+    if profile is None:
+        return
+
+    console_writer.empty_line()
+    console_writer.print(f"Profile ({profile.total_seconds * 1000:.1f} ms total):")
+    for phase, seconds in profile.phases.items():
+        console_writer.print(f"  {phase}: {seconds * 1000:.1f} ms")
+    for name, value in profile.counters.items():
+        console_writer.print(f"  {name}: {value}")
+
+
 def _show_no_tasks_message(console_writer: ConsoleWriter) -> None:
     """Show message when no tasks were optimized.
 
@@ -59,6 +154,9 @@ Examples:
   taskdog optimize 1 2 3                    # Optimize only tasks 1, 2, and 3
   taskdog optimize 5 --force                # Force optimize task 5
   taskdog optimize --include-all-days       # Include weekends and holidays
+  taskdog optimize -a portfolio -m 6 --portfolio-algorithms greedy,balanced
+  taskdog optimize -a monte_carlo -m 6 --simulations 2000
+  taskdog optimize -a genetic -m 6 --profile  # Show where the time went
 """,
 )
 @click.argument("task_ids", nargs=-1, type=int, required=False)
@@ -89,7 +187,9 @@ Examples:
         "round_robin (parallel progress), "
         "dependency_aware (CPM), "
         "genetic (evolutionary), "
-        "monte_carlo (random sampling)"
+        "monte_carlo (random sampling), "
+        "exact (branch and bound, small backlogs), "
+        "portfolio (best of several)"
     ),
 )
 @click.option("--force", "-f", is_flag=True, help="Override existing schedules")
@@ -98,6 +198,26 @@ Examples:
     is_flag=True,
     help="Schedule tasks on weekends and holidays too (default: weekdays only)",
 )
+@click.option(
+    "--portfolio-algorithms",
+    type=str,
+    default=None,
+    help=(
+        "Comma-separated algorithms compared by the portfolio algorithm "
+        "(default: all fast heuristics)"
+    ),
+)
+@click.option(
+    "--simulations",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Random orderings sampled by monte_carlo (default: 50)",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Show time spent per optimization phase and algorithm counters",
+)
 @click.pass_context
 @handle_command_errors("optimizing schedules")
 def optimize_command(
@@ -108,6 +228,9 @@ def optimize_command(
     algorithm: str,
     force: bool,
     include_all_days: bool,
+    portfolio_algorithms: str | None,
+    simulations: int | None,
+    profile: bool,
 ) -> None:
     """Auto-generate optimal schedules for tasks."""
     ctx_obj: CliContext = ctx.obj
@@ -116,6 +239,11 @@ def optimize_command(
 
     # Convert task_ids tuple to list (or None if empty)
     task_ids_list = list(task_ids) if task_ids else None
+    portfolio_list = (
+        [name.strip() for name in portfolio_algorithms.split(",") if name.strip()]
+        if portfolio_algorithms
+        else None
+    )
 
     # Execute optimization via API
     result = api_client.optimize_schedule(
@@ -125,7 +253,12 @@ def optimize_command(
         force_override=force,
         task_ids=task_ids_list,
         include_all_days=include_all_days,
+        portfolio_algorithms=portfolio_list,
+        num_simulations=simulations,
+        profile=profile,
     )
+    if profile:
+        _show_profile(console_writer, result)
 
     # Handle empty result (no tasks to optimize)
     if result.all_failed():
@@ -150,3 +283,7 @@ def optimize_command(
         console_writer.success(
             f"Optimized {success_count} task(s) using '{algorithm}' (all tasks scheduled)"
         )
+
+    _show_portfolio(console_writer, result)
+    _show_critical_path(console_writer, result)
+    _show_search_stats(console_writer, result)
@@ -5,6 +5,7 @@ with the Gantt overlay and applies presentation logic (formatting,
 strikethrough) to create presentation-ready view models.
 """
 
+from taskdog.view_models.gantt_matrix import GanttMatrix
 from taskdog.view_models.gantt_view_model import GanttViewModel, TaskGanttRowViewModel
 from taskdog.view_models.status import TaskStatus
 from taskdog_core.application.dto.gantt_overlay import GanttOverlay
@@ -20,18 +21,39 @@ class GanttPresenter:
     3. Joining task data with the Gantt overlay into ViewModels
     """
 
-    def present(self, tasks: list[TaskRowDto], overlay: GanttOverlay) -> GanttViewModel:
+    def present(
+        self,
+        tasks: list[TaskRowDto],
+        overlay: GanttOverlay,
+        dense: bool = False,
+    ) -> GanttViewModel:
         """Build a GanttViewModel from the shared task list and overlay.
 
         Args:
             tasks: Canonical task DTOs (shared with the table view)
             overlay: Gantt-specific overlay (dates, allocations, workload)
+            dense: Also pack the allocations into a GanttMatrix, for
+                renderers that format the chart cell by cell
 
         Returns:
             GanttViewModel with TaskGanttRowViewModel rows
         """
         task_view_models = [self._map_task_to_view_model(task) for task in tasks]
 
+        matrix = None
+        if dense:
+            # Same tasks as the overlay's workload: not archived, not finished
+            matrix = GanttMatrix.build(
+                overlay.date_range.start_date,
+                overlay.date_range.end_date,
+                overlay.task_daily_hours,
+                (
+                    task.id
+                    for task in tasks
+                    if not task.is_archived and not task.is_finished
+                ),
+            )
+
         return GanttViewModel(
             start_date=overlay.date_range.start_date,
             end_date=overlay.date_range.end_date,
@@ -40,6 +62,7 @@ class GanttPresenter:
             daily_workload=overlay.daily_workload,
             holidays=overlay.holidays,
             total_estimated_duration=overlay.total_estimated_duration,
+            matrix=matrix,
         )
 
     def _map_task_to_view_model(self, task: TaskRowDto) -> TaskGanttRowViewModel:
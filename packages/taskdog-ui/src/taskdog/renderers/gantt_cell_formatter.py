@@ -35,6 +35,7 @@ from taskdog.constants.symbols import (
     SYMBOL_PENDING,
     SYMBOL_TODAY,
 )
+from taskdog.view_models.gantt_matrix import DayValues
 from taskdog.view_models.status import TaskStatus
 from taskdog_core.shared.constants import (
     SATURDAY,
@@ -292,31 +293,23 @@ class GanttCellFormatter:
         return month_cells, today_cells, day_cells
 
     @staticmethod
-    def build_workload_cells(
-        daily_workload: dict[date, float],
-        start_date: date,
-        end_date: date,
+    def build_workload_cells_from_totals(
+        totals: DayValues[float],
         comfortable_hours: float = WORKLOAD_COMFORTABLE_HOURS,
         moderate_hours: float = WORKLOAD_MODERATE_HOURS,
     ) -> list[Text]:
-        """Build workload summary as per-date cells.
+        """Build workload summary cells from per-day totals.
 
         Args:
-            daily_workload: Pre-computed daily workload totals
-            start_date: Start date of the chart
-            end_date: End date of the chart
+            totals: Workload hours per day, from the chart's first day
             comfortable_hours: Threshold for green zone
             moderate_hours: Threshold for yellow zone
 
         Returns:
-            List of Rich Text objects, one per date
+            List of Rich Text objects, one per day
         """
-        days = (end_date - start_date).days + 1
-
         cells: list[Text] = []
-        for day_offset in range(days):
-            current_date = start_date + timedelta(days=day_offset)
-            hours = daily_workload.get(current_date, 0.0)
+        for hours in totals:
             hours_ceiled = math.ceil(hours)
             display = str(hours_ceiled)
 
@@ -441,7 +434,7 @@ class GanttCellFormatter:
     def format_timeline_cells_batch(
         dates: list[date],
         date_metadata: list[DateMetadata],
-        task_daily_hours: dict[date, float],
+        daily_hours: DayValues[float],
         status: TaskStatus,
         planned_start: date | None,
         planned_end: date | None,
@@ -459,7 +452,8 @@ class GanttCellFormatter:
         Args:
             dates: List of dates in the timeline
             date_metadata: Pre-computed metadata for each date
-            task_daily_hours: Daily hours allocation for this task
+            daily_hours: Hours allocated to this task per date, aligned with
+                ``dates`` (e.g. a GanttMatrix row)
             status: Task status
             planned_start: Planned start date (or None)
             planned_end: Planned end date (or None)
@@ -488,7 +482,7 @@ class GanttCellFormatter:
 
         for i, current_date in enumerate(dates):
             meta = date_metadata[i]
-            hours = task_daily_hours.get(current_date, 0.0)
+            hours = daily_hours[i]
 
             # Determine actual period membership (inlined _is_in_actual_period)
             is_actual = False
@@ -100,7 +100,7 @@ class TaskDataLoader:
         gantt_view_model = None
         if task_list_output.gantt_data:
             gantt_view_model = self.gantt_presenter.present(
-                all_tasks, task_list_output.gantt_data
+                all_tasks, task_list_output.gantt_data, dense=True
             )
 
         return TaskData(
@@ -223,6 +223,7 @@ class TUIState:
             daily_workload=self.gantt_cache.daily_workload,
             holidays=self.gantt_cache.holidays,
             total_estimated_duration=self.gantt_cache.total_estimated_duration,
+            matrix=self.gantt_cache.matrix,
         )
 
     def update_caches(
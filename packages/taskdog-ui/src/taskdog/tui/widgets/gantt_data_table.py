@@ -19,6 +19,7 @@ from taskdog.constants.task_table import ESTIMATED_COLUMN_WIDTH, TASK_NAME_COLUM
 from taskdog.formatters.text_formatter import format_finished_name
 from taskdog.renderers.gantt_cell_formatter import DateMetadata, GanttCellFormatter
 from taskdog.tui.events import GanttPanRequested
+from taskdog.view_models.gantt_matrix import DayValues
 from taskdog.view_models.gantt_view_model import GanttViewModel, TaskGanttRowViewModel
 from taskdog_core.shared.constants import (
     WORKLOAD_COMFORTABLE_HOURS,
@@ -234,18 +235,16 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
 
             # Add task rows
             for idx, task_vm in enumerate(gantt_view_model.tasks):
-                task_daily_hours = gantt_view_model.task_daily_hours.get(task_vm.id, {})
+                daily_hours = self._task_hours_row(gantt_view_model, task_vm)
                 cells = self._build_task_row_cells(
-                    task_vm, task_daily_hours, self._date_columns, date_metadata, today
+                    task_vm, daily_hours, self._date_columns, date_metadata, today
                 )
                 self.add_row(*cells)
                 self._task_map[idx + GANTT_HEADER_ROW_COUNT] = task_vm
 
             # Add workload summary row
             workload_cells = self._build_workload_row_cells(
-                gantt_view_model.daily_workload,
-                gantt_view_model.start_date,
-                gantt_view_model.end_date,
+                self._workload_totals(gantt_view_model),
                 gantt_view_model.total_estimated_duration,
                 comfortable_hours=comfortable_hours,
                 moderate_hours=moderate_hours,
@@ -311,12 +310,10 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
             if new_task_count == prev_task_count:
                 # Same count: update all task rows + workload in-place
                 for idx, task_vm in enumerate(gantt_view_model.tasks):
-                    task_daily_hours = gantt_view_model.task_daily_hours.get(
-                        task_vm.id, {}
-                    )
+                    daily_hours = self._task_hours_row(gantt_view_model, task_vm)
                     cells = self._build_task_row_cells(
                         task_vm,
-                        task_daily_hours,
+                        daily_hours,
                         self._date_columns,
                         date_metadata,
                         today,
@@ -326,9 +323,7 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
 
                 # Update workload row in-place
                 workload_cells = self._build_workload_row_cells(
-                    gantt_view_model.daily_workload,
-                    gantt_view_model.start_date,
-                    gantt_view_model.end_date,
+                    self._workload_totals(gantt_view_model),
                     gantt_view_model.total_estimated_duration,
                     comfortable_hours=comfortable_hours,
                     moderate_hours=moderate_hours,
@@ -351,12 +346,10 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
                 # Update existing task rows
                 for idx in range(prev_task_count):
                     task_vm = gantt_view_model.tasks[idx]
-                    task_daily_hours = gantt_view_model.task_daily_hours.get(
-                        task_vm.id, {}
-                    )
+                    daily_hours = self._task_hours_row(gantt_view_model, task_vm)
                     cells = self._build_task_row_cells(
                         task_vm,
-                        task_daily_hours,
+                        daily_hours,
                         self._date_columns,
                         date_metadata,
                         today,
@@ -367,12 +360,10 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
                 # Add new task rows
                 for idx in range(prev_task_count, new_task_count):
                     task_vm = gantt_view_model.tasks[idx]
-                    task_daily_hours = gantt_view_model.task_daily_hours.get(
-                        task_vm.id, {}
-                    )
+                    daily_hours = self._task_hours_row(gantt_view_model, task_vm)
                     cells = self._build_task_row_cells(
                         task_vm,
-                        task_daily_hours,
+                        daily_hours,
                         self._date_columns,
                         date_metadata,
                         today,
@@ -382,9 +373,7 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
 
                 # Add new workload row
                 workload_cells = self._build_workload_row_cells(
-                    gantt_view_model.daily_workload,
-                    gantt_view_model.start_date,
-                    gantt_view_model.end_date,
+                    self._workload_totals(gantt_view_model),
                     gantt_view_model.total_estimated_duration,
                     comfortable_hours=comfortable_hours,
                     moderate_hours=moderate_hours,
@@ -396,12 +385,10 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
                 # then add new workload row
                 for idx in range(new_task_count):
                     task_vm = gantt_view_model.tasks[idx]
-                    task_daily_hours = gantt_view_model.task_daily_hours.get(
-                        task_vm.id, {}
-                    )
+                    daily_hours = self._task_hours_row(gantt_view_model, task_vm)
                     cells = self._build_task_row_cells(
                         task_vm,
-                        task_daily_hours,
+                        daily_hours,
                         self._date_columns,
                         date_metadata,
                         today,
@@ -422,9 +409,7 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
 
                 # Add new workload row
                 workload_cells = self._build_workload_row_cells(
-                    gantt_view_model.daily_workload,
-                    gantt_view_model.start_date,
-                    gantt_view_model.end_date,
+                    self._workload_totals(gantt_view_model),
                     gantt_view_model.total_estimated_duration,
                     comfortable_hours=comfortable_hours,
                     moderate_hours=moderate_hours,
@@ -458,10 +443,53 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
             start_date, end_date, holidays
         )
 
+    def _task_hours_row(
+        self, gantt_view_model: GanttViewModel, task_vm: TaskGanttRowViewModel
+    ) -> DayValues[float]:
+        """Get a task's hours per date column.
+
+        Reads the row of the view model's GanttMatrix when it matches the
+        date columns, and falls back to the per-task dict otherwise.
+
+        Args:
+            gantt_view_model: Gantt ViewModel being rendered
+            task_vm: Task ViewModel of the row
+
+        Returns:
+            Hours per date, aligned with the date columns
+        """
+        if self._matrix_matches_columns(gantt_view_model):
+            assert gantt_view_model.matrix is not None
+            return gantt_view_model.matrix.row(task_vm.id)
+        daily_hours = gantt_view_model.task_daily_hours.get(task_vm.id, {})
+        return [daily_hours.get(d, 0.0) for d in self._date_columns]
+
+    def _workload_totals(self, gantt_view_model: GanttViewModel) -> DayValues[float]:
+        """Get the workload hours per date column.
+
+        Args:
+            gantt_view_model: Gantt ViewModel being rendered
+
+        Returns:
+            Workload hours per date, aligned with the date columns
+        """
+        if self._matrix_matches_columns(gantt_view_model):
+            assert gantt_view_model.matrix is not None
+            return gantt_view_model.matrix.workload
+        return [gantt_view_model.daily_workload.get(d, 0.0) for d in self._date_columns]
+
+    def _matrix_matches_columns(self, gantt_view_model: GanttViewModel) -> bool:
+        matrix = gantt_view_model.matrix
+        return (
+            matrix is not None
+            and matrix.days == len(self._date_columns)
+            and (not self._date_columns or matrix.start_date == self._date_columns[0])
+        )
+
     def _build_task_row_cells(
         self,
         task_vm: TaskGanttRowViewModel,
-        task_daily_hours: dict[date, float],
+        daily_hours: DayValues[float],
         dates: list[date],
         date_metadata: list[DateMetadata],
         today: date,
@@ -470,7 +498,7 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
 
         Args:
             task_vm: Task ViewModel
-            task_daily_hours: Daily hours allocation for this task
+            daily_hours: Hours allocated to this task per date
             dates: Pre-computed list of dates in the timeline
             date_metadata: Pre-computed metadata for each date
             today: Current date
@@ -480,7 +508,7 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
         """
         task_id, task_name, est_hours = self._format_task_metadata(task_vm)
         date_cells = self._build_timeline_cells(
-            task_vm, task_daily_hours, dates, date_metadata, today
+            task_vm, daily_hours, dates, date_metadata, today
         )
 
         return [
@@ -510,7 +538,7 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
     def _build_timeline_cells(
         self,
         task_vm: TaskGanttRowViewModel,
-        task_daily_hours: dict[date, float],
+        daily_hours: DayValues[float],
         dates: list[date],
         date_metadata: list[DateMetadata],
         today: date,
@@ -521,7 +549,7 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
 
         Args:
             task_vm: Task ViewModel to build timeline for
-            task_daily_hours: Daily hours allocation
+            daily_hours: Hours allocated to this task per date
             dates: Pre-computed list of dates in the timeline
             date_metadata: Pre-computed metadata for each date
             today: Current date (computed once by caller)
@@ -532,7 +560,7 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
         cell_data = GanttCellFormatter.format_timeline_cells_batch(
             dates,
             date_metadata,
-            task_daily_hours,
+            daily_hours,
             task_vm.status,
             task_vm.planned_start,
             task_vm.planned_end,
@@ -548,9 +576,7 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
 
     def _build_workload_row_cells(
         self,
-        daily_workload: dict[date, float],
-        start_date: date,
-        end_date: date,
+        workload_totals: DayValues[float],
         total_estimated_duration: float = 0.0,
         comfortable_hours: float = WORKLOAD_COMFORTABLE_HOURS,
         moderate_hours: float = WORKLOAD_MODERATE_HOURS,
@@ -558,9 +584,7 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
         """Build all cells for the workload summary row.
 
         Args:
-            daily_workload: Pre-computed daily workload totals
-            start_date: Start date of the chart
-            end_date: End date of the chart
+            workload_totals: Workload hours per date column
             total_estimated_duration: Sum of all estimated durations
             comfortable_hours: Workload threshold for green zone
             moderate_hours: Workload threshold for yellow zone
@@ -568,10 +592,8 @@ class GanttDataTable(DataTable):  # type: ignore[type-arg]
         Returns:
             List of Text cells for the workload row
         """
-        workload_cells = GanttCellFormatter.build_workload_cells(
-            daily_workload,
-            start_date,
-            end_date,
+        workload_cells = GanttCellFormatter.build_workload_cells_from_totals(
+            workload_totals,
             comfortable_hours=comfortable_hours,
             moderate_hours=moderate_hours,
         )
@@ -0,0 +1,123 @@
+"""Dense task x day representation of Gantt chart allocations.
+
+The Gantt overlay carries allocations as ``{task_id: {date: hours}}``. Looking
+up every cell of a large chart in those dicts is slow, so the presenter packs
+them into one row of hours per task, indexed by day offset from the chart
+start. Renderers then read array slices, and the workload row is a column
+sum over the rows that count in workload.
+
+NumPy is used when it is installed (``uv pip install "taskdog-ui[numpy]"``);
+otherwise rows are stdlib ``array('d')`` buffers with the same interface.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+    from datetime import date
+
+
+class DayValues[T](Protocol):
+    """Values indexed by day offset: a NumPy array, stdlib array or list."""
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, offset: int, /) -> T: ...
+
+    def __iter__(self) -> Iterator[T]: ...
+
+
+@dataclass(frozen=True, eq=False)
+class GanttMatrix:
+    """Allocated hours per task and day, with the workload row.
+
+    Hours are float64: the workload row rounds totals up, and float32
+    rounding of values such as 1.1h would turn a day of 4.0h into 5.
+
+    Attributes:
+        start_date: Day of column 0
+        days: Number of day columns
+        row_index: Row of each task that has allocations in the range
+        hours: Task x day hours (a 2-D ndarray, or a list of array rows)
+        workload: Per-day column sum over the rows that count in workload
+    """
+
+    start_date: date
+    days: int
+    row_index: dict[int, int]
+    hours: Any
+    workload: DayValues[float]
+
+    @classmethod
+    def build(
+        cls,
+        start_date: date,
+        end_date: date,
+        task_daily_hours: Mapping[int, Mapping[date, float]],
+        workload_task_ids: Iterable[int],
+    ) -> GanttMatrix:
+        """Pack per-task allocations into a dense matrix.
+
+        Args:
+            start_date: First day of the chart
+            end_date: Last day of the chart
+            task_daily_hours: Daily hours per task ({task_id: {date: hours}})
+            workload_task_ids: Tasks whose hours count in the workload row
+
+        Returns:
+            GanttMatrix covering start_date to end_date
+        """
+        days = max((end_date - start_date).days + 1, 0)
+        row_index = {task_id: row for row, task_id in enumerate(task_daily_hours)}
+
+        if _np is not None:
+            hours: Any = _np.zeros((len(row_index), days))
+        else:
+            hours = [array("d", bytes(8 * days)) for _ in row_index]
+        for task_id, daily_hours in task_daily_hours.items():
+            row = hours[row_index[task_id]]
+            for day, value in daily_hours.items():
+                offset = (day - start_date).days
+                if 0 <= offset < days:
+                    row[offset] = value
+
+        counted = [row_index[t] for t in workload_task_ids if t in row_index]
+        if _np is not None:
+            return cls(start_date, days, row_index, hours, hours[counted].sum(axis=0))
+
+        totals = array("d", bytes(8 * days))
+        for row in counted:
+            for offset, value in enumerate(hours[row]):
+                totals[offset] += value
+        return cls(start_date, days, row_index, hours, totals)
+
+    def row(self, task_id: int) -> DayValues[float]:
+        """Hours of a task per day, zeros if it has no allocations.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            ``days`` hours, indexed by day offset
+        """
+        row = self.row_index.get(task_id)
+        if row is None:
+            return _zeros(self.days)
+        hours: DayValues[float] = self.hours[row]
+        return hours
+
+
+def _zeros(days: int) -> DayValues[float]:
+    if _np is not None:
+        zeros: DayValues[float] = _np.zeros(days)
+        return zeros
+    return array("d", bytes(8 * days))
@@ -5,10 +5,11 @@ without domain entity references. All presentation logic (formatting,
 strikethrough, etc.) is applied by the Mapper before creating these ViewModels.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 
 from taskdog.view_models.base import BaseViewModel
+from taskdog.view_models.gantt_matrix import GanttMatrix
 from taskdog.view_models.status import TaskStatus
 
 
@@ -59,6 +60,8 @@ class GanttViewModel(BaseViewModel):
         daily_workload: Daily workload totals across all tasks
         holidays: Set of holiday dates in the chart range (for rendering)
         total_estimated_duration: Sum of all estimated durations in hours
+        matrix: Dense form of task_daily_hours and daily_workload for
+            cell-by-cell rendering (None when not built)
     """
 
     start_date: date
@@ -68,6 +71,7 @@ class GanttViewModel(BaseViewModel):
     daily_workload: dict[date, float]
     holidays: set[date]
     total_estimated_duration: float = 0.0
+    matrix: GanttMatrix | None = field(default=None, compare=False)
 
     @property
     def total_days(self) -> int:
@@ -6,6 +6,12 @@ import pytest
 from click.testing import CliRunner
 
 from taskdog.cli.commands.optimize import optimize_command
+from taskdog_core.application.dto.optimization_output import OptimizationProfile
+from taskdog_core.application.dto.optimization_summary import (
+    CriticalPath,
+    PortfolioCandidate,
+    SearchStats,
+)
 
 
 class TestOptimizeCommand:
@@ -164,6 +170,145 @@ class TestOptimizeCommand:
         call_kwargs = self.api_client.optimize_schedule.call_args[1]
         assert call_kwargs["start_date"] is None
 
+    def test_optimize_simulations(self):
+        """Test --simulations is passed as num_simulations."""
+        mock_result = MagicMock()
+        mock_result.all_failed.return_value = False
+        mock_result.successful_tasks = [MagicMock()]
+        mock_result.has_failures.return_value = False
+        self.api_client.optimize_schedule.return_value = mock_result
+
+        result = self.runner.invoke(
+            optimize_command,
+            ["-a", "monte_carlo", "-m", "6.0", "--simulations", "2000"],
+            obj=self.cli_context,
+        )
+
+        assert result.exit_code == 0
+        call_kwargs = self.api_client.optimize_schedule.call_args[1]
+        assert call_kwargs["num_simulations"] == 2000
+
+    def test_optimize_profile(self):
+        """Test --profile requests and prints phase timings and counters."""
+        mock_result = MagicMock()
+        mock_result.all_failed.return_value = False
+        mock_result.successful_tasks = [MagicMock()]
+        mock_result.has_failures.return_value = False
+        mock_result.summary.portfolio = []
+        mock_result.summary.critical_path = None
+        mock_result.summary.search_stats = None
+        mock_result.profile = OptimizationProfile(
+            phases={"load_tasks": 0.002, "strategy": 0.0105},
+            total_seconds=0.015,
+            counters={"generations": 12, "early_terminated": True},
+        )
+        self.api_client.optimize_schedule.return_value = mock_result
+
+        result = self.runner.invoke(
+            optimize_command,
+            ["-a", "genetic", "-m", "6.0", "--profile"],
+            obj=self.cli_context,
+        )
+
+        assert result.exit_code == 0
+        assert self.api_client.optimize_schedule.call_args[1]["profile"] is True
+        printed = [c.args[0] for c in self.console_writer.print.call_args_list]
+        assert "Profile (15.0 ms total):" in printed
+        assert "  strategy: 10.5 ms" in printed
+        assert "  generations: 12" in printed
+        assert "  early_terminated: True" in printed
+
+    def test_optimize_portfolio(self):
+        """Test portfolio algorithms are parsed and candidates are shown."""
+        # Setup
+        mock_result = MagicMock()
+        mock_result.all_failed.return_value = False
+        mock_result.successful_tasks = [MagicMock()]
+        mock_result.has_failures.return_value = False
+        mock_result.summary.selected_algorithm = "balanced"
+        mock_result.summary.portfolio = [
+            PortfolioCandidate(algorithm="greedy", fitness=10.0, runtime_seconds=0.001),
+            PortfolioCandidate(
+                algorithm="balanced",
+                fitness=12.0,
+                runtime_seconds=0.002,
+                selected=True,
+            ),
+        ]
+        self.api_client.optimize_schedule.return_value = mock_result
+
+        # Execute
+        result = self.runner.invoke(
+            optimize_command,
+            [
+                "-a",
+                "portfolio",
+                "-m",
+                "6.0",
+                "--portfolio-algorithms",
+                "greedy, balanced",
+            ],
+            obj=self.cli_context,
+        )
+
+        # Verify
+        assert result.exit_code == 0
+        call_kwargs = self.api_client.optimize_schedule.call_args[1]
+        assert call_kwargs["portfolio_algorithms"] == ["greedy", "balanced"]
+        printed = [c.args[0] for c in self.console_writer.print.call_args_list]
+        assert "Selected algorithm: balanced" in printed
+        assert any(line.startswith(" * balanced") for line in printed)
+
+    def test_optimize_shows_critical_path(self):
+        """Test the dependency_aware critical path is printed."""
+        mock_result = MagicMock()
+        mock_result.all_failed.return_value = False
+        mock_result.successful_tasks = [MagicMock(), MagicMock()]
+        mock_result.has_failures.return_value = False
+        mock_result.summary.portfolio = []
+        mock_result.summary.critical_path = CriticalPath(
+            task_ids=[3, 5], total_hours=12.0, length_days=2
+        )
+        self.api_client.optimize_schedule.return_value = mock_result
+
+        result = self.runner.invoke(
+            optimize_command,
+            ["-a", "dependency_aware", "-m", "6.0"],
+            obj=self.cli_context,
+        )
+
+        assert result.exit_code == 0
+        printed = [c.args[0] for c in self.console_writer.print.call_args_list]
+        assert "Critical path: #3 → #5 (12.0h, 2 day(s))" in printed
+
+    def test_optimize_shows_search_stats(self):
+        """Test the exact algorithm's search statistics are printed."""
+        mock_result = MagicMock()
+        mock_result.all_failed.return_value = False
+        mock_result.successful_tasks = [MagicMock()]
+        mock_result.has_failures.return_value = False
+        mock_result.summary.portfolio = []
+        mock_result.summary.critical_path = None
+        mock_result.summary.search_stats = SearchStats(
+            nodes_explored=1200,
+            runtime_seconds=0.1,
+            nodes_per_second=12000.0,
+            optimal=False,
+            fallback="time",
+        )
+        self.api_client.optimize_schedule.return_value = mock_result
+
+        result = self.runner.invoke(
+            optimize_command, ["-a", "exact", "-m", "6.0"], obj=self.cli_context
+        )
+
+        assert result.exit_code == 0
+        printed = [c.args[0] for c in self.console_writer.print.call_args_list]
+        assert (
+            "Exact search: 1200 nodes (12000 nodes/s), "
+            "time limit reached, best order found so far"
+        ) in printed
+
     def test_optimize_all_failed(self):
         """Test optimization when all tasks fail."""
         # Setup
@@ -161,3 +161,39 @@ class TestGanttPresenter:
         assert len(result.tasks) == 2
         assert result.tasks[0].id == 1
         assert result.tasks[1].id == 2
+
+    def test_present_without_dense_has_no_matrix(self):
+        result = self.presenter.present([self._make_task()], self._make_overlay())
+
+        assert result.matrix is None
+
+    def test_present_dense_packs_rows_and_workload(self):
+        day = date(2026, 1, 1)  # Thursday
+        tasks = [
+            self._make_task(task_id=1),
+            self._make_task(task_id=2, is_finished=True, status=TaskStatus.COMPLETED),
+            self._make_task(task_id=3),
+        ]
+        overlay = GanttOverlay(
+            date_range=GanttDateRange(start_date=day, end_date=date(2026, 1, 7)),
+            task_daily_hours={
+                1: {day: 1.1, date(2026, 1, 2): 2.5},
+                2: {day: 4.0},
+                3: {day: 2.9, date(2026, 1, 9): 8.0},
+            },
+            daily_workload={day: 4.0, date(2026, 1, 2): 2.5},
+            holidays={date(2026, 1, 1)},
+        )
+
+        matrix = self.presenter.present(tasks, overlay, dense=True).matrix
+
+        assert matrix is not None
+        assert matrix.days == 7
+        assert list(matrix.row(1)) == [1.1, 2.5, 0.0, 0.0, 0.0, 0.0, 0.0]
+        assert list(matrix.row(3)) == [2.9, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        assert list(matrix.row(4)) == [0.0] * 7
+        # Finished task 2 does not count, matching the overlay's workload
+        assert [float(h) for h in matrix.workload[:2]] == [
+            overlay.daily_workload[day],
+            overlay.daily_workload[date(2026, 1, 2)],
+        ]
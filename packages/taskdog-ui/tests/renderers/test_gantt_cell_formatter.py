@@ -451,19 +451,10 @@ class TestGanttCellFormatter:
         assert len(today_cells) == 1
         assert SYMBOL_TODAY in today_cells[0].plain
 
-    def test_build_workload_cells(self):
-        """Test building per-date workload cells."""
-        daily_workload = {
-            date(2025, 10, 1): 4.0,
-            date(2025, 10, 2): 6.5,
-            date(2025, 10, 3): 8.5,
-            date(2025, 10, 4): 0.0,
-        }
-        start_date = date(2025, 10, 1)
-        end_date = date(2025, 10, 4)
-
-        cells = GanttCellFormatter.build_workload_cells(
-            daily_workload, start_date, end_date
+    def test_build_workload_cells_from_totals(self):
+        """Test building per-day workload cells."""
+        cells = GanttCellFormatter.build_workload_cells_from_totals(
+            [4.0, 6.5, 8.5, 0.0]
         )
 
         assert len(cells) == 4
@@ -475,20 +466,31 @@ class TestGanttCellFormatter:
         assert "9" in cells[2].plain  # 8.5 -> 9 (ceil)
         assert "0" in cells[3].plain
 
+    def test_format_timeline_cells_batch_reads_hours_by_position(self):
+        """Daily hours are a row aligned with the dates, e.g. a matrix row."""
+        dates = [date(2025, 10, 1), date(2025, 10, 2), date(2025, 10, 3)]
+        today = date(2025, 9, 1)
+        metadata = GanttCellFormatter.precompute_date_metadata(dates, set(), today)
+
+        cells = GanttCellFormatter.format_timeline_cells_batch(
+            dates,
+            metadata,
+            [2.0, 0.0, 1.5],
+            TaskStatus.PENDING,
+            dates[0],
+            dates[-1],
+            None,
+            None,
+            None,
+            today,
+        )
+
+        assert [display for display, _ in cells] == [" 2 ", SYMBOL_EMPTY, "1.5"]
+
     def test_build_workload_cells_custom_thresholds(self):
         """Test workload cells with custom thresholds."""
-        daily_workload = {
-            date(2025, 10, 1): 3.0,
-            date(2025, 10, 2): 5.0,
-            date(2025, 10, 3): 7.0,
-        }
-        start_date = date(2025, 10, 1)
-        end_date = date(2025, 10, 3)
-
-        cells = GanttCellFormatter.build_workload_cells(
-            daily_workload,
-            start_date,
-            end_date,
+        cells = GanttCellFormatter.build_workload_cells_from_totals(
+            [3.0, 5.0, 7.0],
             comfortable_hours=4.0,
             moderate_hours=6.0,
         )
@@ -0,0 +1,72 @@
+"""Tests for GanttMatrix with the NumPy and stdlib backends."""
+
+from datetime import date
+
+import pytest
+
+from taskdog.view_models import gantt_matrix
+from taskdog.view_models.gantt_matrix import GanttMatrix
+
+START = date(2026, 1, 1)  # Thursday
+END = date(2026, 1, 7)
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    """Run each test with NumPy rows and with stdlib array rows."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(gantt_matrix, "_np", None)
+    return request.param
+
+
+def _build(task_daily_hours, workload_task_ids=None):
+    return GanttMatrix.build(
+        START,
+        END,
+        task_daily_hours,
+        task_daily_hours if workload_task_ids is None else workload_task_ids,
+    )
+
+
+class TestGanttMatrix:
+    def test_backend_is_selected(self, backend):
+        matrix = _build({1: {START: 1.0}})
+
+        assert (type(matrix.workload).__module__ == "numpy") == (backend == "numpy")
+
+    def test_rows_are_indexed_by_day_offset(self, backend):
+        matrix = _build(
+            {1: {START: 1.1, date(2026, 1, 3): 2.5}, 2: {date(2026, 1, 7): 8.0}}
+        )
+
+        assert matrix.days == 7
+        assert list(matrix.row(1)) == [1.1, 0.0, 2.5, 0.0, 0.0, 0.0, 0.0]
+        assert matrix.row(2)[6] == 8.0
+        assert len(matrix.row(2)) == 7
+
+    def test_unknown_task_row_is_zeros(self, backend):
+        matrix = _build({1: {START: 1.0}})
+
+        assert list(matrix.row(99)) == [0.0] * 7
+
+    def test_hours_outside_range_are_dropped(self, backend):
+        matrix = _build({1: {date(2025, 12, 31): 3.0, date(2026, 1, 8): 3.0}})
+
+        assert list(matrix.row(1)) == [0.0] * 7
+
+    def test_workload_sums_counted_rows_only(self, backend):
+        matrix = _build(
+            {1: {START: 1.1}, 2: {START: 2.9}, 3: {START: 4.0}},
+            workload_task_ids=[1, 2, 99],
+        )
+
+        assert [float(h) for h in matrix.workload] == [4.0] + [0.0] * 6
+
+    def test_empty_range(self, backend):
+        matrix = GanttMatrix.build(END, START, {1: {START: 1.0}}, [1])
+
+        assert matrix.days == 0
+        assert len(matrix.row(1)) == 0
+        assert len(matrix.workload) == 0
@@ -0,0 +1,119 @@
+"""Benchmark the dependency_aware strategy on large dependency graphs.
+
+Times the CPM passes (graph build, topological order, timings, critical
+path) and a full optimize_tasks() run for random DAGs and deep chains.
+
+Usage:
+    uv run python scripts/bench_dependency_aware.py [--sizes 1000,10000]
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from datetime import datetime
+
+from taskdog_core.application.dto.optimize_params import OptimizeParams
+from taskdog_core.application.services.optimization.dependency_aware_optimization_strategy import (
+    DependencyAwareOptimizationStrategy,
+)
+from taskdog_core.application.services.optimization.precedence_graph import (
+    PrecedenceGraph,
+)
+from taskdog_core.domain.entities.task import Task
+
+START = datetime(2025, 1, 6, 9, 0)
+MAX_HOURS_PER_DAY = 8.0
+
+
+def random_dag(size: int, rng: random.Random) -> list[Task]:
+    """Tasks with up to three prerequisites among the previous 50 tasks."""
+    tasks = []
+    for task_id in range(1, size + 1):
+        window = range(max(1, task_id - 50), task_id)
+        depends_on = rng.sample(window, min(len(window), rng.randint(0, 3)))
+        tasks.append(
+            Task(
+                id=task_id,
+                name=f"Task {task_id}",
+                priority=rng.randint(1, 100),
+                estimated_duration=float(rng.randint(1, 16)),
+                depends_on=depends_on,
+            )
+        )
+    rng.shuffle(tasks)
+    return tasks
+
+
+def deep_chain(size: int, rng: random.Random) -> list[Task]:
+    """A single chain where every task depends on the previous one."""
+    tasks = [
+        Task(
+            id=task_id,
+            name=f"Task {task_id}",
+            priority=rng.randint(1, 100),
+            estimated_duration=float(rng.randint(1, 8)),
+            depends_on=[task_id - 1] if task_id > 1 else [],
+        )
+        for task_id in range(1, size + 1)
+    ]
+    rng.shuffle(tasks)
+    return tasks
+
+
+def timed(func: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def run(shape: str, tasks: list[Task]) -> None:
+    params = OptimizeParams(start_date=START, max_hours_per_day=MAX_HOURS_PER_DAY)
+    strategy = DependencyAwareOptimizationStrategy()
+
+    def cpm() -> None:
+        graph = PrecedenceGraph(tasks)
+        timings = graph.compute_timings(
+            [strategy._duration_days(task, params) for task in tasks],
+            [strategy._due_day(task, params) for task in tasks],
+        )
+        graph.critical_path(timings)
+
+    cpm_seconds = timed(cpm)
+    result = None
+
+    def optimize() -> None:
+        nonlocal result
+        result = strategy.optimize_tasks(tasks, {}, params)
+
+    optimize_seconds = timed(optimize)
+    assert result is not None
+    path = result.critical_path
+    print(
+        f"{shape:<12} {len(tasks):>7} {cpm_seconds * 1000:>10.1f} "
+        f"{optimize_seconds * 1000:>12.1f} "
+        f"{len(path.task_ids) if path else 0:>9} {len(result.failures):>7}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default="1000,10000",
+        help="Comma-separated task counts (default: 1000,10000)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{'shape':<12} {'tasks':>7} {'cpm ms':>10} {'optimize ms':>12} "
+        f"{'path len':>9} {'failed':>7}"
+    )
+    for size in (int(s) for s in args.sizes.split(",")):
+        run("random_dag", random_dag(size, random.Random(args.seed)))
+        run("deep_chain", deep_chain(size, random.Random(args.seed)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""Benchmark every optimization strategy on synthetic backlogs.
+
+Generates reproducible backlogs for each combination of the given sizes,
+deadline tightness, dependency density, fixed-task ratio and holiday
+calendar, runs each algorithm with a fixed seed, and records runtime, peak
+memory, fitness and scheduled/failed counts as JSON. Pass an earlier JSON
+file with --compare to flag runtime regressions between commits.
+
+Usage:
+    uv run python scripts/bench_optimize.py --output bench.json
+    uv run python scripts/bench_optimize.py --sizes 50,500,5000,20000 \\
+        --deadlines loose,tight --dependencies 0,1.5 --fixed-ratios 0,0.2 \\
+        --holidays none,JP --output bench.json
+    uv run python scripts/bench_optimize.py --compare before.json --output after.json
+"""
+
+import argparse
+import itertools
+import json
+import math
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from taskdog_core.application.dto.optimize_params import OptimizeParams
+from taskdog_core.application.services.optimization.fitness_cache import (
+    get_shared_fitness_cache,
+)
+from taskdog_core.application.services.optimization.schedule_fitness_calculator import (
+    ScheduleFitnessCalculator,
+)
+from taskdog_core.application.services.optimization.strategy_factory import (
+    StrategyFactory,
+)
+from taskdog_core.domain.entities.task import Task
+from taskdog_core.domain.services.holiday_checker import IHolidayChecker
+from taskdog_core.infrastructure.holiday_checker import HolidayChecker
+
+START = datetime(2025, 1, 6, 9, 0)
+MAX_HOURS_PER_DAY = 8.0
+# Algorithms that evaluate many candidate schedules per run
+SLOW_ALGORITHMS = {"genetic", "monte_carlo", "portfolio"}
+# Deadline as a multiple of the day a task would finish in a perfect packing
+DEADLINE_FACTORS = {"loose": (1.2, 2.0), "tight": (0.5, 1.0), "mixed": (0.5, 2.0)}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Parameters of one synthetic backlog."""
+
+    size: int
+    deadlines: str
+    dependencies: float
+    fixed_ratio: float
+    holidays: str
+
+    @property
+    def key(self) -> str:
+        return (
+            f"n={self.size} deadlines={self.deadlines} deps={self.dependencies} "
+            f"fixed={self.fixed_ratio} holidays={self.holidays}"
+        )
+
+
+class SyntheticHolidayChecker(IHolidayChecker):
+    """Every 17th day is a holiday, giving irregular gaps in any year."""
+
+    def is_holiday(self, check_date: date) -> bool:
+        return check_date.toordinal() % 17 == 0
+
+    def get_holidays_in_range(self, start_date: date, end_date: date) -> set[date]:
+        return {
+            start_date + timedelta(days=offset)
+            for offset in range((end_date - start_date).days + 1)
+            if self.is_holiday(start_date + timedelta(days=offset))
+        }
+
+
+def holiday_checker(name: str) -> IHolidayChecker | None:
+    """Resolve --holidays values: none, synthetic, or a country code."""
+    if name == "none":
+        return None
+    if name == "synthetic":
+        return SyntheticHolidayChecker()
+    return HolidayChecker(name)
+
+
+def generate_backlog(
+    scenario: Scenario, seed: int
+) -> tuple[list[Task], dict[date, float]]:
+    """Build the tasks to optimize and the allocations of fixed tasks.
+
+    Estimates are 1-16 hours, so the backlog spans roughly size / 1.9
+    workdays: a few weeks at 50 tasks and several years at 20k. Deadlines
+    are placed relative to when each task would finish if the backlog were
+    packed perfectly in ID order. Prerequisites are drawn from the previous
+    50 tasks.
+
+    Args:
+        scenario: Backlog parameters
+        seed: Random seed
+
+    Returns:
+        Tuple of (schedulable tasks, existing allocations of fixed tasks)
+    """
+    rng = random.Random(f"{seed}:{scenario.key}")
+    low, high = DEADLINE_FACTORS[scenario.deadlines]
+    tasks: list[Task] = []
+    existing: dict[date, float] = {}
+    cumulative_hours = 0.0
+
+    for task_id in range(1, scenario.size + 1):
+        hours = float(rng.randint(1, 16))
+        if rng.random() < scenario.fixed_ratio:
+            # Fixed tasks are not optimized; their hours are booked already
+            day = START.date() + timedelta(days=int(cumulative_hours / 6.0))
+            existing[day] = existing.get(day, 0.0) + min(hours, 4.0)
+            continue
+        cumulative_hours += hours
+
+        deadline = None
+        if rng.random() < 0.7:
+            packed_days = cumulative_hours / MAX_HOURS_PER_DAY * 7 / 5
+            days = max(1, int(packed_days * rng.uniform(low, high)))
+            deadline = START.replace(hour=18) + timedelta(days=days)
+
+        depends_on: list[int] = []
+        if tasks and scenario.dependencies > 0:
+            window = [t.id for t in tasks[-50:] if t.id is not None]
+            count = min(len(window), _poisson(rng, scenario.dependencies))
+            depends_on = rng.sample(window, count)
+
+        tasks.append(
+            Task(
+                id=task_id,
+                name=f"Task {task_id}",
+                priority=rng.randint(1, 100),
+                estimated_duration=hours,
+                deadline=deadline,
+                depends_on=depends_on,
+            )
+        )
+    return tasks, existing
+
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    """Small Poisson sampler (Knuth), enough for dependency counts."""
+    limit = math.exp(-mean)
+    count, product = 0, rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+def run_once(
+    algorithm: str, scenario: Scenario, seed: int, measure_memory: bool
+) -> tuple[float, int | None, float, int, int]:
+    """Optimize a fresh copy of the backlog once.
+
+    Returns:
+        Tuple of (runtime seconds, peak traced bytes or None, fitness,
+        scheduled count, failed count)
+    """
+    tasks, existing = generate_backlog(scenario, seed)
+    params = OptimizeParams(
+        start_date=START,
+        max_hours_per_day=MAX_HOURS_PER_DAY,
+        holiday_checker=holiday_checker(scenario.holidays),
+        seed=seed,
+    )
+    strategy = StrategyFactory.create(algorithm)
+    # Cached fitness scores from an earlier run would skew later ones
+    get_shared_fitness_cache().clear()
+
+    if measure_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    result = strategy.optimize_tasks(tasks, existing, params)
+    elapsed = time.perf_counter() - started
+    peak = None
+    if measure_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    fitness = ScheduleFitnessCalculator().calculate_fitness(
+        result.tasks, result.daily_allocations, include_scheduling_bonus=True
+    )
+    return elapsed, peak, fitness, len(result.tasks), len(result.failures)
+
+
+def benchmark(
+    algorithm: str, scenario: Scenario, seed: int, repeat: int, memory: bool
+) -> dict[str, Any]:
+    """Best-of-``repeat`` runtime plus one traced run for peak memory."""
+    runs = [run_once(algorithm, scenario, seed, False) for _ in range(repeat)]
+    runtime, _, fitness, scheduled, failed = min(runs, key=lambda r: r[0])
+    peak = run_once(algorithm, scenario, seed, True)[1] if memory else None
+    return {
+        "scenario": asdict(scenario),
+        "scenario_key": scenario.key,
+        "algorithm": algorithm,
+        "runtime_seconds": round(runtime, 6),
+        "peak_memory_bytes": peak,
+        "fitness": round(fitness, 3),
+        "scheduled": scheduled,
+        "failed": failed,
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(
+    baseline_path: Path, results: list[dict[str, Any]], threshold: float
+) -> int:
+    """Print runtime ratios against a baseline and count regressions."""
+    baseline = {
+        (r["scenario_key"], r["algorithm"]): r
+        for r in json.loads(baseline_path.read_text())["results"]
+    }
+    regressions = 0
+    print(f"\nComparison with {baseline_path} (regression if ratio > {threshold}):")
+    for result in results:
+        before = baseline.get((result["scenario_key"], result["algorithm"]))
+        if before is None or not before["runtime_seconds"]:
+            continue
+        ratio = result["runtime_seconds"] / before["runtime_seconds"]
+        flag = ""
+        if ratio > threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        if result["fitness"] != before["fitness"]:
+            flag += f"  fitness {before['fitness']} -> {result['fitness']}"
+        print(
+            f"{result['scenario_key']:<64} {result['algorithm']:<18} "
+            f"{ratio:>6.2f}x{flag}"
+        )
+    return regressions
+
+
+def _csv(value: str, cast: Callable[[str], Any] = str) -> list[Any]:
+    return [cast(item) for item in value.split(",") if item]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="50,500,5000", help="Task counts")
+    parser.add_argument(
+        "--deadlines",
+        default="mixed",
+        help=f"Deadline tightness ({', '.join(DEADLINE_FACTORS)})",
+    )
+    parser.add_argument(
+        "--dependencies",
+        default="0.5",
+        help="Mean prerequisites per task (e.g. 0,0.5,2)",
+    )
+    parser.add_argument(
+        "--fixed-ratios", default="0.1", help="Share of fixed tasks (e.g. 0,0.2)"
+    )
+    parser.add_argument(
+        "--holidays",
+        default="none",
+        help="Holiday calendars: none, synthetic, or country codes (e.g. JP)",
+    )
+    parser.add_argument(
+        "--algorithms",
+        default="all",
+        help="Comma-separated algorithm names (default: all)",
+    )
+    parser.add_argument(
+        "--slow-limit",
+        type=int,
+        default=1000,
+        help="Skip genetic, monte_carlo and portfolio above this many tasks "
+        "(0 disables the limit)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="Best-of-N runtime")
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip the traced peak-memory run"
+    )
+    parser.add_argument("--output", type=Path, help="Write results as JSON here")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Runtime ratio counted as a regression (default: 1.25)",
+    )
+    args = parser.parse_args()
+
+    algorithms = (
+        [name for name, _, _ in StrategyFactory.get_algorithm_metadata()]
+        if args.algorithms == "all"
+        else _csv(args.algorithms)
+    )
+    scenarios = [
+        Scenario(*values)
+        for values in itertools.product(
+            _csv(args.sizes, int),
+            _csv(args.deadlines),
+            _csv(args.dependencies, float),
+            _csv(args.fixed_ratios, float),
+            _csv(args.holidays),
+        )
+    ]
+
+    results: list[dict[str, Any]] = []
+    skipped: list[dict[str, str]] = []
+    print(
+        f"{'scenario':<64} {'algorithm':<18} {'seconds':>9} {'peak MiB':>9} "
+        f"{'fitness':>14} {'ok':>6} {'failed':>6}"
+    )
+    for scenario in scenarios:
+        for algorithm in algorithms:
+            if (
+                args.slow_limit
+                and algorithm in SLOW_ALGORITHMS
+                and scenario.size > args.slow_limit
+            ):
+                skipped.append({"scenario_key": scenario.key, "algorithm": algorithm})
+                continue
+            result = benchmark(
+                algorithm, scenario, args.seed, args.repeat, not args.no_memory
+            )
+            results.append(result)
+            peak = result["peak_memory_bytes"]
+            peak_mib = f"{peak / 2**20:.1f}" if isinstance(peak, int) else "-"
+            print(
+                f"{scenario.key:<64} {algorithm:<18} "
+                f"{result['runtime_seconds']:>9.3f} {peak_mib:>9} "
+                f"{result['fitness']:>14.1f} {result['scheduled']:>6} "
+                f"{result['failed']:>6}",
+                flush=True,
+            )
+
+    report = {
+        "meta": {
+            "git_revision": git_revision(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nWrote {len(results)} results to {args.output}")
+
+    if args.compare:
+        return 1 if compare(args.compare, results, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""Benchmark the round_robin strategy over long planning horizons.
+
+Times the rotation (which days each task receives hours on) and a full
+optimize_tasks() run for backlogs sized to fill a given number of years.
+The full run also builds every task's per-day allocations, which grow with
+tasks x days, so it is skipped for backlogs above --full-limit cells.
+
+Usage:
+    uv run python scripts/bench_round_robin.py [--sizes 100,1000,10000] \\
+        [--years 1,10,50]
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from taskdog_core.application.dto.optimize_params import OptimizeParams
+from taskdog_core.application.services.optimization.capacity_calendar import (
+    CapacityCalendar,
+)
+from taskdog_core.application.services.optimization.round_robin_optimization_strategy import (
+    RoundRobinOptimizationStrategy,
+)
+from taskdog_core.domain.entities.task import Task
+
+START = datetime(2025, 1, 6, 9, 0)
+MAX_HOURS_PER_DAY = 8.0
+WORKDAYS_PER_YEAR = 261
+
+
+def backlog(size: int, years: int, rng: random.Random) -> list[Task]:
+    """Tasks whose estimates add up to about ``years`` of full workdays.
+
+    A third of the tasks get a deadline somewhere within the horizon.
+    """
+    mean_hours = years * WORKDAYS_PER_YEAR * MAX_HOURS_PER_DAY / size
+    tasks = []
+    for task_id in range(1, size + 1):
+        deadline = None
+        if rng.random() < 1 / 3:
+            deadline = START + timedelta(days=rng.randint(1, years * 365))
+        tasks.append(
+            Task(
+                id=task_id,
+                name=f"Task {task_id}",
+                priority=rng.randint(1, 100),
+                estimated_duration=round(mean_hours * rng.uniform(0.5, 1.5), 1),
+                deadline=deadline,
+            )
+        )
+    return tasks
+
+
+def timed(func: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def run(tasks: list[Task], years: int, full_limit: int) -> None:
+    params = OptimizeParams(start_date=START, max_hours_per_day=MAX_HOURS_PER_DAY)
+    strategy = RoundRobinOptimizationStrategy()
+    rotation = None
+
+    def rotate() -> None:
+        nonlocal rotation
+        calendar = CapacityCalendar.from_params(params, {})
+        rotation = strategy._allocate_round_robin(tasks, calendar, START)
+
+    rotation_seconds = timed(rotate)
+    assert rotation is not None
+    last_day = rotation.days[-1] if rotation.days else None
+
+    optimize = "-"
+    failed = "-"
+    if len(tasks) * len(rotation.days) <= full_limit:
+        result = None
+
+        def optimize_tasks() -> None:
+            nonlocal result
+            result = strategy.optimize_tasks(tasks, {}, params)
+
+        optimize = f"{timed(optimize_tasks) * 1000:.1f}"
+        assert result is not None
+        failed = str(len(result.failures))
+
+    print(
+        f"{len(tasks):>7} {years:>6} {len(rotation.days):>8} {last_day!s:>11} "
+        f"{rotation_seconds * 1000:>12.1f} {optimize:>12} {failed:>7}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default="100,1000,10000",
+        help="Comma-separated task counts (default: 100,1000,10000)",
+    )
+    parser.add_argument(
+        "--years",
+        default="1,10,50",
+        help="Comma-separated horizons in years of full workdays (default: 1,10,50)",
+    )
+    parser.add_argument(
+        "--full-limit",
+        type=int,
+        default=5_000_000,
+        help="Skip the full run above this many tasks x days (default: 5000000)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{'tasks':>7} {'years':>6} {'days':>8} {'last day':>11} "
+        f"{'rotation ms':>12} {'optimize ms':>12} {'failed':>7}"
+    )
+    for size in (int(s) for s in args.sizes.split(",")):
+        for years in (int(y) for y in args.years.split(",")):
+            run(backlog(size, years, random.Random(args.seed)), years, args.full_limit)
+
+
+if __name__ == "__main__":
+    main()
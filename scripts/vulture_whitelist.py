@@ -21,3 +21,6 @@ reschedule  # StatisticsPayload / StatisticsResponse field (used by API serializ
 first_deadline  # ChronicSlipperTask DTO field (API-only; not yet in the TUI)
 latest_deadline  # ChronicSlipperTask DTO field (API-only; not yet in the TUI)
 ranking_basis  # NextTasksOutput / NextTasksResponse field (used by API serialization)
+IncompleteFilter  # public query filter for library users (packages/taskdog-core/src/taskdog_core/application/queries/filters/incomplete_filter.py:8)
+deadline_misses  # ScenarioResult / ScenarioResultResponse field (used by API serialization)
+peak_load  # ScenarioResult / ScenarioResultResponse field (used by API serialization)